@@ -20,7 +20,7 @@ Evolutionary approach:
 Inspired by 17000% return swarm in tradfi.
 """
 
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, StrategyTag
 from coinswarm.agents.committee import AgentCommittee, CommitteeDecision
 from coinswarm.agents.trend_agent import TrendFollowingAgent
 from coinswarm.agents.risk_agent import RiskManagementAgent
@@ -31,8 +31,10 @@ from coinswarm.agents.academic_research_agent import AcademicResearchAgent, Rese
 from coinswarm.agents.hedge_agent import HedgeAgent, RiskParameters, HedgeRecommendation
 
 __all__ = [
+    "AgentCost",
     "BaseAgent",
     "AgentVote",
+    "StrategyTag",
     "AgentCommittee",
     "CommitteeDecision",
     "TrendFollowingAgent",
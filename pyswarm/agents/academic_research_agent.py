@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote
 
 
 logger = logging.getLogger(__name__)
@@ -67,6 +67,8 @@ class AcademicResearchAgent(BaseAgent):
     - Crypto research (Messari, CoinMetrics research)
     """
 
+    cost_class = AgentCost.EXPENSIVE
+
     def __init__(
         self,
         name: str = "AcademicResearcher",
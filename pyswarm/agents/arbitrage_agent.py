@@ -13,9 +13,15 @@ Example:
 Need >0.4% spread to profit after fees!
 
 Types of arbitrage:
-1. Triangular (BTC→SOL→USDC→BTC)
+1. Triangular / multi-leg cycles (BTC→SOL→USDC→BTC), found on a currency
+   graph of all pairs seen (see arbitrage_graph.CurrencyGraph)
 2. Cross-exchange (Binance vs Coinbase)
 3. Funding rate (spot vs futures)
+
+When order book ticks are streamed (bids/asks, e.g. Binance depth@100ms),
+each leg is walked through its L2 book (see order_book) and trades are sized
+to the depth that is actually executable, instead of a fixed size at the
+top-of-book price.
 """
 
 import logging
@@ -23,7 +29,9 @@ from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import BaseAgent, AgentVote, StrategyTag
+from coinswarm.agents.arbitrage_graph import ArbitrageCycle, CurrencyGraph, split_pair
+from coinswarm.agents.order_book import OrderBook, OrderBooks, PathFill, best_fill, fill_path
 
 
 logger = logging.getLogger(__name__)
@@ -36,9 +44,13 @@ class ArbitrageAgent(BaseAgent):
     Monitors price differences across pairs to find profitable trades.
 
     Strategy:
-    - Continuously monitor all pairs
-    - Calculate theoretical profit from triangular arbitrage
+    - Continuously monitor all pairs (every pair seen becomes two edges of a
+      CurrencyGraph)
+    - Track every profitable conversion cycle up to max_cycle_length legs,
+      re-evaluating only cycles through the pair that just ticked
     - Execute if profit > min_profit_threshold (after fees)
+    - With order books for every leg, size to the executable depth (and
+      skip edges that only exist at the top of the book)
     - Fast execution required (<1 second for all legs)
     """
 
@@ -47,20 +59,75 @@ class ArbitrageAgent(BaseAgent):
         name: str = "ArbitrageAgent",
         weight: float = 2.0,  # High weight (arbitrage is low risk)
         min_profit_pct: float = 0.004,  # 0.4% minimum profit
-        fee_pct: float = 0.003  # 0.3% fee per trade (3 trades = 0.9% total)
+        fee_pct: float = 0.003,  # 0.3% fee per trade (3 trades = 0.9% total)
+        max_cycle_length: int = 4,  # Longest conversion cycle searched (legs)
+        max_size: float = 0.01,  # Largest arbitrage size (1% of capital)
+        capital: Optional[float] = None,  # Capital in capital_asset, for depth sizing
+        capital_asset: str = "USDC"
     ):
         super().__init__(name, weight)
 
         self.min_profit_pct = min_profit_pct
         self.fee_pct = fee_pct
-        self.total_fee_pct = fee_pct * 3  # 3 legs = 3× fees
+        self.total_fee_pct = fee_pct * 3  # Nominal 3-leg fees (stats only; cycles compound per leg)
+
+        # Currency graph (−log rate edges, both directions, fees included)
+        self.graph = CurrencyGraph(fee_pct=fee_pct, max_length=max_cycle_length)
 
         # Price cache for arbitrage calculation
-        self.price_cache: Dict[str, float] = {}
+        self._price_cache: Dict[str, float] = {}
+
+        # L2 books per pair (from order book ticks) for depth-aware sizing
+        self.books = OrderBooks()
+        self.max_size = max_size
+        self.capital = capital
+        self.capital_asset = capital_asset
+        self.last_fill: Optional[PathFill] = None
 
         # Arbitrage opportunities found
         self.opportunities_found = 0
         self.opportunities_executed = 0
+        self.depth_rejections = 0  # Top-of-book edges with no executable size
+
+    @property
+    def price_cache(self) -> Dict[str, float]:
+        """Last price per pair (assigning a dict rebuilds the graph)"""
+        return self._price_cache
+
+    @price_cache.setter
+    def price_cache(self, prices: Dict[str, float]):
+        self._price_cache = dict(prices)
+        self.graph.clear()
+        for symbol, price in self._price_cache.items():
+            self._update_graph(symbol, price)
+
+    def _update_graph(self, symbol: str, bid: float, ask: Optional[float] = None):
+        try:
+            self.graph.update(symbol, bid, ask)
+        except ValueError:
+            logger.debug("Ignoring non-pair symbol for arbitrage: %s", symbol)
+
+    def _apply(self, tick: DataPoint) -> Optional[OrderBook]:
+        """Apply tick to the pair's book, price cache and graph edges; returns the book"""
+        symbol = tick.symbol
+        book = self.books.update(tick)
+
+        if book is not None:
+            if book.needs_snapshot:
+                return book
+            price = book.mid or 0
+            bid, ask = book.best_bid or 0, book.best_ask or 0
+        else:
+            price = tick.data.get("price", 0)
+            bid, ask = tick.data.get("bid", price), tick.data.get("ask", price)
+
+        self._price_cache[symbol] = price
+        self._update_graph(symbol, bid, ask)
+        return book
+
+    def observe(self, tick: DataPoint):
+        """Keep books, prices and the graph current on ticks the committee prunes"""
+        self._apply(tick)
 
     async def analyze(
         self,
@@ -72,36 +139,66 @@ class ArbitrageAgent(BaseAgent):
         Analyze for arbitrage opportunities.
 
         Process:
-        1. Update price cache with latest tick
-        2. Check all triangular arbitrage paths
-        3. Calculate theoretical profit
-        4. Return BUY vote if profit > threshold
+        1. Update price cache and the pair's graph edges (bid/ask if present,
+           best bid/ask for order book ticks)
+        2. Re-evaluate cycles through that pair
+        3. Take the most profitable cycle
+        4. Size it through the order books when every leg has one
+        5. Return BUY vote if profit after fees > threshold
         """
 
         symbol = tick.symbol
-        price = tick.data.get("price", 0)
-
-        # Update price cache
-        self.price_cache[symbol] = price
+        book = self._apply(tick)
+
+        if book is not None and book.needs_snapshot:
+            # Gapped or never snapshotted: its levels are not the exchange's
+            return AgentVote(
+                agent_name=self.name,
+                action="HOLD",
+                confidence=0.5,
+                size=0.0,
+                reason="Order book for {} waiting for a snapshot",
+                reason_args=(symbol,)
+            )
 
         # Check for arbitrage opportunities
         opportunity = self._find_best_arbitrage()
 
         if opportunity:
-            path, profit_pct, expected_return = opportunity
-
-            # Check if profitable after fees
-            net_profit_pct = profit_pct - self.total_fee_pct
+            path, net_profit_pct, expected_return = opportunity
 
             if net_profit_pct >= self.min_profit_pct:
+                size = self.max_size
+                sized = self._find_executable_arbitrage()
+
+                if sized is not None:
+                    cycle, fill = sized
+                    path = list(self._oriented(cycle)[0])
+                    if fill is None:
+                        self.depth_rejections += 1
+                        return AgentVote(
+                            agent_name=self.name,
+                            action="HOLD",
+                            confidence=0.5,
+                            size=0.0,
+                            reason="Arbitrage {} = {:.2%} at top of book, not executable at depth",
+                            reason_args=(" → ".join(path), cycle.net_return)
+                        )
+
+                    self.last_fill = fill
+                    net_profit_pct = fill.return_pct
+                    size = self._fill_size(cycle, fill)
+
                 self.opportunities_found += 1
 
                 return AgentVote(
                     agent_name=self.name,
                     action="BUY",  # Start arbitrage sequence
                     confidence=min(0.95, 0.7 + (net_profit_pct * 10)),  # Higher profit = higher confidence
-                    size=0.01,  # Arbitrage size (1% of capital)
-                    reason=f"Arbitrage: {' → '.join(path)} = {net_profit_pct:.2%} profit (after fees)"
+                    size=size,
+                    reason="Arbitrage: {} = {:.2%} profit (after fees)",
+                    reason_args=(" → ".join(path), net_profit_pct),
+                    tags=StrategyTag.ARBITRAGE
                 )
 
         # No opportunity found
@@ -115,171 +212,86 @@ class ArbitrageAgent(BaseAgent):
 
     def _find_best_arbitrage(self) -> Optional[Tuple[List[str], float, float]]:
         """
-        Find best triangular arbitrage opportunity.
+        Find best arbitrage opportunity across all tracked cycles.
 
-        Checks all possible paths:
-        1. BTC → SOL → USDC → BTC
-        2. BTC → ETH → USDC → BTC
-        3. ETH → SOL → USDC → ETH
-        4. BTC → ETH → SOL → BTC
-        etc.
+        Every pair in the price cache is part of the graph, so this covers
+        all paths (BTC → SOL → USDC → BTC, ETH → BTC → SOL → ETH, ...), not
+        just a fixed list. Cycles are ranked by their graph weight, i.e.
+        with fee_pct compounded on every leg, the same fee model the order
+        book sizing uses.
 
         Returns:
-            (path, profit_pct, expected_return) or None
+            (path, net_return, expected_return) or None, where path is the
+            asset sequence and net_return the return after fees
         """
 
-        opportunities = []
-
-        # Path 1: BTC → SOL → USDC → BTC
-        path1 = self._calculate_triangular_arbitrage(
-            start="BTC-USDC",
-            leg1="BTC-SOL",
-            leg2="SOL-USDC",
-            end="BTC-USDC"
-        )
-        if path1:
-            opportunities.append(path1)
-
-        # Path 2: BTC → ETH → USDC → BTC
-        path2 = self._calculate_triangular_arbitrage(
-            start="BTC-USDC",
-            leg1="ETH-BTC",  # Inverse (sell BTC for ETH)
-            leg2="ETH-USDC",
-            end="BTC-USDC"
-        )
-        if path2:
-            opportunities.append(path2)
-
-        # Path 3: ETH → SOL → USDC → ETH
-        path3 = self._calculate_triangular_arbitrage(
-            start="ETH-USDC",
-            leg1="ETH-SOL",
-            leg2="SOL-USDC",
-            end="ETH-USDC"
-        )
-        if path3:
-            opportunities.append(path3)
-
-        # Path 4: SOL → BTC → ETH → SOL (complex)
-        path4 = self._calculate_complex_arbitrage(
-            start="SOL-USDC",
-            leg1="BTC-SOL",
-            leg2="ETH-BTC",
-            leg3="ETH-SOL",
-            end="SOL-USDC"
-        )
-        if path4:
-            opportunities.append(path4)
-
-        # Return best opportunity
-        if opportunities:
-            return max(opportunities, key=lambda x: x[1])  # Max profit_pct
+        best = self.graph.best_cycle()
+        if best is None:
+            return None
 
-        return None
+        start_amount = 50000
+        return (list(best.assets), best.net_return, start_amount * (1 + best.net_return))
 
-    def _calculate_triangular_arbitrage(
-        self,
-        start: str,
-        leg1: str,
-        leg2: str,
-        end: str
-    ) -> Optional[Tuple[List[str], float, float]]:
+    def _find_executable_arbitrage(self) -> Optional[Tuple[ArbitrageCycle, Optional[PathFill]]]:
         """
-        Calculate profit from triangular arbitrage.
+        Best cycle by executable return, walking each leg's order book.
 
-        Example:
-        start = BTC-USDC (buy BTC with $50,000 USDC)
-        leg1 = BTC-SOL (sell 1 BTC for 1000 SOL)
-        leg2 = SOL-USDC (sell 1000 SOL for $50,100 USDC)
-        end = BTC-USDC (compare to starting $50,000)
+        Only cycles with a book for every leg are considered.
 
-        Profit = ($50,100 - $50,000) / $50,000 = 0.2%
+        Returns:
+            None if no cycle is fully covered by books; (cycle, None) if
+            none of them clears min_profit_pct at depth, where cycle is the
+            covered one with the best top-of-book return; else (cycle, fill)
+            for the cycle traded, with the largest size that still clears
+            min_profit_pct at the margin
         """
-
-        # Check if all prices are available
-        if not all(p in self.price_cache for p in [start, leg1, leg2]):
-            return None
-
-        try:
-            # Starting amount (e.g., $50,000 USDC)
-            start_amount = 50000
-
-            # Leg 1: Buy BTC with USDC
-            start_price = self.price_cache[start]  # $50,000 per BTC
-            btc_amount = start_amount / start_price  # 1 BTC
-
-            # Leg 2: Sell BTC for SOL
-            leg1_price = self.price_cache[leg1]  # 1 BTC = 1000 SOL
-            sol_amount = btc_amount * leg1_price  # 1000 SOL
-
-            # Leg 3: Sell SOL for USDC
-            leg2_price = self.price_cache[leg2]  # $50.10 per SOL
-            end_amount = sol_amount * leg2_price  # $50,100 USDC
-
-            # Calculate profit
-            profit = end_amount - start_amount  # $100
-            profit_pct = profit / start_amount  # 0.2%
-
-            path = [start, leg1, leg2, end]
-
-            return (path, profit_pct, end_amount)
-
-        except Exception as e:
-            logger.debug(f"Error calculating arbitrage: {e}")
-            return None
-
-    def _calculate_complex_arbitrage(
-        self,
-        start: str,
-        leg1: str,
-        leg2: str,
-        leg3: str,
-        end: str
-    ) -> Optional[Tuple[List[str], float, float]]:
+        rejected = None
+        best = None
+        for cycle in self.graph.cycles.values():
+            fill = self._size_cycle(cycle)
+            if fill is False:
+                continue
+            if fill is None:
+                if rejected is None or cycle.weight < rejected.weight:
+                    rejected = cycle
+            elif best is None or fill.return_pct > best[1].return_pct:
+                best = (cycle, fill)
+
+        if best is not None:
+            return best
+        return None if rejected is None else (rejected, None)
+
+    def _size_cycle(self, cycle: ArbitrageCycle):
+        """Executable fill of cycle (None if not profitable, False if a leg has no book)"""
+        assets, pairs = self._oriented(cycle)
+        curves = []
+        for asset, pair in zip(assets, pairs):
+            book: Optional[OrderBook] = self.books.get(pair)
+            if book is None:
+                return False
+            base, _ = split_pair(pair)
+            curves.append(book.fill_curve(sell=asset == base))
+        return best_fill(fill_path(curves, self.fee_pct), self.min_profit_pct)
+
+    def _oriented(self, cycle: ArbitrageCycle) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
         """
-        Calculate profit from 4-leg arbitrage.
-
-        Example:
-        SOL → BTC → ETH → SOL → USDC
-
-        More complex but can find opportunities missed by simple triangular.
+        (assets, pairs) of cycle starting at capital_asset when it passes
+        through it, so fills are measured in capital units
         """
+        loop = cycle.assets[:-1]
+        i = loop.index(self.capital_asset) if self.capital_asset in loop else 0
+        assets = loop[i:] + loop[:i]
+        return assets + assets[:1], cycle.pairs[i:] + cycle.pairs[:i]
 
-        # Check if all prices are available
-        if not all(p in self.price_cache for p in [start, leg1, leg2, leg3]):
-            return None
-
-        try:
-            # Starting amount
-            start_amount = 50000
-
-            # Leg 1
-            price1 = self.price_cache[start]
-            amount1 = start_amount / price1
-
-            # Leg 2
-            price2 = self.price_cache[leg1]
-            amount2 = amount1 / price2  # May need inverse
-
-            # Leg 3
-            price3 = self.price_cache[leg2]
-            amount3 = amount2 * price3
-
-            # Leg 4
-            price4 = self.price_cache[leg3]
-            end_amount = amount3 * price4
-
-            # Calculate profit
-            profit = end_amount - start_amount
-            profit_pct = profit / start_amount
+    def _fill_size(self, cycle: ArbitrageCycle, fill: PathFill) -> float:
+        """Vote size: executable amount as a fraction of capital, capped at max_size"""
+        if self.capital and self.capital_asset in cycle.assets:
+            return min(self.max_size, fill.amount_in / self.capital)
+        return self.max_size
 
-            path = [start, leg1, leg2, leg3, end]
-
-            return (path, profit_pct, end_amount)
-
-        except Exception as e:
-            logger.debug(f"Error calculating complex arbitrage: {e}")
-            return None
+    def best_cycle(self) -> Optional[ArbitrageCycle]:
+        """Most profitable cycle after fees"""
+        return self.graph.best_cycle()
 
     def get_arbitrage_stats(self) -> Dict:
         """Get arbitrage statistics"""
@@ -293,7 +305,10 @@ class ArbitrageAgent(BaseAgent):
                 else 0
             ),
             "min_profit_threshold": self.min_profit_pct,
-            "total_fee_pct": self.total_fee_pct
+            "total_fee_pct": self.total_fee_pct,
+            "cycles_tracked": len(self.graph.cycles),
+            "depth_rejections": self.depth_rejections,
+            "order_books": len(self.books)
         }
 
 
@@ -309,6 +324,11 @@ class CrossExchangeArbitrageAgent(BaseAgent):
     - Profit: $200 (0.4%)
     - After fees + withdrawal: ~0.1-0.2%
 
+    Order book ticks are kept per (exchange, symbol), where the exchange is
+    the tick's source. Buying on one exchange's asks and selling into
+    another's bids is walked level by level, so the vote is sized to the
+    depth where the spread still pays for fees.
+
     Challenges:
     - Withdrawal time (minutes to hours)
     - Withdrawal fees
@@ -320,14 +340,32 @@ class CrossExchangeArbitrageAgent(BaseAgent):
         self,
         name: str = "CrossExchangeArb",
         weight: float = 1.5,
-        min_profit_pct: float = 0.005  # 0.5% minimum (higher than triangular due to complexity)
+        min_profit_pct: float = 0.005,  # 0.5% minimum (higher than triangular due to complexity)
+        fee_pct: float = 0.001,  # Taker fee per leg
+        max_size: float = 0.01,  # Largest size (1% of capital)
+        capital: Optional[float] = None  # Capital in quote currency, for depth sizing
     ):
         super().__init__(name, weight)
         self.min_profit_pct = min_profit_pct
+        self.fee_pct = fee_pct
+        self.max_size = max_size
+        self.capital = capital
 
-        # Track prices across exchanges
+        # Track prices across exchanges (symbol -> exchange -> mid price)
         self.exchange_prices: Dict[str, Dict[str, float]] = {}
 
+        # L2 books per (exchange, symbol)
+        self.books = OrderBooks()
+        self.last_fill: Optional[PathFill] = None
+
+    def observe(self, tick: DataPoint):
+        """Apply tick to its exchange's book and mid price"""
+        key = (tick.source, tick.symbol)
+        self.books.update(tick, key=key)
+        book = self.books.get(key)
+        if book is not None:
+            self.exchange_prices.setdefault(tick.symbol, {})[tick.source] = book.mid
+
     async def analyze(
         self,
         tick: DataPoint,
@@ -337,16 +375,62 @@ class CrossExchangeArbitrageAgent(BaseAgent):
         """
         Analyze cross-exchange arbitrage.
 
-        Note: This is more complex than triangular arbitrage
-        and requires capital on multiple exchanges.
-
-        For now, returns HOLD (can be implemented later).
+        Note: Withdrawal fees and transfer time are not modelled; only
+        ticks with order books (bids/asks) from two or more exchanges can
+        produce a trade.
         """
 
+        symbol = tick.symbol
+        self.observe(tick)
+
+        best = self._find_best_route(symbol)
+        if best is None:
+            return AgentVote(
+                agent_name=self.name,
+                action="HOLD",
+                confidence=0.5,
+                size=0.0,
+                reason="No executable cross-exchange spread for {}",
+                reason_args=(symbol,)
+            )
+
+        buy_exchange, sell_exchange, fill = best
+        self.last_fill = fill
+
+        size = self.max_size
+        if self.capital:
+            size = min(self.max_size, fill.amount_in / self.capital)
+
         return AgentVote(
             agent_name=self.name,
-            action="HOLD",
-            confidence=0.5,
-            size=0.0,
-            reason="Cross-exchange arbitrage not yet implemented"
+            action="BUY",
+            confidence=min(0.9, 0.6 + fill.return_pct * 10),
+            size=size,
+            reason="Cross-exchange: buy {} on {}, sell on {} = {:.2%} on {:.2f} (after fees)",
+            reason_args=(symbol, buy_exchange, sell_exchange, fill.return_pct, fill.amount_in),
+            tags=StrategyTag.ARBITRAGE
         )
+
+    def _find_best_route(self, symbol: str) -> Optional[Tuple[str, str, PathFill]]:
+        """(buy exchange, sell exchange, fill) with the best executable return"""
+        books = [
+            (exchange, self.books.get((exchange, symbol)))
+            for exchange in self.exchange_prices.get(symbol, ())
+        ]
+        books = [(exchange, book) for exchange, book in books if book is not None]
+
+        best = None
+        for buy_exchange, buy_book in books:
+            for sell_exchange, sell_book in books:
+                if buy_exchange == sell_exchange or sell_book.best_bid <= buy_book.best_ask:
+                    continue
+
+                curve = fill_path(
+                    [buy_book.fill_curve(sell=False), sell_book.fill_curve(sell=True)],
+                    self.fee_pct
+                )
+                fill = best_fill(curve, self.min_profit_pct)
+                if fill is not None and (best is None or fill.return_pct > best[2].return_pct):
+                    best = (buy_exchange, sell_exchange, fill)
+
+        return best
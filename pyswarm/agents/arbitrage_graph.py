@@ -0,0 +1,254 @@
+"""
+Currency Graph for Arbitrage Detection
+
+Every trading pair is two directed edges between assets:
+
+    BTC-USDC @ bid/ask  →  BTC → USDC (rate = bid)
+                           USDC → BTC (rate = 1 / ask)
+
+Edge weights are −log(rate × (1 − fee)), so a cycle whose weights sum to less
+than zero returns more than it started with after fees (a "negative cycle").
+
+Instead of re-scanning the whole graph on each tick, the graph keeps the set
+of profitable cycles up to max_length legs. A price update only changes the
+two edges of that pair, so only cycles through those edges are re-evaluated:
+a bounded DFS for simple paths that close the loop. Cycles that don't touch
+the pair keep their value.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+Edge = Tuple[str, str]
+
+# Cycles must beat break-even by more than float rounding to count
+PROFIT_TOLERANCE = 1e-12
+
+
+def split_pair(symbol: str) -> Tuple[str, str]:
+    """'BTC-USDC' → ('BTC', 'USDC')"""
+    base, sep, quote = symbol.partition("-")
+    if not sep:
+        base, sep, quote = symbol.partition("/")
+    if not sep or not base or not quote:
+        raise ValueError(f"Not a BASE-QUOTE pair: {symbol}")
+    return base, quote
+
+
+@dataclass(frozen=True)
+class ArbitrageCycle:
+    """Closed conversion path, e.g. USDC → BTC → SOL → USDC"""
+    assets: Tuple[str, ...]  # First asset repeated at the end
+    pairs: Tuple[str, ...]  # Pair traded on each leg
+    rates: Tuple[float, ...]  # Conversion rate of each leg (before fees)
+    weight: float  # Σ −log(rate × (1 − fee)); < 0 means profitable after fees
+
+    @property
+    def legs(self) -> int:
+        return len(self.pairs)
+
+    @property
+    def gross_return(self) -> float:
+        """Return before fees (0.01 = 1%)"""
+        return math.prod(self.rates) - 1
+
+    @property
+    def net_return(self) -> float:
+        """Return after compounding the per-leg fee"""
+        return math.exp(-self.weight) - 1
+
+    def __str__(self):
+        return " → ".join(self.assets)
+
+
+class CurrencyGraph:
+    """
+    Directed asset graph with incremental profitable-cycle tracking.
+
+    Example:
+        graph = CurrencyGraph(fee_pct=0.001, max_length=4)
+        graph.update("BTC-USDC", 50000.0)
+        graph.update("BTC-SOL", 500.0)
+        graph.update("SOL-USDC", 101.5)
+        best = graph.best_cycle()   # USDC → BTC → SOL → USDC
+    """
+
+    def __init__(self, fee_pct: float = 0.0, max_length: int = 4):
+        if max_length < 2:
+            raise ValueError("max_length must be >= 2")
+
+        self.fee_pct = fee_pct
+        self.max_length = max_length
+        self._fee_weight = -math.log(1 - fee_pct)
+
+        # asset -> {neighbor: (rate, weight, pair)}
+        self._adj: Dict[str, Dict[str, Tuple[float, float, str]]] = {}
+        self._pairs: Dict[str, Edge] = {}
+
+        # Profitable cycles and which cycles use each edge
+        self.cycles: Dict[Tuple[str, ...], ArbitrageCycle] = {}
+        self._by_edge: Dict[Edge, Set[Tuple[str, ...]]] = {}
+
+        self.stats = {"updates": 0, "paths_evaluated": 0}
+
+    # ------------------------------------------------------------------
+    # Edges
+    # ------------------------------------------------------------------
+
+    def update(self, symbol: str, bid: float, ask: Optional[float] = None) -> List[ArbitrageCycle]:
+        """
+        Set the pair's rates and re-evaluate cycles through it.
+
+        Args:
+            symbol: "BASE-QUOTE" pair
+            bid: Price received selling 1 BASE (QUOTE per BASE)
+            ask: Price paid buying 1 BASE (defaults to bid)
+
+        Returns:
+            Profitable cycles through this pair after the update
+        """
+        ask = bid if ask is None else ask
+        if bid <= 0 or ask <= 0:
+            self.remove(symbol)
+            return []
+
+        base, quote = split_pair(symbol)
+        self._pairs[symbol] = (base, quote)
+        self._set_edge(base, quote, bid, symbol)
+        self._set_edge(quote, base, 1.0 / ask, symbol)
+        self.stats["updates"] += 1
+
+        self._drop_cycles((base, quote))
+        self._drop_cycles((quote, base))
+        found = self._find_cycles(base, quote)
+        found.extend(self._find_cycles(quote, base))
+        return found
+
+    def remove(self, symbol: str):
+        """Remove a pair (and every cycle through it)"""
+        edge = self._pairs.pop(symbol, None)
+        if edge is None:
+            return
+
+        base, quote = edge
+        for u, v in ((base, quote), (quote, base)):
+            self._drop_cycles((u, v))
+            neighbors = self._adj.get(u)
+            if neighbors is not None:
+                neighbors.pop(v, None)
+
+    def clear(self):
+        self._adj.clear()
+        self._pairs.clear()
+        self.cycles.clear()
+        self._by_edge.clear()
+
+    def _set_edge(self, u: str, v: str, rate: float, symbol: str):
+        weight = -math.log(rate) + self._fee_weight
+        self._adj.setdefault(u, {})[v] = (rate, weight, symbol)
+        self._adj.setdefault(v, {})
+
+    @property
+    def assets(self) -> List[str]:
+        return list(self._adj)
+
+    def rate(self, u: str, v: str) -> Optional[float]:
+        """Conversion rate u → v before fees (None if no direct pair)"""
+        edge = self._adj.get(u, {}).get(v)
+        return edge[0] if edge else None
+
+    # ------------------------------------------------------------------
+    # Cycles
+    # ------------------------------------------------------------------
+
+    def _drop_cycles(self, edge: Edge):
+        for key in self._by_edge.pop(edge, ()):
+            cycle = self.cycles.pop(key, None)
+            if cycle is None:
+                continue
+            for other in zip(key, key[1:]):
+                if other != edge:
+                    self._by_edge.get(other, set()).discard(key)
+
+    def _paths(self, source: str, target: str, max_edges: int) -> Iterator[Tuple[List[str], float]]:
+        """Simple paths source → target with at most max_edges edges (and their weight)"""
+        path = [source]
+        on_path = {source}
+
+        def dfs(node: str, weight: float):
+            if len(path) > max_edges:
+                return
+            for neighbor, (_, w, _) in self._adj[node].items():
+                if neighbor == target:
+                    yield path + [target], weight + w
+                elif neighbor not in on_path:
+                    path.append(neighbor)
+                    on_path.add(neighbor)
+                    yield from dfs(neighbor, weight + w)
+                    path.pop()
+                    on_path.discard(neighbor)
+
+        if source == target:
+            return
+        yield from dfs(source, 0.0)
+
+    def _find_cycles(self, u: str, v: str) -> List[ArbitrageCycle]:
+        """Profitable cycles that use edge u → v"""
+        first_rate, first_weight, _ = self._adj[u][v]
+        found = []
+
+        for path, weight in self._paths(v, u, self.max_length - 1):
+            self.stats["paths_evaluated"] += 1
+            total = first_weight + weight
+            if total >= -PROFIT_TOLERANCE:
+                continue
+
+            assets = self._canonical([u] + path[:-1])
+            cycle = self._make_cycle(assets, total)
+            self._add_cycle(cycle)
+            found.append(cycle)
+
+        return found
+
+    @staticmethod
+    def _canonical(nodes: List[str]) -> Tuple[str, ...]:
+        """Rotate so the smallest asset comes first; closes the loop"""
+        i = nodes.index(min(nodes))
+        rotated = nodes[i:] + nodes[:i]
+        return tuple(rotated + [rotated[0]])
+
+    def _make_cycle(self, assets: Tuple[str, ...], weight: float) -> ArbitrageCycle:
+        legs = [self._adj[a][b] for a, b in zip(assets, assets[1:])]
+        return ArbitrageCycle(
+            assets=assets,
+            pairs=tuple(leg[2] for leg in legs),
+            rates=tuple(leg[0] for leg in legs),
+            weight=weight
+        )
+
+    def _add_cycle(self, cycle: ArbitrageCycle):
+        key = cycle.assets
+        self.cycles[key] = cycle
+        for edge in zip(key, key[1:]):
+            self._by_edge.setdefault(edge, set()).add(key)
+
+    def best_cycle(self) -> Optional[ArbitrageCycle]:
+        """Most profitable cycle after fees (None if there is none)"""
+        if not self.cycles:
+            return None
+        return min(self.cycles.values(), key=lambda c: c.weight)
+
+    def opportunities(self, min_return: float = 0.0) -> List[ArbitrageCycle]:
+        """Profitable cycles with net_return >= min_return, best first"""
+        return sorted(
+            (c for c in self.cycles.values() if c.net_return >= min_return),
+            key=lambda c: c.weight
+        )
+
+    def __repr__(self):
+        return (
+            f"CurrencyGraph(assets={len(self._adj)}, pairs={len(self._pairs)}, "
+            f"cycles={len(self.cycles)})"
+        )
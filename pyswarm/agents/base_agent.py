@@ -11,23 +11,196 @@ Swarm intelligence: Multiple specialized agents vote on each trade.
 Committee aggregates votes using weighted confidence.
 """
 
+import copy
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Optional
+from enum import IntEnum, IntFlag
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
 from coinswarm.data_ingest.base import DataPoint
 
 
-@dataclass
+class StrategyTag(IntFlag):
+    """
+    Strategy patterns behind a vote, as a bitmask (AgentVote.tags).
+
+    Agents set the tags they voted on; trade analysis and the learning loop
+    attribute and classify trades with bit operations instead of parsing
+    reason strings.
+    """
+    NONE = 0
+    TREND_UPTREND = 1 << 0
+    TREND_DOWNTREND = 1 << 1
+    RSI_OVERSOLD = 1 << 2
+    RSI_OVERBOUGHT = 1 << 3
+    NEWS_POSITIVE = 1 << 4
+    NEWS_NEGATIVE = 1 << 5
+    MEAN_REVERSION = 1 << 6
+    BREAKOUT = 1 << 7
+    ARBITRAGE = 1 << 8
+    HEDGE = 1 << 9
+
+    TREND = TREND_UPTREND | TREND_DOWNTREND
+    NEWS = NEWS_POSITIVE | NEWS_NEGATIVE
+
+
+# Single-bit tags in declaration order, with their strategy tag names
+_TAG_NAMES = tuple(
+    (tag, tag.name.lower()) for tag in StrategyTag.__members__.values()
+    if tag and not tag & (tag - 1)
+)
+_TAG_BY_NAME = {name: tag for tag, name in _TAG_NAMES}
+
+
+@lru_cache(maxsize=None)
+def strategy_tag_names(tags: int) -> Tuple[str, ...]:
+    """Names of the tags in a bitmask ("trend_uptrend", "arbitrage", ...)"""
+    return tuple(name for tag, name in _TAG_NAMES if tags & tag)
+
+
+def strategy_tags_from_names(names) -> StrategyTag:
+    """Bitmask for tag names (unknown names are ignored)"""
+    tags = StrategyTag.NONE
+    for name in names:
+        tags |= _TAG_BY_NAME.get(name, StrategyTag.NONE)
+    return tags
+
+
+def strategy_tags_from_reason(reason: str) -> StrategyTag:
+    """
+    Infer strategy tags from a free-text reason.
+
+    For agents whose reasons are generated rather than tied to one strategy
+    (ChaosBuy, OpportunisticSell), and for vote records that predate tags.
+
+    Examples:
+    - "Uptrend: momentum=2.5%" → TREND_UPTREND
+    - "Positive news sentiment" → NEWS_POSITIVE
+    - "RSI oversold" → RSI_OVERSOLD
+    """
+
+    reason = reason.lower()
+    tags = StrategyTag.NONE
+
+    # Trend patterns
+    if "uptrend" in reason or "momentum" in reason:
+        tags |= StrategyTag.TREND_UPTREND
+    if "downtrend" in reason:
+        tags |= StrategyTag.TREND_DOWNTREND
+    if "rsi" in reason and "oversold" in reason:
+        tags |= StrategyTag.RSI_OVERSOLD
+    if "rsi" in reason and "overbought" in reason:
+        tags |= StrategyTag.RSI_OVERBOUGHT
+
+    # News patterns
+    if "positive" in reason and "news" in reason:
+        tags |= StrategyTag.NEWS_POSITIVE
+    if "negative" in reason and "news" in reason:
+        tags |= StrategyTag.NEWS_NEGATIVE
+
+    # Mean reversion
+    if "mean reversion" in reason:
+        tags |= StrategyTag.MEAN_REVERSION
+
+    # Breakout
+    if "breakout" in reason:
+        tags |= StrategyTag.BREAKOUT
+
+    # Arbitrage
+    if "arbitrage" in reason:
+        tags |= StrategyTag.ARBITRAGE
+
+    return tags
+
+
 class AgentVote:
-    """Vote from an agent"""
-    agent_name: str
-    action: str  # "BUY", "SELL", "HOLD"
-    confidence: float  # 0.0-1.0
-    size: float  # Suggested position size
-    reason: str  # Explanation for vote
-    veto: bool = False  # Agent can veto trade (e.g., risk too high)
+    """
+    Vote from an agent.
+
+    Slotted record (one is created per agent per tick). The reason can be
+    passed as a ready string, a callable, or a str.format template; with
+    reason_args the callable/template receives them. It is rendered only
+    when someone reads it. tags is a StrategyTag bitmask of the patterns
+    the vote is based on.
+
+        AgentVote(name, "BUY", 0.8, 0.01,
+                  reason="Uptrend: momentum={:.2%}", reason_args=(momentum,),
+                  tags=StrategyTag.TREND_UPTREND)
+    """
+
+    __slots__ = ("agent_name", "action", "confidence", "size", "veto", "tags",
+                 "_reason", "_reason_args")
+
+    def __init__(
+        self,
+        agent_name: str,
+        action: str,  # "BUY", "SELL", "HOLD"
+        confidence: float,  # 0.0-1.0
+        size: float,  # Suggested position size
+        reason: Union[str, Callable[[], str]] = "",  # Explanation for vote
+        veto: bool = False,  # Agent can veto trade (e.g., risk too high)
+        reason_args: Optional[Tuple] = None,
+        tags: int = StrategyTag.NONE  # StrategyTag bitmask
+    ):
+        self.agent_name = agent_name
+        self.action = action
+        self.confidence = confidence
+        self.size = size
+        self.veto = veto
+        self.tags = tags
+        self._reason = reason
+        self._reason_args = reason_args
+
+    @property
+    def reason(self) -> str:
+        """Explanation for vote (rendered on first access)"""
+        reason = self._reason
+        args = self._reason_args
+        if args is not None:
+            reason = reason(*args) if callable(reason) else reason.format(*args)
+            self._reason_args = None
+        elif callable(reason):
+            reason = reason()
+        else:
+            return reason
+
+        self._reason = reason
+        return reason
+
+    @reason.setter
+    def reason(self, value: str):
+        self._reason = value
+        self._reason_args = None
+
+    def __eq__(self, other):
+        if not isinstance(other, AgentVote):
+            return NotImplemented
+        return (
+            self.agent_name == other.agent_name
+            and self.action == other.action
+            and self.confidence == other.confidence
+            and self.size == other.size
+            and self.veto == other.veto
+            and self.tags == other.tags
+            and self.reason == other.reason
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"AgentVote(agent_name={self.agent_name!r}, action={self.action!r}, "
+            f"confidence={self.confidence!r}, size={self.size!r}, "
+            f"reason={self.reason!r}, veto={self.veto!r}, tags={self.tags!r})"
+        )
+
+
+class AgentCost(IntEnum):
+    """Relative cost of one analyze() call (committee evaluates cheap agents first)"""
+    CHEAP = 0  # Pure in-memory math on the current tick
+    NORMAL = 1  # Heavier computation (scans, model inference)
+    EXPENSIVE = 2  # I/O bound (crawling, remote APIs)
 
 
 class BaseAgent(ABC):
@@ -39,8 +212,25 @@ class BaseAgent(ABC):
     2. Analyzes using its specific strategy
     3. Returns a vote with confidence
     4. Can veto dangerous trades
+
+    Subclasses declare scheduling hints for the committee:
+    - cost_class: how expensive analyze() is
+    - can_veto: whether the agent may veto (veto agents run first, and a veto
+      skips the remaining agents)
+
+    and which attributes hold warm-up state (indicator buffers, rolling
+    statistics, learned pools) in snapshot_attributes, so snapshot() /
+    restore() can skip the cold start of a backtest window.
+
+    Agents that keep per-tick market state of their own (order books, price
+    caches) override observe(), which the committee calls with every tick
+    whose analyze() it prunes, so that state doesn't miss ticks.
     """
 
+    cost_class: AgentCost = AgentCost.NORMAL
+    can_veto: bool = False
+    snapshot_attributes: Tuple[str, ...] = ()
+
     def __init__(self, name: str, weight: float = 1.0):
         """
         Initialize agent.
@@ -78,6 +268,39 @@ class BaseAgent(ABC):
         """
         pass
 
+    def observe(self, tick: DataPoint):
+        """
+        Update per-tick state from a tick without voting on it.
+
+        Called by the committee in place of analyze() when a veto or missing
+        capacity prunes the agent's evaluation. The default does nothing:
+        agents that read indicators from the feature bus have no state of
+        their own to keep current.
+        """
+        pass
+
+    async def analyze_batch(
+        self,
+        ticks: Sequence[DataPoint],
+        positions: Sequence[Optional[Dict]],
+        market_contexts: Sequence[Dict]
+    ) -> List[AgentVote]:
+        """
+        Analyze several symbols at the same timestamp (one vote per tick).
+
+        Used by AgentCommittee.vote_batch(). The default runs analyze() for
+        each symbol; agents whose indicators vectorize override it and score
+        every symbol at once from market_contexts[i]["feature_batch"] (a
+        FeatureBatch whose rows follow ticks).
+
+        Returns:
+            Votes in the same order as ticks
+        """
+        return [
+            await self.analyze(tick, position, context)
+            for tick, position, context in zip(ticks, positions, market_contexts)
+        ]
+
     def update_performance(self, trade_result: Dict):
         """
         Update agent performance stats.
@@ -89,6 +312,42 @@ class BaseAgent(ABC):
         else:
             self.stats["incorrect_predictions"] += 1
 
+    def snapshot(self) -> Dict:
+        """
+        Copy of the agent's learned and warm-up state.
+
+        Captures weight, stats and every attribute in snapshot_attributes
+        (objects with their own snapshot(), like SymbolRingBuffers, store
+        that compact form; anything else is deep-copied). The result shares
+        nothing with the agent and can be pickled.
+        """
+        state = {}
+        for attr in self.snapshot_attributes:
+            value = getattr(self, attr)
+            state[attr] = value.snapshot() if hasattr(value, "snapshot") else copy.deepcopy(value)
+
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "stats": dict(self.stats),
+            "state": state,
+        }
+
+    def restore(self, snapshot: Dict):
+        """
+        Load a snapshot() taken from this agent or one configured the same.
+
+        The snapshot itself is left untouched, so it can be restored again.
+        """
+        self.weight = snapshot["weight"]
+        self.stats = dict(snapshot["stats"])
+        for attr, value in snapshot["state"].items():
+            current = getattr(self, attr, None)
+            if hasattr(current, "restore") and hasattr(current, "snapshot"):
+                current.restore(value)
+            else:
+                setattr(self, attr, copy.deepcopy(value))
+
     @property
     def accuracy(self) -> float:
         """Calculate agent accuracy"""
@@ -12,10 +12,12 @@ lead to profitable vs unprofitable trades.
 """
 
 import random
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, strategy_tags_from_reason
+from coinswarm.agents.feature_bus import FeatureSnapshot
+from coinswarm.agents.symbol_state import SymbolRingBuffers
 from coinswarm.data_ingest.base import DataPoint
 
 
@@ -28,6 +30,9 @@ class ChaosBuyAgent(BaseAgent):
     collect data on what market conditions correlate with success.
     """
 
+    cost_class = AgentCost.CHEAP
+    snapshot_attributes = ("history", "_symbol")
+
     def __init__(
         self,
         name: str = "ChaosBuy",
@@ -44,9 +49,23 @@ class ChaosBuyAgent(BaseAgent):
         # Memory: store all decisions with justifications
         self.memory = []
 
-        # Price history for analysis
-        self.price_history = []
-        self.volume_history = []
+        # Per-symbol price/volume history for analysis (last 100 points)
+        self.history = SymbolRingBuffers(capacity=100, fields=("price", "volume"))
+        self._symbol = ""  # Symbol of the most recent tick
+
+    @property
+    def price_history(self) -> List[float]:
+        """Recent prices for the most recently analyzed symbol"""
+        return self.history.view(self._symbol, "price").tolist()
+
+    @price_history.setter
+    def price_history(self, prices: List[float]):
+        # Volume 0, as for ticks without one
+        self.history.load(self._symbol, prices, [0.0] * len(prices))
+
+    @property
+    def volume_history(self) -> List[float]:
+        return self.history.view(self._symbol, "volume").tolist()
 
     async def analyze(
         self,
@@ -58,20 +77,22 @@ class ChaosBuyAgent(BaseAgent):
         Randomly decide to buy or not, with justification.
         """
 
-        # Update history
         price = tick.data.get("price", tick.data.get("close", 0))
-        volume = tick.data.get("volume", 0)
-
-        self.price_history.append(price)
-        self.volume_history.append(volume)
 
-        # Keep last 100 data points
-        if len(self.price_history) > 100:
-            self.price_history.pop(0)
-            self.volume_history.pop(0)
+        features = market_context.get("features")
+        if features is None:
+            # Update this symbol's history
+            self._symbol = tick.symbol
+            sid = self.history.append(tick.symbol, price, tick.data.get("volume", 0))
+            features = FeatureSnapshot(
+                tick.symbol,
+                self.history.view(sid, "price"),
+                self.history.view(sid, "volume"),
+                symbol_id=sid
+            )
 
         # Calculate market state features
-        state = self._calculate_market_state(tick)
+        state = self._calculate_market_state(tick, features)
 
         # Randomly decide to buy or not
         should_buy = random.random() < self.buy_probability
@@ -92,7 +113,8 @@ class ChaosBuyAgent(BaseAgent):
                 confidence=confidence,
                 size=size_pct,
                 reason=justification,
-                veto=False
+                veto=False,
+                tags=strategy_tags_from_reason(justification)
             )
         else:
             # Hold - don't interfere
@@ -120,7 +142,7 @@ class ChaosBuyAgent(BaseAgent):
 
         return vote
 
-    def _calculate_market_state(self, tick: DataPoint) -> Dict:
+    def _calculate_market_state(self, tick: DataPoint, features: FeatureSnapshot) -> Dict:
         """Calculate current market state features"""
 
         price = tick.data.get("price", tick.data.get("close", 0))
@@ -132,34 +154,22 @@ class ChaosBuyAgent(BaseAgent):
             "timestamp": tick.timestamp.isoformat()
         }
 
-        if len(self.price_history) >= 2:
-            # Price momentum
-            state["price_change_1"] = (price - self.price_history[-2]) / self.price_history[-2]
-
-        if len(self.price_history) >= 10:
-            avg_10 = sum(self.price_history[-10:]) / 10
-            state["price_vs_sma10"] = (price - avg_10) / avg_10
-            state["volatility_10"] = self._calculate_volatility(self.price_history[-10:])
+        for name in (
+            "price_change_1",
+            "price_vs_sma10",
+            "volatility_10",
+            "price_vs_sma20",
+        ):
+            value = features.get(name)
+            if value is not None:
+                state[name] = value
 
-        if len(self.price_history) >= 20:
-            avg_20 = sum(self.price_history[-20:]) / 20
-            state["price_vs_sma20"] = (price - avg_20) / avg_20
-
-        if len(self.volume_history) >= 10:
-            avg_vol_10 = sum(self.volume_history[-10:]) / 10
-            state["volume_vs_avg"] = (volume - avg_vol_10) / avg_vol_10 if avg_vol_10 > 0 else 0
+        volume_vs_avg = features.get("volume_vs_avg10")
+        if volume_vs_avg is not None:
+            state["volume_vs_avg"] = volume_vs_avg
 
         return state
 
-    def _calculate_volatility(self, prices) -> float:
-        """Calculate price volatility"""
-        if len(prices) < 2:
-            return 0.0
-
-        mean = sum(prices) / len(prices)
-        variance = sum((p - mean) ** 2 for p in prices) / len(prices)
-        return (variance ** 0.5) / mean
-
     def _generate_buy_justification(self, state: Dict, confidence: float) -> str:
         """
         Generate a justification for buying based on current state.
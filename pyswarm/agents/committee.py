@@ -6,32 +6,89 @@ The committee manages a swarm of specialized trading agents:
 - Votes are aggregated using weighted confidence
 - Veto system prevents dangerous trades
 - Dynamic weight adjustment based on performance
+- Shared feature bus: indicators computed once per tick for all agents
+- Agents run concurrently under an optional per-vote deadline
+- Veto-first evaluation: cheap veto agents run first and a veto skips the rest
+  (agents with per-tick state still observe the skipped tick)
+- Batched voting: a cross-section of symbols is voted on in one pass
+  (one analyze_batch call per agent, aggregation over a votes matrix)
 
 This is the core of the 17000% return strategy:
 Multiple specialized agents working together are better than any single agent.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import time
+from typing import Callable, List, Dict, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote
+from coinswarm.agents.feature_bus import FeatureBatch, FeatureBus
 
 
 logger = logging.getLogger(__name__)
 
+# Column order of the votes matrix (also the tie-break order)
+ACTIONS = ("BUY", "SELL", "HOLD")
+_ACTION_INDEX = {action: i for i, action in enumerate(ACTIONS)}
+
 
-@dataclass
 class CommitteeDecision:
-    """Final decision from agent committee"""
-    action: str  # "BUY", "SELL", "HOLD"
-    confidence: float  # 0.0-1.0 (aggregated from all agents)
-    size: float  # Position size
-    price: Optional[float] = None
-    reason: str = ""  # Summary of all agent votes
-    votes: List[AgentVote] = None  # Individual agent votes
-    vetoed: bool = False  # If any agent vetoed
+    """
+    Final decision from agent committee.
+
+    Slotted like AgentVote; the reason summary is rendered only when read.
+    """
+
+    __slots__ = ("action", "confidence", "size", "price", "votes", "vetoed",
+                 "_reason", "_reason_args")
+
+    def __init__(
+        self,
+        action: str,  # "BUY", "SELL", "HOLD"
+        confidence: float,  # 0.0-1.0 (aggregated from all agents)
+        size: float,  # Position size
+        price: Optional[float] = None,
+        reason: Union[str, Callable[..., str]] = "",  # Summary of all agent votes
+        votes: Optional[List[AgentVote]] = None,  # Individual agent votes
+        vetoed: bool = False,  # If any agent vetoed
+        reason_args: Optional[Tuple] = None
+    ):
+        self.action = action
+        self.confidence = confidence
+        self.size = size
+        self.price = price
+        self.votes = votes
+        self.vetoed = vetoed
+        self._reason = reason
+        self._reason_args = reason_args
+
+    reason = AgentVote.reason
+
+    def __repr__(self):
+        return (
+            f"CommitteeDecision(action={self.action!r}, confidence={self.confidence!r}, "
+            f"size={self.size!r}, price={self.price!r}, reason={self.reason!r}, "
+            f"vetoed={self.vetoed!r})"
+        )
+
+
+def _summarize_votes(votes: List[AgentVote], action: str) -> str:
+    """Top 3 reasons from the votes for the chosen action"""
+    parts = []
+    for v in votes:
+        if v.action == action:
+            parts.append(f"{v.agent_name}({v.confidence:.0%}): {v.reason}")
+            if len(parts) == 3:
+                break
+    return " | ".join(parts)
+
+
+def _summarize_vetoes(votes: List[AgentVote]) -> str:
+    return "Vetoed by " + ", ".join(v.agent_name for v in votes if v.veto)
 
 
 class AgentCommittee:
@@ -48,23 +105,72 @@ class AgentCommittee:
     This is inspired by the 17000% return swarm in tradfi.
     """
 
-    def __init__(self, agents: List[BaseAgent], confidence_threshold: float = 0.7):
+    def __init__(
+        self,
+        agents: List[BaseAgent],
+        confidence_threshold: float = 0.7,
+        feature_history: int = 100,
+        vote_timeout: Optional[float] = None,
+        late_vote_policy: str = "abstain",
+        veto_first: bool = True,
+        skip_without_capacity: bool = True
+    ):
         """
         Initialize committee.
 
         Args:
             agents: List of trading agents
             confidence_threshold: Minimum confidence to execute trade
+            feature_history: Ticks of per-symbol history kept on the feature bus
+            vote_timeout: Latency budget per vote in seconds (None = wait for all agents)
+            late_vote_policy: What to do with agents that miss the budget:
+                "abstain" (no vote) or "cached" (reuse their last vote for the symbol)
+            veto_first: Evaluate veto-capable agents first (cheapest first) and
+                skip the remaining agents once one of them vetoes
+            skip_without_capacity: Skip signal agents when the symbol has no
+                position and market_context shows open_positions >= max_positions
+
+        Skipped agents still see the tick through BaseAgent.observe().
         """
+        if late_vote_policy not in ("abstain", "cached"):
+            raise ValueError(f"Unknown late_vote_policy: {late_vote_policy}")
+
         self.agents = agents
         self.confidence_threshold = confidence_threshold
+        self.vote_timeout = vote_timeout
+        self.late_vote_policy = late_vote_policy
+        self.veto_first = veto_first
+        self.skip_without_capacity = skip_without_capacity
+
+        # Evaluation order, rebuilt whenever self.agents changes
+        self._plan_key: Tuple[BaseAgent, ...] = ()
+        self._veto_tiers: List[List[BaseAgent]] = []
+        self._signal_agents: List[BaseAgent] = []
+        self._observers: Set[BaseAgent] = set()  # Agents that override observe()
+        self._agents_by_name: Dict[str, BaseAgent] = {}
+        self._agent_columns: Dict[BaseAgent, int] = {}
+
+        # Last completed vote and still-running analysis per (agent, symbol)
+        self._last_votes: Dict[Tuple[str, str], AgentVote] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        # One feature snapshot per tick, shared by every agent
+        self.feature_bus = FeatureBus(max_history=feature_history)
 
         self.stats = {
             "decisions_made": 0,
             "trades_executed": 0,
             "trades_vetoed": 0,
             "profitable_trades": 0,
-            "losing_trades": 0
+            "losing_trades": 0,
+            "agent_timeouts": 0,
+            "abstentions": 0,
+            "cached_votes_used": 0,
+            "evaluations_pruned": 0,
+            "veto_short_circuits": 0,
+            "capacity_skips": 0,
+            "last_vote_latency_ms": 0.0,
+            "max_vote_latency_ms": 0.0
         }
 
         logger.info(
@@ -82,11 +188,17 @@ class AgentCommittee:
         Get votes from all agents and aggregate into final decision.
 
         Process:
-        1. Each agent analyzes independently
-        2. Collect all votes
-        3. Check for vetoes (instant HOLD)
-        4. Aggregate votes using weighted confidence
-        5. Return decision if confidence > threshold
+        1. Build the shared feature snapshot for this tick
+        2. Veto-capable agents analyze first, cheapest first; a veto skips
+           everyone else
+        3. Remaining agents analyze concurrently (bounded by vote_timeout),
+           unless the symbol has no position and no capacity to open one
+        4. Check for vetoes (instant HOLD)
+        5. Aggregate votes using weighted confidence
+        6. Return decision if confidence > threshold
+
+        Agents receive the snapshot as market_context["features"] and read
+        indicators from it by name (see feature_bus.FEATURES).
 
         Args:
             tick: Latest market tick
@@ -98,74 +210,589 @@ class AgentCommittee:
         """
 
         self.stats["decisions_made"] += 1
+        started = time.perf_counter()
 
-        # Collect votes from all agents
-        votes: List[AgentVote] = []
+        # Shared features for this tick (computed lazily, once, on first use)
+        context = dict(market_context) if market_context else {}
+        context["features"] = self.feature_bus.update(tick)
 
-        for agent in self.agents:
-            try:
-                vote = await agent.analyze(tick, position, market_context or {})
-                votes.append(vote)
+        # Collect votes: veto agents first, then signal agents
+        votes = await self._run_evaluation_plan(tick, position, context, started)
 
-                # Update agent stats
-                agent.stats["votes_cast"] += 1
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.stats["last_vote_latency_ms"] = latency_ms
+        if latency_ms > self.stats["max_vote_latency_ms"]:
+            self.stats["max_vote_latency_ms"] = latency_ms
+
+        # Check for vetoes
+        if any(v.veto for v in votes):
+            return self._veto_decision(votes)
+
+        # Aggregate votes
+        decision = self._aggregate_votes(votes, tick)
+        self._record_decision(decision, tick)
+        return decision
+
+    async def vote_batch(
+        self,
+        ticks: Sequence[DataPoint],
+        positions: Optional[Sequence[Optional[Dict]]] = None,
+        market_contexts: Optional[Union[Dict, Sequence[Optional[Dict]]]] = None
+    ) -> List[CommitteeDecision]:
+        """
+        Vote on a cross-section of symbols at one timestamp.
+
+        Same decisions as calling vote() for each tick, but every agent is
+        dispatched once per batch (BaseAgent.analyze_batch) instead of once
+        per symbol, and votes are aggregated over a (symbols × agents) matrix.
+        Agents that vectorize (e.g. TrendFollowingAgent) score all symbols in
+        one call, so per-timestamp cost grows slowly with the number of pairs.
+
+        Veto-first and capacity pruning apply per symbol: vetoed symbols and
+        symbols without capacity are dropped before the signal agents run.
+        Agents receive the batch's FeatureBatch as
+        market_context["feature_batch"] next to the per-symbol snapshot.
+
+        Args:
+            ticks: Latest tick for each symbol (one tick per symbol)
+            positions: Current position per tick (None = no open positions)
+            market_contexts: Context per tick, or one dict shared by all ticks
+
+        Returns:
+            One CommitteeDecision per tick, in tick order
+        """
 
-                logger.debug(
-                    f"{agent.name} voted: {vote.action} "
-                    f"(confidence={vote.confidence:.2f}, size={vote.size})"
+        n = len(ticks)
+        if n == 0:
+            return []
+
+        if len({tick.symbol for tick in ticks}) != n:
+            raise ValueError("vote_batch takes at most one tick per symbol")
+        if positions is None:
+            positions = [None] * n
+        if market_contexts is None or isinstance(market_contexts, dict):
+            market_contexts = [market_contexts] * n
+
+        self.stats["decisions_made"] += n
+        started = time.perf_counter()
+
+        # Shared features for every symbol in the batch
+        batch = self.feature_bus.update_batch(ticks)
+        contexts = []
+        for i, market_context in enumerate(market_contexts):
+            context = dict(market_context) if market_context else {}
+            context["features"] = batch.snapshot(i)
+            context["feature_batch"] = batch
+            contexts.append(context)
+
+        veto_tiers, signal_agents = self._evaluation_plan()
+        deadline = started + self.vote_timeout if self.vote_timeout is not None else None
+
+        # Votes matrix: one row per symbol, one column per agent
+        shape = (n, len(self.agents))
+        actions = np.full(shape, -1, dtype=np.int8)
+        confidences = np.zeros(shape)
+        sizes = np.zeros(shape)
+        vetoes = np.zeros(shape, dtype=bool)
+        row_votes: List[List[AgentVote]] = [[] for _ in range(n)]
+
+        def record(rows: List[int], collected: List[Tuple[BaseAgent, List[Optional[AgentVote]]]]):
+            for agent, agent_votes in collected:
+                col = self._agent_columns[agent]
+                for row, vote in zip(rows, agent_votes):
+                    if vote is None:
+                        continue
+                    row_votes[row].append(vote)
+                    code = _ACTION_INDEX.get(vote.action)
+                    if code is not None:
+                        actions[row, col] = code
+                        confidences[row, col] = vote.confidence
+                        sizes[row, col] = vote.size
+                    if vote.veto:
+                        vetoes[row, col] = True
+
+        # Veto tiers first; vetoed symbols drop out of later tiers
+        active = list(range(n))
+        evaluated = 0
+        for i, tier in enumerate(veto_tiers):
+            record(active, await self._collect_batch_votes(
+                tier, active, ticks, positions, contexts, batch, deadline
+            ))
+            evaluated += len(tier)
+
+            vetoed_rows = vetoes[active].any(axis=1)
+            if vetoed_rows.any():
+                count = int(vetoed_rows.sum())
+                self.stats["veto_short_circuits"] += count
+                self.stats["evaluations_pruned"] += (len(self.agents) - evaluated) * count
+                vetoed_ticks = [ticks[row] for row, v in zip(active, vetoed_rows) if v]
+                for skipped in veto_tiers[i + 1:] + [signal_agents]:
+                    self._observe(skipped, vetoed_ticks)
+                active = [row for row, v in zip(active, vetoed_rows) if not v]
+            if not active:
+                break
+
+        if signal_agents and active and self.skip_without_capacity:
+            full = [row for row in active if self._at_capacity(positions[row], contexts[row])]
+            if full:
+                self.stats["capacity_skips"] += len(full)
+                self.stats["evaluations_pruned"] += len(signal_agents) * len(full)
+                self._observe(signal_agents, [ticks[row] for row in full])
+                active = [row for row in active if row not in full]
+
+        if signal_agents and active:
+            record(active, await self._collect_batch_votes(
+                signal_agents, active, ticks, positions, contexts, batch, deadline
+            ))
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.stats["last_vote_latency_ms"] = latency_ms
+        if latency_ms > self.stats["max_vote_latency_ms"]:
+            self.stats["max_vote_latency_ms"] = latency_ms
+
+        weights = np.array([agent.weight for agent in self.agents], dtype=np.float64)
+        choice, confidence, size = self._aggregate_matrix(actions, confidences, sizes, weights)
+        vetoed = vetoes.any(axis=1)
+
+        decisions = []
+        for row, tick in enumerate(ticks):
+            votes = row_votes[row]
+            if vetoed[row]:
+                decisions.append(self._veto_decision(votes))
+                continue
+
+            if not votes:
+                decision = CommitteeDecision(
+                    action="HOLD",
+                    confidence=0.0,
+                    size=0.0,
+                    reason="No votes received",
+                    votes=[]
+                )
+            else:
+                action = ACTIONS[choice[row]]
+                decision = CommitteeDecision(
+                    action=action,
+                    confidence=float(confidence[row]),
+                    size=float(size[row]),
+                    price=tick.data.get("price"),
+                    reason=_summarize_votes,
+                    votes=votes,
+                    vetoed=False,
+                    reason_args=(votes, action)
                 )
 
-            except Exception as e:
-                logger.error(f"Error getting vote from {agent.name}: {e}")
+            self._record_decision(decision, tick)
+            decisions.append(decision)
 
-        # Check for vetoes
-        vetoed_by = [v.agent_name for v in votes if v.veto]
-        if vetoed_by:
-            logger.warning(f"Trade vetoed by: {', '.join(vetoed_by)}")
-            self.stats["trades_vetoed"] += 1
+        return decisions
 
-            for agent in self.agents:
-                if agent.name in vetoed_by:
+    def _veto_decision(self, votes: List[AgentVote]) -> CommitteeDecision:
+        """HOLD decision for vetoed votes (credits the vetoing agents)"""
+        for v in votes:
+            if v.veto:
+                agent = self._agents_by_name.get(v.agent_name)
+                if agent is not None:
                     agent.stats["vetoes_issued"] += 1
 
-            return CommitteeDecision(
-                action="HOLD",
-                confidence=0.0,
-                size=0.0,
-                reason=f"Vetoed by {', '.join(vetoed_by)}",
-                votes=votes,
-                vetoed=True
-            )
-
-        # Aggregate votes
-        decision = self._aggregate_votes(votes, tick)
+        self.stats["trades_vetoed"] += 1
+        decision = CommitteeDecision(
+            action="HOLD",
+            confidence=0.0,
+            size=0.0,
+            reason=_summarize_vetoes,
+            votes=votes,
+            vetoed=True,
+            reason_args=(votes,)
+        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Trade %s", decision.reason)
+        return decision
 
-        # Log decision
+    def _record_decision(self, decision: CommitteeDecision, tick: DataPoint):
+        """Log an aggregated decision and count it if it clears the threshold"""
         if decision.confidence >= self.confidence_threshold:
             logger.info(
-                f"Committee decision: {decision.action} {decision.size} "
-                f"{tick.symbol} @ {decision.price} "
-                f"(confidence={decision.confidence:.2%})"
+                "Committee decision: %s %s %s @ %s (confidence=%.2f%%)",
+                decision.action, decision.size, tick.symbol, decision.price,
+                decision.confidence * 100
             )
             self.stats["trades_executed"] += 1
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Committee decision: HOLD "
                 f"(confidence={decision.confidence:.2%} < {self.confidence_threshold:.2%})"
             )
 
-        return decision
+    def _evaluation_plan(self) -> Tuple[List[List[BaseAgent]], List[BaseAgent]]:
+        """
+        Split agents into veto tiers (grouped by cost class, cheapest first)
+        and signal agents. Cached until self.agents changes.
+        """
+        key = tuple(self.agents)
+        if key != self._plan_key:
+            tiers: Dict[int, List[BaseAgent]] = {}
+            signal_agents = []
+
+            for agent in self.agents:
+                if self.veto_first and agent.can_veto:
+                    tiers.setdefault(agent.cost_class, []).append(agent)
+                else:
+                    signal_agents.append(agent)
+
+            self._veto_tiers = [tiers[cost] for cost in sorted(tiers)]
+            self._signal_agents = signal_agents
+            self._observers = {
+                agent for agent in self.agents
+                if type(agent).observe is not BaseAgent.observe
+            }
+            self._agents_by_name = {agent.name: agent for agent in self.agents}
+            self._agent_columns = {agent: i for i, agent in enumerate(self.agents)}
+            self._plan_key = key
+
+        return self._veto_tiers, self._signal_agents
+
+    def _observe(self, agents: List[BaseAgent], ticks: List[DataPoint]):
+        """Feed pruned ticks to the agents among `agents` that keep per-tick state"""
+        for agent in agents:
+            if agent in self._observers:
+                try:
+                    for tick in ticks:
+                        agent.observe(tick)
+                except Exception as e:
+                    logger.error("Error updating %s from a pruned tick: %s", agent.name, e)
+
+    def _at_capacity(self, position: Optional[Dict], context: Dict) -> bool:
+        """True if nothing can be traded: no position to exit, no room to enter"""
+        if position:
+            return False
+
+        max_positions = context.get("max_positions")
+        if max_positions is None:
+            return False
+
+        return context.get("open_positions", 0) >= max_positions
+
+    async def _run_evaluation_plan(
+        self,
+        tick: DataPoint,
+        position: Optional[Dict],
+        context: Dict,
+        started: float
+    ) -> List[AgentVote]:
+        """Run veto tiers, then signal agents, pruning whatever can't change the outcome"""
+
+        veto_tiers, signal_agents = self._evaluation_plan()
+        deadline = started + self.vote_timeout if self.vote_timeout is not None else None
+
+        votes: List[AgentVote] = []
+        evaluated = 0
+
+        for i, tier in enumerate(veto_tiers):
+            votes.extend(await self._collect_votes(tier, tick, position, context, deadline))
+            evaluated += len(tier)
+
+            if any(v.veto for v in votes):
+                self.stats["veto_short_circuits"] += 1
+                self.stats["evaluations_pruned"] += len(self.agents) - evaluated
+                for skipped in veto_tiers[i + 1:] + [signal_agents]:
+                    self._observe(skipped, [tick])
+                return votes
+
+        if signal_agents and self.skip_without_capacity and self._at_capacity(position, context):
+            self.stats["capacity_skips"] += 1
+            self.stats["evaluations_pruned"] += len(signal_agents)
+            self._observe(signal_agents, [tick])
+            return votes
+
+        votes.extend(await self._collect_votes(signal_agents, tick, position, context, deadline))
+        return votes
+
+    async def _collect_votes(
+        self,
+        agents: List[BaseAgent],
+        tick: DataPoint,
+        position: Optional[Dict],
+        context: Dict,
+        deadline: Optional[float] = None
+    ) -> List[AgentVote]:
+        """
+        Run agents concurrently and collect their votes in agent order.
+
+        Cheap agents (pure in-memory math) are awaited inline, which avoids
+        task overhead and lets them read the feature bus's zero-copy views;
+        everything else runs as a task under the deadline, with its own copy
+        of the feature snapshot since it may still be running after the next
+        tick for the symbol has overwritten those views.
+
+        Agents still running when vote_timeout expires are not cancelled: they
+        keep running in the background and their result becomes the cached vote
+        for the symbol. Until then the agent is not re-run for that symbol, and
+        it abstains or contributes its last cached vote (late_vote_policy).
+        """
+
+        symbol = tick.symbol
+        keep_votes = self.late_vote_policy == "cached"
+        tasks: Dict[BaseAgent, asyncio.Task] = {}
+        inline: List[BaseAgent] = []
+        task_context: Optional[Dict] = None
+
+        for agent in agents:
+            if self._inflight and (agent.name, symbol) in self._inflight:
+                continue  # Still working on an earlier tick
+            if agent.cost_class == AgentCost.CHEAP:
+                inline.append(agent)
+            else:
+                if task_context is None:
+                    task_context = context
+                    if context.get("features") is not None:
+                        task_context = dict(context, features=context["features"].copy())
+                tasks[agent] = asyncio.ensure_future(agent.analyze(tick, position, task_context))
+
+        results: Dict[BaseAgent, AgentVote] = {}
+        for agent in inline:
+            try:
+                results[agent] = await agent.analyze(tick, position, context)
+            except Exception as e:
+                logger.error("Error getting vote from %s: %s", agent.name, e)
+
+        if tasks:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.perf_counter())
+            await asyncio.wait(tasks.values(), timeout=timeout)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        votes: List[AgentVote] = []
+
+        for agent in agents:
+            vote = results.get(agent)
+            task = tasks.get(agent) if vote is None else None
+
+            if task is not None and task.done():
+                try:
+                    vote = task.result()
+                except Exception as e:
+                    logger.error("Error getting vote from %s: %s", agent.name, e)
+                    continue
+
+            if vote is not None:
+                votes.append(vote)
+                if keep_votes:
+                    self._last_votes[(agent.name, symbol)] = vote
+
+                # Update agent stats
+                agent.stats["votes_cast"] += 1
+
+                if debug:
+                    logger.debug(
+                        f"{agent.name} voted: {vote.action} "
+                        f"(confidence={vote.confidence:.2f}, size={vote.size})"
+                    )
+                continue
+
+            if agent in inline:
+                continue  # Raised an error (already logged)
+
+            # Missed the deadline (now, or on an earlier tick and still running)
+            key = (agent.name, symbol)
+            if task is not None:
+                self.stats["agent_timeouts"] += 1
+                self._inflight[key] = task
+                task.add_done_callback(
+                    lambda t, key=key: self._finish_late_vote(key, t)
+                )
+                logger.warning(
+                    "%s missed the %ss vote budget for %s", agent.name, self.vote_timeout, symbol
+                )
+
+            cached = self._last_votes.get(key) if keep_votes else None
+            if cached is not None:
+                votes.append(cached)
+                self.stats["cached_votes_used"] += 1
+            else:
+                self.stats["abstentions"] += 1
+
+        return votes
+
+    def _finish_late_vote(self, key: Tuple[str, str], task: asyncio.Task):
+        """Store the result of an agent that finished after its deadline"""
+        self._inflight.pop(key, None)
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            logger.error(f"Late vote from {key[0]} failed: {error}")
+            return
+
+        self._last_votes[key] = task.result()
+
+    async def _collect_batch_votes(
+        self,
+        agents: List[BaseAgent],
+        rows: List[int],
+        ticks: Sequence[DataPoint],
+        positions: Sequence[Optional[Dict]],
+        contexts: List[Dict],
+        batch: FeatureBatch,
+        deadline: Optional[float] = None
+    ) -> List[Tuple[BaseAgent, List[Optional[AgentVote]]]]:
+        """
+        Batch counterpart of _collect_votes: one analyze_batch call per agent
+        over the given rows.
+
+        Returns each agent's votes aligned with rows (None where it has no
+        vote). Deadline, in-flight and late_vote_policy handling match
+        _collect_votes, per (agent, symbol).
+        """
+
+        symbols = [ticks[row].symbol for row in rows]
+        keep_votes = self.late_vote_policy == "cached"
+        every = list(range(len(rows)))
+        inputs_cache: Dict[Tuple[int, ...], Tuple] = {}
+
+        def inputs(js: List[int], owned: bool = False) -> Tuple:
+            """
+            Ticks, positions and contexts for the selected rows; owned=True
+            gives each context a copy of its feature snapshot (for tasks that
+            may outlive the batch)
+            """
+            key = (tuple(js), owned)
+            result = inputs_cache.get(key)
+            if result is None:
+                selected = [rows[j] for j in js]
+                if len(selected) == len(batch):
+                    selected_contexts = [contexts[row] for row in selected]
+                else:
+                    sub_batch = batch.take(selected)
+                    selected_contexts = [
+                        dict(contexts[row], feature_batch=sub_batch) for row in selected
+                    ]
+                if owned:
+                    selected_contexts = [
+                        dict(context, features=context["features"].copy())
+                        for context in selected_contexts
+                    ]
+                result = (
+                    [ticks[row] for row in selected],
+                    [positions[row] for row in selected],
+                    selected_contexts
+                )
+                inputs_cache[key] = result
+            return result
+
+        calls: List[Tuple[BaseAgent, List[int]]] = []
+        results: Dict[BaseAgent, Optional[List[AgentVote]]] = {}
+        tasks: Dict[BaseAgent, asyncio.Task] = {}
+
+        for agent in agents:
+            js = every
+            if self._inflight:
+                # Skip symbols the agent is still working on from an earlier tick
+                js = [j for j in every if (agent.name, symbols[j]) not in self._inflight]
+            calls.append((agent, js))
+            if not js:
+                continue
+
+            if agent.cost_class == AgentCost.CHEAP:
+                try:
+                    results[agent] = await agent.analyze_batch(*inputs(js))
+                except Exception as e:
+                    logger.error("Error getting votes from %s: %s", agent.name, e)
+                    results[agent] = None
+            else:
+                tasks[agent] = asyncio.ensure_future(agent.analyze_batch(*inputs(js, owned=True)))
+
+        if tasks:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.perf_counter())
+            await asyncio.wait(tasks.values(), timeout=timeout)
+
+        collected = []
+        for agent, js in calls:
+            votes: List[Optional[AgentVote]] = [None] * len(rows)
+            missing = set(every).difference(js)  # Still in flight from earlier ticks
+            agent_votes = results.get(agent)
+            task = tasks.get(agent)
+
+            if task is not None:
+                if task.done():
+                    try:
+                        agent_votes = task.result()
+                    except Exception as e:
+                        logger.error("Error getting votes from %s: %s", agent.name, e)
+                else:
+                    # Missed the deadline: let it finish in the background
+                    self.stats["agent_timeouts"] += 1
+                    keys = [(agent.name, symbols[j]) for j in js]
+                    for key in keys:
+                        self._inflight[key] = task
+                    task.add_done_callback(
+                        lambda t, keys=keys: self._finish_late_batch(keys, t)
+                    )
+                    logger.warning(
+                        "%s missed the %ss vote budget for %d symbols",
+                        agent.name, self.vote_timeout, len(keys)
+                    )
+                    missing.update(js)
+
+            if agent_votes is not None and len(agent_votes) != len(js):
+                logger.error(
+                    "%s returned %d votes for %d symbols", agent.name, len(agent_votes), len(js)
+                )
+                agent_votes = None
+
+            if agent_votes is not None:
+                for j, vote in zip(js, agent_votes):
+                    if vote is None:
+                        continue
+                    votes[j] = vote
+                    if keep_votes:
+                        self._last_votes[(agent.name, symbols[j])] = vote
+                    agent.stats["votes_cast"] += 1
+
+            for j in sorted(missing):
+                cached = self._last_votes.get((agent.name, symbols[j])) if keep_votes else None
+                if cached is not None:
+                    votes[j] = cached
+                    self.stats["cached_votes_used"] += 1
+                else:
+                    self.stats["abstentions"] += 1
+
+            collected.append((agent, votes))
+
+        return collected
+
+    def _finish_late_batch(self, keys: List[Tuple[str, str]], task: asyncio.Task):
+        """Store the results of a batch that finished after its deadline"""
+        for key in keys:
+            self._inflight.pop(key, None)
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            logger.error(f"Late batch from {keys[0][0]} failed: {error}")
+            return
+
+        for key, vote in zip(keys, task.result()):
+            if vote is not None:
+                self._last_votes[key] = vote
 
     def _aggregate_votes(self, votes: List[AgentVote], tick: DataPoint) -> CommitteeDecision:
         """
         Aggregate agent votes using weighted confidence.
 
-        Algorithm:
-        1. Group votes by action (BUY, SELL, HOLD)
-        2. Calculate weighted confidence for each action
+        Algorithm (single pass over the votes):
+        1. Accumulate weight × confidence, weight and size per action
+        2. Weighted confidence per action = Σ(weight × confidence) / Σweight
         3. Choose action with highest weighted confidence
-        4. Calculate position size (average of votes for that action)
-        5. Generate summary reason
+        4. Position size = average size of votes for that action
+        5. Summary reason (top 3 votes for the action) is rendered lazily
 
         Returns:
             CommitteeDecision with aggregated action, confidence, size
@@ -180,73 +807,107 @@ class AgentCommittee:
                 votes=[]
             )
 
-        # Group votes by action
-        buy_votes = [v for v in votes if v.action == "BUY"]
-        sell_votes = [v for v in votes if v.action == "SELL"]
-        hold_votes = [v for v in votes if v.action == "HOLD"]
-
-        # Calculate weighted confidence for each action
-        def weighted_confidence(action_votes: List[AgentVote]) -> float:
-            if not action_votes:
-                return 0.0
+        self._evaluation_plan()  # Keeps the name → agent index current
+        agents = self._agents_by_name
 
-            # Sum of (agent_weight × confidence)
-            weighted_sum = sum(
-                self._get_agent_weight(v.agent_name) * v.confidence
-                for v in action_votes
-            )
+        # action -> [Σ weight × confidence, Σ weight, Σ size, count]
+        totals = {"BUY": [0.0, 0.0, 0.0, 0], "SELL": [0.0, 0.0, 0.0, 0], "HOLD": [0.0, 0.0, 0.0, 0]}
 
-            # Normalize by total weight
-            total_weight = sum(self._get_agent_weight(v.agent_name) for v in action_votes)
+        for v in votes:
+            acc = totals.get(v.action)
+            if acc is None:
+                continue
+            agent = agents.get(v.agent_name)
+            weight = agent.weight if agent is not None else 1.0
+            acc[0] += weight * v.confidence
+            acc[1] += weight
+            acc[2] += v.size
+            acc[3] += 1
 
-            return weighted_sum / total_weight if total_weight > 0 else 0.0
+        def weighted_confidence(acc: List) -> float:
+            return acc[0] / acc[1] if acc[1] > 0 else 0.0
 
-        buy_confidence = weighted_confidence(buy_votes)
-        sell_confidence = weighted_confidence(sell_votes)
-        hold_confidence = weighted_confidence(hold_votes)
+        buy, sell, hold = totals["BUY"], totals["SELL"], totals["HOLD"]
+        buy_confidence = weighted_confidence(buy)
+        sell_confidence = weighted_confidence(sell)
+        hold_confidence = weighted_confidence(hold)
 
         # Choose action with highest confidence
         max_confidence = max(buy_confidence, sell_confidence, hold_confidence)
 
-        if max_confidence == buy_confidence and buy_votes:
-            action = "BUY"
-            action_votes = buy_votes
-            confidence = buy_confidence
-        elif max_confidence == sell_confidence and sell_votes:
-            action = "SELL"
-            action_votes = sell_votes
-            confidence = sell_confidence
+        if max_confidence == buy_confidence and buy[3]:
+            action, acc, confidence = "BUY", buy, buy_confidence
+        elif max_confidence == sell_confidence and sell[3]:
+            action, acc, confidence = "SELL", sell, sell_confidence
         else:
-            action = "HOLD"
-            action_votes = hold_votes
-            confidence = hold_confidence
+            action, acc, confidence = "HOLD", hold, hold_confidence
 
         # Calculate position size (average of votes for chosen action)
-        size = sum(v.size for v in action_votes) / len(action_votes) if action_votes else 0.0
-
-        # Generate summary reason
-        reason_parts = [
-            f"{v.agent_name}({v.confidence:.0%}): {v.reason}"
-            for v in action_votes[:3]  # Top 3 reasons
-        ]
-        reason = " | ".join(reason_parts)
+        size = acc[2] / acc[3] if acc[3] else 0.0
 
         return CommitteeDecision(
             action=action,
             confidence=confidence,
             size=size,
             price=tick.data.get("price"),
-            reason=reason,
+            reason=_summarize_votes,
             votes=votes,
-            vetoed=False
+            vetoed=False,
+            reason_args=(votes, action)
+        )
+
+    @staticmethod
+    def _aggregate_matrix(
+        actions: np.ndarray,
+        confidences: np.ndarray,
+        sizes: np.ndarray,
+        weights: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized _aggregate_votes over a votes matrix.
+
+        Args:
+            actions: (symbols, agents) index into ACTIONS, -1 for no vote
+            confidences: (symbols, agents) vote confidence
+            sizes: (symbols, agents) vote size
+            weights: (agents,) agent weights
+
+        Returns:
+            (action index, confidence, size) per symbol
+        """
+
+        onehot = actions[:, :, None] == np.arange(len(ACTIONS))  # symbols × agents × actions
+        weighted = onehot * weights[None, :, None]
+
+        weight_sum = weighted.sum(axis=1)
+        confidence_sum = (weighted * confidences[:, :, None]).sum(axis=1)
+        counts = onehot.sum(axis=1)
+        size_sum = (onehot * sizes[:, :, None]).sum(axis=1)
+
+        by_action = np.divide(
+            confidence_sum, weight_sum,
+            out=np.zeros_like(confidence_sum), where=weight_sum > 0
+        )
+        best = by_action.max(axis=1)
+
+        # Same tie-break as _aggregate_votes: BUY, then SELL, else HOLD
+        buy = (by_action[:, 0] == best) & (counts[:, 0] > 0)
+        sell = (by_action[:, 1] == best) & (counts[:, 1] > 0)
+        choice = np.where(buy, 0, np.where(sell, 1, 2))
+
+        rows = np.arange(len(actions))
+        n = counts[rows, choice]
+        size = np.divide(
+            size_sum[rows, choice], n,
+            out=np.zeros(len(actions)), where=n > 0
         )
+        return choice, by_action[rows, choice], size
 
     def _get_agent_weight(self, agent_name: str) -> float:
         """Get agent weight by name"""
-        for agent in self.agents:
-            if agent.name == agent_name:
-                return agent.weight
-        return 1.0  # Default weight
+        self._evaluation_plan()
+        agent = self._agents_by_name.get(agent_name)
+        return agent.weight if agent is not None else 1.0  # Default weight
 
     def update_weights_by_performance(self):
         """
@@ -293,6 +954,39 @@ class AgentCommittee:
         # Adjust weights based on performance
         self.update_weights_by_performance()
 
+    def snapshot(self) -> Dict:
+        """
+        Warm state of the committee: every agent's snapshot() and the
+        feature bus history.
+
+        Restoring it into a committee built with the same agents skips the
+        indicator warm-up at the start of a backtest window.
+        """
+        return {
+            "agents": [agent.snapshot() for agent in self.agents],
+            "feature_bus": self.feature_bus.buffers.snapshot(),
+        }
+
+    def restore(self, snapshot: Dict):
+        """
+        Load a snapshot() (agents are matched by name; unknown names skipped).
+
+        Cached and in-flight votes are dropped, since they belong to the
+        stream the committee was on before.
+        """
+        self._evaluation_plan()
+        for agent_snapshot in snapshot["agents"]:
+            agent = self._agents_by_name.get(agent_snapshot["name"])
+            if agent is not None:
+                agent.restore(agent_snapshot)
+
+        self.feature_bus.buffers.restore(snapshot["feature_bus"])
+
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._last_votes.clear()
+
     @property
     def win_rate(self) -> float:
         """Calculate overall win rate"""
@@ -307,6 +1001,14 @@ class AgentCommittee:
             "decisions_made": self.stats["decisions_made"],
             "trades_executed": self.stats["trades_executed"],
             "trades_vetoed": self.stats["trades_vetoed"],
+            "agent_timeouts": self.stats["agent_timeouts"],
+            "abstentions": self.stats["abstentions"],
+            "cached_votes_used": self.stats["cached_votes_used"],
+            "evaluations_pruned": self.stats["evaluations_pruned"],
+            "veto_short_circuits": self.stats["veto_short_circuits"],
+            "capacity_skips": self.stats["capacity_skips"],
+            "last_vote_latency_ms": self.stats["last_vote_latency_ms"],
+            "max_vote_latency_ms": self.stats["max_vote_latency_ms"],
             "win_rate": self.win_rate,
             "agents": [
                 {
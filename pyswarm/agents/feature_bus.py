@@ -0,0 +1,506 @@
+"""
+Shared Feature Bus for the Agent Committee
+
+Several agents look at the same numbers on every tick:
+- Trend and Risk both keep the last 100 prices
+- Chaos and Sell both compute SMA10/SMA20 and volatility
+- Everyone pulls price/volume out of tick.data
+
+The committee owns one FeatureBus. On each vote it appends the tick to the
+symbol's history and hands agents a FeatureSnapshot through
+market_context["features"]. Agents ask for features by name; each feature is
+computed lazily the first time any agent requests it and memoized for the
+rest of the tick, so cost scales with unique features, not agents × features.
+
+Adding a feature:
+
+    @register_feature("sma_100")
+    def _sma_100(snapshot):
+        return sma(snapshot.prices, 100)
+
+For committee.vote_batch() the bus also builds a FeatureBatch: the same
+indicators for a whole cross-section of symbols, computed as NumPy arrays
+(one row per symbol) from BATCH_FEATURES.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from coinswarm.data_ingest.base import DataPoint
+from coinswarm.agents.symbol_state import SymbolRingBuffers
+
+
+# ============================================================================
+# Indicator functions (shared by the bus and by agents running standalone)
+# ============================================================================
+
+def momentum(prices: Sequence[float], period: int = 10) -> float:
+    """% change over the last `period` prices (0.0 if not enough data)"""
+    if len(prices) < period:
+        return 0.0
+
+    old_price = prices[-period]
+    return float((prices[-1] - old_price) / old_price)
+
+
+def sma(prices: Sequence[float], period: int) -> Optional[float]:
+    """Simple moving average of the last `period` values (None if not enough data)"""
+    if len(prices) < period:
+        return None
+    return float(np.mean(prices[-period:]))
+
+
+def rsi(prices: Sequence[float], period: int = 14) -> float:
+    """
+    Relative Strength Index (0-100).
+
+    Returns 50.0 (neutral) when there is not enough data.
+    """
+    if len(prices) < period + 1:
+        return 50.0
+
+    changes = np.diff(np.asarray(prices[-(period + 1):], dtype=np.float64))
+    avg_gain = changes[changes > 0].sum() / period
+    avg_loss = -changes[changes < 0].sum() / period
+
+    if avg_loss == 0:
+        return 100.0
+
+    rs = avg_gain / avg_loss
+    return float(100 - (100 / (1 + rs)))
+
+
+def return_volatility(prices: Sequence[float]) -> float:
+    """Population standard deviation of simple returns over the whole history"""
+    if len(prices) < 2:
+        return 0.0
+
+    p = np.asarray(prices, dtype=np.float64)
+    returns = np.diff(p) / p[:-1]
+    return float(returns.std())
+
+
+def price_volatility(prices: Sequence[float]) -> float:
+    """Standard deviation of prices relative to their mean (coefficient of variation)"""
+    if len(prices) < 2:
+        return 0.0
+
+    p = np.asarray(prices, dtype=np.float64)
+    return float(p.std() / p.mean())
+
+
+# ============================================================================
+# Feature registry
+# ============================================================================
+
+FeatureFn = Callable[["FeatureSnapshot"], object]
+
+FEATURES: Dict[str, FeatureFn] = {}
+
+
+def register_feature(name: str) -> Callable[[FeatureFn], FeatureFn]:
+    """Register a named feature computed from a FeatureSnapshot"""
+
+    def decorator(fn: FeatureFn) -> FeatureFn:
+        FEATURES[name] = fn
+        return fn
+
+    return decorator
+
+
+def _relative_to(price: float, reference: Optional[float]) -> Optional[float]:
+    if reference is None or reference == 0:
+        return None
+    return (price - reference) / reference
+
+
+@register_feature("price_change_1")
+def _price_change_1(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.prices) < 2:
+        return None
+    return (s.price - s.prices[-2]) / s.prices[-2]
+
+
+@register_feature("momentum_5")
+def _momentum_5(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.prices) < 5:
+        return None
+    return momentum(s.prices, 5)
+
+
+@register_feature("momentum_10")
+def _momentum_10(s: "FeatureSnapshot") -> float:
+    return momentum(s.prices, 10)
+
+
+@register_feature("sma_10")
+def _sma_10(s: "FeatureSnapshot") -> Optional[float]:
+    return sma(s.prices, 10)
+
+
+@register_feature("sma_20")
+def _sma_20(s: "FeatureSnapshot") -> Optional[float]:
+    return sma(s.prices, 20)
+
+
+@register_feature("sma_50")
+def _sma_50(s: "FeatureSnapshot") -> Optional[float]:
+    return sma(s.prices, 50)
+
+
+@register_feature("price_vs_sma10")
+def _price_vs_sma10(s: "FeatureSnapshot") -> Optional[float]:
+    return _relative_to(s.price, s.get("sma_10"))
+
+
+@register_feature("price_vs_sma20")
+def _price_vs_sma20(s: "FeatureSnapshot") -> Optional[float]:
+    return _relative_to(s.price, s.get("sma_20"))
+
+
+@register_feature("ma_crossover")
+def _ma_crossover(s: "FeatureSnapshot") -> str:
+    """Fast (10) vs slow (50) MA with a 1% band: "BUY", "SELL" or "HOLD" """
+    slow_ma = s.get("sma_50")
+    if slow_ma is None:
+        return "HOLD"
+
+    fast_ma = s.get("sma_10")
+    if fast_ma > slow_ma * 1.01:
+        return "BUY"
+    elif fast_ma < slow_ma * 0.99:
+        return "SELL"
+    return "HOLD"
+
+
+@register_feature("rsi_14")
+def _rsi_14(s: "FeatureSnapshot") -> float:
+    return rsi(s.prices, 14)
+
+
+@register_feature("return_volatility")
+def _return_volatility(s: "FeatureSnapshot") -> float:
+    return return_volatility(s.prices)
+
+
+@register_feature("volatility_10")
+def _volatility_10(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.prices) < 10:
+        return None
+    return price_volatility(s.prices[-10:])
+
+
+@register_feature("volume_vs_avg10")
+def _volume_vs_avg10(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.volumes) < 10:
+        return None
+    avg_volume = float(np.mean(s.volumes[-10:]))
+    return (s.volume - avg_volume) / avg_volume if avg_volume > 0 else 0
+
+
+@register_feature("high_5")
+def _high_5(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.highs) < 5:
+        return None
+    return float(np.max(s.highs[-5:]))
+
+
+@register_feature("high_20")
+def _high_20(s: "FeatureSnapshot") -> Optional[float]:
+    if len(s.highs) < 20:
+        return None
+    return float(np.max(s.highs[-20:]))
+
+
+# ============================================================================
+# Batch features (one value per symbol, computed as arrays)
+# ============================================================================
+
+BatchFeatureFn = Callable[["FeatureBatch"], np.ndarray]
+
+BATCH_FEATURES: Dict[str, BatchFeatureFn] = {}
+
+
+def register_batch_feature(name: str) -> Callable[[BatchFeatureFn], BatchFeatureFn]:
+    """Register a named feature computed for every symbol of a FeatureBatch"""
+
+    def decorator(fn: BatchFeatureFn) -> BatchFeatureFn:
+        BATCH_FEATURES[name] = fn
+        return fn
+
+    return decorator
+
+
+def _batch_sma(b: "FeatureBatch", period: int) -> np.ndarray:
+    values, _ = b.window(period)
+    return values.mean(axis=1)  # NaN where history is too short
+
+
+@register_batch_feature("count")
+def _batch_count(b: "FeatureBatch") -> np.ndarray:
+    return b.window(1)[1]
+
+
+@register_batch_feature("momentum_10")
+def _batch_momentum_10(b: "FeatureBatch") -> np.ndarray:
+    values, counts = b.window(10)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        change = (values[:, -1] - values[:, 0]) / values[:, 0]
+    return np.where(counts >= 10, change, 0.0)
+
+
+@register_batch_feature("sma_10")
+def _batch_sma_10(b: "FeatureBatch") -> np.ndarray:
+    return _batch_sma(b, 10)
+
+
+@register_batch_feature("sma_50")
+def _batch_sma_50(b: "FeatureBatch") -> np.ndarray:
+    return _batch_sma(b, 50)
+
+
+@register_batch_feature("ma_crossover")
+def _batch_ma_crossover(b: "FeatureBatch") -> np.ndarray:
+    """Same rule as "ma_crossover", encoded as 1 (BUY), -1 (SELL), 0 (HOLD)"""
+    fast = b.get("sma_10")
+    slow = b.get("sma_50")
+    with np.errstate(invalid="ignore"):
+        signal = np.where(fast > slow * 1.01, 1, np.where(fast < slow * 0.99, -1, 0))
+    return np.where(np.isnan(slow), 0, signal).astype(np.int8)
+
+
+@register_batch_feature("rsi_14")
+def _batch_rsi_14(b: "FeatureBatch") -> np.ndarray:
+    period = 14
+    values, counts = b.window(period + 1)
+    changes = np.diff(values, axis=1)
+    avg_gain = np.where(changes > 0, changes, 0.0).sum(axis=1) / period
+    avg_loss = -np.where(changes < 0, changes, 0.0).sum(axis=1) / period
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = 100 - (100 / (1 + avg_gain / avg_loss))
+    result = np.where(avg_loss == 0, 100.0, result)
+    return np.where(counts >= period + 1, result, 50.0)
+
+
+# ============================================================================
+# Snapshot and bus
+# ============================================================================
+
+def tick_price(tick: DataPoint) -> float:
+    """Price from a tick, falling back to the candle close"""
+    return tick.data.get("price", tick.data.get("close", 0))
+
+
+class FeatureSnapshot:
+    """
+    Features for one symbol at one tick.
+
+    Features are computed on first access and memoized, so every agent in a
+    committee vote shares the same computation.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        prices: Sequence[float],
+        volumes: Sequence[float] = (),
+        highs: Sequence[float] = (),
+        symbol_id: Optional[int] = None
+    ):
+        self.symbol = symbol
+        self.symbol_id = symbol_id
+        self.prices = prices
+        self.volumes = volumes
+        self.highs = highs
+        self._cache: Dict[str, object] = {}
+
+    @property
+    def price(self) -> float:
+        return float(self.prices[-1]) if len(self.prices) else 0.0
+
+    @property
+    def volume(self) -> float:
+        return float(self.volumes[-1]) if len(self.volumes) else 0.0
+
+    def __len__(self) -> int:
+        """Number of prices in the history"""
+        return len(self.prices)
+
+    def get(self, name: str):
+        """Get feature by name, computing it on first access"""
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        try:
+            fn = FEATURES[name]
+        except KeyError:
+            raise KeyError(f"Unknown feature: {name}") from None
+
+        value = fn(self)
+        self._cache[name] = value
+        return value
+
+    __getitem__ = get
+
+    @property
+    def computed(self) -> List[str]:
+        """Names of features computed so far this tick"""
+        return list(self._cache)
+
+    def copy(self) -> "FeatureSnapshot":
+        """
+        Snapshot owning its history, for readers that may outlive the tick
+        (the bus's snapshots are views that the next update overwrites).
+        Features computed so far are carried over.
+        """
+        snapshot = FeatureSnapshot(
+            self.symbol,
+            np.array(self.prices),
+            np.array(self.volumes),
+            np.array(self.highs),
+            symbol_id=self.symbol_id
+        )
+        snapshot._cache = dict(self._cache)
+        return snapshot
+
+    def __repr__(self):
+        return (
+            f"FeatureSnapshot({self.symbol}, history={len(self.prices)}, "
+            f"computed={len(self._cache)})"
+        )
+
+
+class FeatureBus:
+    """
+    Per-symbol market history shared by every agent in a committee.
+
+    Call update() once per tick; it records price/volume/high for the tick's
+    symbol and returns a fresh FeatureSnapshot for that tick. History lives in
+    SymbolRingBuffers, so snapshots hold zero-copy views that are valid until
+    the next update for the same symbol.
+    """
+
+    def __init__(self, max_history: int = 100):
+        self.max_history = max_history
+        self.buffers = SymbolRingBuffers(
+            capacity=max_history,
+            fields=("price", "volume", "high")
+        )
+
+    def update(self, tick: DataPoint) -> FeatureSnapshot:
+        """Record tick and return the snapshot agents will read from"""
+        price = tick_price(tick)
+        sid = self.buffers.append(
+            tick.symbol,
+            price,
+            tick.data.get("volume", 0),
+            tick.data.get("high", price)
+        )
+        return self.snapshot(sid)
+
+    def snapshot(self, symbol) -> FeatureSnapshot:
+        """Snapshot of the current history for symbol (name or id)"""
+        sid = self.buffers.symbol_id(symbol)
+        return FeatureSnapshot(
+            self.buffers.symbols[sid] if isinstance(symbol, int) else symbol,
+            self.buffers.view(sid, "price"),
+            self.buffers.view(sid, "volume"),
+            self.buffers.view(sid, "high"),
+            symbol_id=sid
+        )
+
+    def symbol_id(self, symbol: str) -> int:
+        """Integer index for symbol (stable until a committee snapshot is restored)"""
+        return self.buffers.symbol_id(symbol)
+
+    @property
+    def symbols(self) -> List[str]:
+        return self.buffers.symbols
+
+    def history(self, symbol: str) -> List[float]:
+        """Price history for symbol (oldest first)"""
+        return self.buffers.view(symbol).tolist()
+
+    def update_batch(self, ticks: Sequence[DataPoint]) -> "FeatureBatch":
+        """Record one tick per symbol and return the cross-section for them"""
+        sids = [
+            self.buffers.append(
+                tick.symbol,
+                tick_price(tick),
+                tick.data.get("volume", 0),
+                tick.data.get("high", tick_price(tick))
+            )
+            for tick in ticks
+        ]
+        return FeatureBatch(self, sids)
+
+
+class FeatureBatch:
+    """
+    Features for several symbols at one timestamp.
+
+    Rows follow the order of the symbol ids passed in. get(name) returns a
+    NumPy array with one value per row (see BATCH_FEATURES), computed once per
+    batch; snapshot(i) gives the per-symbol FeatureSnapshot for row i.
+    """
+
+    def __init__(self, bus: FeatureBus, symbol_ids: Sequence[int]):
+        self.bus = bus
+        self.symbol_ids = list(symbol_ids)
+        self._windows: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self._cache: Dict[str, np.ndarray] = {}
+        self._snapshots: Dict[int, FeatureSnapshot] = {}
+
+    def __len__(self) -> int:
+        return len(self.symbol_ids)
+
+    @property
+    def symbols(self) -> List[str]:
+        names = self.bus.buffers.symbols
+        return [names[sid] for sid in self.symbol_ids]
+
+    def window(self, length: int, field: str = "price") -> Tuple[np.ndarray, np.ndarray]:
+        """(values, counts) matrix of the last `length` values per row"""
+        key = (field, length)
+        result = self._windows.get(key)
+        if result is None:
+            result = self.bus.buffers.window(self.symbol_ids, length, field)
+            self._windows[key] = result
+        return result
+
+    def get(self, name: str) -> np.ndarray:
+        """Get batch feature by name, computing it on first access"""
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        try:
+            fn = BATCH_FEATURES[name]
+        except KeyError:
+            raise KeyError(f"Unknown batch feature: {name}") from None
+
+        value = fn(self)
+        self._cache[name] = value
+        return value
+
+    __getitem__ = get
+
+    def snapshot(self, row: int) -> FeatureSnapshot:
+        """Per-symbol snapshot for row (shared by every agent in the vote)"""
+        snapshot = self._snapshots.get(row)
+        if snapshot is None:
+            snapshot = self.bus.snapshot(self.symbol_ids[row])
+            self._snapshots[row] = snapshot
+        return snapshot
+
+    def take(self, rows: Sequence[int]) -> "FeatureBatch":
+        """Batch restricted to the given rows (in that order)"""
+        return FeatureBatch(self.bus, [self.symbol_ids[r] for r in rows])
+
+    def __repr__(self):
+        return f"FeatureBatch(symbols={len(self.symbol_ids)}, computed={len(self._cache)})"
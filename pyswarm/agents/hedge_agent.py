@@ -17,15 +17,21 @@ Finance terms:
 - Sharpe ratio: Return / volatility (higher is better)
 - Max drawdown: Largest peak-to-trough decline
 - Position sizing: How much to risk per trade (e.g., 1-2% of capital)
+
+Hedge candidates come from a rolling return correlation matrix
+(patterns.rolling_covariance), updated once per bar from the ticks the agent
+sees, so every symbol's correlations are current rather than hard-coded.
 """
 
 import logging
+import math
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, StrategyTag
+from coinswarm.patterns.rolling_covariance import RollingCovariance
 
 
 logger = logging.getLogger(__name__)
@@ -66,11 +72,16 @@ class HedgeAgent(BaseAgent):
     5. Prevent excessive drawdowns
     """
 
+    cost_class = AgentCost.CHEAP
+    can_veto = True
+    snapshot_attributes = ("covariance", "_bar_time", "_bar_prices")
+
     def __init__(
         self,
         name: str = "HedgeManager",
         weight: float = 3.0,  # Very high weight (can veto trades)
-        risk_params: Optional[RiskParameters] = None
+        risk_params: Optional[RiskParameters] = None,
+        correlation_window: int = 100  # Bars in the rolling correlation window
     ):
         super().__init__(name, weight)
 
@@ -79,7 +90,12 @@ class HedgeAgent(BaseAgent):
         # Track positions
         self.positions: Dict[str, Dict] = {}
 
-        # Correlation matrix (for hedging)
+        # Rolling return correlations (for hedging), one bar per timestamp
+        self.covariance = RollingCovariance(window=correlation_window)
+        self._bar_time: Optional[datetime] = None
+        self._bar_prices: Dict[str, float] = {}
+
+        # Prior correlations, used until the rolling matrix has enough bars for a pair
         self.correlations: Dict[Tuple[str, str], float] = {
             ("BTC-USD", "ETH-USD"): 0.85,  # BTC and ETH highly correlated
             ("BTC-USD", "SOL-USD"): 0.75,
@@ -104,6 +120,7 @@ class HedgeAgent(BaseAgent):
 
         symbol = tick.symbol
         price = tick.data.get("price", 0)
+        self.observe(tick)
 
         # Get account info from context
         account_value = market_context.get("account_value", 100000)
@@ -161,8 +178,10 @@ class HedgeAgent(BaseAgent):
 
         if hedge_recommendation:
             reason = f"Approved with hedge: {hedge_recommendation.reason}"
+            tags = StrategyTag.HEDGE
         else:
             reason = "Risk acceptable, no hedge needed"
+            tags = StrategyTag.NONE
 
         # Approve with adjusted size based on risk
         optimal_size = self._calculate_optimal_position_size(
@@ -177,7 +196,8 @@ class HedgeAgent(BaseAgent):
             action="HOLD",  # Hedge agent doesn't initiate trades
             confidence=0.7,
             size=min(optimal_size, proposed_size),  # Suggest smaller size if needed
-            reason=reason
+            reason=reason,
+            tags=tags
         )
 
     def _calculate_optimal_position_size(
@@ -233,23 +253,53 @@ class HedgeAgent(BaseAgent):
         if not position:
             return None
 
-        # Check correlation with other assets
-        for (asset1, asset2), correlation in self.correlations.items():
-            if asset1 == symbol and correlation > self.risk_params.correlation_threshold:
-                # High correlation → hedge with asset2
-                hedge_size = position.get("size", 0) * correlation
-
-                return HedgeRecommendation(
-                    position_symbol=symbol,
-                    hedge_symbol=asset2,
-                    hedge_size=hedge_size,
-                    hedge_type="short",
-                    correlation=correlation,
-                    reason=f"Hedge {symbol} with short {asset2} (corr={correlation:.2f})"
-                )
+        # Most correlated asset: short it if positively correlated, long if negatively
+        for hedge_symbol, correlation in self._hedge_candidates(symbol):
+            hedge_size = position.get("size", 0) * abs(correlation)
+            hedge_type = "short" if correlation > 0 else "long"
+
+            return HedgeRecommendation(
+                position_symbol=symbol,
+                hedge_symbol=hedge_symbol,
+                hedge_size=hedge_size,
+                hedge_type=hedge_type,
+                correlation=correlation,
+                reason=f"Hedge {symbol} with {hedge_type} {hedge_symbol} (corr={correlation:.2f})"
+            )
 
         return None
 
+    def observe(self, tick: DataPoint):
+        """Collect tick prices into bars; a new timestamp closes the bar"""
+        if tick.timestamp != self._bar_time:
+            if self._bar_prices:
+                self.covariance.update_prices(self._bar_prices)
+                self._bar_prices = {}
+            self._bar_time = tick.timestamp
+
+        price = tick.data.get("price")
+        if price:
+            self._bar_prices[tick.symbol] = price
+
+    def _hedge_candidates(self, symbol: str) -> List[Tuple[str, float]]:
+        """
+        (symbol, correlation) pairs above correlation_threshold, strongest first.
+
+        Rolling correlations are used where the pair has enough bars; the
+        prior correlations fill in pairs that don't yet.
+        """
+        threshold = self.risk_params.correlation_threshold
+        candidates = self.covariance.correlated_with(symbol, threshold)
+
+        for (asset1, asset2), correlation in self.correlations.items():
+            if asset1 != symbol or correlation <= threshold:
+                continue
+            if math.isnan(self.covariance.correlation_of(asset1, asset2)):
+                candidates.append((asset2, correlation))
+
+        candidates.sort(key=lambda c: -abs(c[1]))
+        return candidates
+
     def check_stop_loss(self, symbol: str, current_price: float, position: Dict) -> bool:
         """
         Check if position should be stopped out.
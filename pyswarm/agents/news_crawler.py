@@ -0,0 +1,193 @@
+"""
+Pooled HTTP Crawler for News Sources
+
+All sources share one keep-alive aiohttp session (one connection pool), so a
+refresh of a dozen sources reuses sockets instead of a TLS handshake each.
+
+Per URL (a source queried for one symbol):
+- Rate limit: at most one request per min_interval seconds; a call inside
+  the interval returns the last body (None if there is none) without
+  touching the network. Each URL has its own window, so querying a source
+  for ETH right after BTC still goes out
+- Backoff: after consecutive failures the window grows to retry_backoff,
+  doubling per failure up to max_backoff (and never below min_interval),
+  so a dead source is not re-requested on every refresh
+- Timeout: per-source override of the crawler's default
+- Conditional requests: the last ETag / Last-Modified is sent back as
+  If-None-Match / If-Modified-Since, and a 304 reuses the cached body
+
+Failures (timeouts, connection errors, HTTP errors) are logged and counted;
+fetch() returns None (or the last good body while backing off) so one bad
+source never fails a whole refresh.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """Last successful response for a URL"""
+    body: Any  # Parsed JSON, or {"text": ...} for non-JSON bodies
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float  # time.monotonic()
+
+
+class NewsCrawler:
+    """
+    Shared HTTP client for news sources.
+
+    Example:
+        crawler = NewsCrawler(timeout=5.0)
+        body = await crawler.fetch("CoinDesk", url, min_interval=60.0)
+        await crawler.close()
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        user_agent: str = "coinswarm-research/1.0",
+        retry_backoff: float = 5.0,
+        max_backoff: float = 600.0
+    ):
+        """
+        Args:
+            timeout: Default request timeout (seconds)
+            max_connections: Connection pool size
+            user_agent: User-Agent header
+            retry_backoff: Wait after a URL's first failure (seconds);
+                           doubles with each further failure
+            max_backoff: Longest wait between retries of a failing URL
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.user_agent = user_agent
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._responses: Dict[str, CachedResponse] = {}
+        self._last_request: Dict[str, float] = {}  # url -> monotonic time
+        self._failures: Dict[str, int] = {}  # url -> consecutive failures
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "rate_limited": 0,
+            "backed_off": 0,
+            "errors": 0,
+        }
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session (created on first use, inside the running loop)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60),
+                headers={"User-Agent": self.user_agent}
+            )
+        return self._session
+
+    async def fetch(
+        self,
+        source: str,
+        url: str,
+        min_interval: float = 0.0,
+        timeout: Optional[float] = None
+    ) -> Optional[Any]:
+        """
+        GET url for source, honouring the URL's rate limit and validators.
+
+        Returns:
+            Parsed body (fresh, or cached on 304 / rate limit / backoff),
+            None on error or while backing off with nothing cached
+        """
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            cached = self._responses.get(url)
+            now = time.monotonic()
+            last = self._last_request.get(url)
+            failures = self._failures.get(url, 0)
+            if last is not None and now - last < self._interval(failures, min_interval):
+                self.stats["backed_off" if failures else "rate_limited"] += 1
+                return cached.body if cached is not None else None
+
+            self._last_request[url] = now
+            return await self._get(source, url, cached, timeout or self.timeout)
+
+    def _interval(self, failures: int, min_interval: float) -> float:
+        """Seconds a URL must wait after its last request"""
+        if not failures:
+            return min_interval
+        backoff = min(self.retry_backoff * 2 ** (failures - 1), self.max_backoff)
+        return max(min_interval, backoff)
+
+    async def _get(
+        self,
+        source: str,
+        url: str,
+        cached: Optional[CachedResponse],
+        timeout: float
+    ) -> Optional[Any]:
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        self.stats["requests"] += 1
+        try:
+            async with self.session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    self._failures.pop(url, None)
+                    self.stats["not_modified"] += 1
+                    cached.fetched_at = time.monotonic()
+                    return cached.body
+
+                response.raise_for_status()
+                body = await self._read(response)
+                self._responses[url] = CachedResponse(
+                    body=body,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    fetched_at=time.monotonic()
+                )
+                self._failures.pop(url, None)
+                return body
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._failures[url] = self._failures.get(url, 0) + 1
+            self.stats["errors"] += 1
+            logger.warning("Error crawling %s: %r", source, e)
+            return None
+
+    @staticmethod
+    async def _read(response: aiohttp.ClientResponse) -> Any:
+        if response.content_type == "application/json":
+            return await response.json()
+        return {"text": await response.text()}
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "NewsCrawler":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -11,10 +11,12 @@ Goal: Learn what conditions indicate a good time to take profits.
 """
 
 import random
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, strategy_tags_from_reason
+from coinswarm.agents.feature_bus import FeatureSnapshot
+from coinswarm.agents.symbol_state import SymbolRingBuffers
 from coinswarm.data_ingest.base import DataPoint
 
 
@@ -29,6 +31,9 @@ class OpportunisticSellAgent(BaseAgent):
     - Random "this feels like the top" vibes
     """
 
+    cost_class = AgentCost.CHEAP
+    snapshot_attributes = ("history", "_symbol")
+
     def __init__(
         self,
         name: str = "OpportunisticSell",
@@ -45,9 +50,24 @@ class OpportunisticSellAgent(BaseAgent):
         # Memory: store all decisions with justifications
         self.memory = []
 
-        # Price history for peak detection
-        self.price_history = []
-        self.high_history = []  # Track recent highs
+        # Per-symbol price/high history for peak detection (last 100 points)
+        self.history = SymbolRingBuffers(capacity=100, fields=("price", "high"))
+        self._symbol = ""  # Symbol of the most recent tick
+
+    @property
+    def price_history(self) -> List[float]:
+        """Recent prices for the most recently analyzed symbol"""
+        return self.history.view(self._symbol, "price").tolist()
+
+    @price_history.setter
+    def price_history(self, prices: List[float]):
+        # Highs default to the price, as for ticks without one
+        self.history.load(self._symbol, prices, prices)
+
+    @property
+    def high_history(self) -> List[float]:
+        """Recent highs"""
+        return self.history.view(self._symbol, "high").tolist()
 
     async def analyze(
         self,
@@ -59,20 +79,22 @@ class OpportunisticSellAgent(BaseAgent):
         Decide whether to sell based on peak detection.
         """
 
-        # Update history
         price = tick.data.get("price", tick.data.get("close", 0))
-        high = tick.data.get("high", price)
 
-        self.price_history.append(price)
-        self.high_history.append(high)
-
-        # Keep last 100 data points
-        if len(self.price_history) > 100:
-            self.price_history.pop(0)
-            self.high_history.pop(0)
+        features = market_context.get("features")
+        if features is None:
+            # Update this symbol's history
+            self._symbol = tick.symbol
+            sid = self.history.append(tick.symbol, price, tick.data.get("high", price))
+            features = FeatureSnapshot(
+                tick.symbol,
+                self.history.view(sid, "price"),
+                highs=self.history.view(sid, "high"),
+                symbol_id=sid
+            )
 
         # Calculate market state
-        state = self._calculate_market_state(tick, position)
+        state = self._calculate_market_state(tick, features)
 
         # Only suggest sell if we have a position
         if not position or not position.get("size", 0):
@@ -122,7 +144,8 @@ class OpportunisticSellAgent(BaseAgent):
                 confidence=confidence,
                 size=size,
                 reason=justification,
-                veto=False
+                veto=False,
+                tags=strategy_tags_from_reason(justification)
             )
         else:
             # Hold - not convinced this is the top yet
@@ -151,7 +174,7 @@ class OpportunisticSellAgent(BaseAgent):
 
         return vote
 
-    def _calculate_market_state(self, tick: DataPoint, position: Optional[Dict]) -> Dict:
+    def _calculate_market_state(self, tick: DataPoint, features: FeatureSnapshot) -> Dict:
         """Calculate current market state features"""
 
         price = tick.data.get("price", tick.data.get("close", 0))
@@ -163,21 +186,22 @@ class OpportunisticSellAgent(BaseAgent):
             "timestamp": tick.timestamp.isoformat()
         }
 
-        if len(self.price_history) >= 2:
+        price_change_1 = features.get("price_change_1")
+        if price_change_1 is not None:
             # Recent price movement
-            state["price_change_1"] = (price - self.price_history[-2]) / self.price_history[-2]
+            state["price_change_1"] = price_change_1
 
-        if len(self.price_history) >= 5:
+        recent_high = features.get("high_5")
+        if recent_high is not None:
             # Check if price is falling from recent high
-            recent_high = max(self.high_history[-5:])
             state["distance_from_recent_high"] = (price - recent_high) / recent_high
 
             # Momentum slowing?
-            state["momentum_5"] = (price - self.price_history[-5]) / self.price_history[-5]
+            state["momentum_5"] = features.get("momentum_5")
 
-        if len(self.price_history) >= 20:
+        long_high = features.get("high_20")
+        if long_high is not None:
             # Long-term high
-            long_high = max(self.high_history[-20:])
             state["distance_from_20_high"] = (price - long_high) / long_high
 
         return state
@@ -0,0 +1,324 @@
+"""
+Incremental L2 Order Books
+
+Arbitrage on top-of-book prices assumes infinite liquidity at the last
+price: a 0.5% edge on 0.02 BTC of depth is not a 0.5% edge on 1 BTC. An
+OrderBook keeps each side of a symbol's book in sorted NumPy arrays, updated
+in place from exchange diffs (Binance depth@100ms: a size of 0 removes the
+level), so arbitrage legs can be walked level by level.
+
+Walking a leg turns the book into a fill curve: cumulative amount in vs
+cumulative amount out, piecewise linear and concave (each level is a worse
+price than the one before). A multi-leg path is the composition of its legs'
+curves, which is again piecewise linear and concave, so the most profitable
+size sits on one of the curves' breakpoints and can be found exactly:
+
+    curve = fill_path([book1.fill_curve(sell=False), book2.fill_curve(sell=True)])
+    fill = best_fill(curve)   # (amount_in, amount_out) maximizing out − in
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from coinswarm.data_ingest.base import DataPoint
+
+
+Levels = Iterable[Sequence[float]]  # [[price, size], ...]
+Curve = Tuple[np.ndarray, np.ndarray]  # (cumulative in, cumulative out), from (0, 0)
+
+BID, ASK = 0, 1
+
+
+class OrderBook:
+    """
+    One symbol's L2 book as sorted NumPy arrays.
+
+    Both sides are stored in walk order (bids high → low, asks low → high)
+    under a sort key (−price for bids, price for asks), so a diff is a
+    searchsorted plus in-place writes / inserts rather than a dict rebuild.
+
+    Example:
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[50000, 1.0]], asks=[[50010, 0.5]])
+        book.apply_diff(bids=[[50000, 0.0], [49990, 2.0]], asks=[])
+        book.best_bid   # 49990.0
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._keys = [np.zeros(0), np.zeros(0)]
+        self._sizes = [np.zeros(0), np.zeros(0)]
+        self._curves: Dict[bool, Curve] = {}
+
+        # Exchange sequence numbers (Binance lastUpdateId / U / u)
+        self.last_update_id: Optional[int] = None
+        self.needs_snapshot = False
+        self.updates = 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def apply_snapshot(self, bids: Levels, asks: Levels, last_update_id: Optional[int] = None):
+        """Replace the whole book"""
+        for side, levels in ((BID, bids), (ASK, asks)):
+            prices, sizes = self._levels(levels)
+            keep = sizes > 0
+            keys = self._key(side, prices[keep])
+            order = np.argsort(keys, kind="stable")
+            self._keys[side] = keys[order]
+            self._sizes[side] = sizes[keep][order]
+
+        self.last_update_id = last_update_id
+        self.needs_snapshot = False
+        self._changed()
+
+    def apply_diff(
+        self,
+        bids: Levels,
+        asks: Levels,
+        first_update_id: Optional[int] = None,
+        last_update_id: Optional[int] = None
+    ) -> bool:
+        """
+        Apply changed levels (absolute sizes; 0 removes the level).
+
+        With update ids, diffs older than the book are ignored. A gap sets
+        needs_snapshot, and from then on diffs are dropped until
+        apply_snapshot() resyncs the book (levels missed in the gap would
+        otherwise stay in it for good).
+
+        Returns:
+            False if the diff was ignored (stale, or the book needs a snapshot)
+        """
+        if self.needs_snapshot:
+            return False
+
+        if last_update_id is not None and self.last_update_id is not None:
+            if last_update_id <= self.last_update_id:
+                return False
+            if first_update_id is not None and first_update_id > self.last_update_id + 1:
+                self.needs_snapshot = True
+                return False
+
+        for side, levels in ((BID, bids), (ASK, asks)):
+            prices, sizes = self._levels(levels)
+            if len(prices):
+                self._update_side(side, prices, sizes)
+
+        if last_update_id is not None:
+            self.last_update_id = last_update_id
+        self._changed()
+        return True
+
+    def _update_side(self, side: int, prices: np.ndarray, sizes: np.ndarray):
+        keys = self._key(side, prices)
+
+        # Last update per price wins
+        keys, first = np.unique(keys[::-1], return_index=True)
+        sizes = sizes[::-1][first]
+
+        book_keys = self._keys[side]
+        book_sizes = self._sizes[side]
+        pos = np.searchsorted(book_keys, keys)
+        exists = pos < len(book_keys)
+        exists[exists] = book_keys[pos[exists]] == keys[exists]
+
+        book_sizes[pos[exists]] = sizes[exists]
+
+        new = ~exists & (sizes > 0)
+        if new.any():
+            book_keys = np.insert(book_keys, pos[new], keys[new])
+            book_sizes = np.insert(book_sizes, pos[new], sizes[new])
+
+        keep = book_sizes > 0
+        if not keep.all():
+            book_keys, book_sizes = book_keys[keep], book_sizes[keep]
+
+        self._keys[side] = book_keys
+        self._sizes[side] = book_sizes
+
+    def _changed(self):
+        self._curves.clear()
+        self.updates += 1
+
+    @staticmethod
+    def _levels(levels: Levels) -> Tuple[np.ndarray, np.ndarray]:
+        array = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+        return array[:, 0], array[:, 1]
+
+    @staticmethod
+    def _key(side: int, prices: np.ndarray) -> np.ndarray:
+        return -prices if side == BID else prices
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def levels(self, side: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(prices, sizes) for BID or ASK, best first"""
+        keys = self._keys[side]
+        return (-keys if side == BID else keys), self._sizes[side]
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        keys = self._keys[BID]
+        return float(-keys[0]) if len(keys) else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        keys = self._keys[ASK]
+        return float(keys[0]) if len(keys) else None
+
+    @property
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def __bool__(self):
+        return bool(len(self._keys[BID]) and len(self._keys[ASK]))
+
+    def fill_curve(self, sell: bool) -> Curve:
+        """
+        Cumulative fill of walking one side, starting at (0, 0).
+
+        sell=True walks the bids: base in → quote out.
+        sell=False walks the asks: quote in → base out.
+        """
+        curve = self._curves.get(sell)
+        if curve is None:
+            prices, sizes = self.levels(BID if sell else ASK)
+            base = np.concatenate(([0.0], np.cumsum(sizes)))
+            quote = np.concatenate(([0.0], np.cumsum(prices * sizes)))
+            curve = (base, quote) if sell else (quote, base)
+            self._curves[sell] = curve
+        return curve
+
+    def sell_proceeds(self, quantity: float) -> float:
+        """Quote received selling quantity of base into the bids (capped at depth)"""
+        amount_in, amount_out = self.fill_curve(sell=True)
+        return float(np.interp(quantity, amount_in, amount_out))
+
+    def buy_cost(self, quantity: float) -> float:
+        """Quote spent buying quantity of base from the asks (capped at depth)"""
+        amount_in, amount_out = self.fill_curve(sell=False)
+        return float(np.interp(quantity, amount_out, amount_in))
+
+    def __repr__(self):
+        return (
+            f"OrderBook({self.symbol}, bids={len(self._keys[BID])}, "
+            f"asks={len(self._keys[ASK])}, bid={self.best_bid}, ask={self.best_ask})"
+        )
+
+
+class OrderBooks:
+    """
+    Order books by key (a symbol, or e.g. (exchange, symbol)), fed from ticks.
+
+    A tick carrying "bids"/"asks" is applied as a diff unless its data says
+    update="snapshot". A diff for a key without a book (joining a stream
+    mid-way) creates an empty book flagged needs_snapshot; such books, and
+    books that saw a sequence gap, are not returned by get() until a
+    snapshot tick arrives. resync_keys() lists them for a REST fetch.
+    """
+
+    def __init__(self):
+        self.books: Dict[object, OrderBook] = {}
+
+    def update(self, tick: DataPoint, key: object = None) -> Optional[OrderBook]:
+        """Apply an order book tick; returns the book (None for other ticks)"""
+        data = tick.data
+        if "bids" not in data and "asks" not in data:
+            return None
+
+        key = tick.symbol if key is None else key
+        book = self.books.get(key)
+        bids, asks = data.get("bids", ()), data.get("asks", ())
+
+        if book is None:
+            book = self.books[key] = OrderBook(tick.symbol)
+            book.needs_snapshot = True
+
+        if data.get("update") == "snapshot":
+            book.apply_snapshot(bids, asks, data.get("last_update_id"))
+        else:
+            book.apply_diff(bids, asks, data.get("first_update_id"), data.get("last_update_id"))
+
+        return book
+
+    def get(self, key: object) -> Optional[OrderBook]:
+        """The book for key, or None if it is empty or waiting for a snapshot"""
+        book = self.books.get(key)
+        return book if book and not book.needs_snapshot else None
+
+    def resync_keys(self) -> List[object]:
+        """Keys whose books need a fresh snapshot"""
+        return [key for key, book in self.books.items() if book.needs_snapshot]
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self.books)
+
+
+@dataclass(frozen=True)
+class PathFill:
+    """Executable size of a conversion path"""
+    amount_in: float  # In the path's start asset
+    amount_out: float  # Back in the start asset, after fees
+
+    @property
+    def profit(self) -> float:
+        return self.amount_out - self.amount_in
+
+    @property
+    def return_pct(self) -> float:
+        return self.profit / self.amount_in if self.amount_in > 0 else 0.0
+
+
+def fill_path(curves: List[Curve], fee_pct: float = 0.0) -> Curve:
+    """
+    Compose leg fill curves into one curve for the whole path.
+
+    Each leg's output is the next leg's input; fee_pct is taken from every
+    leg's output. Breakpoints of every leg are mapped back to start units,
+    so the result is exact, and it stops where the shallowest leg runs out.
+    """
+    keep = 1.0 - fee_pct
+    xs, ys = curves[0]
+    ys = ys * keep
+
+    for leg_in, leg_out in curves[1:]:
+        limit = min(ys[-1], leg_in[-1])
+
+        # Amounts entering this leg at every breakpoint so far and its own
+        amounts = np.union1d(ys[ys <= limit], leg_in[leg_in <= limit])
+        amounts = np.union1d(amounts, [limit])
+
+        xs = np.interp(amounts, ys, xs)  # ys is strictly increasing
+        ys = np.interp(amounts, leg_in, leg_out) * keep
+
+    return xs, ys
+
+
+def best_fill(curve: Curve, min_return: float = 0.0) -> Optional[PathFill]:
+    """
+    Largest size on a path curve that still clears min_return at the margin.
+
+    Maximizes amount_out − amount_in × (1 + min_return); with min_return=0
+    that is the most profitable size. None if even the first unit misses.
+    """
+    amount_in, amount_out = curve
+    if len(amount_in) < 2:
+        return None
+
+    surplus = amount_out - amount_in * (1 + min_return)
+    best = int(np.argmax(surplus))
+    if surplus[best] <= 0:
+        return None
+    return PathFill(float(amount_in[best]), float(amount_out[best]))
@@ -12,16 +12,23 @@ Example: BTC news research spawns 20 crawlers:
 - All run in parallel (concurrent HTTP requests)
 - Results aggregated in ~2-3 seconds
 - Vote weighted by source credibility
+
+Crawling never blocks the tick path: analyze() always answers from the
+sentiment cache and, when the cache is stale or missing, starts a refresh in
+a background task (stale-while-revalidate). Requests go through one shared
+keep-alive session with per-source rate limits, timeouts and conditional
+requests (see news_crawler.NewsCrawler).
 """
 
 import asyncio
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, StrategyTag
+from coinswarm.agents.news_crawler import NewsCrawler
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +41,8 @@ class NewsSource:
     url_template: str  # e.g., "https://api.coindesk.com/v1/search?q={symbol}"
     credibility: float  # 0.0-1.0 (higher = more trusted)
     enabled: bool = True
+    min_interval: float = 60.0  # Rate limit: seconds between requests
+    timeout: Optional[float] = None  # Overrides the crawler's default
 
 
 @dataclass
@@ -53,19 +62,25 @@ class ResearchAgent(BaseAgent):
 
     Architecture:
     1. Receives market tick
-    2. Spawns crawler for each news source (in parallel)
-    3. Each crawler fetches and analyzes sentiment
+    2. Votes from cached sentiment immediately
+    3. If the cache is stale, refreshes it in the background:
+       one crawler per news source (in parallel), each fetching and
+       analyzing sentiment
     4. Aggregates sentiment across all sources
     5. Votes BUY/SELL/HOLD based on sentiment
 
     This is the "dozens of crawlers with different targets" approach.
     """
 
+    # analyze() only reads the cache; crawling happens off the tick path
+    cost_class = AgentCost.CHEAP
+
     def __init__(
         self,
         name: str = "ResearchAgent",
         weight: float = 1.5,
-        sources: Optional[List[NewsSource]] = None
+        sources: Optional[List[NewsSource]] = None,
+        crawler: Optional[NewsCrawler] = None
     ):
         super().__init__(name, weight)
 
@@ -75,6 +90,17 @@ class ResearchAgent(BaseAgent):
         # Cache sentiment (avoid re-crawling same news)
         self.sentiment_cache: Dict[str, List[NewsSentiment]] = {}
         self.cache_ttl = timedelta(minutes=5)  # Cache for 5 minutes
+        self._refreshed_at: Dict[str, datetime] = {}
+
+        # Failed refreshes: retry after retry_backoff, doubling per failure
+        # (capped at cache_ttl) instead of on every tick
+        self.retry_backoff = timedelta(seconds=30)
+        self._failed_refreshes: Dict[str, int] = {}
+        self._retry_at: Dict[str, datetime] = {}
+
+        # Shared HTTP session; background refresh task per symbol
+        self.crawler = crawler or NewsCrawler()
+        self._refreshing: Dict[str, asyncio.Task] = {}
 
     def _default_sources(self) -> List[NewsSource]:
         """Default news sources for crypto"""
@@ -109,43 +135,82 @@ class ResearchAgent(BaseAgent):
         market_context: Dict
     ) -> AgentVote:
         """
-        Spawn parallel news crawlers and aggregate sentiment.
+        Vote from cached sentiment; refresh stale sentiment in the background.
 
         Process:
         1. Check cache for recent sentiment
-        2. If cache miss, spawn crawlers in parallel
-        3. Aggregate sentiment across all sources
+        2. If stale or missing, start a background refresh (once per symbol,
+           and not before the retry time after a failed refresh)
+        3. Aggregate whatever sentiment is cached (possibly stale, or none)
         4. Return vote based on sentiment
         """
 
         symbol = tick.symbol
 
-        # Check cache first
-        cached_sentiment = self._get_cached_sentiment(symbol)
-        if cached_sentiment:
-            logger.debug(f"Using cached sentiment for {symbol}")
-            sentiments = cached_sentiment
-        else:
-            # Cache miss - spawn parallel crawlers
-            logger.info(f"Spawning {len(self.sources)} news crawlers for {symbol}...")
-            start_time = datetime.now()
+        if self._get_cached_sentiment(symbol) is None and not self._backing_off(symbol):
+            self._schedule_refresh(symbol)
 
-            # Spawn all crawlers in parallel
-            sentiments = await self._spawn_crawlers(symbol)
+        return self._aggregate_sentiment(symbol, self.sentiment_cache.get(symbol, []), tick)
 
-            # Cache results
-            self.sentiment_cache[symbol] = sentiments
+    def _backing_off(self, symbol: str) -> bool:
+        """True while a symbol waits out the backoff after a failed refresh"""
+        retry_at = self._retry_at.get(symbol)
+        return retry_at is not None and datetime.now() < retry_at
 
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(
-                f"Crawled {len(sentiments)} sources in {duration:.1f}s "
-                f"({len(sentiments)/duration:.1f} sources/sec)"
+    def _schedule_refresh(self, symbol: str):
+        """Start a background refresh unless one is already running"""
+        if symbol in self._refreshing:
+            return
+
+        task = asyncio.create_task(self.refresh(symbol))
+        self._refreshing[symbol] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(symbol, None))
+
+    async def refresh(self, symbol: str) -> List[NewsSentiment]:
+        """
+        Crawl all sources for symbol now and update the cache.
+
+        If no source returns data the cached (stale) sentiment is kept and
+        stays stale; analyze() retries after retry_backoff, doubling with
+        each consecutive failure up to cache_ttl.
+        """
+        logger.debug("Spawning %d news crawlers for %s", len(self.sources), symbol)
+        start_time = datetime.now()
+
+        sentiments = await self._spawn_crawlers(symbol)
+        if not sentiments:
+            failures = self._failed_refreshes.get(symbol, 0) + 1
+            self._failed_refreshes[symbol] = failures
+            backoff = min(self.retry_backoff * 2 ** (failures - 1), self.cache_ttl)
+            self._retry_at[symbol] = datetime.now() + backoff
+            logger.warning(
+                "No news source answered for %s; keeping cached sentiment, retrying in %.0fs",
+                symbol, backoff.total_seconds()
             )
+            return self.sentiment_cache.get(symbol, [])
 
-        # Aggregate sentiment
-        vote = self._aggregate_sentiment(symbol, sentiments, tick)
+        self.sentiment_cache[symbol] = sentiments
+        self._refreshed_at[symbol] = datetime.now()
+        self._failed_refreshes.pop(symbol, None)
+        self._retry_at.pop(symbol, None)
+
+        if logger.isEnabledFor(logging.INFO):
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info("Crawled %d sources for %s in %.2fs", len(sentiments), symbol, duration)
+
+        return sentiments
 
-        return vote
+    async def wait_for_refresh(self):
+        """Wait for in-flight background refreshes (tests, shutdown)"""
+        if self._refreshing:
+            await asyncio.gather(*list(self._refreshing.values()), return_exceptions=True)
+
+    async def close(self):
+        """Cancel background refreshes and close the HTTP session"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await self.wait_for_refresh()
+        await self.crawler.close()
 
     async def _spawn_crawlers(self, symbol: str) -> List[NewsSentiment]:
         """
@@ -182,43 +247,65 @@ class ResearchAgent(BaseAgent):
         """
         Crawl a single news source.
 
-        In production, this would:
-        1. Make HTTP request to news API
+        1. HTTP request through the shared crawler (rate limited,
+           conditional, with the source's timeout)
         2. Parse response
-        3. Analyze sentiment (using NLP or simple keyword matching)
+        3. Analyze sentiment (simple keyword matching)
         4. Return NewsSentiment
-
-        For now, this is a placeholder.
         """
 
-        try:
-            # Placeholder: In production, use httpx or aiohttp
-            # import httpx
-            # async with httpx.AsyncClient() as client:
-            #     url = source.url_template.format(symbol=symbol)
-            #     response = await client.get(url, timeout=5)
-            #     data = response.json()
-            #     sentiment = self._analyze_sentiment(data)
-
-            # For now, return mock sentiment
-            await asyncio.sleep(0.1)  # Simulate HTTP request
-
-            # Mock sentiment (in production, analyze actual news)
-            sentiment = NewsSentiment(
-                source=source.name,
-                sentiment=0.0,  # Neutral (placeholder)
-                confidence=0.5,
-                headline=f"Mock headline for {symbol}",
-                url=source.url_template.format(symbol=symbol),
-                timestamp=datetime.now()
-            )
-
-            return sentiment
+        url = source.url_template.format(symbol=symbol)
+        data = await self.crawler.fetch(
+            source.name, url, min_interval=source.min_interval, timeout=source.timeout
+        )
+        if data is None:
+            return None
 
+        try:
+            headline, text = self._extract_text(data)
+            sentiment = self._analyze_sentiment({"text": text})
         except Exception as e:
-            logger.error(f"Error crawling {source.name}: {e}")
+            logger.error("Error parsing %s response: %s", source.name, e)
             return None
 
+        return NewsSentiment(
+            source=source.name,
+            sentiment=sentiment,
+            confidence=0.7 if sentiment else 0.5,
+            headline=headline,
+            url=url,
+            timestamp=datetime.now()
+        )
+
+    @staticmethod
+    def _extract_text(data) -> Tuple[str, str]:
+        """
+        (headline, text) from a news API response.
+
+        Handles plain text ({"text": ...}) and JSON article lists under
+        "articles" / "results" / "data" / "items" (or a bare list).
+        """
+        if isinstance(data, dict):
+            for key in ("articles", "results", "data", "items"):
+                if isinstance(data.get(key), list):
+                    data = data[key]
+                    break
+            else:
+                data = [data]
+
+        fields = ("title", "headline", "description", "summary", "text", "body")
+        parts = []
+        headline = ""
+        for item in data if isinstance(data, list) else []:
+            if not isinstance(item, dict):
+                continue
+            texts = [str(item[f]) for f in fields if item.get(f)]
+            if texts and not headline:
+                headline = texts[0]
+            parts.extend(texts)
+
+        return headline[:200], " ".join(parts)
+
     def _aggregate_sentiment(
         self,
         symbol: str,
@@ -246,11 +333,11 @@ class ResearchAgent(BaseAgent):
         # Calculate weighted sentiment
         weighted_sum = 0.0
         total_weight = 0.0
+        credibility_by_source = {s.name: s.credibility for s in self.sources}
 
         for sentiment in sentiments:
             # Get source credibility
-            source = next((s for s in self.sources if s.name == sentiment.source), None)
-            credibility = source.credibility if source else 0.5
+            credibility = credibility_by_source.get(sentiment.source, 0.5)
 
             # Weight = credibility × confidence
             weight = credibility * sentiment.confidence
@@ -267,41 +354,45 @@ class ResearchAgent(BaseAgent):
             action = "BUY"
             confidence = min(0.9, avg_sentiment)
             size = 0.01 * confidence  # Scale size by confidence
-            reason = f"Positive news sentiment: {avg_sentiment:.2f} from {len(sentiments)} sources"
+            reason = "Positive news sentiment: {:.2f} from {} sources"
+            tags = StrategyTag.NEWS_POSITIVE
 
         elif avg_sentiment < -0.3:
             # Negative sentiment → SELL
             action = "SELL"
             confidence = min(0.9, abs(avg_sentiment))
             size = 0.01 * confidence
-            reason = f"Negative news sentiment: {avg_sentiment:.2f} from {len(sentiments)} sources"
+            reason = "Negative news sentiment: {:.2f} from {} sources"
+            tags = StrategyTag.NEWS_NEGATIVE
 
         else:
             # Neutral sentiment → HOLD
             action = "HOLD"
             confidence = 0.6
             size = 0.0
-            reason = f"Neutral news sentiment: {avg_sentiment:.2f} from {len(sentiments)} sources"
+            reason = "Neutral news sentiment: {:.2f} from {} sources"
+            tags = StrategyTag.NONE
 
         return AgentVote(
             agent_name=self.name,
             action=action,
             confidence=confidence,
             size=size,
-            reason=reason
+            reason=reason,
+            reason_args=(avg_sentiment, len(sentiments)),
+            tags=tags
         )
 
     def _get_cached_sentiment(self, symbol: str) -> Optional[List[NewsSentiment]]:
         """Get cached sentiment if available and fresh"""
 
-        if symbol not in self.sentiment_cache:
+        refreshed_at = self._refreshed_at.get(symbol)
+        if refreshed_at is None:
             return None
 
-        sentiments = self.sentiment_cache[symbol]
-
         # Check if cache is still fresh
-        if sentiments and (datetime.now() - sentiments[0].timestamp) < self.cache_ttl:
-            return sentiments
+        if datetime.now() - refreshed_at < self.cache_ttl:
+            return self.sentiment_cache.get(symbol)
 
         # Cache expired
         return None
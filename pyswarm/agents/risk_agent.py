@@ -13,10 +13,12 @@ Critical for protecting capital in the swarm.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote
+from coinswarm.agents.feature_bus import FeatureSnapshot, return_volatility
+from coinswarm.agents.symbol_state import SymbolRingBuffers
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,10 @@ class RiskManagementAgent(BaseAgent):
     - Correlation risk
     """
 
+    cost_class = AgentCost.CHEAP
+    can_veto = True
+    snapshot_attributes = ("history", "_symbol")
+
     def __init__(
         self,
         name: str = "RiskManager",
@@ -47,8 +53,18 @@ class RiskManagementAgent(BaseAgent):
         self.max_drawdown_pct = max_drawdown_pct
         self.max_volatility = max_volatility
 
-        self.price_history = []
         self.max_history = 100
+        self.history = SymbolRingBuffers(capacity=self.max_history)
+        self._symbol = ""  # Symbol of the most recent tick
+
+    @property
+    def price_history(self) -> List[float]:
+        """Recent prices for the most recently analyzed symbol"""
+        return self.history.view(self._symbol).tolist()
+
+    @price_history.setter
+    def price_history(self, prices: List[float]):
+        self.history.load(self._symbol, prices)
 
     async def analyze(
         self,
@@ -66,17 +82,19 @@ class RiskManagementAgent(BaseAgent):
         price = tick.data.get("price", 0)
         spread = tick.data.get("spread", 0)
 
-        # Update price history
-        self.price_history.append(price)
-        if len(self.price_history) > self.max_history:
-            self.price_history.pop(0)
+        features = market_context.get("features")
+        if features is None:
+            # Update this symbol's price history
+            self._symbol = tick.symbol
+            sid = self.history.append(tick.symbol, price)
+            features = FeatureSnapshot(tick.symbol, self.history.view(sid), symbol_id=sid)
 
         # Check various risk factors
         veto_reasons = []
 
         # 1. Check volatility
-        if len(self.price_history) >= 20:
-            volatility = self._calculate_volatility()
+        if len(features) >= 20:
+            volatility = features.get("return_volatility")
             if volatility > self.max_volatility:
                 veto_reasons.append(
                     f"Volatility too high: {volatility:.2%} > {self.max_volatility:.2%}"
@@ -105,14 +123,14 @@ class RiskManagementAgent(BaseAgent):
             )
 
         # 5. Check for flash crash (sudden price drop)
-        if len(self.price_history) >= 10:
-            recent_change = (price - self.price_history[-10]) / self.price_history[-10]
+        if len(features) >= 10:
+            recent_change = features.get("momentum_10")
             if abs(recent_change) > 0.1:  # 10% move in 10 ticks
                 veto_reasons.append(f"Flash crash detected: {recent_change:.1%} in 10 ticks")
 
         # Issue veto if any risk condition triggered
         if veto_reasons:
-            logger.warning(f"RiskManager VETO: {'; '.join(veto_reasons)}")
+            logger.warning("RiskManager VETO: %s", "; ".join(veto_reasons))
 
             return AgentVote(
                 agent_name=self.name,
@@ -139,18 +157,4 @@ class RiskManagementAgent(BaseAgent):
         Returns:
             Volatility as decimal (e.g., 0.05 = 5%)
         """
-        if len(self.price_history) < 2:
-            return 0.0
-
-        # Calculate returns
-        returns = [
-            (self.price_history[i] - self.price_history[i-1]) / self.price_history[i-1]
-            for i in range(1, len(self.price_history))
-        ]
-
-        # Calculate standard deviation
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        volatility = variance ** 0.5
-
-        return volatility
+        return return_volatility(self.price_history)
@@ -11,16 +11,22 @@ Evolutionary approach:
 - Test new strategies in sandbox first
 
 This is the "memory improver" that invents new strategies.
+
+The pool lives in a StrategyPopulation (genomes as a NumPy parameter matrix
+plus weight vectors), so weighting, culling and breeding a generation of
+thousands of children are whole-population array operations.
 """
 
 import logging
-import random
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 from coinswarm.data_ingest.base import DataPoint
 from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.strategy_population import StrategyPopulation
 
 
 logger = logging.getLogger(__name__)
@@ -57,22 +63,29 @@ class StrategyLearningAgent(BaseAgent):
     This creates an evolving strategy pool that improves over time.
     """
 
+    snapshot_attributes = ("population",)
+
     def __init__(
         self,
         name: str = "StrategyLearner",
         weight: float = 0.0,  # Doesn't vote on trades
         cull_threshold: float = -0.5,  # Kill strategies below this weight
         mutation_rate: float = 0.1,  # Probability of random mutation
-        sandbox_min_trades: int = 10  # Minimum trades in sandbox before production
+        sandbox_min_trades: int = 10,  # Minimum trades in sandbox before production
+        breeding_probability: float = 0.1,  # Chance to breed per evolution cycle
+        offspring_per_generation: int = 1,  # Children bred per generation
+        seed: Optional[int] = None
     ):
         super().__init__(name, weight)
 
         self.cull_threshold = cull_threshold
         self.mutation_rate = mutation_rate
         self.sandbox_min_trades = sandbox_min_trades
+        self.breeding_probability = breeding_probability
+        self.offspring_per_generation = offspring_per_generation
 
         # Strategy pool
-        self.strategies: Dict[str, Strategy] = {}
+        self.population = StrategyPopulation(seed=seed)
 
         # Initialize with base strategies
         self._initialize_base_strategies()
@@ -137,10 +150,39 @@ class StrategyLearningAgent(BaseAgent):
         ]
 
         for strategy in base_strategies:
-            self.strategies[strategy.id] = strategy
+            self.population.add(
+                strategy.id,
+                strategy.name,
+                strategy.pattern,
+                weight=strategy.weight,
+                created_at=strategy.created_at.timestamp(),
+                sandbox_tested=strategy.sandbox_tested,
+                production_ready=strategy.production_ready
+            )
 
         logger.info(f"Initialized {len(base_strategies)} base strategies")
 
+    @property
+    def strategies(self) -> Dict[str, Strategy]:
+        """Snapshot of the pool as Strategy records, keyed by id"""
+        return {strategy_id: self._strategy(row) for strategy_id, row in self.population.index.items()}
+
+    def _strategy(self, row: int) -> Strategy:
+        p = self.population
+        return Strategy(
+            id=p.ids[row],
+            name=p.names[row],
+            pattern=p.pattern(row),
+            weight=float(p.weight[row]),
+            win_rate=float(p.win_rate[row]),
+            avg_pnl=float(p.avg_pnl[row]),
+            trade_count=int(p.trade_count[row]),
+            created_at=datetime.fromtimestamp(p.created_at[row]),
+            parent_strategies=list(p.parents[row]),
+            sandbox_tested=bool(p.sandbox_tested[row]),
+            production_ready=bool(p.production_ready[row])
+        )
+
     async def analyze(
         self,
         tick: DataPoint,
@@ -170,24 +212,14 @@ class StrategyLearningAgent(BaseAgent):
         This causes bad strategies to die off FASTER than good ones grow.
         """
 
-        for strategy_id, new_weight in strategy_weights.items():
-            if strategy_id not in self.strategies:
-                continue
+        index = self.population.index
+        known = [(index[k], w) for k, w in strategy_weights.items() if k in index]
+        if known:
+            rows, weights = np.array(known).T
+            rows = rows.astype(np.intp)
 
-            strategy = self.strategies[strategy_id]
-
-            # Apply weight update
-            if new_weight > 0:
-                # Successful strategy: moderate reward
-                strategy.weight += new_weight * 1.5
-            else:
-                # Unsuccessful strategy: BIGGER penalty
-                strategy.weight += new_weight * 2.0
-
-            logger.debug(
-                f"Strategy {strategy_id}: weight={strategy.weight:.2f}, "
-                f"win_rate={strategy.win_rate:.2%}"
-            )
+            # Successful strategy: moderate reward; unsuccessful: BIGGER penalty
+            self.population.add_weights(rows, np.where(weights > 0, weights * 1.5, weights * 2.0))
 
         # Cull weak strategies
         self._cull_weak_strategies()
@@ -197,225 +229,117 @@ class StrategyLearningAgent(BaseAgent):
 
     def _cull_weak_strategies(self):
         """
-        Remove strategies with weight below threshold.
+        Remove strategies with weight below threshold, along with those
+        that failed sandbox testing since the last cull.
 
         Only best strategies survive!
         """
 
-        to_remove = []
+        culled = self.population.cull(self.cull_threshold)
 
-        for strategy_id, strategy in self.strategies.items():
-            if strategy.weight < self.cull_threshold:
-                logger.warning(
-                    f"Culling strategy {strategy_id}: "
-                    f"weight={strategy.weight:.2f} < {self.cull_threshold:.2f}"
-                )
-                to_remove.append(strategy_id)
-
-        # Remove culled strategies
-        for strategy_id in to_remove:
-            del self.strategies[strategy_id]
-
-        if to_remove:
-            logger.info(f"Culled {len(to_remove)} weak strategies")
+        if culled:
+            logger.info(
+                "Culled %d weak or failed strategies (weight < %.2f): %s",
+                len(culled), self.cull_threshold, ", ".join(culled[:10])
+            )
 
     def _evolve_new_strategies(self):
         """
         Create new strategies by combining successful patterns.
 
-        Genetic algorithm:
-        1. Select 2 parent strategies (weighted by success)
-        2. Combine their patterns
-        3. Apply random mutation
-        4. Create new strategy
-        5. Mark for sandbox testing
+        Each evolution cycle breeds a generation with probability
+        breeding_probability (see evolve_generation).
         """
 
-        # Need at least 2 strategies to breed
-        production_strategies = [
-            s for s in self.strategies.values()
-            if s.production_ready and s.weight > 0
-        ]
-
-        if len(production_strategies) < 2:
+        if self.population.rng.random() > self.breeding_probability:
             return
 
-        # Probabilistic breeding (10% chance per evolution cycle)
-        if random.random() > 0.1:
-            return
-
-        # Select 2 parents (weighted by weight)
-        parents = self._select_parents(production_strategies)
-
-        if len(parents) != 2:
-            return
-
-        # Breed new strategy
-        child = self._breed_strategies(parents[0], parents[1])
-
-        if child:
-            self.strategies[child.id] = child
-            logger.info(
-                f"Evolved new strategy {child.id} from "
-                f"{parents[0].id} + {parents[1].id}"
-            )
-
-    def _select_parents(self, strategies: List[Strategy]) -> List[Strategy]:
-        """
-        Select 2 parents for breeding using weighted random selection.
+        self.evolve_generation()
 
-        Higher weight → higher chance of being selected.
+    def evolve_generation(self, offspring: Optional[int] = None) -> List[str]:
         """
+        Breed one generation from the production strategies.
 
-        if len(strategies) < 2:
-            return []
-
-        # Normalize weights for selection
-        total_weight = sum(s.weight for s in strategies)
-        if total_weight <= 0:
-            return []
-
-        # Weighted random selection
-        selected = []
-        for _ in range(2):
-            rand = random.random() * total_weight
-            cumulative = 0.0
-
-            for strategy in strategies:
-                cumulative += strategy.weight
-                if cumulative >= rand:
-                    selected.append(strategy)
-                    break
-
-        return selected
+        Genetic algorithm:
+        1. Select parent pairs (weighted by success)
+        2. Combine their patterns
+        3. Apply random mutation
+        4. Add the children as new strategies
+        5. Mark them for sandbox testing
 
-    def _breed_strategies(self, parent1: Strategy, parent2: Strategy) -> Optional[Strategy]:
-        """
-        Breed two strategies to create a child.
+        Args:
+            offspring: Children to breed (default offspring_per_generation)
 
-        Algorithm:
-        1. Combine patterns from both parents
-        2. Apply random mutation
-        3. Create new strategy ID
+        Returns:
+            Ids of the new strategies
         """
 
-        # Generate new strategy ID
-        child_id = f"{parent1.id[:10]}_{parent2.id[:10]}_{datetime.now().timestamp()}"
-
-        # Combine patterns (50/50 mix)
-        child_pattern = {}
-
-        # Take pattern from parent1
-        for key, value in parent1.pattern.items():
-            if key in parent2.pattern:
-                # Both parents have this parameter
-                if isinstance(value, (int, float)):
-                    # Average numeric values
-                    child_pattern[key] = (value + parent2.pattern[key]) / 2
-                else:
-                    # Randomly choose for non-numeric
-                    child_pattern[key] = random.choice([value, parent2.pattern[key]])
-            else:
-                child_pattern[key] = value
-
-        # Add unique parameters from parent2
-        for key, value in parent2.pattern.items():
-            if key not in child_pattern:
-                child_pattern[key] = value
-
-        # Apply random mutation
-        if random.random() < self.mutation_rate:
-            child_pattern = self._mutate_pattern(child_pattern)
-
-        # Create child strategy
-        child = Strategy(
-            id=child_id,
-            name=f"Evolved: {parent1.name} × {parent2.name}",
-            pattern=child_pattern,
-            weight=0.0,  # Start neutral
-            win_rate=0.5,
-            avg_pnl=0.0,
-            trade_count=0,
-            created_at=datetime.now(),
-            parent_strategies=[parent1.id, parent2.id],
-            sandbox_tested=False,  # Must test in sandbox
-            production_ready=False
+        population = self.population
+        pairs = population.select_parents(
+            offspring or self.offspring_per_generation,
+            population.production_mask()
         )
 
-        return child
-
-    def _mutate_pattern(self, pattern: Dict) -> Dict:
-        """
-        Apply random mutation to strategy pattern.
-
-        Mutations:
-        - Adjust numeric thresholds by ±10%
-        - Randomly flip boolean values
-        """
+        # Need at least 2 production strategies with positive weight to breed
+        if len(pairs) == 0:
+            return []
 
-        mutated = pattern.copy()
+        rows = population.breed(pairs, self.mutation_rate, created_at=datetime.now().timestamp())
+        children = population.ids[rows[0]:rows[-1] + 1]
 
-        for key, value in mutated.items():
-            if isinstance(value, float):
-                # Adjust by ±10%
-                mutated[key] = value * random.uniform(0.9, 1.1)
-            elif isinstance(value, int):
-                # Adjust by ±1
-                mutated[key] = value + random.randint(-1, 1)
-            elif isinstance(value, bool):
-                # 20% chance to flip
-                if random.random() < 0.2:
-                    mutated[key] = not value
+        if len(children) == 1:
+            logger.info(
+                "Evolved new strategy %s from %s + %s",
+                children[0], population.ids[pairs[0, 0]], population.ids[pairs[0, 1]]
+            )
+        else:
+            logger.info("Evolved %d new strategies", len(children))
 
-        return mutated
+        return children
 
     def mark_sandbox_tested(self, strategy_id: str, success: bool):
         """
         Mark strategy as sandbox tested.
 
         If successful, promote to production.
-        Otherwise, cull immediately.
+        Otherwise, retire it now; its row is compacted on the next cull.
         """
 
-        if strategy_id not in self.strategies:
+        population = self.population
+        row = population.index.get(strategy_id)
+        if row is None:
             return
 
-        strategy = self.strategies[strategy_id]
-        strategy.sandbox_tested = True
+        population.sandbox_tested[row] = True
 
         if success:
-            strategy.production_ready = True
+            population.production_ready[row] = True
             logger.info(f"Strategy {strategy_id} promoted to production")
         else:
-            # Failed sandbox, cull immediately
+            # Failed sandbox: gone from the pool now, compacted on the next cull
             logger.warning(f"Strategy {strategy_id} failed sandbox, culling")
-            del self.strategies[strategy_id]
+            population.kill(row)
 
     def get_production_strategies(self) -> List[Strategy]:
         """Get all production-ready strategies"""
-        return [
-            s for s in self.strategies.values()
-            if s.production_ready
-        ]
+        return [self._strategy(row) for row in np.flatnonzero(self.population.production_mask())]
 
     def get_sandbox_strategies(self) -> List[Strategy]:
         """Get strategies awaiting sandbox testing"""
-        return [
-            s for s in self.strategies.values()
-            if not s.sandbox_tested
-        ]
+        return [self._strategy(row) for row in np.flatnonzero(self.population.sandbox_mask())]
 
     def get_strategy_summary(self) -> Dict:
         """Get summary of strategy pool"""
 
-        production = self.get_production_strategies()
-        sandbox = self.get_sandbox_strategies()
+        population = self.population
+        production = np.flatnonzero(population.production_mask())
+        weights = population.weight[production]
 
         return {
-            "total_strategies": len(self.strategies),
+            "total_strategies": len(population.index),
             "production_strategies": len(production),
-            "sandbox_strategies": len(sandbox),
-            "best_strategy": max(production, key=lambda s: s.weight).id if production else None,
-            "worst_strategy": min(production, key=lambda s: s.weight).id if production else None,
-            "avg_weight": sum(s.weight for s in production) / len(production) if production else 0.0
+            "sandbox_strategies": int(population.sandbox_mask().sum()),
+            "best_strategy": population.ids[production[np.argmax(weights)]] if len(production) else None,
+            "worst_strategy": population.ids[production[np.argmin(weights)]] if len(production) else None,
+            "avg_weight": float(weights.mean()) if len(production) else 0.0
         }
@@ -0,0 +1,299 @@
+"""
+Array-Backed Strategy Population
+
+Strategy genomes for StrategyLearningAgent, stored column-wise so a whole
+generation is selected, bred, mutated and culled with NumPy operations:
+
+- params: (N, G) float matrix of numeric genes (NaN = gene not used)
+- kind: strategy type code per row (index into KINDS)
+- weight / win_rate / avg_pnl / trade_count: per-strategy vectors
+- sandbox_tested / production_ready: lifecycle flags
+- dead: rows killed since the last compaction (see kill)
+
+Selection is fitness-proportional: one cumulative sum over the weights of
+the eligible parents and a searchsorted for every draw. Crossover averages
+the genes both parents use and inherits the rest; mutation scales the
+genes of the selected children by ±10%.
+
+Example:
+    population = StrategyPopulation(seed=7)
+    population.add("trend_uptrend", "Trend", {"type": "trend", "momentum_threshold": 0.02})
+    ...
+    pairs = population.select_parents(1000, population.production_mask())
+    children = population.breed(pairs, mutation_rate=0.1)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Numeric genes (params columns)
+GENES = (
+    "momentum_threshold",
+    "rsi_max",
+    "rsi_min",
+    "deviation_threshold",
+    "confidence_threshold",
+)
+_GENE_INDEX = {gene: i for i, gene in enumerate(GENES)}
+
+# Strategy types (kind codes) and the fixed traits each type carries
+KINDS = ("trend", "mean_reversion", "news")
+_KIND_INDEX = {kind: i for i, kind in enumerate(KINDS)}
+_KIND_TRAITS = {
+    "trend": {"direction": "up"},
+    "mean_reversion": {"condition": "oversold"},
+    "news": {"sentiment": "positive"},
+}
+
+
+class StrategyPopulation:
+    """
+    Column store of strategies, indexed by row.
+
+    Rows are dense (0..len-1); culling compacts them, so row numbers are
+    only stable between removals. Strategy ids map to rows via `index`.
+    Killed rows leave the index at once but keep their storage until the
+    next remove()/cull(), so len() counts them until then.
+    """
+
+    def __init__(self, capacity: int = 64, seed: Optional[int] = None):
+        """
+        Args:
+            capacity: Initial rows (storage grows by doubling)
+            seed: Seed for selection, crossover and mutation draws
+        """
+        self.rng = np.random.default_rng(seed)
+        self.size = 0
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.parents: List[Tuple[str, ...]] = []
+        self.index: Dict[str, int] = {}
+        self.dead_count = 0
+        self._serial = 0  # Suffix for evolved strategy ids
+
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        """(Re)size the columns to capacity, keeping existing rows"""
+
+        def grow(name: str, shape, fill, dtype):
+            grown = np.full(shape, fill, dtype=dtype)
+            array = getattr(self, name, None)
+            if array is not None:
+                grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+
+        grow("params", (capacity, len(GENES)), np.nan, np.float64)
+        grow("kind", capacity, 0, np.int8)
+        grow("weight", capacity, 0.0, np.float64)
+        grow("win_rate", capacity, 0.5, np.float64)
+        grow("avg_pnl", capacity, 0.0, np.float64)
+        grow("trade_count", capacity, 0, np.int64)
+        grow("created_at", capacity, 0.0, np.float64)  # Unix time
+        grow("sandbox_tested", capacity, False, bool)
+        grow("production_ready", capacity, False, bool)
+        grow("dead", capacity, False, bool)
+
+    def _reserve(self, rows: int) -> slice:
+        """Room for `rows` more strategies; returns their row slice"""
+        needed = self.size + rows
+        if needed > len(self.weight):
+            capacity = len(self.weight)
+            while capacity < needed:
+                capacity *= 2
+            self._allocate(capacity)
+        return slice(self.size, needed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, strategy_id: str) -> bool:
+        return strategy_id in self.index
+
+    # ------------------------------------------------------------------
+    # Rows ↔ patterns
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        strategy_id: str,
+        name: str,
+        pattern: Dict,
+        weight: float = 0.0,
+        created_at: float = 0.0,
+        parents: Sequence[str] = (),
+        sandbox_tested: bool = False,
+        production_ready: bool = False
+    ) -> int:
+        """Add one strategy from a pattern dict; returns its row"""
+        row = self._reserve(1).start
+        self.params[row] = np.nan
+        for gene, value in pattern.items():
+            i = _GENE_INDEX.get(gene)
+            if i is not None:
+                self.params[row, i] = value
+        self.kind[row] = _KIND_INDEX[pattern.get("type", KINDS[0])]
+        self.weight[row] = weight
+        self.win_rate[row] = 0.5
+        self.avg_pnl[row] = 0.0
+        self.trade_count[row] = 0
+        self.created_at[row] = created_at
+        self.sandbox_tested[row] = sandbox_tested
+        self.production_ready[row] = production_ready
+        self.dead[row] = False
+
+        self.ids.append(strategy_id)
+        self.names.append(name)
+        self.parents.append(tuple(parents))
+        self.index[strategy_id] = row
+        self.size += 1
+        return row
+
+    def pattern(self, row: int) -> Dict:
+        """Pattern dict of a row ({"type": ..., traits..., genes...})"""
+        kind = KINDS[self.kind[row]]
+        pattern = {"type": kind, **_KIND_TRAITS[kind]}
+        for gene, value in zip(GENES, self.params[row]):
+            if not np.isnan(value):
+                pattern[gene] = float(value)
+        return pattern
+
+    # ------------------------------------------------------------------
+    # Whole-population operations
+    # ------------------------------------------------------------------
+
+    def production_mask(self) -> np.ndarray:
+        return self.production_ready[:self.size]
+
+    def sandbox_mask(self) -> np.ndarray:
+        return ~self.sandbox_tested[:self.size]
+
+    def add_weights(self, rows: np.ndarray, deltas: np.ndarray):
+        """weight[rows] += deltas (repeated rows accumulate)"""
+        np.add.at(self.weight, rows, deltas)
+
+    def select_parents(self, pairs: int, eligible: np.ndarray) -> np.ndarray:
+        """
+        Draw parent pairs with probability proportional to weight.
+
+        Args:
+            pairs: Number of (parent1, parent2) pairs
+            eligible: Boolean mask over rows; only positive weights count
+
+        Returns:
+            (pairs, 2) array of rows (empty if fewer than 2 candidates)
+        """
+        candidates = np.flatnonzero(eligible & (self.weight[:self.size] > 0))
+        if len(candidates) < 2 or pairs <= 0:
+            return np.empty((0, 2), dtype=np.intp)
+
+        cumulative = np.cumsum(self.weight[candidates])
+        draws = self.rng.random((pairs, 2)) * cumulative[-1]
+        picks = np.minimum(np.searchsorted(cumulative, draws), len(candidates) - 1)
+        return candidates[picks]
+
+    def breed(self, pairs: np.ndarray, mutation_rate: float = 0.1, created_at: float = 0.0) -> np.ndarray:
+        """
+        One child per parent pair, appended as untested strategies.
+
+        Genes both parents use are averaged, genes only one parent uses are
+        inherited; the type comes from either parent at random. With
+        probability mutation_rate a child's genes are scaled by U(0.9, 1.1).
+
+        Returns:
+            Rows of the children
+        """
+        count = len(pairs)
+        if count == 0:
+            return np.empty(0, dtype=np.intp)
+
+        p1, p2 = pairs[:, 0], pairs[:, 1]
+        a, b = self.params[p1], self.params[p2]
+        genes = np.where(np.isnan(a), b, np.where(np.isnan(b), a, (a + b) / 2))
+
+        mutate = self.rng.random(count) < mutation_rate
+        genes[mutate] *= self.rng.uniform(0.9, 1.1, size=(int(mutate.sum()), len(GENES)))
+
+        kind = np.where(self.rng.random(count) < 0.5, self.kind[p1], self.kind[p2])
+
+        rows = self._reserve(count)
+        self.params[rows] = genes
+        self.kind[rows] = kind
+        self.weight[rows] = 0.0  # Start neutral
+        self.win_rate[rows] = 0.5
+        self.avg_pnl[rows] = 0.0
+        self.trade_count[rows] = 0
+        self.created_at[rows] = created_at
+        self.sandbox_tested[rows] = False  # Must test in sandbox
+        self.production_ready[rows] = False
+        self.dead[rows] = False
+
+        ids, names = self.ids, self.names
+        for i, j in zip(p1.tolist(), p2.tolist()):
+            child_id = f"{ids[i][:10]}_{ids[j][:10]}_{self._serial}"
+            self._serial += 1
+            self.index[child_id] = len(ids)
+            ids.append(child_id)
+            names.append(f"Evolved: {ids[i]} × {ids[j]}")
+            self.parents.append((ids[i], ids[j]))
+
+        self.size += count
+        return np.arange(rows.start, rows.stop)
+
+    def kill(self, row: int):
+        """
+        Retire a row without compacting.
+
+        The strategy leaves the index and every mask immediately; its row is
+        dropped by the next remove()/cull(), so killing many strategies one
+        at a time costs one compaction rather than one each.
+        """
+        if self.dead[row]:
+            return
+        self.dead[row] = True
+        self.sandbox_tested[row] = True
+        self.production_ready[row] = False
+        del self.index[self.ids[row]]
+        self.dead_count += 1
+
+    def remove(self, drop: np.ndarray) -> List[str]:
+        """
+        Remove the rows where drop is True, plus any killed rows, and
+        compact the columns.
+
+        Returns:
+            Ids of the removed strategies
+        """
+        drop = drop[:self.size]
+        if self.dead_count:
+            drop = drop | self.dead[:self.size]
+        if not drop.any():
+            return []
+
+        keep = np.flatnonzero(~drop)
+        removed = [self.ids[i] for i in np.flatnonzero(drop)]
+
+        for name in ("params", "kind", "weight", "win_rate", "avg_pnl", "trade_count",
+                     "created_at", "sandbox_tested", "production_ready", "dead"):
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+
+        self.ids = [self.ids[i] for i in keep]
+        self.names = [self.names[i] for i in keep]
+        self.parents = [self.parents[i] for i in keep]
+        self.index = {strategy_id: row for row, strategy_id in enumerate(self.ids)}
+        self.size = len(keep)
+        self.dead_count = 0
+        return removed
+
+    def cull(self, threshold: float) -> List[str]:
+        """Remove every strategy whose weight is below threshold (and killed rows)"""
+        return self.remove(self.weight[:self.size] < threshold)
+
+    def __repr__(self):
+        return (
+            f"StrategyPopulation(size={self.size}, "
+            f"production={int(self.production_mask().sum())}, dead={self.dead_count})"
+        )
@@ -0,0 +1,226 @@
+"""
+Per-Symbol Ring Buffers for Agent State
+
+One committee replays a merged multi-symbol stream (BTC, ETH, SOL ticks
+interleaved), so agent history has to be keyed by symbol. Instead of a dict
+of Python lists per agent, SymbolRingBuffers keeps every symbol's history in
+one preallocated NumPy array:
+
+- Fixed capacity per symbol, O(1) append, no pop(0)
+- Each value is written twice (slot i and i + capacity), so the window is
+  always one contiguous, zero-copy slice in chronological order
+- Symbols map to small integer ids; hot paths can pass the id directly
+- Storage grows by doubling the symbol dimension as new symbols appear
+
+Views returned by view() are live: they stay valid until the next append for
+that symbol.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+SymbolKey = Union[str, int]
+
+
+class SymbolRingBuffers:
+    """
+    Fixed-capacity ring buffers for several named fields, one per symbol.
+
+    Example:
+        buffers = SymbolRingBuffers(capacity=100, fields=("price", "volume"))
+        buffers.append("BTC-USD", 50000.0, 1.2)
+        prices = buffers.view("BTC-USD")           # np.ndarray, oldest first
+        volumes = buffers.view("BTC-USD", "volume")
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        fields: Sequence[str] = ("price",),
+        initial_symbols: int = 8,
+        dtype=np.float64
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._field_index = {name: i for i, name in enumerate(self.fields)}
+
+        n = max(1, initial_symbols)
+        self._data = np.zeros((len(self.fields), n, 2 * capacity), dtype=dtype)
+        self._start = np.zeros(n, dtype=np.int64)
+        self._count = np.zeros(n, dtype=np.int64)
+
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Symbol index
+    # ------------------------------------------------------------------
+
+    def symbol_id(self, symbol: SymbolKey) -> int:
+        """Integer id for symbol, allocating a new slot on first use"""
+        if isinstance(symbol, (int, np.integer)):
+            if not 0 <= symbol < len(self._names):
+                raise KeyError(f"Unknown symbol id: {symbol}")
+            return int(symbol)
+
+        sid = self._ids.get(symbol)
+        if sid is None:
+            sid = len(self._names)
+            if sid == self._data.shape[1]:
+                self._grow()
+            self._ids[symbol] = sid
+            self._names.append(symbol)
+        return sid
+
+    def _grow(self):
+        """Double the number of symbol slots"""
+        n = self._data.shape[1]
+        self._data = np.concatenate([self._data, np.zeros_like(self._data)], axis=1)
+        self._start = np.concatenate([self._start, np.zeros(n, dtype=np.int64)])
+        self._count = np.concatenate([self._count, np.zeros(n, dtype=np.int64)])
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._names)
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: SymbolKey, *values: float) -> int:
+        """
+        Append one value per field for symbol.
+
+        Returns:
+            The symbol id (callers can reuse it to skip the name lookup)
+        """
+        sid = self.symbol_id(symbol)
+        cap = self.capacity
+        start = self._start[sid]
+        count = self._count[sid]
+
+        if count < cap:
+            pos = (start + count) % cap
+            self._count[sid] = count + 1
+        else:
+            # Full: overwrite the oldest value
+            pos = start
+            self._start[sid] = (start + 1) % cap
+
+        column = self._data[:, sid]
+        column[:, pos] = values
+        column[:, pos + cap] = values
+        return sid
+
+    def view(self, symbol: SymbolKey, field: str = "price") -> np.ndarray:
+        """Window for symbol in chronological order (zero-copy)"""
+        if isinstance(symbol, str) and symbol not in self._ids:
+            return self._data[0, 0, :0]
+
+        sid = self.symbol_id(symbol)
+        start = self._start[sid]
+        return self._data[self._field_index[field], sid, start:start + self._count[sid]]
+
+    def window(
+        self,
+        symbols: Sequence[SymbolKey],
+        length: int,
+        field: str = "price"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Last `length` values of several symbols as one matrix.
+
+        Returns:
+            (values, counts): values has shape (len(symbols), length), oldest
+            first, left-padded with NaN where a symbol has fewer values;
+            counts is each symbol's history length
+        """
+        sids = np.fromiter(
+            (self.symbol_id(s) for s in symbols), dtype=np.int64, count=len(symbols)
+        )
+        start = self._start[sids]
+        counts = self._count[sids]
+
+        # Thanks to the double write, [end - length, end) is contiguous
+        idx = (start + counts)[:, None] - length + np.arange(length)
+        valid = idx >= start[:, None]
+        values = self._data[self._field_index[field], sids[:, None], np.maximum(idx, 0)]
+        return np.where(valid, values, np.nan), counts
+
+    def count(self, symbol: SymbolKey) -> int:
+        if isinstance(symbol, str) and symbol not in self._ids:
+            return 0
+        return int(self._count[self.symbol_id(symbol)])
+
+    def load(self, symbol: SymbolKey, *columns: Iterable[float]):
+        """Replace symbol's window with the given columns (one per field)"""
+        sid = self.symbol_id(symbol)
+        self._start[sid] = 0
+        self._count[sid] = 0
+        for values in zip(*columns):
+            self.append(sid, *values)
+
+    def clear(self, symbol: SymbolKey):
+        """Drop history for symbol (its id is kept)"""
+        if isinstance(symbol, str) and symbol not in self._ids:
+            return
+        sid = self.symbol_id(symbol)
+        self._start[sid] = 0
+        self._count[sid] = 0
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        """
+        Compact copy of every symbol's window (for warm starts).
+
+        Values are stored once, oldest first: (fields, symbols, capacity)
+        with each row's first `counts[i]` entries valid.
+        """
+        n = len(self._names)
+        idx = self._start[:n, None] + np.arange(self.capacity)
+        return {
+            "capacity": self.capacity,
+            "fields": self.fields,
+            "symbols": list(self._names),
+            "counts": self._count[:n].copy(),
+            "values": self._data[:, np.arange(n)[:, None], idx],
+        }
+
+    def restore(self, snapshot: Dict):
+        """Replace all history with a snapshot() (same capacity and fields)"""
+        if snapshot["capacity"] != self.capacity or tuple(snapshot["fields"]) != self.fields:
+            raise ValueError("Snapshot capacity/fields do not match these buffers")
+
+        symbols = snapshot["symbols"]
+        n = len(symbols)
+        slots = max(n, 1, self._data.shape[1])
+        self._data = np.zeros((len(self.fields), slots, 2 * self.capacity), dtype=self._data.dtype)
+        self._data[:, :n, :self.capacity] = snapshot["values"]
+        self._data[:, :n, self.capacity:] = snapshot["values"]
+        self._start = np.zeros(slots, dtype=np.int64)
+        self._count = np.zeros(slots, dtype=np.int64)
+        self._count[:n] = snapshot["counts"]
+
+        self._names = list(symbols)
+        self._ids = {symbol: i for i, symbol in enumerate(symbols)}
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __repr__(self):
+        return (
+            f"SymbolRingBuffers(symbols={len(self._names)}, capacity={self.capacity}, "
+            f"fields={self.fields})"
+        )
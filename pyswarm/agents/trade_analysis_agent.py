@@ -9,15 +9,24 @@ Key responsibilities:
 - Identify which agents contributed to successful trades
 - Update agent weights based on performance
 - Store trade patterns for strategy learning
+
+Statistics are kept as running aggregates over the lookback window (a deque):
+each completed trade is added to the window, the overall stats and the stats
+of its agents and strategy tags, and the trade falling out of the window is
+subtracted again. Metrics and per-agent / per-strategy queries are O(1) no
+matter how many trades have been seen.
 """
 
 import logging
-from typing import Dict, Optional, List
+from collections import deque
+from typing import Deque, Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import (
+    BaseAgent, AgentVote, StrategyTag, strategy_tag_names, strategy_tags_from_reason
+)
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +46,77 @@ class TradeOutcome:
     winning: bool
     contributing_agents: List[str]  # Agents that voted for this trade
     strategy_tags: List[str]  # Strategy patterns (e.g., "trend_uptrend", "news_positive")
+    tags: int = StrategyTag.NONE  # The same patterns as a StrategyTag bitmask
+
+
+class _TradeStats:
+    """
+    Running aggregates over a set of trades that supports removal.
+
+    Return variance uses Welford's update (and its inverse on removal), so
+    the Sharpe ratio stays accurate without rescanning the window.
+    """
+
+    __slots__ = ("count", "wins", "total_pnl", "total_pnl_pct", "win_pnl", "loss_pnl", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.wins = 0
+        self.total_pnl = 0.0
+        self.total_pnl_pct = 0.0
+        self.win_pnl = 0.0
+        self.loss_pnl = 0.0
+        self.mean = 0.0  # Mean pnl_pct
+        self.m2 = 0.0  # Sum of squared deviations of pnl_pct
+
+    def add(self, outcome: TradeOutcome):
+        self.count += 1
+        self.total_pnl += outcome.pnl
+        self.total_pnl_pct += outcome.pnl_pct
+        if outcome.winning:
+            self.wins += 1
+            self.win_pnl += outcome.pnl
+        else:
+            self.loss_pnl += outcome.pnl
+
+        delta = outcome.pnl_pct - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (outcome.pnl_pct - self.mean)
+
+    def remove(self, outcome: TradeOutcome):
+        if self.count <= 1:
+            self.__init__()
+            return
+
+        self.count -= 1
+        self.total_pnl -= outcome.pnl
+        self.total_pnl_pct -= outcome.pnl_pct
+        if outcome.winning:
+            self.wins -= 1
+            self.win_pnl -= outcome.pnl
+        else:
+            self.loss_pnl -= outcome.pnl
+
+        delta = outcome.pnl_pct - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (outcome.pnl_pct - self.mean))
+
+    @property
+    def losses(self) -> int:
+        return self.count - self.wins
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.count if self.count else 0.5
+
+    @property
+    def avg_pnl(self) -> float:
+        return self.total_pnl / self.count if self.count else 0.0
+
+    @property
+    def std_pnl_pct(self) -> float:
+        """Population standard deviation of pnl_pct"""
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
 
 
 class TradeAnalysisAgent(BaseAgent):
@@ -50,6 +130,11 @@ class TradeAnalysisAgent(BaseAgent):
     4. Extract strategy patterns for learning
     """
 
+    snapshot_attributes = (
+        "trade_outcomes", "metrics", "_stats", "_agent_stats", "_strategy_stats",
+        "_seq", "_best", "_worst"
+    )
+
     def __init__(
         self,
         name: str = "TradeAnalyzer",
@@ -59,8 +144,19 @@ class TradeAnalysisAgent(BaseAgent):
         super().__init__(name, weight)
         self.lookback_period = lookback_period
 
-        # Trade history
-        self.trade_outcomes: List[TradeOutcome] = []
+        # Trade history (last lookback_period trades)
+        self.trade_outcomes: Deque[TradeOutcome] = deque()
+
+        # Running aggregates over trade_outcomes, overall and indexed by
+        # contributing agent / strategy tag (entries are dropped at zero trades)
+        self._stats = _TradeStats()
+        self._agent_stats: Dict[str, _TradeStats] = {}
+        self._strategy_stats: Dict[str, _TradeStats] = {}
+
+        # Monotonic deques of (sequence, pnl) for the window's best/worst trade
+        self._seq = 0
+        self._best: Deque[Tuple[int, float]] = deque()
+        self._worst: Deque[Tuple[int, float]] = deque()
 
         # Performance metrics
         self.metrics = {
@@ -140,8 +236,8 @@ class TradeAnalysisAgent(BaseAgent):
             if vote["action"] == action
         ]
 
-        # Extract strategy tags from reasons
-        strategy_tags = self._extract_strategy_tags(committee_votes)
+        # Combine the strategy tags of all votes
+        tags = self._extract_strategy_tags(committee_votes)
 
         # Create outcome
         outcome = TradeOutcome(
@@ -155,13 +251,14 @@ class TradeAnalysisAgent(BaseAgent):
             duration_seconds=duration_seconds,
             winning=pnl > 0,
             contributing_agents=contributing_agents,
-            strategy_tags=strategy_tags
+            strategy_tags=list(strategy_tag_names(tags)),
+            tags=tags
         )
 
         # Store outcome
-        self.trade_outcomes.append(outcome)
+        self._add_outcome(outcome)
         if len(self.trade_outcomes) > self.lookback_period:
-            self.trade_outcomes.pop(0)
+            self._evict_oldest()
 
         # Update metrics
         self._update_metrics()
@@ -176,99 +273,103 @@ class TradeAnalysisAgent(BaseAgent):
 
         return outcome
 
-    def _extract_strategy_tags(self, committee_votes: List[Dict]) -> List[str]:
+    def _extract_strategy_tags(self, committee_votes: List[Dict]) -> int:
         """
-        Extract strategy tags from agent vote reasons.
+        Combine the votes' strategy tags into one StrategyTag bitmask.
 
-        Examples:
-        - "Uptrend: momentum=2.5%" → "trend_uptrend"
-        - "Positive news sentiment" → "news_positive"
-        - "RSI oversold" → "rsi_oversold"
+        Votes carry the tags their agent set ("tags"), and 0 means the agent
+        voted on no strategy. Only records without a "tags" entry (from
+        before votes were tagged) are tagged from their reason string.
         """
 
-        tags = []
+        tags = StrategyTag.NONE
 
         for vote in committee_votes:
-            reason = vote.get("reason", "").lower()
-
-            # Trend patterns
-            if "uptrend" in reason or "momentum" in reason:
-                tags.append("trend_uptrend")
-            if "downtrend" in reason:
-                tags.append("trend_downtrend")
-            if "rsi" in reason and "oversold" in reason:
-                tags.append("rsi_oversold")
-            if "rsi" in reason and "overbought" in reason:
-                tags.append("rsi_overbought")
-
-            # News patterns
-            if "positive" in reason and "news" in reason:
-                tags.append("news_positive")
-            if "negative" in reason and "news" in reason:
-                tags.append("news_negative")
-
-            # Mean reversion
-            if "mean reversion" in reason:
-                tags.append("mean_reversion")
-
-            # Breakout
-            if "breakout" in reason:
-                tags.append("breakout")
-
-            # Arbitrage
-            if "arbitrage" in reason:
-                tags.append("arbitrage")
-
-        return list(set(tags))  # Deduplicate
+            vote_tags = vote.get("tags")
+            if vote_tags is None:
+                vote_tags = strategy_tags_from_reason(vote.get("reason") or "")
+            tags |= vote_tags
+
+        return tags
+
+    def _add_outcome(self, outcome: TradeOutcome):
+        """Append a trade to the window and every aggregate it belongs to"""
+        self.trade_outcomes.append(outcome)
+        self._stats.add(outcome)
+        for index, keys in self._indexes(outcome):
+            for key in keys:
+                index.setdefault(key, _TradeStats()).add(outcome)
+
+        # Best/worst candidates: drop entries the new trade dominates
+        self._seq += 1
+        while self._best and self._best[-1][1] <= outcome.pnl:
+            self._best.pop()
+        self._best.append((self._seq, outcome.pnl))
+        while self._worst and self._worst[-1][1] >= outcome.pnl:
+            self._worst.pop()
+        self._worst.append((self._seq, outcome.pnl))
+
+    def _evict_oldest(self):
+        """Drop the oldest trade from the window and its aggregates"""
+        outcome = self.trade_outcomes.popleft()
+        self._stats.remove(outcome)
+        for index, keys in self._indexes(outcome):
+            for key in keys:
+                stats = index[key]
+                stats.remove(outcome)
+                if not stats.count:
+                    del index[key]
+
+        # The evicted trade is the oldest sequence still in the deques, if any
+        evicted_seq = self._seq - len(self.trade_outcomes)
+        for extremes in (self._best, self._worst):
+            if extremes and extremes[0][0] <= evicted_seq:
+                extremes.popleft()
+
+    def _indexes(self, outcome: TradeOutcome):
+        """(index, keys) pairs for the per-agent and per-strategy aggregates"""
+        return (
+            (self._agent_stats, set(outcome.contributing_agents)),
+            (self._strategy_stats, strategy_tag_names(outcome.tags)),
+        )
 
     def _update_metrics(self):
-        """Update performance metrics from trade history"""
+        """Update performance metrics from the running aggregates"""
 
-        if not self.trade_outcomes:
+        stats = self._stats
+        if not stats.count:
             return
 
         # Basic counts
-        self.metrics["total_trades"] = len(self.trade_outcomes)
-        self.metrics["winning_trades"] = sum(1 for t in self.trade_outcomes if t.winning)
-        self.metrics["losing_trades"] = sum(1 for t in self.trade_outcomes if not t.winning)
+        self.metrics["total_trades"] = stats.count
+        self.metrics["winning_trades"] = stats.wins
+        self.metrics["losing_trades"] = stats.losses
 
         # P&L
-        self.metrics["total_pnl"] = sum(t.pnl for t in self.trade_outcomes)
-        self.metrics["total_pnl_pct"] = sum(t.pnl_pct for t in self.trade_outcomes)
+        self.metrics["total_pnl"] = stats.total_pnl
+        self.metrics["total_pnl_pct"] = stats.total_pnl_pct
 
         # Best/worst
-        self.metrics["best_trade_pnl"] = max(t.pnl for t in self.trade_outcomes)
-        self.metrics["worst_trade_pnl"] = min(t.pnl for t in self.trade_outcomes)
+        self.metrics["best_trade_pnl"] = self._best[0][1]
+        self.metrics["worst_trade_pnl"] = self._worst[0][1]
 
         # Win/loss averages
-        winning_trades = [t for t in self.trade_outcomes if t.winning]
-        losing_trades = [t for t in self.trade_outcomes if not t.winning]
-
-        if winning_trades:
-            self.metrics["avg_win"] = sum(t.pnl for t in winning_trades) / len(winning_trades)
-
-        if losing_trades:
-            self.metrics["avg_loss"] = sum(t.pnl for t in losing_trades) / len(losing_trades)
+        self.metrics["avg_win"] = stats.win_pnl / stats.wins if stats.wins else 0.0
+        self.metrics["avg_loss"] = stats.loss_pnl / stats.losses if stats.losses else 0.0
 
         # Win rate
-        self.metrics["win_rate"] = self.metrics["winning_trades"] / self.metrics["total_trades"]
+        self.metrics["win_rate"] = stats.wins / stats.count
 
         # Profit factor
-        total_wins = sum(t.pnl for t in winning_trades)
-        total_losses = abs(sum(t.pnl for t in losing_trades))
-
-        if total_losses > 0:
-            self.metrics["profit_factor"] = total_wins / total_losses
+        total_losses = abs(stats.loss_pnl)
+        self.metrics["profit_factor"] = stats.win_pnl / total_losses if total_losses > 0 else 0.0
 
         # Sharpe ratio (simplified)
-        returns = [t.pnl_pct for t in self.trade_outcomes]
-        if len(returns) > 1:
-            mean_return = sum(returns) / len(returns)
-            variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-            std_dev = variance ** 0.5
-
-            if std_dev > 0:
-                self.metrics["sharpe_ratio"] = mean_return / std_dev
+        std_dev = stats.std_pnl_pct
+        if stats.count > 1 and std_dev > 0:
+            self.metrics["sharpe_ratio"] = stats.mean / std_dev
+        else:
+            self.metrics["sharpe_ratio"] = 0.0
 
     def get_agent_performance(self, agent_name: str) -> Dict:
         """
@@ -278,29 +379,14 @@ class TradeAnalysisAgent(BaseAgent):
             Dict with win_rate, avg_pnl, trade_count for this agent
         """
 
-        # Find trades where this agent contributed
-        agent_trades = [
-            t for t in self.trade_outcomes
-            if agent_name in t.contributing_agents
-        ]
-
-        if not agent_trades:
-            return {
-                "agent_name": agent_name,
-                "trade_count": 0,
-                "win_rate": 0.5,
-                "avg_pnl": 0.0,
-                "total_pnl": 0.0
-            }
-
-        winning_trades = [t for t in agent_trades if t.winning]
+        stats = self._agent_stats.get(agent_name, _TradeStats())
 
         return {
             "agent_name": agent_name,
-            "trade_count": len(agent_trades),
-            "win_rate": len(winning_trades) / len(agent_trades),
-            "avg_pnl": sum(t.pnl for t in agent_trades) / len(agent_trades),
-            "total_pnl": sum(t.pnl for t in agent_trades)
+            "trade_count": stats.count,
+            "win_rate": stats.win_rate,
+            "avg_pnl": stats.avg_pnl,
+            "total_pnl": stats.total_pnl
         }
 
     def get_strategy_performance(self, strategy_tag: str) -> Dict:
@@ -311,13 +397,8 @@ class TradeAnalysisAgent(BaseAgent):
             Dict with win_rate, avg_pnl, trade_count for this strategy
         """
 
-        # Find trades using this strategy
-        strategy_trades = [
-            t for t in self.trade_outcomes
-            if strategy_tag in t.strategy_tags
-        ]
-
-        if not strategy_trades:
+        stats = self._strategy_stats.get(strategy_tag, _TradeStats())
+        if not stats.count:
             return {
                 "strategy_tag": strategy_tag,
                 "trade_count": 0,
@@ -327,10 +408,8 @@ class TradeAnalysisAgent(BaseAgent):
                 "weight": 0.0
             }
 
-        winning_trades = [t for t in strategy_trades if t.winning]
-
-        win_rate = len(winning_trades) / len(strategy_trades)
-        avg_pnl = sum(t.pnl for t in strategy_trades) / len(strategy_trades)
+        win_rate = stats.win_rate
+        avg_pnl = stats.avg_pnl
 
         # Calculate weight for strategy
         # Win rate > 50% → positive weight
@@ -340,10 +419,10 @@ class TradeAnalysisAgent(BaseAgent):
 
         return {
             "strategy_tag": strategy_tag,
-            "trade_count": len(strategy_trades),
+            "trade_count": stats.count,
             "win_rate": win_rate,
             "avg_pnl": avg_pnl,
-            "total_pnl": sum(t.pnl for t in strategy_trades),
+            "total_pnl": stats.total_pnl,
             "weight": weight
         }
 
@@ -358,14 +437,9 @@ class TradeAnalysisAgent(BaseAgent):
             Dict mapping strategy_tag → weight
         """
 
-        # Find all unique strategy tags
-        all_tags = set()
-        for outcome in self.trade_outcomes:
-            all_tags.update(outcome.strategy_tags)
-
-        # Calculate weight for each
+        # Calculate weight for each strategy tag in the window
         weights = {}
-        for tag in all_tags:
+        for tag in self._strategy_stats:
             perf = self.get_strategy_performance(tag)
             weights[tag] = perf["weight"]
 
@@ -11,10 +11,14 @@ Strategy:
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from coinswarm.data_ingest.base import DataPoint
-from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote, StrategyTag
+from coinswarm.agents.feature_bus import FeatureSnapshot, momentum, rsi
+from coinswarm.agents.symbol_state import SymbolRingBuffers
 
 
 logger = logging.getLogger(__name__)
@@ -29,12 +33,28 @@ class TrendFollowingAgent(BaseAgent):
     - Moving average crossover
     - RSI (Relative Strength Index)
     - Volume confirmation
+
+    History is kept per symbol, so one agent can follow a merged
+    multi-symbol stream.
     """
 
+    cost_class = AgentCost.CHEAP
+    snapshot_attributes = ("history", "_symbol")
+
     def __init__(self, name: str = "TrendFollower", weight: float = 1.0):
         super().__init__(name, weight)
-        self.price_history = []  # Recent prices
-        self.max_history = 100  # Keep last 100 prices
+        self.max_history = 100  # Keep last 100 prices per symbol
+        self.history = SymbolRingBuffers(capacity=self.max_history)
+        self._symbol = ""  # Symbol of the most recent tick
+
+    @property
+    def price_history(self) -> List[float]:
+        """Recent prices for the most recently analyzed symbol"""
+        return self.history.view(self._symbol).tolist()
+
+    @price_history.setter
+    def price_history(self, prices: List[float]):
+        self.history.load(self._symbol, prices)
 
     async def analyze(
         self,
@@ -50,18 +70,21 @@ class TrendFollowingAgent(BaseAgent):
         2. Check moving average crossover
         3. Confirm with volume
         4. Return BUY on strong uptrend, SELL on strong downtrend
-        """
 
-        price = tick.data.get("price", 0)
-        volume = tick.data.get("volume", 0)
+        Indicators come from the committee's shared feature snapshot when
+        available (market_context["features"]); standalone, the agent keeps
+        its own price history.
+        """
 
-        # Update price history
-        self.price_history.append(price)
-        if len(self.price_history) > self.max_history:
-            self.price_history.pop(0)
+        features = market_context.get("features")
+        if features is None:
+            # Update this symbol's price history
+            self._symbol = tick.symbol
+            sid = self.history.append(tick.symbol, tick.data.get("price", 0))
+            features = FeatureSnapshot(tick.symbol, self.history.view(sid), symbol_id=sid)
 
         # Need at least 20 prices for analysis
-        if len(self.price_history) < 20:
+        if len(features) < 20:
             return AgentVote(
                 agent_name=self.name,
                 action="HOLD",
@@ -71,9 +94,9 @@ class TrendFollowingAgent(BaseAgent):
             )
 
         # Calculate indicators
-        momentum = self._calculate_momentum()
-        ma_signal = self._calculate_ma_crossover()
-        rsi = self._calculate_rsi()
+        momentum = features.get("momentum_10")
+        ma_signal = features.get("ma_crossover")
+        rsi = features.get("rsi_14")
 
         # Determine action
         if momentum > 0.02 and ma_signal == "BUY" and rsi < 70:
@@ -86,7 +109,9 @@ class TrendFollowingAgent(BaseAgent):
                 action="BUY",
                 confidence=confidence,
                 size=size,
-                reason=f"Uptrend: momentum={momentum:.2%}, RSI={rsi:.1f}"
+                reason="Uptrend: momentum={:.2%}, RSI={:.1f}",
+                reason_args=(momentum, rsi),
+                tags=StrategyTag.TREND_UPTREND
             )
 
         elif momentum < -0.02 and ma_signal == "SELL" and rsi > 30:
@@ -99,7 +124,9 @@ class TrendFollowingAgent(BaseAgent):
                 action="SELL",
                 confidence=confidence,
                 size=size,
-                reason=f"Downtrend: momentum={momentum:.2%}, RSI={rsi:.1f}"
+                reason="Downtrend: momentum={:.2%}, RSI={:.1f}",
+                reason_args=(momentum, rsi),
+                tags=StrategyTag.TREND_DOWNTREND
             )
 
         else:
@@ -109,18 +136,77 @@ class TrendFollowingAgent(BaseAgent):
                 action="HOLD",
                 confidence=0.6,
                 size=0.0,
-                reason=f"No clear trend: momentum={momentum:.2%}, RSI={rsi:.1f}"
+                reason="No clear trend: momentum={:.2%}, RSI={:.1f}",
+                reason_args=(momentum, rsi)
             )
 
-    def _calculate_momentum(self) -> float:
-        """Calculate price momentum (% change over last 10 periods)"""
-        if len(self.price_history) < 10:
-            return 0.0
+    async def analyze_batch(
+        self,
+        ticks: Sequence[DataPoint],
+        positions: Sequence[Optional[Dict]],
+        market_contexts: Sequence[Dict]
+    ) -> List[AgentVote]:
+        """
+        Score every symbol of a committee batch at once.
 
-        old_price = self.price_history[-10]
-        new_price = self.price_history[-1]
+        Same rules as analyze(), evaluated on the batch's indicator arrays
+        (momentum, MA crossover and RSI for all symbols in a few NumPy ops).
+        """
 
-        return (new_price - old_price) / old_price
+        batch = market_contexts[0].get("feature_batch") if market_contexts else None
+        if batch is None:
+            return await super().analyze_batch(ticks, positions, market_contexts)
+
+        counts = batch.get("count")
+        momentum = batch.get("momentum_10")
+        ma_signal = batch.get("ma_crossover")
+        rsi = batch.get("rsi_14")
+
+        ready = counts >= 20
+        buy = ready & (momentum > 0.02) & (ma_signal == 1) & (rsi < 70)
+        sell = ready & (momentum < -0.02) & (ma_signal == -1) & (rsi > 30)
+        confidence = np.minimum(0.9, np.abs(momentum) * 10)
+
+        votes = []
+        for i, position in enumerate(positions):
+            if not ready[i]:
+                votes.append(AgentVote(
+                    agent_name=self.name,
+                    action="HOLD",
+                    confidence=0.5,
+                    size=0.0,
+                    reason="Insufficient data for trend analysis"
+                ))
+                continue
+
+            args = (float(momentum[i]), float(rsi[i]))
+            if buy[i] or sell[i]:
+                c = float(confidence[i])
+                votes.append(AgentVote(
+                    agent_name=self.name,
+                    action="BUY" if buy[i] else "SELL",
+                    confidence=c,
+                    size=self._calculate_position_size(c, position),
+                    reason="Uptrend: momentum={:.2%}, RSI={:.1f}" if buy[i]
+                    else "Downtrend: momentum={:.2%}, RSI={:.1f}",
+                    reason_args=args,
+                    tags=StrategyTag.TREND_UPTREND if buy[i] else StrategyTag.TREND_DOWNTREND
+                ))
+            else:
+                votes.append(AgentVote(
+                    agent_name=self.name,
+                    action="HOLD",
+                    confidence=0.6,
+                    size=0.0,
+                    reason="No clear trend: momentum={:.2%}, RSI={:.1f}",
+                    reason_args=args
+                ))
+
+        return votes
+
+    def _calculate_momentum(self) -> float:
+        """Calculate price momentum (% change over last 10 periods)"""
+        return momentum(self.price_history, 10)
 
     def _calculate_ma_crossover(self) -> str:
         """
@@ -131,21 +217,7 @@ class TrendFollowingAgent(BaseAgent):
             "SELL" if fast MA < slow MA (death cross)
             "HOLD" otherwise
         """
-        if len(self.price_history) < 50:
-            return "HOLD"
-
-        # Fast MA (10 period)
-        fast_ma = sum(self.price_history[-10:]) / 10
-
-        # Slow MA (50 period)
-        slow_ma = sum(self.price_history[-50:]) / 50
-
-        if fast_ma > slow_ma * 1.01:  # 1% threshold
-            return "BUY"
-        elif fast_ma < slow_ma * 0.99:
-            return "SELL"
-        else:
-            return "HOLD"
+        return FeatureSnapshot("", self.price_history).get("ma_crossover")
 
     def _calculate_rsi(self, period: int = 14) -> float:
         """
@@ -156,31 +228,7 @@ class TrendFollowingAgent(BaseAgent):
             > 70 = overbought
             < 30 = oversold
         """
-        if len(self.price_history) < period + 1:
-            return 50.0  # Neutral
-
-        # Calculate price changes
-        changes = [
-            self.price_history[i] - self.price_history[i-1]
-            for i in range(-period, 0)
-        ]
-
-        # Separate gains and losses
-        gains = [c for c in changes if c > 0]
-        losses = [abs(c) for c in changes if c < 0]
-
-        # Average gain and loss
-        avg_gain = sum(gains) / period if gains else 0.0
-        avg_loss = sum(losses) / period if losses else 0.0
-
-        # Calculate RSI
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
+        return rsi(self.price_history, period)
 
     def _calculate_position_size(
         self,
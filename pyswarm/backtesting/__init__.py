@@ -24,6 +24,7 @@ from coinswarm.backtesting.backtest_engine import (
     BacktestTrade,
     BacktestResult
 )
+from coinswarm.backtesting.checkpoints import CommitteeCheckpoints
 from coinswarm.backtesting.continuous_backtester import (
     ContinuousBacktester,
     BacktestTask
@@ -34,6 +35,7 @@ __all__ = [
     "BacktestConfig",
     "BacktestTrade",
     "BacktestResult",
+    "CommitteeCheckpoints",
     "ContinuousBacktester",
     "BacktestTask",
 ]
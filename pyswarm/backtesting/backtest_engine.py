@@ -27,6 +27,7 @@ from collections import defaultdict
 
 from coinswarm.data_ingest.base import DataPoint
 from coinswarm.agents.committee import AgentCommittee, CommitteeDecision
+from coinswarm.backtesting.checkpoints import CommitteeCheckpoints
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ class BacktestConfig:
     commission: float = 0.001  # 0.1% per trade
     slippage: float = 0.0005  # 0.05% slippage
     max_positions: int = 5
+    batch_votes: bool = False  # One committee.vote_batch per timestamp instead of vote per tick
 
 
 @dataclass
@@ -148,7 +150,9 @@ class BacktestEngine:
     async def run_backtest(
         self,
         committee: AgentCommittee,
-        historical_data: Dict[str, List[DataPoint]]
+        historical_data: Dict[str, List[DataPoint]],
+        warm_start: Optional[CommitteeCheckpoints] = None,
+        dataset: str = "default"
     ) -> BacktestResult:
         """
         Run backtest with given committee and historical data.
@@ -156,6 +160,9 @@ class BacktestEngine:
         Args:
             committee: Agent committee to test
             historical_data: Dict mapping symbol → list of DataPoints
+            warm_start: Checkpoints to restore the committee from (the
+                nearest one at or before the first tick) instead of starting cold
+            dataset: Dataset name the checkpoints were built under
 
         Returns:
             BacktestResult with performance metrics
@@ -173,9 +180,18 @@ class BacktestEngine:
 
         logger.info(f"Loaded {len(all_ticks)} ticks for replay")
 
-        # Replay data tick-by-tick
-        for tick in all_ticks:
-            await self._process_tick(tick, committee)
+        if warm_start is not None and all_ticks:
+            checkpoint = warm_start.restore(dataset, committee, all_ticks[0].timestamp)
+            if checkpoint is not None:
+                logger.info("Warm start from %s checkpoint %s", dataset, checkpoint)
+
+        # Replay data tick-by-tick (or one cross-section per timestamp)
+        if self.config.batch_votes:
+            for ticks in self._group_by_timestamp(all_ticks):
+                await self._process_batch(ticks, committee)
+        else:
+            for tick in all_ticks:
+                await self._process_tick(tick, committee)
 
         # Close all open positions at end
         for symbol in list(self.positions.keys()):
@@ -213,6 +229,24 @@ class BacktestEngine:
 
         return all_ticks
 
+    def _group_by_timestamp(self, all_ticks: List[DataPoint]) -> List[List[DataPoint]]:
+        """Split sorted ticks into cross-sections (one tick per symbol per timestamp)"""
+
+        groups: List[List[DataPoint]] = []
+        symbols = set()
+        for tick in all_ticks:
+            if (
+                not groups
+                or tick.timestamp != groups[-1][0].timestamp
+                or tick.symbol in symbols
+            ):
+                groups.append([])
+                symbols = set()
+            groups[-1].append(tick)
+            symbols.add(tick.symbol)
+
+        return groups
+
     async def _process_tick(
         self,
         tick: DataPoint,
@@ -220,17 +254,81 @@ class BacktestEngine:
     ):
         """Process a single tick"""
 
-        self.current_time = tick.timestamp
-        self.stats["ticks_processed"] += 1
+        current_equity = self._start_tick(tick)
+
+        # Check open positions for stop loss / take profit
+        if await self._check_exits(tick):
+            return
 
+        # Get committee decision
         symbol = tick.symbol
-        price = tick.data.get("price", 0)
+        position = self.positions.get(symbol)
+        market_context = self._market_context(position, current_equity)
+
+        decision = await committee.vote(tick, position, market_context)
+        await self._execute_decision(tick, decision, committee)
+
+    async def _process_batch(
+        self,
+        ticks: List[DataPoint],
+        committee: AgentCommittee
+    ):
+        """
+        Process all ticks of one timestamp with a single committee.vote_batch.
+
+        Exits are checked for every tick first; the remaining symbols are voted
+        on together (position counts are as of the start of the timestamp) and
+        decisions are executed in tick order.
+        """
+
+        pending = []
+        for tick in ticks:
+            current_equity = self._start_tick(tick)
+            if not await self._check_exits(tick):
+                pending.append((tick, current_equity))
+
+        if not pending:
+            return
+
+        positions = [self.positions.get(tick.symbol) for tick, _ in pending]
+        contexts = [
+            self._market_context(position, equity)
+            for position, (_, equity) in zip(positions, pending)
+        ]
+
+        decisions = await committee.vote_batch(
+            [tick for tick, _ in pending], positions, contexts
+        )
+
+        for (tick, _), decision in zip(pending, decisions):
+            await self._execute_decision(tick, decision, committee)
+
+    def _start_tick(self, tick: DataPoint) -> float:
+        """Advance the clock, count the tick and record equity; returns equity"""
+
+        self.current_time = tick.timestamp
+        self.stats["ticks_processed"] += 1
 
         # Update equity curve
         current_equity = self._calculate_current_equity(tick)
         self.equity_curve.append((self.current_time, current_equity))
+        return current_equity
+
+    def _market_context(self, position: Optional[BacktestTrade], current_equity: float) -> Dict:
+        return {
+            "account_value": current_equity,
+            "position": position,
+            "open_positions": len(self.positions),
+            "max_positions": self.config.max_positions,
+            "backtest_mode": True
+        }
+
+    async def _check_exits(self, tick: DataPoint) -> bool:
+        """Apply stop loss / take profit; True if the position was closed"""
+
+        symbol = tick.symbol
+        price = tick.data.get("price", 0)
 
-        # Check open positions for stop loss / take profit
         if symbol in self.positions:
             position = self.positions[symbol]
 
@@ -245,22 +343,23 @@ class BacktestEngine:
                 if pnl_pct <= -stop_loss_pct:
                     # Stop loss triggered
                     await self._close_position(symbol, price, "stop_loss")
-                    return
+                    return True
 
                 if pnl_pct >= take_profit_pct:
                     # Take profit triggered
                     await self._close_position(symbol, price, "take_profit")
-                    return
+                    return True
 
-        # Get committee decision
-        position = self.positions.get(symbol)
-        market_context = {
-            "account_value": current_equity,
-            "position": position,
-            "backtest_mode": True
-        }
+        return False
 
-        decision = await committee.vote(tick, position, market_context)
+    async def _execute_decision(
+        self,
+        tick: DataPoint,
+        decision: CommitteeDecision,
+        committee: AgentCommittee
+    ):
+        symbol = tick.symbol
+        price = tick.data.get("price", 0)
 
         # Execute decision if confidence is high enough
         if decision.confidence >= committee.confidence_threshold:
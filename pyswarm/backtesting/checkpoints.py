@@ -0,0 +1,151 @@
+"""
+Committee Checkpoints for Warm-Started Backtests
+
+Agents start cold: TrendFollowingAgent needs 50 prices before its MA
+crossover fires, the feature bus is empty and learned weights are reset, so
+every backtest window either wastes its first segment or replays history.
+
+CommitteeCheckpoints replays a dataset once, keeps committee.snapshot() at
+regular checkpoints, and lets any window restore the nearest snapshot taken
+at or before its start:
+
+    checkpoints = CommitteeCheckpoints(every=timedelta(days=1))
+    await checkpoints.build("btc-2024", build_committee(), historical_data)
+
+    engine = BacktestEngine(config)
+    result = await engine.run_backtest(
+        build_committee(), window_data, warm_start=checkpoints, dataset="btc-2024"
+    )
+
+A snapshot labelled T holds the state after every tick before T, so a
+window starting at T continues exactly where the replay was. Snapshots are
+dicts of NumPy arrays and plain values; save() / load() pickle the cache so
+it can be reused across runs.
+"""
+
+import bisect
+import logging
+import pickle
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from coinswarm.data_ingest.base import DataPoint
+from coinswarm.agents.committee import AgentCommittee
+
+
+logger = logging.getLogger(__name__)
+
+
+class CommitteeCheckpoints:
+    """
+    Committee snapshots per dataset, sorted by checkpoint time.
+    """
+
+    def __init__(self, every: timedelta = timedelta(days=1)):
+        """
+        Args:
+            every: Spacing of the checkpoints taken by build()
+        """
+        self.every = every
+        self._times: Dict[str, List[datetime]] = {}
+        self._snapshots: Dict[str, List[Dict]] = {}
+
+    def put(self, dataset: str, timestamp: datetime, snapshot: Dict):
+        """Store a snapshot taken at timestamp (replaces one at the same time)"""
+        times = self._times.setdefault(dataset, [])
+        snapshots = self._snapshots.setdefault(dataset, [])
+
+        i = bisect.bisect_left(times, timestamp)
+        if i < len(times) and times[i] == timestamp:
+            snapshots[i] = snapshot
+        else:
+            times.insert(i, timestamp)
+            snapshots.insert(i, snapshot)
+
+    def nearest(self, dataset: str, timestamp: datetime) -> Optional[Tuple[datetime, Dict]]:
+        """Latest (checkpoint time, snapshot) at or before timestamp"""
+        times = self._times.get(dataset, [])
+        i = bisect.bisect_right(times, timestamp) - 1
+        if i < 0:
+            return None
+        return times[i], self._snapshots[dataset][i]
+
+    def restore(self, dataset: str, committee: AgentCommittee, timestamp: datetime) -> Optional[datetime]:
+        """
+        Restore the nearest checkpoint at or before timestamp into committee.
+
+        Returns:
+            The checkpoint time, or None if there is none (committee untouched)
+        """
+        found = self.nearest(dataset, timestamp)
+        if found is None:
+            return None
+
+        checkpoint, snapshot = found
+        committee.restore(snapshot)
+        return checkpoint
+
+    async def build(
+        self,
+        dataset: str,
+        committee: AgentCommittee,
+        historical_data: Dict[str, List[DataPoint]]
+    ) -> int:
+        """
+        Replay a dataset through committee, snapshotting every `every`.
+
+        The committee is advanced through the whole dataset (pass one built
+        for the purpose). Checkpoints fall on start + k × every.
+
+        Returns:
+            Number of checkpoints taken
+        """
+        ticks = sorted(
+            (tick for series in historical_data.values() for tick in series),
+            key=lambda t: t.timestamp
+        )
+        if not ticks:
+            return 0
+
+        taken = 0
+        next_at = ticks[0].timestamp + self.every
+        for tick in ticks:
+            if tick.timestamp >= next_at:
+                self.put(dataset, next_at, committee.snapshot())
+                taken += 1
+                while next_at <= tick.timestamp:
+                    next_at += self.every
+
+            await committee.vote(tick, None, {})
+
+        logger.info("Built %d checkpoints for %s from %d ticks", taken, dataset, len(ticks))
+        return taken
+
+    def checkpoints(self, dataset: str) -> List[datetime]:
+        return list(self._times.get(dataset, []))
+
+    def save(self, path: str):
+        """Pickle every checkpoint to path"""
+        with open(path, "wb") as f:
+            pickle.dump(
+                {"every": self.every, "times": self._times, "snapshots": self._snapshots},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "CommitteeCheckpoints":
+        """Load a cache written by save() (only load files you wrote)"""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+
+        cache = cls(every=data["every"])
+        cache._times = data["times"]
+        cache._snapshots = data["snapshots"]
+        return cache
+
+    def __len__(self) -> int:
+        return sum(len(times) for times in self._times.values())
+
+    def __repr__(self):
+        return f"CommitteeCheckpoints(datasets={len(self._times)}, checkpoints={len(self)}, every={self.every})"
@@ -0,0 +1,127 @@
+"""
+Snapshot Resync for Depth-Diff Streams
+
+A depth-diff stream (Binance depth@100ms) only carries the levels that
+changed, so an order book built from it (agents.order_book.OrderBook) has to
+start from a REST snapshot and needs a fresh one after any missed update;
+until then the book is flagged needs_snapshot and arbitrage holds.
+
+DepthSync sits between the websocket and the consumers and inserts a
+snapshot tick (data["update"] == "snapshot") before the first diff of each
+symbol and before the first diff after a sequence gap. It tracks the same
+update ids the books do (Binance's procedure: diffs with u <= lastUpdateId
+are stale, and the next one applied must have U <= lastUpdateId + 1), so it
+refetches exactly when a book would be waiting.
+
+Example:
+    sync = DepthSync(lambda symbol: ingestor.get_orderbook(symbol, depth=1000), "binance")
+    async for tick in sync.stream(diff_ticks):
+        await committee.vote(tick)
+"""
+
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from coinswarm.data_ingest.base import DataPoint
+
+
+logger = logging.getLogger(__name__)
+
+# symbol -> get_orderbook()-style dict: symbol, timestamp, last_update_id, bids, asks
+SnapshotFetcher = Callable[[str], Awaitable[Dict[str, Any]]]
+
+
+def snapshot_tick(snapshot: Dict[str, Any], source: str) -> DataPoint:
+    """Order book tick for a REST snapshot (replaces the consumer's book)"""
+    data = {k: v for k, v in snapshot.items() if k not in ("symbol", "timestamp")}
+    data["update"] = "snapshot"
+    return DataPoint(
+        source=source,
+        symbol=snapshot["symbol"],
+        timeframe="snapshot",
+        timestamp=snapshot["timestamp"],
+        data=data,
+        quality_score=1.0,
+        version="v1",
+    )
+
+
+class DepthSync:
+    """
+    Per-symbol update-id tracking for a depth-diff stream.
+
+    A REST fetch for a symbol is made at most once per retry_interval
+    seconds, so a failing endpoint or a snapshot that keeps lagging the
+    stream is not hammered on every diff.
+    """
+
+    def __init__(self, fetch_snapshot: SnapshotFetcher, source: str, retry_interval: float = 1.0):
+        """
+        Args:
+            fetch_snapshot: Coroutine function returning a symbol's snapshot
+            source: DataPoint source of the snapshot ticks
+            retry_interval: Minimum seconds between fetches for one symbol
+        """
+        self.fetch_snapshot = fetch_snapshot
+        self.source = source
+        self.retry_interval = retry_interval
+
+        self._synced: Dict[str, Optional[int]] = {}  # symbol -> last update id the books hold
+        self._retry_at: Dict[str, float] = {}  # symbol -> monotonic time
+
+        self.stats = {"snapshots": 0, "errors": 0}
+
+    def _advance(self, symbol: str, first: Optional[int], last: Optional[int]) -> bool:
+        """Move symbol's sync point over a diff; False if it has none or the diff gaps"""
+        if symbol not in self._synced:
+            return False
+
+        synced = self._synced[symbol]
+        if synced is not None and first is not None and first > synced + 1:
+            return False
+        if last is not None and (synced is None or last > synced):
+            self._synced[symbol] = last
+        return True
+
+    async def before(self, tick: DataPoint) -> Optional[DataPoint]:
+        """
+        Snapshot tick to deliver ahead of tick, if its book needs one.
+
+        Returns:
+            None for ticks that are not diffs, for diffs the books can apply,
+            and while a symbol waits out retry_interval
+        """
+        data = tick.data
+        if data.get("update") != "diff":
+            return None
+
+        symbol = tick.symbol
+        first, last = data.get("first_update_id"), data.get("last_update_id")
+        if self._advance(symbol, first, last):
+            return None
+
+        now = time.monotonic()
+        if now < self._retry_at.get(symbol, 0.0):
+            return None
+        self._retry_at[symbol] = now + self.retry_interval
+
+        try:
+            snapshot = await self.fetch_snapshot(symbol)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning("Order book snapshot for %s failed: %s", symbol, e)
+            return None
+
+        self.stats["snapshots"] += 1
+        self._synced[symbol] = snapshot.get("last_update_id")
+        self._advance(symbol, first, last)  # The diff follows the snapshot
+        return snapshot_tick(snapshot, self.source)
+
+    async def stream(self, ticks: AsyncIterator[DataPoint]) -> AsyncIterator[DataPoint]:
+        """ticks with snapshot ticks inserted where a book needs one"""
+        async for tick in ticks:
+            snapshot = await self.before(tick)
+            if snapshot is not None:
+                yield snapshot
+            yield tick
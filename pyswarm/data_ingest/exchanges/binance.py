@@ -18,6 +18,7 @@ from coinswarm.data_ingest.base import (
     SourceMetadata,
     StreamType,
 )
+from coinswarm.data_ingest.depth_sync import DepthSync
 
 
 class BinanceIngestor(ExchangeDataSource):
@@ -42,6 +43,9 @@ class BinanceIngestor(ExchangeDataSource):
         # WebSocket base URL
         self.ws_base_url = "wss://stream.binance.com:9443/stream"
 
+        # Levels fetched for the REST snapshots order book streams start from
+        self.snapshot_depth = 1000
+
     async def fetch_historical(
         self,
         symbol: str,
@@ -124,6 +128,10 @@ class BinanceIngestor(ExchangeDataSource):
         """
         Stream real-time data from Binance WebSocket.
 
+        Order book streams carry diffs only, so a REST snapshot tick is
+        yielded before each symbol's first diff and after any sequence gap
+        (see depth_sync.DepthSync).
+
         Args:
             symbols: List of symbols (e.g., ["BTC-USD", "ETH-USD"])
             stream_types: Types of streams to subscribe to
@@ -152,6 +160,10 @@ class BinanceIngestor(ExchangeDataSource):
 
         self.logger.info("starting_websocket", url=ws_url, streams=subscriptions)
 
+        depth = DepthSync(
+            lambda symbol: self.get_orderbook(symbol, depth=self.snapshot_depth), "binance"
+        )
+
         try:
             async with websockets.connect(ws_url) as ws:
                 async for message in ws:
@@ -167,7 +179,11 @@ class BinanceIngestor(ExchangeDataSource):
                     if "trade" in stream_name:
                         yield self._parse_trade(stream_data, symbols)
                     elif "depth" in stream_name:
-                        yield self._parse_orderbook(stream_data, symbols)
+                        tick = self._parse_orderbook(stream_data, symbols)
+                        snapshot = await depth.before(tick)
+                        if snapshot is not None:
+                            yield snapshot
+                        yield tick
                     elif "ticker" in stream_name:
                         yield self._parse_ticker(stream_data, symbols)
                     elif "kline" in stream_name:
@@ -239,6 +255,8 @@ class BinanceIngestor(ExchangeDataSource):
             return {
                 "symbol": symbol,
                 "timestamp": datetime.now(),
+                "update": "snapshot",
+                "last_update_id": orderbook.get("nonce"),
                 "bids": orderbook["bids"][:depth],  # [[price, size], ...]
                 "asks": orderbook["asks"][:depth],
                 "spread": orderbook["asks"][0][0] - orderbook["bids"][0][0]
@@ -314,6 +332,11 @@ class BinanceIngestor(ExchangeDataSource):
             timeframe="snapshot",
             timestamp=datetime.fromtimestamp(data["E"] / 1000),
             data={
+                # depth@100ms carries changed levels only (size 0 = removed);
+                # U/u let an OrderBook drop stale diffs and detect gaps
+                "update": "diff",
+                "first_update_id": data.get("U"),
+                "last_update_id": data.get("u"),
                 "bids": bids,
                 "asks": asks,
                 "spread": asks[0][0] - bids[0][0] if bids and asks else 0,
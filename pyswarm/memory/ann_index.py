@@ -0,0 +1,453 @@
+"""
+Approximate Nearest-Neighbour Indexes for Episode Recall
+
+SimpleMemory's exact recall scans every stored state (one mat-vec over the
+whole matrix). That is fine up to ~100k episodes, but the long timescales
+keep 500k - 5M episodes and exact search can't hold their latency targets
+once states stop fitting in cache. These indexes trade a little recall for
+scanning only a small part of the memory.
+
+Keys are SimpleMemory state-matrix rows (0..capacity-1). The memory calls
+add() when it writes a row and remove() when a row stops being recallable,
+so the index always follows eviction: overwriting a ring slot re-adds the
+same key with the new state. Vectors are unit-norm float32, so inner
+product = cosine similarity.
+
+Indexes:
+- IVFIndex (NumPy): spherical k-means coarse quantizer with `nlist` lists;
+  a query scans the `nprobe` lists whose centroids are closest. Until
+  `train_size` vectors have been added everything sits in one list and
+  search is exact. Inside an event loop the k-means fit then runs in the
+  default executor (search stays exact meanwhile) and the lists are
+  swapped in when it finishes. nprobe is the recall / latency knob and can be changed
+  at any time. Given a directory, each list's vectors live in their own
+  np.memmap segment file, so a query only pages in the lists it probes.
+- HNSWIndex: hnswlib graph index, if hnswlib is installed. ef_search is the
+  recall / latency knob.
+
+Example:
+    memory = SimpleMemory(
+        max_episodes=500_000,
+        index_factory=partial(make_index, "ivf", nprobe=16)
+    )
+"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from coinswarm.memory.quantization import StateQuantizer
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _top_k(keys: np.ndarray, similarities: np.ndarray, k: int, min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Best k (key, similarity) at or above min_similarity, best first"""
+    keep = similarities >= min_similarity
+    keys, similarities = keys[keep], similarities[keep]
+    if len(keys) > k:
+        best = np.argpartition(-similarities, k - 1)[:k]
+        keys, similarities = keys[best], similarities[best]
+    order = np.argsort(-similarities, kind="stable")
+    return keys[order], similarities[order]
+
+
+class VectorIndex(ABC):
+    """
+    Similarity index over unit vectors keyed by int (SimpleMemory rows).
+    """
+
+    @abstractmethod
+    def add(self, key: int, vector: np.ndarray):
+        """Insert vector under key (replaces what key held)"""
+        pass
+
+    @abstractmethod
+    def remove(self, key: int):
+        """Drop key (no-op if absent)"""
+        pass
+
+    @abstractmethod
+    def search(self, query: np.ndarray, k: int, min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate top k by inner product.
+
+        Returns:
+            (keys, similarities), best first
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class IVFIndex(VectorIndex):
+    """
+    Inverted-file index: vectors grouped into lists by nearest centroid.
+
+    Each list is a contiguous (capacity, dim) block of quantizer codes
+    (float32 by default) grown by doubling; removal moves the list's last
+    vector into the freed slot. Blocks are in RAM, or memory-mapped segment
+    files under `directory`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        dim: int,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        train_size: Optional[int] = None,
+        train_iterations: int = 10,
+        seed: Optional[int] = None,
+        quantizer: Optional[StateQuantizer] = None,
+        directory: Optional[str] = None
+    ):
+        """
+        Args:
+            capacity: Keys are 0..capacity-1
+            dim: Vector dimension
+            nlist: Number of lists (default sqrt(capacity), 16..1024)
+            nprobe: Lists scanned per query (more = better recall, slower)
+            train_size: Vectors to collect before training (default 32 × nlist)
+            train_iterations: k-means iterations when training
+            seed: Seed for k-means initialisation
+            quantizer: Storage codec for the list vectors (share the
+                       memory's so both hold the same codes)
+            directory: Keep list vectors in memmap segment files here
+                       (created if missing; default in RAM)
+        """
+        self.capacity = capacity
+        self.dim = dim
+        self.nlist = nlist or int(np.clip(np.sqrt(capacity), 16, 1024))
+        self.nprobe = nprobe
+        self.train_size = train_size or 32 * self.nlist
+        self.train_iterations = train_iterations
+        self.rng = np.random.default_rng(seed)
+        self.quantizer = quantizer or StateQuantizer()
+        self.directory = directory
+        self._segments = 0  # Segment files created (names stay unique)
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self.centroids: Optional[np.ndarray] = None  # (nlist, dim) once trained
+        self.training: Optional[asyncio.Future] = None  # Background fit in progress
+        # One list holding everything until trained
+        self._vectors: List[np.ndarray] = [self._block(16)]
+        self._keys: List[np.ndarray] = [np.empty(16, dtype=np.int64)]
+        self._sizes = np.zeros(1, dtype=np.int64)
+        self._list_of = np.zeros(capacity, dtype=np.int32)  # List + 1, 0 = absent
+        self._slot_of = np.zeros(capacity, dtype=np.int64)
+        self._count = 0
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _block(self, rows: int) -> np.ndarray:
+        """Uninitialised (rows, dim) block of codes, in RAM or a new segment file"""
+        if self.directory is None:
+            return np.empty((rows, self.dim), dtype=self.quantizer.dtype)
+
+        self._segments += 1
+        path = os.path.join(self.directory, f"segment_{self._segments}.npy")
+        return np.lib.format.open_memmap(path, mode="w+", dtype=self.quantizer.dtype, shape=(rows, self.dim))
+
+    @staticmethod
+    def _release(block: np.ndarray):
+        """Delete a replaced block's segment file (the mapping stays valid)"""
+        if isinstance(block, np.memmap):
+            os.remove(block.filename)
+
+    def _append(self, list_id: int, key: int, vector: np.ndarray):
+        size = self._sizes[list_id]
+        if size == len(self._keys[list_id]):
+            grown = self._block(2 * size)
+            grown[:size] = self._vectors[list_id][:size]
+            self._release(self._vectors[list_id])
+            self._vectors[list_id] = grown
+            self._keys[list_id] = np.resize(self._keys[list_id], 2 * size)
+
+        self._vectors[list_id][size] = self.quantizer.encode(vector)
+        self._keys[list_id][size] = key
+        self._list_of[key] = list_id + 1
+        self._slot_of[key] = size
+        self._sizes[list_id] = size + 1
+        self._count += 1
+
+    def add(self, key: int, vector: np.ndarray):
+        self.remove(key)
+        list_id = int(np.argmax(self.centroids @ vector)) if self.trained else 0
+        self._append(list_id, key, vector)
+
+        if not self.trained and self.training is None and self._count >= self.train_size:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self.train()
+            else:
+                self.training = asyncio.ensure_future(self._train_in_background())
+
+    def remove(self, key: int):
+        list_id = self._list_of[key] - 1
+        if list_id < 0:
+            return
+
+        slot = self._slot_of[key]
+        last = self._sizes[list_id] - 1
+        if slot != last:
+            moved = self._keys[list_id][last]
+            self._vectors[list_id][slot] = self._vectors[list_id][last]
+            self._keys[list_id][slot] = moved
+            self._slot_of[moved] = slot
+
+        self._sizes[list_id] = last
+        self._list_of[key] = 0
+        self._count -= 1
+
+    def search(self, query: np.ndarray, k: int, min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+        if self.trained and self.nprobe < self.nlist:
+            scores = self.centroids @ query
+            probe = np.argpartition(-scores, self.nprobe - 1)[:self.nprobe]
+        else:
+            probe = range(len(self._sizes))
+
+        keys, similarities = [], []
+        for list_id in probe:
+            size = self._sizes[list_id]
+            if size:
+                keys.append(self._keys[list_id][:size])
+                similarities.append(self.quantizer.scores(self._vectors[list_id][:size], query))
+
+        if not keys:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return _top_k(np.concatenate(keys), np.concatenate(similarities), k, min_similarity)
+
+    def _all(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(keys, codes) of every stored entry"""
+        sizes = self._sizes
+        keys = np.concatenate([self._keys[i][:sizes[i]] for i in range(len(sizes))])
+        vectors = np.concatenate([self._vectors[i][:sizes[i]] for i in range(len(sizes))])
+        return keys, vectors
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        """Nearest centroid of each vector (chunked to bound the score matrix)"""
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk):
+            assignments[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+        return assignments
+
+    def train(self, sample_size: Optional[int] = None):
+        """
+        Fit the centroids (spherical k-means) and redistribute every entry.
+
+        Runs once train_size vectors have been added (in the background
+        inside an event loop); call it again to re-fit after the state
+        distribution has drifted.
+
+        Args:
+            sample_size: Vectors used for k-means (default train_size)
+        """
+        sample = self._training_sample(sample_size)
+        if sample is not None:
+            self._install(self._fit_centroids(sample))
+
+    async def _train_in_background(self):
+        """
+        train() with the k-means fit in the default executor.
+
+        The sample is copied on the event loop; adds and removes carry on
+        into the untrained list meanwhile, and every entry present when the
+        fit finishes is redistributed.
+        """
+        try:
+            sample = self._training_sample()
+            if sample is None:
+                return
+            loop = asyncio.get_running_loop()
+            centroids = await loop.run_in_executor(None, self._fit_centroids, sample)
+            self._install(centroids)
+        except Exception as e:
+            logger.error("IVF index training failed: %s", e)
+        finally:
+            self.training = None
+
+    def _training_sample(self, sample_size: Optional[int] = None) -> Optional[np.ndarray]:
+        """Decoded copy of up to sample_size stored vectors (None if fewer than nlist)"""
+        keys, codes = self._all()
+        if len(keys) < self.nlist:
+            return None
+
+        sample_size = sample_size or self.train_size
+        if len(codes) > sample_size:
+            codes = codes[self.rng.choice(len(codes), sample_size, replace=False)]
+        return np.array(self.quantizer.decode(codes), dtype=np.float32)
+
+    def _fit_centroids(self, sample: np.ndarray) -> np.ndarray:
+        """Spherical k-means centroids of sample (touches no index state)"""
+        centroids = sample[self.rng.choice(len(sample), self.nlist, replace=False)].copy()
+        for _ in range(self.train_iterations):
+            assignments = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+
+            # Empty lists restart from a random sample vector
+            empty = np.flatnonzero(np.bincount(assignments, minlength=self.nlist) == 0)
+            sums[empty] = sample[self.rng.choice(len(sample), len(empty))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = sums / np.where(norms > 0, norms, 1.0)
+        return centroids
+
+    def _install(self, centroids: np.ndarray):
+        """Adopt centroids and rebuild the lists from every stored entry"""
+        keys, codes = self._all()
+        assignments = self._assign(self.quantizer.decode(codes), centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=self.nlist)
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+
+        for old in self._vectors:
+            self._release(old)
+        self._vectors, self._keys = [], []
+        for list_id in range(self.nlist):
+            members = order[bounds[list_id]:bounds[list_id + 1]]
+            block = max(16, 1 << len(members).bit_length())
+            self._vectors.append(self._block(block))
+            self._vectors[list_id][:len(members)] = codes[members]
+            self._keys.append(np.empty(block, dtype=np.int64))
+            self._keys[list_id][:len(members)] = keys[members]
+            self._list_of[keys[members]] = list_id + 1
+            self._slot_of[keys[members]] = np.arange(len(members))
+        self._sizes = counts.astype(np.int64)
+        self.centroids = centroids
+
+        logger.info(
+            "Trained IVF index: %d lists over %d vectors (largest list %d)",
+            self.nlist, len(keys), int(counts.max())
+        )
+
+    def __repr__(self):
+        return (
+            f"IVFIndex(size={self._count}, nlist={self.nlist}, nprobe={self.nprobe}, "
+            f"trained={self.trained})"
+        )
+
+
+class HNSWIndex(VectorIndex):
+    """
+    hnswlib graph index (inner-product space). Requires hnswlib.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        dim: int,
+        ef_search: int = 64,
+        M: int = 16,
+        ef_construction: int = 200,
+        seed: int = 100
+    ):
+        """
+        Args:
+            capacity: Keys are 0..capacity-1
+            dim: Vector dimension
+            ef_search: Candidate list size per query (more = better recall, slower)
+            M: Graph out-degree
+            ef_construction: Candidate list size while inserting
+            seed: hnswlib random seed
+        """
+        if hnswlib is None:
+            raise ImportError("HNSWIndex requires hnswlib (pip install hnswlib)")
+
+        self.capacity = capacity
+        self.dim = dim
+        self.ef_search = ef_search
+
+        self._index = hnswlib.Index(space="ip", dim=dim)
+        self._index.init_index(
+            max_elements=capacity, ef_construction=ef_construction, M=M, random_seed=seed
+        )
+        self._present = np.zeros(capacity, dtype=bool)
+        self._deleted = np.zeros(capacity, dtype=bool)  # Marked deleted in the graph
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, key: int, vector: np.ndarray):
+        if self._deleted[key]:
+            self._index.unmark_deleted(key)
+            self._deleted[key] = False
+        elif not self._present[key]:
+            self._count += 1
+
+        # Adding an existing label updates its vector in place
+        self._index.add_items(vector[None, :], np.array([key]))
+        self._present[key] = True
+
+    def remove(self, key: int):
+        if self._present[key]:
+            self._index.mark_deleted(key)
+            self._present[key] = False
+            self._deleted[key] = True
+            self._count -= 1
+
+    def search(self, query: np.ndarray, k: int, min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+        k = min(k, self._count)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        self._index.set_ef(max(self.ef_search, k))
+        labels, distances = self._index.knn_query(query[None, :], k=k)
+        # hnswlib's "ip" distance is 1 - inner product
+        return _top_k(labels[0].astype(np.int64), 1.0 - distances[0], k, min_similarity)
+
+    def __repr__(self):
+        return f"HNSWIndex(size={self._count}, ef_search={self.ef_search})"
+
+
+def make_index(kind: str, capacity: int, dim: int, **options) -> Optional[VectorIndex]:
+    """
+    Build an index by name for SimpleMemory's index_factory.
+
+    Args:
+        kind: "exact" (no index: SimpleMemory scans its matrix), "ivf" or "hnsw"
+              ("hnsw" falls back to "ivf" without hnswlib)
+        capacity: Number of keys (memory max_episodes)
+        dim: State dimension
+        **options: Index options (an IVF "nprobe" given for "hnsw" becomes
+                   ef_search = 4 × nprobe; hnswlib ignores "quantizer" and
+                   stores float32)
+    """
+    if kind == "exact":
+        return None
+
+    if kind == "hnsw":
+        if hnswlib is not None:
+            if "nprobe" in options:
+                options.setdefault("ef_search", 4 * options.pop("nprobe"))
+            options.pop("quantizer", None)
+            return HNSWIndex(capacity, dim, **options)
+        logger.warning("hnswlib not installed, using IVF index instead")
+        kind = "ivf"
+
+    if kind == "ivf":
+        return IVFIndex(capacity, dim, **options)
+
+    raise ValueError(f"Unknown index kind: {kind}")
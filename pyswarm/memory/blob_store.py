@@ -0,0 +1,185 @@
+"""
+Append-Only Compressed Blob Store
+
+Holds the cold part of stored episodes (context dicts, raw state, reason
+text) as individually zlib-compressed pickles. Records are only ever
+appended; dropping one just counts its bytes as dead, and compact()
+rewrites the live records once dead bytes dominate.
+
+Compaction can also run in two phases so the copy stays off the event
+loop: begin_compaction() snapshots the live records, Compaction.run()
+copies them (any thread; appends, reads and discards carry on meanwhile),
+and finish_compaction() moves the records appended since across and swaps
+the compacted copy in. Compaction.remap() then translates old offsets.
+
+In memory (a bytearray) by default, or in a file when a path is given so
+cold context can live on disk.
+
+Records are pickles: only read stores this process wrote.
+"""
+
+import os
+import pickle
+import zlib
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+class Compaction:
+    """
+    Copy of a BlobStore's live records as of begin_compaction().
+
+    Contiguous records are copied as one run, so a store whose live records
+    are mostly back to back (FIFO eviction) costs a handful of copies.
+    """
+
+    def __init__(self, blobs: "BlobStore", offsets: np.ndarray, lengths: np.ndarray, chunk: int = 1 << 24):
+        order = np.argsort(offsets, kind="stable")
+        self.blobs = blobs
+        self.chunk = chunk
+        self.end = blobs.size  # Records at or past end were appended later
+        self.dead = blobs.dead  # Discards up to now are dropped by the copy
+        self.old_offsets = offsets[order]
+        self.new_offsets = np.cumsum(lengths[order]) - lengths[order]
+        self.size = int(lengths.sum())  # Bytes of compacted records
+
+        # Runs of back-to-back records: [start, stop) byte ranges
+        ends = self.old_offsets + lengths[order]
+        breaks = np.flatnonzero(self.old_offsets[1:] != ends[:-1]) + 1
+        first, last = np.r_[0, breaks], np.r_[breaks, len(order)] - 1
+        self._runs = list(zip(self.old_offsets[first].tolist(), ends[last].tolist())) if len(order) else []
+
+        self._buffer: Optional[bytearray] = None
+        self.temp = f"{blobs.path}.compact" if blobs.path is not None else None
+
+    def run(self):
+        """Copy the snapshot's records back to back (safe off the event loop)"""
+        blobs = self.blobs
+        if self.temp is None:
+            source = blobs._buffer  # Appends grow it in place; the copy only reads below end
+            compacted = bytearray()
+            for start, end in self._runs:
+                compacted += source[start:end]
+            self._buffer = compacted
+        else:
+            # Own read handle: the store's handle keeps appending meanwhile
+            with open(blobs.path, "rb") as source, open(self.temp, "wb") as out:
+                for start, end in self._runs:
+                    source.seek(start)
+                    while start < end:
+                        data = source.read(min(self.chunk, end - start))
+                        out.write(data)
+                        start += len(data)
+
+    def remap(self, offsets: np.ndarray) -> np.ndarray:
+        """New offsets of records that were live at begin or appended since"""
+        appended = offsets >= self.end
+        new_offsets = offsets - self.end + self.size
+        old = ~appended
+        new_offsets[old] = self.new_offsets[np.searchsorted(self.old_offsets, offsets[old])]
+        return new_offsets
+
+
+class BlobStore:
+    """
+    Append-only sequence of compressed records addressed by (offset, length).
+    """
+
+    def __init__(self, path: Optional[str] = None, level: int = 1):
+        """
+        Args:
+            path: File to keep the blobs in (default: in memory). Truncated.
+            level: zlib compression level (1 = fastest)
+        """
+        self.path = path
+        self.level = level
+        self._buffer = bytearray() if path is None else None
+        self._file = open(path, "w+b") if path is not None else None
+
+        self.size = 0  # Bytes appended (next offset)
+        self.dead = 0  # Bytes of discarded records
+
+    def append(self, record: Any) -> Tuple[int, int]:
+        """Compress and append record; returns (offset, length)"""
+        data = zlib.compress(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL), self.level)
+        offset = self.size
+        if self._file is None:
+            self._buffer += data
+        else:
+            self._file.seek(offset)
+            self._file.write(data)
+        self.size += len(data)
+        return offset, len(data)
+
+    def read(self, offset: int, length: int) -> Any:
+        if self._file is None:
+            data = bytes(self._buffer[offset:offset + length])
+        else:
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return pickle.loads(zlib.decompress(data))
+
+    def discard(self, length: int):
+        """Count a record's bytes as dead (space is reclaimed by compact())"""
+        self.dead += length
+
+    @property
+    def should_compact(self) -> bool:
+        """Dead bytes outweigh live ones (and are worth a rewrite)"""
+        return self.dead > max(self.size - self.dead, 1 << 20)
+
+    def compact(self, offsets: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Rewrite only the given live records, back to back in offset order.
+
+        Returns:
+            New offset of each record (same order as the arguments)
+        """
+        compaction = self.begin_compaction(offsets, lengths)
+        compaction.run()
+        self.finish_compaction(compaction)
+        return compaction.remap(offsets)
+
+    def begin_compaction(self, offsets: np.ndarray, lengths: np.ndarray) -> Compaction:
+        """Snapshot the given live records for a Compaction.run() elsewhere"""
+        if self._file is not None:
+            self._file.flush()  # The copy reads through its own handle
+        return Compaction(self, offsets, lengths)
+
+    def finish_compaction(self, compaction: Compaction) -> bool:
+        """
+        Swap in a finished compaction, moving records appended meanwhile.
+
+        Returns:
+            False if the store was closed in the meantime (nothing changed)
+        """
+        tail_length = self.size - compaction.end
+        if self._file is None and self.path is not None:
+            os.remove(compaction.temp)
+            return False
+
+        if self._file is None:
+            compaction._buffer += self._buffer[compaction.end:self.size]
+            self._buffer = compaction._buffer
+        else:
+            self._file.seek(compaction.end)
+            tail = self._file.read(tail_length)
+            with open(compaction.temp, "ab") as out:
+                out.write(tail)
+            self._file.close()
+            os.replace(compaction.temp, self.path)
+            self._file = open(self.path, "r+b")
+
+        self.size = compaction.size + tail_length
+        self.dead -= compaction.dead
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __repr__(self):
+        where = self.path or "memory"
+        return f"BlobStore({where}, size={self.size}, dead={self.dead})"
@@ -0,0 +1,142 @@
+"""
+Vectorized k-means for Pattern Extraction
+
+Building blocks for SimpleMemory's pattern library:
+
+- nearest_centroid: squared distances for a whole block of states in one
+  broadcasted product (||c||² - 2·x·c; ||x||² doesn't change the argmin),
+  chunked so the (n, k) score matrix stays small
+- kmeans_plus_plus: greedy D²-weighted seeding (Arthur & Vassilvitskii, 2007)
+- minibatch_kmeans: Sculley's mini-batch k-means (2010). Each step draws a
+  batch, assigns it and moves every centroid to the running mean of the
+  points it has absorbed, so cost depends on batch size × steps rather than
+  on how many episodes are stored
+- StreamingKMeans: the same update applied to one state at a time, used to
+  keep centroids current between full reclusterings
+
+Example:
+    centroids = minibatch_kmeans(states, k=5, rng=np.random.default_rng(0))
+    stream = StreamingKMeans(centroids)
+    stream.partial_fit(new_state)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def nearest_centroid(x: np.ndarray, centroids: np.ndarray, chunk: int = 65536) -> np.ndarray:
+    """Index of the nearest centroid (Euclidean) for every row of x"""
+    offset = np.einsum("ij,ij->i", centroids, centroids)
+    assignments = np.empty(len(x), dtype=np.int64)
+    for start in range(0, len(x), chunk):
+        block = x[start:start + chunk]
+        assignments[start:start + chunk] = np.argmin(offset - 2.0 * (block @ centroids.T), axis=1)
+    return assignments
+
+
+def kmeans_plus_plus(x: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    k initial centroids, drawn with probability ∝ squared distance to the
+    nearest centroid so far. Greedy variant: each step draws 2 + log(k)
+    candidates and keeps the one that lowers the total distance most.
+    """
+    trials = 2 + int(np.log(k))
+    norms = np.einsum("ij,ij->i", x, x)
+    centroids = np.empty((k, x.shape[1]), dtype=np.float64)
+    first = rng.integers(len(x))
+    centroids[0] = x[first]
+    closest = np.maximum(norms + norms[first] - 2.0 * (x @ x[first]), 0.0)
+
+    for i in range(1, k):
+        total = closest.sum()
+        if total > 0:
+            picks = np.searchsorted(np.cumsum(closest), rng.random(trials) * total)
+            picks = np.minimum(picks, len(x) - 1)
+        else:
+            picks = rng.integers(len(x), size=trials)  # All points sit on a centroid
+
+        # (trials, n) distances; keep the candidate with the smallest potential
+        to_picks = norms[picks, None] + norms[None, :] - 2.0 * (x[picks] @ x.T)
+        distances = np.minimum(closest, np.maximum(to_picks, 0.0))
+        best = int(np.argmin(distances.sum(axis=1)))
+        centroids[i] = x[picks[best]]
+        closest = distances[best]
+
+    return centroids
+
+
+def minibatch_kmeans(
+    x: np.ndarray,
+    k: int,
+    rng: np.random.Generator,
+    batch_size: int = 1024,
+    steps: int = 50,
+    seed_sample: int = 10000
+) -> np.ndarray:
+    """
+    Mini-batch k-means centroids of the rows of x.
+
+    Args:
+        x: (n, d) states
+        k: Number of clusters (<= n)
+        rng: Random generator (seeding and batches)
+        batch_size: Rows per step
+        steps: Number of batches
+        seed_sample: Rows k-means++ seeds from
+
+    Returns:
+        (k, d) centroids
+    """
+    seed_rows = x if len(x) <= seed_sample else x[rng.choice(len(x), seed_sample, replace=False)]
+    centroids = kmeans_plus_plus(np.asarray(seed_rows, dtype=np.float64), k, rng)
+    counts = np.zeros(k, dtype=np.float64)
+
+    batch_size = min(batch_size, len(x))
+    for _ in range(steps):
+        batch = x[rng.integers(len(x), size=batch_size)]
+        assignments = nearest_centroid(batch, centroids)
+
+        members = (assignments[:, None] == np.arange(k)).astype(np.float64)  # (batch, k)
+        sums = members.T @ batch
+        absorbed = members.sum(axis=0)
+
+        # Running mean: c ← (count·c + Σ batch points) / (count + m)
+        moved = absorbed > 0
+        counts[moved] += absorbed[moved]
+        centroids[moved] += (sums[moved] - absorbed[moved, None] * centroids[moved]) / counts[moved, None]
+
+    return centroids
+
+
+class StreamingKMeans:
+    """
+    Online k-means: each new state pulls its nearest centroid towards it.
+
+    The learning rate is 1 / (points absorbed), floored at 1 / max_count so
+    centroids keep following a drifting state distribution.
+    """
+
+    def __init__(self, centroids: np.ndarray, counts: Optional[np.ndarray] = None, max_count: int = 1000):
+        """
+        Args:
+            centroids: (k, d) starting centroids (updated in place)
+            counts: Points already absorbed per centroid (default 1 each)
+            max_count: Cap on the counts (sets the minimum learning rate)
+        """
+        self.centroids = centroids
+        self.counts = np.ones(len(centroids)) if counts is None else np.minimum(counts, max_count)
+        self.max_count = max_count
+        self._offset = np.einsum("ij,ij->i", centroids, centroids)  # ||c||²
+
+    def partial_fit(self, x: np.ndarray) -> int:
+        """Absorb one state; returns the centroid it moved"""
+        i = int(np.argmin(self._offset - 2.0 * (self.centroids @ x)))
+        if self.counts[i] < self.max_count:
+            self.counts[i] += 1
+        self.centroids[i] += (x - self.centroids[i]) / self.counts[i]
+        self._offset[i] = self.centroids[i] @ self.centroids[i]
+        return i
+
+    def __len__(self) -> int:
+        return len(self.centroids)
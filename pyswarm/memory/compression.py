@@ -0,0 +1,129 @@
+"""
+State Compression for Timescale Memories
+
+HierarchicalMemory stores states at fewer dimensions on the slower
+timescales (384 → 256 / 128 / 64). Two compressors, both applied to a
+single state or a whole (n, 384) batch in one operation:
+
+- FeatureSelection: keeps the top features by TimescaleConfig group
+  weights. The indices depend only on the config, so they are computed
+  once and compression is a single fancy-indexing gather.
+- PCAProjection: a learned linear projection onto the top principal
+  components of a sample of full states. Memory only keeps compressed
+  states, so the projection has to be fitted before a timescale stores
+  anything (HierarchicalMemory.fit_projection).
+
+Example:
+    select = FeatureSelection(TIMESCALE_CONFIGS[Timescale.MONTH])
+    compressed = select(states)  # (n, 384) -> (n, 64)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+# StateBuilder feature groups: config weight attribute -> column range
+FEATURE_GROUPS = {
+    "price_weight": (0, 24),
+    "technical_weight": (24, 104),
+    "microstructure_weight": (104, 144),
+    "sentiment_weight": (144, 184),
+    "portfolio_weight": (184, 224),
+    "temporal_weight": (224, 384),
+}
+
+
+def select_features(config, dim: int = 384) -> np.ndarray:
+    """
+    Sorted indices of the config.state_dimensions most important features.
+
+    Args:
+        config: TimescaleConfig (group weights and state_dimensions)
+        dim: Full state dimension
+
+    Returns:
+        Feature indices in their original order
+    """
+    importance = np.ones(dim)
+    for weight, (start, end) in FEATURE_GROUPS.items():
+        importance[start:end] *= getattr(config, weight)
+
+    indices = np.argsort(importance)[-config.state_dimensions:]
+    indices.sort()  # Maintain order
+    return indices
+
+
+class FeatureSelection:
+    """Top-k feature selection with precomputed indices"""
+
+    def __init__(self, config, dim: int = 384):
+        """
+        Args:
+            config: TimescaleConfig
+            dim: Full state dimension
+        """
+        self.input_dim = dim
+        self.indices = select_features(config, dim)
+
+    @property
+    def output_dim(self) -> int:
+        return len(self.indices)
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        """Compress one state (dim,) or a batch (n, dim)"""
+        return states[..., self.indices]
+
+    def __repr__(self):
+        return f"FeatureSelection({self.input_dim} -> {self.output_dim})"
+
+
+class PCAProjection:
+    """Projection onto the top principal components of fitted states"""
+
+    def __init__(self, components: int):
+        """
+        Args:
+            components: Output dimension
+        """
+        self.components = components
+        self.mean: Optional[np.ndarray] = None  # (dim,)
+        self.basis: Optional[np.ndarray] = None  # (dim, components)
+        self.explained_variance_ratio: Optional[np.ndarray] = None
+
+    @property
+    def input_dim(self) -> Optional[int]:
+        return None if self.mean is None else len(self.mean)
+
+    @property
+    def output_dim(self) -> int:
+        return self.components
+
+    def fit(self, states: np.ndarray) -> "PCAProjection":
+        """
+        Fit on (n, dim) full states (n >= components).
+        """
+        states = np.asarray(states, dtype=np.float64)
+        if states.ndim != 2 or len(states) < self.components:
+            raise ValueError(
+                f"Need at least {self.components} states of shape (n, dim), got {states.shape}"
+            )
+
+        self.mean = states.mean(axis=0)
+        _, singular, vt = np.linalg.svd(states - self.mean, full_matrices=False)
+        self.basis = vt[:self.components].T.copy()
+
+        variance = singular ** 2
+        self.explained_variance_ratio = variance[:self.components] / max(variance.sum(), 1e-12)
+        return self
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        """Project one state (dim,) or a batch (n, dim)"""
+        if self.basis is None:
+            raise RuntimeError("PCAProjection used before fit()")
+        return (states - self.mean) @ self.basis
+
+    def __repr__(self):
+        explained = "unfitted" if self.explained_variance_ratio is None else \
+            f"explained={self.explained_variance_ratio.sum():.2f}"
+        return f"PCAProjection({self.input_dim} -> {self.components}, {explained})"
@@ -0,0 +1,232 @@
+"""
+Episode and Pattern records for the memory system
+
+Episode is one stored trade with its full decision context; Pattern is a
+cluster of similar episodes with aggregate statistics. Both are re-exported
+from coinswarm.memory.simple_memory.
+"""
+
+import numpy as np
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+
+if TYPE_CHECKING:
+    from coinswarm.memory.episode_store import EpisodeStore
+
+
+@dataclass
+class Episode:
+    """
+    Single trading episode stored in memory.
+
+    Captures complete context: what trade was made, why it was made,
+    all information that informed the decision, and the outcome.
+    """
+
+    # ==================== WHAT WAS DONE ====================
+
+    # Action taken
+    action: str  # "BUY", "SELL", "HOLD"
+    symbol: str
+    price: float  # Execution price
+    size: float  # Position size
+    timestamp: datetime
+
+    # ==================== WHY IT WAS DONE ====================
+
+    # Committee decision
+    confidence: float = 0.0  # Committee confidence (0-1)
+    reason: str = ""  # Human-readable explanation
+
+    # Individual agent votes (for attribution)
+    agent_votes: Dict[str, Dict] = field(default_factory=dict)
+    # Format: {"TrendFollower": {"action": "BUY", "confidence": 0.85, "reason": "..."}}
+
+    # ==================== MARKET CONTEXT ====================
+
+    # State embedding (compressed features for similarity matching)
+    state: np.ndarray = field(default_factory=lambda: np.array([]))  # Shape: (n_features,)
+
+    # Raw market data at decision time
+    market_context: Dict = field(default_factory=dict)
+    # Contains:
+    # - "price": current price
+    # - "volume_24h": 24h volume
+    # - "bid_ask_spread": spread in bps
+    # - "orderbook_depth": top of book depth
+    # - "recent_volatility": recent volatility measure
+
+    # Technical indicators
+    technical_indicators: Dict = field(default_factory=dict)
+    # Contains:
+    # - "rsi": RSI value
+    # - "macd": MACD value
+    # - "ma_20": 20-period MA
+    # - "ma_50": 50-period MA
+    # - "bollinger_upper/lower": Bollinger bands
+    # - "atr": Average True Range
+
+    # Sentiment signals
+    sentiment_data: Dict = field(default_factory=dict)
+    # Contains:
+    # - "news_sentiment": Aggregated news sentiment (-1 to 1)
+    # - "social_sentiment": Twitter/Reddit sentiment
+    # - "funding_rate": Perpetual funding rate
+    # - "fear_greed_index": Market fear/greed
+
+    # ==================== PORTFOLIO STATE ====================
+
+    # Current portfolio state when trade was made
+    portfolio_state: Dict = field(default_factory=dict)
+    # Contains:
+    # - "total_value": Total portfolio value
+    # - "cash_available": Available cash
+    # - "positions": Current positions {symbol: size}
+    # - "daily_pnl": P&L today
+    # - "drawdown": Current drawdown from peak
+    # - "risk_utilization": % of risk budget used
+
+    # ==================== OUTCOME ====================
+
+    # Trade outcome
+    reward: float = 0.0  # Actual P&L (can be negative)
+    holding_period: float = 0.0  # How long position was held (hours)
+    exit_reason: str = ""  # "take_profit", "stop_loss", "signal_reverse", etc.
+
+    # Execution quality
+    slippage: float = 0.0  # Actual fill vs expected (bps)
+    fill_time: float = 0.0  # Execution time (ms)
+    transaction_cost: float = 0.0  # Fees + slippage
+
+    # ==================== METADATA ====================
+
+    episode_id: str = ""  # Unique identifier
+    regime: str = ""  # Market regime: "trending_up", "ranging", "volatile", etc.
+    trade_type: str = ""  # "momentum", "mean_reversion", "breakout", etc.
+
+    def __post_init__(self):
+        """Validate and generate defaults"""
+        if self.action not in ["BUY", "SELL", "HOLD"]:
+            raise ValueError(f"Invalid action: {self.action}")
+
+        # Generate episode ID if not provided
+        if not self.episode_id:
+            self.episode_id = f"{self.symbol}_{self.timestamp.timestamp()}"
+
+        # Validate state vector if provided
+        if len(self.state) > 0 and self.state.ndim != 1:
+            raise ValueError(f"State must be 1D array, got shape {self.state.shape}")
+
+
+@dataclass
+class Pattern:
+    """
+    Cluster of similar episodes with aggregate statistics.
+
+    Members are kept as store slots plus the sequence number each slot had
+    when clustered (16 bytes per member), not as Episode objects; statistics
+    are computed from the store's columns and `episodes` builds views of the
+    members that are still stored on demand.
+    """
+
+    # Pattern identity
+    pattern_id: str
+    centroid: np.ndarray  # Average state vector
+
+    # Episodes in this pattern: EpisodeStore slots and their sequence numbers
+    store: Optional["EpisodeStore"] = field(default=None, repr=False, compare=False)
+    rows: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    sequences: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+    # Statistics
+    n_samples: int = 0
+    mean_reward: float = 0.0
+    std_reward: float = 0.0
+    win_rate: float = 0.0
+    sharpe_ratio: float = 0.0
+
+    # Action distribution
+    action_counts: Dict[str, int] = field(default_factory=lambda: {"BUY": 0, "SELL": 0, "HOLD": 0})
+
+    # Performance by action
+    mean_reward_by_action: Dict[str, float] = field(default_factory=dict)
+
+    # Metadata
+    created_at: datetime = field(default_factory=datetime.now)
+    last_updated: datetime = field(default_factory=datetime.now)
+
+    @property
+    def episodes(self) -> List[Episode]:
+        """Views of the members still in the store (cold context loads lazily)"""
+        if self.store is None:
+            return []
+        live = self.rows[self.store.sequence[self.rows] == self.sequences]
+        return [self.store.episode(row) for row in live.tolist()]
+
+    def update_statistics(self, centroid: Optional[np.ndarray] = None):
+        """
+        Recalculate statistics from the reward and action columns of the
+        members still in the store.
+
+        Args:
+            centroid: Use this centroid instead of averaging episode states
+        """
+        if self.store is None:
+            return
+
+        store = self.store
+        live = self.rows[store.sequence[self.rows] == self.sequences]
+        if len(live) == 0:
+            return
+
+        rewards = store.reward[live]
+        codes = store.action[live]
+
+        self.n_samples = len(rewards)
+
+        # Reward statistics
+        self.mean_reward = float(rewards.mean())
+        self.std_reward = float(rewards.std())
+
+        # Win rate
+        self.win_rate = np.count_nonzero(rewards > 0) / len(rewards)
+
+        # Sharpe ratio (annualized, assuming daily frequency)
+        self.sharpe_ratio = (self.mean_reward / self.std_reward * np.sqrt(365)) if self.std_reward > 0 else 0.0
+
+        # Action distribution and performance by action
+        counts = np.bincount(codes, minlength=len(store.actions))
+        totals = np.bincount(codes, weights=rewards, minlength=len(store.actions))
+        self.action_counts = {"BUY": 0, "SELL": 0, "HOLD": 0}
+        self.mean_reward_by_action = {}
+        for code in np.flatnonzero(counts).tolist():
+            action = store.actions[code]
+            self.action_counts[action] = int(counts[code])
+            self.mean_reward_by_action[action] = float(totals[code] / counts[code])
+
+        # Update centroid
+        if centroid is not None:
+            self.centroid = centroid
+        else:
+            states = np.array([ep.state for ep in self.episodes])
+            self.centroid = np.mean(states, axis=0)
+
+        self.last_updated = datetime.now()
+
+    def get_best_action(self) -> Tuple[str, float]:
+        """
+        Determine best action for this pattern based on historical performance.
+
+        Returns:
+            (action, expected_reward)
+        """
+        action_rewards = {
+            action: self.mean_reward_by_action.get(action, 0.0)
+            for action in ["BUY", "SELL", "HOLD"]
+        }
+
+        best_action = max(action_rewards, key=action_rewards.get)
+        expected_reward = action_rewards[best_action]
+
+        return best_action, expected_reward
@@ -0,0 +1,501 @@
+"""
+Fixed-Capacity Episode Storage
+
+SimpleMemory keeps its episodes in a fixed number of slots. Slot i holds
+one episode and its state lives in row i of the memory's state matrix, so
+evicting an episode frees a slot that the next store reuses in place: no
+list shifting and no matrix copies, whatever the capacity.
+
+Only what recall and eviction read stays resident per episode: action,
+symbol, price, size, confidence, reward and timestamp as NumPy columns. The
+rest (state vector, context dicts, agent votes, reason, ...) is compressed
+into an append-only BlobStore and loaded lazily by episode id. Once dead
+records dominate the blob store it is compacted, in the default executor
+when an event loop is running (EpisodeStore.compaction).
+
+Nothing is kept as a Python object per episode: episode ids are a
+fixed-width bytes column (optionally an np.memmap file) looked up through
+an open-addressing hash table of slots, and free slots and the FIFO order
+are NumPy rings, all allocated once at capacity.
+
+EpisodeStore is a read-only Mapping (episode_id -> Episode) over the slots.
+Which episode gives up its slot is decided by a pluggable EvictionPolicy:
+
+- FIFOEviction: oldest stored episode first
+- RetentionEviction: FIFO, and episodes older than the retention period
+  (TimescaleConfig.retention_period_days) are dropped as new ones arrive
+- RewardWeightedEviction: the least informative episode (smallest |reward|)
+  among a random sample of slots, like Redis' sampled LRU, so big wins and
+  big losses outlive flat trades
+
+Every policy costs O(1) (amortized) per insert.
+"""
+
+import asyncio
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from coinswarm.memory.blob_store import BlobStore
+from coinswarm.memory.episode import Episode
+
+
+logger = logging.getLogger(__name__)
+
+
+# Episode fields kept as NumPy columns; the rest go to the blob store
+HOT_FIELDS = ("action", "symbol", "price", "size", "timestamp", "confidence", "reward", "episode_id")
+COLD_FIELDS = tuple(f.name for f in fields(Episode) if f.name not in HOT_FIELDS)
+
+
+class EvictionPolicy(ABC):
+    """Chooses which slot a full EpisodeStore gives up"""
+
+    def stored(self, store: "EpisodeStore", slot: int):
+        """Called after an episode has been written to slot"""
+
+    @abstractmethod
+    def victim(self, store: "EpisodeStore") -> int:
+        """Slot to evict (the store is full)"""
+        pass
+
+    def expired(self, store: "EpisodeStore", now: float) -> List[int]:
+        """Slots to drop before storing at time now (Unix seconds)"""
+        return []
+
+
+class FIFOEviction(EvictionPolicy):
+    """Evict the oldest stored episode"""
+
+    def __init__(self):
+        # Ring of (slot, sequence) in store order, sized to the store's
+        # capacity on first use; entries whose slot has since been reused or
+        # freed are skipped lazily
+        self._slots: Optional[np.ndarray] = None
+        self._sequences: Optional[np.ndarray] = None
+        self._head = 0
+        self._length = 0
+
+    def stored(self, store: "EpisodeStore", slot: int):
+        if self._slots is None:
+            self._slots = np.zeros(store.capacity, dtype=np.int64)
+            self._sequences = np.zeros(store.capacity, dtype=np.int64)
+        elif self._length == len(self._slots):
+            self._drop_stale(store)
+
+        tail = (self._head + self._length) % len(self._slots)
+        self._slots[tail] = slot
+        self._sequences[tail] = store.sequence[slot]
+        self._length += 1
+
+    def _drop_stale(self, store: "EpisodeStore"):
+        """Compact the ring to its live entries (a full ring holds at least one stale)"""
+        order = (self._head + np.arange(self._length)) % len(self._slots)
+        slots, sequences = self._slots[order], self._sequences[order]
+        live = store.sequence[slots] == sequences
+        self._length = int(live.sum())
+        self._head = 0
+        self._slots[:self._length] = slots[live]
+        self._sequences[:self._length] = sequences[live]
+
+    def _oldest(self) -> Optional[Tuple[int, int]]:
+        """(slot, sequence) at the front of the ring"""
+        if not self._length:
+            return None
+        return int(self._slots[self._head]), int(self._sequences[self._head])
+
+    def _pop(self):
+        self._head = (self._head + 1) % len(self._slots)
+        self._length -= 1
+
+    def _pop_oldest(self, store: "EpisodeStore") -> Optional[int]:
+        while self._length:
+            slot, sequence = self._oldest()
+            self._pop()
+            if store.sequence[slot] == sequence:
+                return slot
+        return None
+
+    def victim(self, store: "EpisodeStore") -> int:
+        return self._pop_oldest(store)
+
+
+class RetentionEviction(FIFOEviction):
+    """FIFO, plus expiry of episodes older than the retention period"""
+
+    def __init__(self, retention: timedelta):
+        super().__init__()
+        self.retention = retention.total_seconds()
+
+    def expired(self, store: "EpisodeStore", now: float) -> List[int]:
+        cutoff = now - self.retention
+        expired = []
+        while self._length:
+            slot, sequence = self._oldest()
+            if store.sequence[slot] != sequence:
+                self._pop()  # Stale entry
+            elif store.stored_at[slot] < cutoff:
+                self._pop()
+                expired.append(slot)
+            else:
+                break
+        return expired
+
+
+class RewardWeightedEviction(EvictionPolicy):
+    """Evict the smallest-|reward| episode among `samples` random slots"""
+
+    def __init__(self, samples: int = 16, seed: Optional[int] = None):
+        self.samples = samples
+        self.rng = np.random.default_rng(seed)
+
+    def victim(self, store: "EpisodeStore") -> int:
+        candidates = self.rng.integers(0, store.capacity, self.samples)
+        # Smallest |reward|, oldest first on ties
+        order = np.lexsort((store.sequence[candidates], np.abs(store.reward[candidates])))
+        return int(candidates[order[0]])
+
+
+class StoredEpisode(Episode):
+    """
+    Episode read back from an EpisodeStore.
+
+    Hot fields are plain attributes; the cold context (state, context dicts,
+    reason, ...) is decompressed from the blob store on first access. Cold
+    fields can only be loaded while the episode is still stored (KeyError
+    after eviction), and assigning one only changes this copy. Two views
+    are equal when they read the same stored episode.
+    """
+
+    def __init__(self, store: "EpisodeStore", slot: int):
+        self.__dict__.update(
+            action=store.actions[store.action[slot]],
+            symbol=store.symbols[store.symbol[slot]],
+            price=float(store.price[slot]),
+            size=float(store.size[slot]),
+            timestamp=datetime.fromtimestamp(store.stored_at[slot]),
+            confidence=float(store.confidence[slot]),
+            reward=float(store.reward[slot]),
+            episode_id=store.id_of(slot),
+            _store=store,
+            _slot=slot,
+            _sequence=int(store.sequence[slot]),
+            _cold=None,
+        )
+
+    def __eq__(self, other):
+        # Same stored episode (each read is a new view)
+        if not isinstance(other, StoredEpisode):
+            return NotImplemented
+        return self._store is other._store and self._sequence == other._sequence
+
+    __hash__ = None
+
+    def _cold_fields(self) -> Dict:
+        if self._cold is None:
+            store, slot = self._store, self._slot
+            if store.sequence[slot] != self._sequence:
+                raise KeyError(f"Episode {self.episode_id} has been evicted")
+            self.__dict__["_cold"] = store._context(slot)
+        return self._cold
+
+
+def _cold_property(name: str) -> property:
+    def get(self):
+        return self._cold_fields()[name]
+
+    def set(self, value):
+        self._cold_fields()[name] = value
+
+    return property(get, set)
+
+
+for _name in COLD_FIELDS:
+    setattr(StoredEpisode, _name, _cold_property(_name))
+
+
+class EpisodeStore(Mapping):
+    """
+    Episodes in fixed slots, readable as {episode_id: Episode}.
+
+    Hot columns (action code, symbol id, price, size, confidence, reward,
+    timestamp, episode id) are NumPy arrays indexed by slot; everything
+    else is one compressed record per episode in a BlobStore. Reads return
+    StoredEpisode views. Iteration follows slot order, which is only
+    chronological until the first eviction.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        eviction: Optional[EvictionPolicy] = None,
+        blobs: Optional[BlobStore] = None,
+        state_dtype=None,
+        ids_path: Optional[str] = None,
+        id_width: int = 64
+    ):
+        """
+        Args:
+            capacity: Number of slots
+            eviction: Eviction policy (default FIFO)
+            blobs: Cold context storage (default in-memory BlobStore)
+            state_dtype: Store episode states as this dtype (e.g. float16;
+                default as given). They read back as float64.
+            ids_path: .npy file to memory-map the episode id column from
+                (default in RAM)
+            id_width: Maximum episode id length in UTF-8 bytes
+        """
+        self.capacity = capacity
+        self.eviction = eviction or FIFOEviction()
+        self.blobs = blobs or BlobStore()
+        self.state_dtype = state_dtype
+
+        # Hot columns
+        self.sequence = np.zeros(capacity, dtype=np.int64)  # 1-based store counter, 0 = free
+        self.stored_at = np.zeros(capacity, dtype=np.float64)  # Episode timestamp (Unix)
+        self.reward = np.zeros(capacity, dtype=np.float64)
+        self.action = np.zeros(capacity, dtype=np.int8)  # Index into actions
+        self.symbol = np.zeros(capacity, dtype=np.int32)  # Index into symbols
+        self.price = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.float64)
+        self.confidence = np.zeros(capacity, dtype=np.float32)
+        self.occupied = np.zeros(capacity, dtype=bool)
+
+        # Cold record location per slot
+        self.blob_offset = np.zeros(capacity, dtype=np.int64)
+        self.blob_length = np.zeros(capacity, dtype=np.int64)
+
+        # Episode id per slot (UTF-8, b"" = free)
+        if ids_path is None:
+            self.ids = np.zeros(capacity, dtype=f"S{id_width}")
+        else:
+            # Sparse file: disk is only used as ids are written
+            self.ids = np.lib.format.open_memmap(
+                ids_path, mode="w+", dtype=f"S{id_width}", shape=(capacity,)
+            )
+        # Linear-probing hash table of slot + 1 (0 = empty), load factor <= 1/2
+        self._table = np.zeros(1 << (2 * capacity - 1).bit_length(), dtype=np.int64)
+
+        self.actions: List[str] = []
+        self.symbols: List[str] = []
+        self._codes: Dict[str, Dict[str, int]] = {"actions": {}, "symbols": {}}
+        self._free = np.zeros(capacity, dtype=np.int64)  # Stack of freed slots below high_water
+        self._free_count = 0
+        self._high_water = 0
+        self._count = 0
+        self._stored = 0
+        self.compaction: Optional[asyncio.Future] = None  # Background blob compaction in progress
+
+    @property
+    def high_water(self) -> int:
+        """One past the highest slot ever used"""
+        return self._high_water
+
+    @property
+    def full(self) -> bool:
+        return not self._free_count and self._high_water == self.capacity
+
+    def _code(self, table: str, value: str) -> int:
+        """Small-integer code of value in the actions / symbols table"""
+        codes = self._codes[table]
+        code = codes.get(value)
+        if code is None:
+            values = getattr(self, table)
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    # Episode id -> slot
+
+    def _find(self, key: bytes) -> Tuple[int, int]:
+        """(bucket, slot) holding key, or (empty bucket to insert at, -1)"""
+        table, ids = self._table, self.ids
+        mask = len(table) - 1
+        bucket = zlib.crc32(key) & mask
+        while True:
+            entry = int(table[bucket])
+            if not entry:
+                return bucket, -1
+            if ids[entry - 1] == key:
+                return bucket, entry - 1
+            bucket = (bucket + 1) & mask
+
+    def _unlink(self, bucket: int):
+        """Empty bucket, shifting later entries of its probe run back into the hole"""
+        table, ids = self._table, self.ids
+        mask = len(table) - 1
+        hole = probe = bucket
+        while True:
+            probe = (probe + 1) & mask
+            entry = int(table[probe])
+            if not entry:
+                break
+            home = zlib.crc32(ids[entry - 1]) & mask
+            # Movable unless its home lies cyclically in (hole, probe]
+            if (probe - home) & mask >= (probe - hole) & mask:
+                table[hole] = entry
+                hole = probe
+        table[hole] = 0
+
+    @staticmethod
+    def _key(episode_id: str) -> bytes:
+        return episode_id.encode()
+
+    def id_of(self, slot: int) -> str:
+        """Episode id stored in slot"""
+        return self.ids[slot].decode()
+
+    def add(self, episode: Episode) -> int:
+        """
+        Store episode in a free slot (the store must not be full).
+
+        An episode_id already present gets a "_<n>" suffix so ids stay unique.
+
+        Returns:
+            Slot
+        """
+        key = self._key(episode.episode_id)
+        bucket, existing = self._find(key)
+        if existing >= 0:
+            episode.episode_id = f"{episode.episode_id}_{self._stored}"
+            key = self._key(episode.episode_id)
+            bucket, _ = self._find(key)
+        if len(key) > self.ids.dtype.itemsize:
+            raise ValueError(
+                f"Episode id {episode.episode_id!r} is longer than {self.ids.dtype.itemsize} bytes"
+            )
+
+        if self._free_count:
+            self._free_count -= 1
+            slot = int(self._free[self._free_count])
+        else:
+            slot = self._high_water
+            self._high_water += 1
+
+        self._stored += 1
+        self._count += 1
+        self.ids[slot] = key
+        self._table[bucket] = slot + 1
+        self.sequence[slot] = self._stored
+        self.stored_at[slot] = episode.timestamp.timestamp()
+        self.reward[slot] = episode.reward
+        self.action[slot] = self._code("actions", episode.action)
+        self.symbol[slot] = self._code("symbols", episode.symbol)
+        self.price[slot] = episode.price
+        self.size[slot] = episode.size
+        self.confidence[slot] = episode.confidence
+        self.occupied[slot] = True
+
+        cold = {name: getattr(episode, name) for name in COLD_FIELDS}
+        if self.state_dtype is not None:
+            cold["state"] = np.asarray(cold["state"], dtype=self.state_dtype)
+        self.blob_offset[slot], self.blob_length[slot] = self.blobs.append(cold)
+
+        self.eviction.stored(self, slot)
+        return slot
+
+    def remove(self, slot: int) -> str:
+        """Free slot; returns the removed episode_id"""
+        key = self.ids[slot]
+        bucket, _ = self._find(key)
+        self._unlink(bucket)
+        self.ids[slot] = b""
+        self.sequence[slot] = 0
+        self.occupied[slot] = False
+        self._free[self._free_count] = slot
+        self._free_count += 1
+        self._count -= 1
+
+        self.blobs.discard(int(self.blob_length[slot]))
+        if self.blobs.should_compact and self.compaction is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self.compact()
+            else:
+                self.compaction = asyncio.ensure_future(self._compact_in_background())
+
+        return key.decode()
+
+    def compact(self):
+        """Rewrite the blob store with only the stored episodes' records"""
+        live = np.flatnonzero(self.occupied[:self.high_water])
+        self.blob_offset[live] = self.blobs.compact(self.blob_offset[live], self.blob_length[live])
+
+    async def _compact_in_background(self):
+        """
+        compact() with the copy in the default executor.
+
+        Adds, reads and removes carry on against the old records meanwhile;
+        records appended during the copy are moved across when it finishes.
+        """
+        try:
+            live = np.flatnonzero(self.occupied[:self.high_water])
+            compaction = self.blobs.begin_compaction(self.blob_offset[live], self.blob_length[live])
+            await asyncio.get_running_loop().run_in_executor(None, compaction.run)
+            if self.blobs.finish_compaction(compaction):
+                live = np.flatnonzero(self.occupied[:self.high_water])
+                self.blob_offset[live] = compaction.remap(self.blob_offset[live])
+        except Exception as e:
+            logger.error("Blob store compaction failed: %s", e)
+        finally:
+            self.compaction = None
+
+    def episode(self, slot: int) -> StoredEpisode:
+        """The episode in an occupied slot (cold context loads lazily)"""
+        return StoredEpisode(self, slot)
+
+    def slot_of(self, episode_id: str) -> Optional[int]:
+        slot = self._find(self._key(episode_id))[1]
+        return slot if slot >= 0 else None
+
+    def context(self, episode_id: str) -> Dict:
+        """Cold fields of a stored episode ({field: value})"""
+        slot = self.slot_of(episode_id)
+        if slot is None:
+            raise KeyError(episode_id)
+        return self._context(slot)
+
+    def _context(self, slot: int) -> Dict:
+        cold = self.blobs.read(int(self.blob_offset[slot]), int(self.blob_length[slot]))
+        if self.state_dtype is not None:
+            cold["state"] = cold["state"].astype(np.float64)
+        return cold
+
+    # Mapping interface
+
+    def __getitem__(self, episode_id: str) -> StoredEpisode:
+        slot = self.slot_of(episode_id)
+        if slot is None:
+            raise KeyError(episode_id)
+        return StoredEpisode(self, slot)
+
+    def __contains__(self, episode_id) -> bool:
+        return isinstance(episode_id, str) and self.slot_of(episode_id) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _live_slots(self) -> List[int]:
+        return np.flatnonzero(self.occupied[:self.high_water]).tolist()
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.id_of(slot) for slot in self._live_slots())
+
+    def values(self) -> Iterator[StoredEpisode]:
+        return (StoredEpisode(self, slot) for slot in self._live_slots())
+
+    def items(self) -> Iterator:
+        return ((episode.episode_id, episode) for episode in self.values())
+
+    def __repr__(self):
+        return (
+            f"EpisodeStore({len(self)}/{self.capacity}, "
+            f"eviction={type(self.eviction).__name__})"
+        )
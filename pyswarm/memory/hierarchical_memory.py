@@ -15,10 +15,18 @@ Timescale Hierarchy:
 ├── Month: Macro trends, seasonal patterns
 └── Year+: Long-term cycles, regime shifts
 
-Memory Tiers:
-1. HOT (< 1 hour):  In-memory, 10k episodes, microsecond retrieval
-2. WARM (1 hour - 1 week): In-memory, 100k episodes, millisecond retrieval
-3. COLD (> 1 week): Disk/DB, unlimited episodes, second retrieval
+Memory Tiers (TimescaleConfig.storage_tier, files under storage_dir):
+1. HOT (< 1 hour):  Everything in RAM, microsecond retrieval
+2. WARM (1 hour - 1 week): State vectors in RAM, episode context in a
+   compressed blob file, millisecond retrieval
+3. COLD (> 1 week): Context in a blob file; state matrix, episode ids and
+   IVF lists in np.memmap files paged in on demand. What stays resident is
+   fixed-size NumPy columns allocated at max_episodes (roughly 150 bytes
+   per slot) plus pattern membership (16 bytes per clustered episode), so
+   resident memory is bounded as the long-horizon memories grow
+
+Episodes older than retention_period_days are dropped as new ones arrive,
+and by start_expiry()'s background task for memories that go quiet.
 
 State Compression:
 - HFT: Full 384-dim state (need all microstructure details)
@@ -40,12 +48,23 @@ Academic References:
 
 import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
-
+import heapq
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+
+from coinswarm.memory.ann_index import make_index
+from coinswarm.memory.compression import FeatureSelection, PCAProjection
+from coinswarm.memory.quantization import make_quantizer
+from coinswarm.memory.episode_store import RetentionEviction
 from coinswarm.memory.simple_memory import Episode, Pattern, SimpleMemory
 
 logger = logging.getLogger(__name__)
@@ -109,9 +128,16 @@ class TimescaleConfig:
     max_episodes: int           # Max episodes to keep
     state_dimensions: int       # State vector size (compression)
     retention_period_days: int  # How long to keep episodes
-    storage_tier: str           # "hot", "warm", "cold"
+    storage_tier: str           # "hot" (RAM), "warm" (context on disk), "cold" (all on disk)
     retrieval_latency_ms: float # Expected retrieval latency
 
+    # Similarity index: "exact" (full scan), "ivf" or "hnsw" (memory/ann_index.py)
+    index: str = "exact"
+    index_nprobe: int = 16      # IVF lists scanned per query (recall vs latency)
+
+    # State storage: "float32", "float16" or "int8" (memory/quantization.py)
+    quantization: str = "float32"
+
     # Feature importance weights (which features matter most?)
     price_weight: float = 1.0
     technical_weight: float = 1.0
@@ -180,6 +206,9 @@ TIMESCALE_CONFIGS = {
         retention_period_days=730,  # 2 years
         storage_tier="warm",
         retrieval_latency_ms=50.0,
+        index="ivf",                # Too many episodes for a full scan
+        index_nprobe=16,
+        quantization="float16",     # Half the memory, recall@10 ~0.999 (slower scan)
         technical_weight=1.5,
         sentiment_weight=2.0,       # Swing trading follows news
         microstructure_weight=0.5,  # Less relevant
@@ -191,6 +220,9 @@ TIMESCALE_CONFIGS = {
         retention_period_days=1825, # 5 years
         storage_tier="cold",
         retrieval_latency_ms=100.0,
+        index="ivf",
+        index_nprobe=16,
+        quantization="int8",        # Cold tiers: a quarter of the memory, recall@10 ~0.98
         technical_weight=1.0,
         sentiment_weight=2.0,
         portfolio_weight=1.5,       # Position management matters
@@ -202,6 +234,9 @@ TIMESCALE_CONFIGS = {
         retention_period_days=3650, # 10 years
         storage_tier="cold",
         retrieval_latency_ms=500.0,
+        index="ivf",
+        index_nprobe=24,
+        quantization="int8",
         sentiment_weight=3.0,       # Macro sentiment dominates
         technical_weight=0.5,
         microstructure_weight=0.1,
@@ -213,6 +248,9 @@ TIMESCALE_CONFIGS = {
         retention_period_days=7300, # 20 years
         storage_tier="cold",
         retrieval_latency_ms=1000.0,
+        index="ivf",
+        index_nprobe=32,
+        quantization="int8",
         sentiment_weight=5.0,       # Long-term is all macro
         price_weight=2.0,           # Price trends
         technical_weight=0.1,
@@ -236,35 +274,76 @@ class HierarchicalMemory:
 
     def __init__(
         self,
-        enabled_timescales: Optional[List[Timescale]] = None
+        enabled_timescales: Optional[List[Timescale]] = None,
+        storage_dir: Optional[str] = None
     ):
         """
         Initialize hierarchical memory.
 
         Args:
             enabled_timescales: Which timescales to enable (default: all)
+            storage_dir: Directory for warm and cold tier files (default: a
+                temporary directory removed by close())
         """
         if enabled_timescales is None:
             enabled_timescales = list(Timescale)
 
+        self._tempdir = None
+        if storage_dir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="coinswarm-memory-")
+            storage_dir = self._tempdir.name
+        os.makedirs(storage_dir, exist_ok=True)
+        self.storage_dir = storage_dir
+        self._expiry_task: Optional[asyncio.Task] = None
+
         # Create memory store for each timescale
         self.memories: Dict[Timescale, SimpleMemory] = {}
+        # State compressor per timescale (None = stored at full dimension)
+        self.compressors: Dict[Timescale, Optional[Callable[[np.ndarray], np.ndarray]]] = {}
 
         for timescale in enabled_timescales:
             config = TIMESCALE_CONFIGS[timescale]
+            quantizer = make_quantizer(config.quantization)
+            self.compressors[timescale] = (
+                FeatureSelection(config) if config.state_dimensions < 384 else None
+            )
+
+            # Tier placement: warm puts context on disk, cold also the vectors
+            base = os.path.join(storage_dir, timescale.value)
+            on_disk = config.storage_tier in ("warm", "cold")
+            cold = config.storage_tier == "cold"
+            index_options = {"nprobe": config.index_nprobe, "quantizer": quantizer}
+            if cold and config.index == "ivf":
+                index_options["directory"] = f"{base}.ivf"
 
             self.memories[timescale] = SimpleMemory(
                 max_episodes=config.max_episodes,
                 pattern_update_frequency=max(100, config.max_episodes // 100),
-                min_pattern_samples=max(5, config.max_episodes // 1000)
+                min_pattern_samples=max(5, config.max_episodes // 1000),
+                index_factory=partial(make_index, config.index, **index_options),
+                eviction=RetentionEviction(timedelta(days=config.retention_period_days)),
+                blob_path=f"{base}.blobs" if on_disk else None,
+                quantizer=quantizer,
+                state_path=f"{base}.states.npy" if cold else None,
+                ids_path=f"{base}.ids.npy" if cold else None
             )
 
         # Statistics
         self.stats = {
             "total_episodes_stored": 0,
-            "episodes_by_timescale": {ts: 0 for ts in enabled_timescales}
+            "episodes_by_timescale": {ts: 0 for ts in enabled_timescales},
+            "recall_latency": {
+                ts: {"count": 0, "total_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0, "slo_misses": 0}
+                for ts in enabled_timescales
+            }
         }
 
+        # Per-timescale searches of one recall run in parallel
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(self.memories), os.cpu_count() or 1)),
+            thread_name_prefix="memory-recall"
+        )
+
         logger.info(
             f"HierarchicalMemory initialized with {len(self.memories)} timescales: "
             f"{[ts.value for ts in enabled_timescales]}"
@@ -306,7 +385,7 @@ class HierarchicalMemory:
 
         return episode_id
 
-    async def recall_similar(
+    def recall(
         self,
         state: np.ndarray,
         timescale: Timescale,
@@ -315,7 +394,11 @@ class HierarchicalMemory:
         cross_timescale: bool = False
     ) -> List[Tuple[Episode, float, Timescale]]:
         """
-        Recall similar episodes from memory.
+        Recall similar episodes from memory (synchronous core).
+
+        With cross_timescale the primary and adjacent timescales are
+        searched in parallel (see _fan_out); adjacent results count k//2
+        each and their similarity is discounted by 0.8.
 
         Args:
             state: Current state vector
@@ -327,46 +410,110 @@ class HierarchicalMemory:
         Returns:
             List of (episode, similarity, timescale) tuples
         """
-        results = []
-
-        # Query primary timescale
+        queries = []
         if timescale in self.memories:
-            config = TIMESCALE_CONFIGS[timescale]
+            queries.append((timescale, k, 1.0))
 
-            # Compress state if needed
-            compressed_state = state
-            if len(state) > config.state_dimensions:
-                compressed_state = self._compress_state(state, config)
-
-            similar = await self.memories[timescale].recall_similar(
-                compressed_state, k=k, min_similarity=min_similarity
+        # Optionally check adjacent timescales (discount cross-timescale)
+        if cross_timescale:
+            queries.extend(
+                (adjacent, k // 2, 0.8)
+                for adjacent in self._get_adjacent_timescales(timescale)
+                if adjacent in self.memories
             )
 
-            # Add timescale tag
-            results.extend([
-                (ep, sim, timescale) for ep, sim in similar
-            ])
+        return self._fan_out(state, queries, k, min_similarity)
 
-        # Optionally check adjacent timescales
-        if cross_timescale:
-            adjacent = self._get_adjacent_timescales(timescale)
-            for adj_ts in adjacent:
-                if adj_ts in self.memories:
-                    config = TIMESCALE_CONFIGS[adj_ts]
-                    compressed_state = self._compress_state(state, config)
+    def recall_across(
+        self,
+        state: np.ndarray,
+        timescales: Optional[List[Timescale]] = None,
+        k: int = 10,
+        min_similarity: float = 0.7
+    ) -> List[Tuple[Episode, float, Timescale]]:
+        """
+        Best k episodes across several timescales (default: all enabled),
+        searched in parallel, similarities undiscounted.
+        """
+        if timescales is None:
+            timescales = list(self.memories)
+        queries = [(ts, k, 1.0) for ts in timescales if ts in self.memories]
+        return self._fan_out(state, queries, k, min_similarity)
 
-                    similar = await self.memories[adj_ts].recall_similar(
-                        compressed_state, k=k//2, min_similarity=min_similarity
-                    )
+    def _fan_out(
+        self,
+        state: np.ndarray,
+        queries: List[Tuple[Timescale, int, float]],
+        k: int,
+        min_similarity: float
+    ) -> List[Tuple[Episode, float, Timescale]]:
+        """
+        Run (timescale, k, discount) searches and merge the top k.
 
-                    results.extend([
-                        (ep, sim * 0.8, adj_ts) for ep, sim in similar  # Discount cross-timescale
-                    ])
+        Searches run on the recall thread pool when there is more than one
+        (the scans are NumPy and release the GIL). Each search's latency is
+        recorded against its timescale's retrieval_latency_ms SLO.
+        """
+        if len(queries) == 1:
+            outcomes = [self._recall_one(state, *queries[0], min_similarity)]
+        else:
+            futures = [
+                self._executor.submit(self._recall_one, state, *query, min_similarity)
+                for query in queries
+            ]
+            outcomes = [future.result() for future in futures]
 
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
+        for (timescale, _, _), (_, latency_ms) in zip(queries, outcomes):
+            self._record_latency(timescale, latency_ms)
 
-        return results[:k]
+        # Merge: results are already sorted per timescale; ties keep query order
+        results = chain.from_iterable(similar for similar, _ in outcomes)
+        return heapq.nlargest(k, results, key=lambda result: result[1])
+
+    def _recall_one(
+        self,
+        state: np.ndarray,
+        timescale: Timescale,
+        k: int,
+        discount: float,
+        min_similarity: float
+    ) -> Tuple[List[Tuple[Episode, float, Timescale]], float]:
+        """One timescale's search; returns (tagged results, latency ms)"""
+        started = time.perf_counter()
+        compressed_state = self._compress_state(state, TIMESCALE_CONFIGS[timescale])
+        similar = self.memories[timescale].recall(
+            compressed_state, k=k, min_similarity=min_similarity
+        )
+        results = [(ep, sim * discount, timescale) for ep, sim in similar]
+        return results, (time.perf_counter() - started) * 1000
+
+    def _record_latency(self, timescale: Timescale, latency_ms: float):
+        """Track recall latency per timescale against its SLO"""
+        latency = self.stats["recall_latency"][timescale]
+        latency["count"] += 1
+        latency["total_ms"] += latency_ms
+        latency["last_ms"] = latency_ms
+        if latency_ms > latency["max_ms"]:
+            latency["max_ms"] = latency_ms
+        if latency_ms > TIMESCALE_CONFIGS[timescale].retrieval_latency_ms:
+            latency["slo_misses"] += 1
+            logger.debug(
+                "Recall on %s took %.2fms (SLO %.2fms)",
+                timescale.value, latency_ms, TIMESCALE_CONFIGS[timescale].retrieval_latency_ms
+            )
+
+    async def recall_similar(
+        self,
+        state: np.ndarray,
+        timescale: Timescale,
+        k: int = 10,
+        min_similarity: float = 0.7,
+        cross_timescale: bool = False
+    ) -> List[Tuple[Episode, float, Timescale]]:
+        """Awaitable form of recall() for existing async callers"""
+        return self.recall(
+            state, timescale, k=k, min_similarity=min_similarity, cross_timescale=cross_timescale
+        )
 
     def suggest_action(
         self,
@@ -406,46 +553,121 @@ class HierarchicalMemory:
         """
         Compress state vector based on timescale config.
 
-        Uses weighted feature selection:
+        Uses the timescale's compressor (memory/compression.py): weighted
+        feature selection with indices precomputed at init, or a PCA
+        projection installed by fit_projection(). Selection keeps:
         - HFT: Keep all microstructure features
         - Day: Keep technical indicators
         - Long-term: Keep only macro sentiment
 
         Args:
-            state: Full 384-dim state vector
+            state: Full 384-dim state vector, or an (n, 384) batch
             config: Timescale configuration
 
         Returns:
-            Compressed state vector
+            Compressed state vector (or batch)
         """
-        if len(state) <= config.state_dimensions:
+        if state.shape[-1] <= config.state_dimensions:
             return state
 
-        # Feature ranges (from StateBuilder)
-        price_range = (0, 24)
-        technical_range = (24, 104)
-        micro_range = (104, 144)
-        sentiment_range = (144, 184)
-        portfolio_range = (184, 224)
-        temporal_range = (224, 384)
+        compressor = self.compressors.get(config.timescale)
+        if compressor is None or compressor.input_dim != state.shape[-1]:
+            compressor = FeatureSelection(config, state.shape[-1])
+
+        return compressor(state)
+
+    def fit_projection(self, timescale: Timescale, states: np.ndarray) -> PCAProjection:
+        """
+        Compress a timescale with PCA instead of feature selection.
+
+        Memory keeps only compressed states, so the projection must be
+        fitted before the timescale stores anything (e.g. on StateBuilder
+        output for the history about to be backfilled).
+
+        Args:
+            timescale: Timescale to compress with the projection
+            states: (n, 384) full state vectors to fit on
+
+        Returns:
+            The fitted projection
+        """
+        if timescale not in self.memories:
+            raise ValueError(f"Timescale {timescale} not enabled")
+        if len(self.memories[timescale].episodes) > 0:
+            raise ValueError(f"Timescale {timescale} already holds episodes; fit before storing")
 
-        # Calculate weighted importance for each feature
-        importance = np.ones(len(state))
+        projection = PCAProjection(TIMESCALE_CONFIGS[timescale].state_dimensions).fit(states)
+        self.compressors[timescale] = projection
+        logger.info(
+            "Fitted PCA projection for %s: %d -> %d dims, %.1f%% variance explained",
+            timescale.value, projection.input_dim, projection.output_dim,
+            100 * projection.explained_variance_ratio.sum()
+        )
+        return projection
 
-        importance[price_range[0]:price_range[1]] *= config.price_weight
-        importance[technical_range[0]:technical_range[1]] *= config.technical_weight
-        importance[micro_range[0]:micro_range[1]] *= config.microstructure_weight
-        importance[sentiment_range[0]:sentiment_range[1]] *= config.sentiment_weight
-        importance[portfolio_range[0]:portfolio_range[1]] *= config.portfolio_weight
-        importance[temporal_range[0]:temporal_range[1]] *= config.temporal_weight
+    def expire(self, now: Optional[datetime] = None) -> Dict[Timescale, int]:
+        """
+        Drop episodes past their timescale's retention period.
 
-        # Select top N features by importance
-        top_indices = np.argsort(importance)[-config.state_dimensions:]
-        top_indices.sort()  # Maintain order
+        Args:
+            now: Reference time (default: wall clock; pass the simulated
+                 time when memories hold backfilled history)
 
-        compressed = state[top_indices]
+        Returns:
+            Episodes dropped per timescale
+        """
+        return {timescale: memory.expire(now) for timescale, memory in self.memories.items()}
+
+    def start_expiry(
+        self,
+        interval_seconds: float = 3600.0,
+        clock: Callable[[], datetime] = datetime.now
+    ) -> asyncio.Task:
+        """
+        Run expire() every interval_seconds in the background.
 
-        return compressed
+        Args:
+            interval_seconds: Time between sweeps
+            clock: Reference time for each sweep
+
+        Returns:
+            The background task (stop it with stop_expiry())
+        """
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expiry_loop(interval_seconds, clock))
+        return self._expiry_task
+
+    async def stop_expiry(self):
+        """Cancel the background expiry task"""
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+
+    async def _expiry_loop(self, interval_seconds: float, clock: Callable[[], datetime]):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            dropped = self.expire(clock())
+            if any(dropped.values()):
+                logger.info(
+                    "Expired episodes: %s",
+                    {ts.value: n for ts, n in dropped.items() if n}
+                )
+
+    def close(self):
+        """Close tier files (and remove the temporary storage directory)"""
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
+        self._executor.shutdown(wait=True)
+        for memory in self.memories.values():
+            memory.close()
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
 
     def _get_adjacent_timescales(self, timescale: Timescale) -> List[Timescale]:
         """Get adjacent timescales (one level up and down)"""
@@ -469,14 +691,26 @@ class HierarchicalMemory:
 
         for timescale, memory in self.memories.items():
             mem_stats = memory.get_statistics()
+            latency = self.stats["recall_latency"][timescale]
             stats["by_timescale"][timescale.value] = {
                 "episodes": len(memory.episodes),
                 "patterns": len(memory.patterns),
                 "cache_utilization": mem_stats["cache_utilization"],
+                "state_bytes": mem_stats["state_bytes"],
+                "recall_latency": {
+                    "count": latency["count"],
+                    "mean_ms": latency["total_ms"] / latency["count"] if latency["count"] else 0.0,
+                    "last_ms": latency["last_ms"],
+                    "max_ms": latency["max_ms"],
+                    "slo_ms": TIMESCALE_CONFIGS[timescale].retrieval_latency_ms,
+                    "slo_misses": latency["slo_misses"]
+                },
                 "config": {
                     "max_episodes": TIMESCALE_CONFIGS[timescale].max_episodes,
                     "state_dims": TIMESCALE_CONFIGS[timescale].state_dimensions,
-                    "retention_days": TIMESCALE_CONFIGS[timescale].retention_period_days
+                    "retention_days": TIMESCALE_CONFIGS[timescale].retention_period_days,
+                    "quantization": TIMESCALE_CONFIGS[timescale].quantization,
+                    "storage_tier": TIMESCALE_CONFIGS[timescale].storage_tier
                 }
             }
 
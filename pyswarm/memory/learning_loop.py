@@ -26,6 +26,7 @@ from datetime import datetime
 
 from coinswarm.memory.simple_memory import SimpleMemory, Episode
 from coinswarm.memory.state_builder import StateBuilder
+from coinswarm.agents.base_agent import StrategyTag
 from coinswarm.agents.trade_analysis_agent import TradeAnalysisAgent
 from coinswarm.agents.strategy_learning_agent import StrategyLearningAgent
 from coinswarm.agents.committee import AgentCommittee
@@ -201,7 +202,8 @@ class LearningLoop:
                 vote.agent_name: {
                     "action": vote.action,
                     "confidence": vote.confidence,
-                    "reason": vote.reason
+                    "reason": vote.reason,
+                    "tags": int(vote.tags)
                 }
                 for vote in decision.votes
             }
@@ -248,7 +250,7 @@ class LearningLoop:
             entry_price=entry_price,
             exit_price=exit_price,
             committee_votes=[
-                {"agent_name": name, "action": vote["action"], "reason": vote["reason"]}
+                {"agent_name": name, "action": vote["action"], "reason": vote["reason"], "tags": vote["tags"]}
                 for name, vote in agent_votes.items()
             ]
         )
@@ -273,10 +275,10 @@ class LearningLoop:
 
         # Strategy learner automatically evolves in update_strategy_weights()
         # Track how many strategies exist
-        old_count = len(self.strategy_learner.strategies)
+        old_count = len(self.strategy_learner.population)
 
         # Check if new strategies were created
-        new_count = len(self.strategy_learner.strategies)
+        new_count = len(self.strategy_learner.population)
         if new_count > old_count:
             self.stats["strategies_evolved"] += (new_count - old_count)
 
@@ -290,7 +292,7 @@ class LearningLoop:
             f"Learning update: "
             f"memory={len(self.memory.episodes)}, "
             f"patterns={len(self.memory.patterns)}, "
-            f"strategies={len(self.strategy_learner.strategies)}, "
+            f"strategies={len(self.strategy_learner.population)}, "
             f"committee_win_rate={self.committee.win_rate:.2%}"
         )
 
@@ -333,15 +335,30 @@ class LearningLoop:
 
     def _classify_trade_type(self, agent_votes: Dict[str, Dict]) -> str:
         """
-        Classify trade type based on which agents voted for it.
+        Classify trade type from the votes' strategy tags, falling back to
+        which agents voted when no vote is tagged.
 
         Types:
-        - momentum: TrendFollower voted
-        - mean_reversion: MeanReversionAgent voted
-        - news_driven: NewsAnalyst voted
+        - momentum: trend tags (or TrendFollower voted)
+        - mean_reversion: mean reversion / RSI tags (or MeanReversionAgent voted)
+        - news_driven: news tags (or NewsAnalyst voted)
+        - arbitrage: arbitrage tag
         - sentiment: SentimentAgent voted
         - combined: Multiple different agents
         """
+        tags = StrategyTag.NONE
+        for vote in agent_votes.values():
+            tags |= vote.get("tags", StrategyTag.NONE)
+
+        if tags & StrategyTag.TREND:
+            return "momentum"
+        if tags & (StrategyTag.MEAN_REVERSION | StrategyTag.RSI_OVERSOLD | StrategyTag.RSI_OVERBOUGHT):
+            return "mean_reversion"
+        if tags & StrategyTag.NEWS:
+            return "news_driven"
+        if tags & StrategyTag.ARBITRAGE:
+            return "arbitrage"
+
         agent_names = set(agent_votes.keys())
 
         # Check for specific agents
@@ -382,7 +399,7 @@ class LearningLoop:
         )
 
         # Find similar episodes
-        similar = await self.memory.recall_similar(
+        similar = self.memory.recall(
             state=current_state,
             k=5,
             min_similarity=0.7
@@ -423,5 +440,5 @@ class LearningLoop:
             f"LearningLoop("
             f"trades={self.stats['trades_closed']}, "
             f"memory={len(self.memory.episodes)}, "
-            f"strategies={len(self.strategy_learner.strategies)})"
+            f"strategies={len(self.strategy_learner.population)})"
         )
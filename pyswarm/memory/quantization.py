@@ -0,0 +1,169 @@
+"""
+Quantized Storage for Normalized State Vectors
+
+SimpleMemory keeps one unit-norm state per slot. At float32 that is 256
+bytes per episode for a 64-dimensional YEAR state, or 1.3 GB across 5M
+episodes, plus the IVF index's copy. A quantizer stores those rows in a
+narrower dtype and scores queries against the stored codes directly:
+
+- Float32Quantizer: no quantization (the default)
+- Float16Quantizer: half precision, 2× smaller, ~1e-3 absolute error;
+  scans are several times slower (NumPy has no fast float16 mat-vec)
+- Int8Quantizer: one byte per dimension with a per-dimension offset and
+  scale, 4× smaller. x ≈ offset + scale · q, so for a query y
+
+      x · y ≈ y · offset + q · (scale ∘ y)
+
+  i.e. one int8 mat-vec against a rescaled query plus a constant; the
+  matrix itself is never dequantized.
+
+Offset and scale are fitted to the stored states: until `calibration_size`
+states have arrived the codes use the lossless-for-unit-vectors range
+[-1, 1]; then SimpleMemory calls fit() on those states and re-encodes them.
+
+Scores are computed block by block (the codes are upcast to float32 one
+chunk at a time) so a query never materializes a full-precision matrix.
+
+Quantized memories also keep each episode's raw state (the cold copy in
+the EpisodeStore's blob store) as float16 instead of float64.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def _chunked_matmul(codes: np.ndarray, query: np.ndarray, out: Optional[np.ndarray], chunk: int) -> np.ndarray:
+    """codes @ query with the codes upcast to float32 chunk rows at a time"""
+    if out is None:
+        out = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), chunk):
+        np.matmul(codes[start:start + chunk].astype(np.float32), query, out=out[start:start + chunk])
+    return out
+
+
+class StateQuantizer:
+    """Storage codec for unit-norm float32 state rows"""
+
+    name = "float32"
+    dtype = np.float32
+    preserves_zero = True  # An all-zero state encodes to codes scoring 0
+    state_dtype = None  # dtype of the episodes' stored raw state (None = as given)
+
+    @property
+    def fitted(self) -> bool:
+        return True
+
+    def fit(self, vectors: np.ndarray):
+        """Calibrate on (n, dim) float32 states"""
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(vectors, dtype=self.dtype)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.asarray(codes, dtype=np.float32)
+
+    def scores(self, codes: np.ndarray, query: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Inner product of every code row with a float32 query"""
+        return np.matmul(codes, query, out=out)
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+Float32Quantizer = StateQuantizer
+
+
+class Float16Quantizer(StateQuantizer):
+    """Half-precision rows, upcast per chunk for the mat-vec"""
+
+    name = "float16"
+    dtype = np.float16
+    state_dtype = np.float16
+
+    def __init__(self, chunk: int = 16384):
+        self.chunk = chunk
+
+    def scores(self, codes: np.ndarray, query: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return _chunked_matmul(codes, query, out, self.chunk)
+
+
+class Int8Quantizer(StateQuantizer):
+    """
+    Per-dimension affine int8 codes, q = round((x - offset) / scale).
+    """
+
+    name = "int8"
+    dtype = np.int8
+    preserves_zero = False
+    state_dtype = np.float16
+
+    def __init__(
+        self,
+        offset: Optional[np.ndarray] = None,
+        scale: Optional[np.ndarray] = None,
+        calibration_size: int = 1024,
+        sigmas: float = 4.0,
+        chunk: int = 16384
+    ):
+        """
+        Args:
+            offset: Per-dimension offset (default: fitted)
+            scale: Per-dimension step (default: fitted)
+            calibration_size: States to collect before fitting
+            sigmas: Fitted range covers the observed states and
+                    mean ± sigmas·std, clipped to [-1, 1]
+            chunk: Rows upcast per block when scoring
+        """
+        self.chunk = chunk
+        self.calibration_size = calibration_size
+        self.sigmas = sigmas
+        self._fitted = offset is not None and scale is not None
+        # Until fitted: [-1, 1] in 255 steps (unit vectors never clip)
+        self.offset = np.asarray(offset if offset is not None else 0.0, dtype=np.float32)
+        self.scale = np.asarray(scale if scale is not None else 1.0 / 127, dtype=np.float32)
+
+    @property
+    def fitted(self) -> bool:
+        return self._fitted
+
+    def fit(self, vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        mean, std = vectors.mean(axis=0), vectors.std(axis=0)
+        low = np.maximum(np.minimum(vectors.min(axis=0), mean - self.sigmas * std), -1.0)
+        high = np.minimum(np.maximum(vectors.max(axis=0), mean + self.sigmas * std), 1.0)
+
+        self.offset = ((low + high) / 2).astype(np.float32)
+        self.scale = np.maximum((high - low) / 254, 1e-6).astype(np.float32)
+        self._fitted = True
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codes = np.rint((np.asarray(vectors, dtype=np.float32) - self.offset) / self.scale)
+        return np.clip(codes, -127, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return self.offset + self.scale * codes.astype(np.float32)
+
+    def scores(self, codes: np.ndarray, query: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        query = np.asarray(query, dtype=np.float32)
+        weights = np.broadcast_to(self.scale, query.shape) * query
+        out = _chunked_matmul(codes, weights, out, self.chunk)
+        out += np.sum(np.broadcast_to(self.offset, query.shape) * query)
+        return out
+
+    def __repr__(self):
+        return f"Int8Quantizer(fitted={self.fitted}, calibration_size={self.calibration_size})"
+
+
+def make_quantizer(kind: str, **options) -> StateQuantizer:
+    """
+    Build a quantizer by name (TimescaleConfig.quantization).
+
+    Args:
+        kind: "float32", "float16" or "int8"
+        **options: Quantizer options
+    """
+    quantizers = {"float32": Float32Quantizer, "float16": Float16Quantizer, "int8": Int8Quantizer}
+    if kind not in quantizers:
+        raise ValueError(f"Unknown quantization: {kind}")
+    return quantizers[kind](**options)
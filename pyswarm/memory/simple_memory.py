@@ -7,206 +7,38 @@ Features:
 - Episodic memory: Store (state, action, reward) tuples
 - Pattern recall: Find similar past situations using cosine similarity
 - Performance tracking: Learn which actions work in which contexts
-- LRU eviction: Keep most recent 1000 entries
+- Bounded storage: fixed episode slots with pluggable eviction (FIFO by default)
+
+State vectors are also kept L2-normalized in one preallocated float32
+matrix (row i = episode slot i), so a recall is a single mat-vec product
+plus argpartition for the top k. Large memories can plug in an approximate
+index (memory/ann_index.py) instead.
+
+Patterns are clusters of those normalized states: a mini-batch k-means
+refit runs in a worker thread every pattern_update_frequency episodes, and
+in between each new state nudges its nearest centroid (memory/clustering.py).
 
 Future: Upgrade to Redis vector DB + quorum voting when scaling to multi-user.
 """
 
+import asyncio
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Optional, Tuple
 from collections import defaultdict
 import logging
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class Episode:
-    """
-    Single trading episode stored in memory.
-
-    Captures complete context: what trade was made, why it was made,
-    all information that informed the decision, and the outcome.
-    """
-
-    # ==================== WHAT WAS DONE ====================
-
-    # Action taken
-    action: str  # "BUY", "SELL", "HOLD"
-    symbol: str
-    price: float  # Execution price
-    size: float  # Position size
-    timestamp: datetime
-
-    # ==================== WHY IT WAS DONE ====================
-
-    # Committee decision
-    confidence: float = 0.0  # Committee confidence (0-1)
-    reason: str = ""  # Human-readable explanation
-
-    # Individual agent votes (for attribution)
-    agent_votes: Dict[str, Dict] = field(default_factory=dict)
-    # Format: {"TrendFollower": {"action": "BUY", "confidence": 0.85, "reason": "..."}}
-
-    # ==================== MARKET CONTEXT ====================
-
-    # State embedding (compressed features for similarity matching)
-    state: np.ndarray = field(default_factory=lambda: np.array([]))  # Shape: (n_features,)
-
-    # Raw market data at decision time
-    market_context: Dict = field(default_factory=dict)
-    # Contains:
-    # - "price": current price
-    # - "volume_24h": 24h volume
-    # - "bid_ask_spread": spread in bps
-    # - "orderbook_depth": top of book depth
-    # - "recent_volatility": recent volatility measure
-
-    # Technical indicators
-    technical_indicators: Dict = field(default_factory=dict)
-    # Contains:
-    # - "rsi": RSI value
-    # - "macd": MACD value
-    # - "ma_20": 20-period MA
-    # - "ma_50": 50-period MA
-    # - "bollinger_upper/lower": Bollinger bands
-    # - "atr": Average True Range
-
-    # Sentiment signals
-    sentiment_data: Dict = field(default_factory=dict)
-    # Contains:
-    # - "news_sentiment": Aggregated news sentiment (-1 to 1)
-    # - "social_sentiment": Twitter/Reddit sentiment
-    # - "funding_rate": Perpetual funding rate
-    # - "fear_greed_index": Market fear/greed
-
-    # ==================== PORTFOLIO STATE ====================
-
-    # Current portfolio state when trade was made
-    portfolio_state: Dict = field(default_factory=dict)
-    # Contains:
-    # - "total_value": Total portfolio value
-    # - "cash_available": Available cash
-    # - "positions": Current positions {symbol: size}
-    # - "daily_pnl": P&L today
-    # - "drawdown": Current drawdown from peak
-    # - "risk_utilization": % of risk budget used
-
-    # ==================== OUTCOME ====================
-
-    # Trade outcome
-    reward: float = 0.0  # Actual P&L (can be negative)
-    holding_period: float = 0.0  # How long position was held (hours)
-    exit_reason: str = ""  # "take_profit", "stop_loss", "signal_reverse", etc.
-
-    # Execution quality
-    slippage: float = 0.0  # Actual fill vs expected (bps)
-    fill_time: float = 0.0  # Execution time (ms)
-    transaction_cost: float = 0.0  # Fees + slippage
-
-    # ==================== METADATA ====================
-
-    episode_id: str = ""  # Unique identifier
-    regime: str = ""  # Market regime: "trending_up", "ranging", "volatile", etc.
-    trade_type: str = ""  # "momentum", "mean_reversion", "breakout", etc.
-
-    def __post_init__(self):
-        """Validate and generate defaults"""
-        if self.action not in ["BUY", "SELL", "HOLD"]:
-            raise ValueError(f"Invalid action: {self.action}")
-
-        # Generate episode ID if not provided
-        if not self.episode_id:
-            self.episode_id = f"{self.symbol}_{self.timestamp.timestamp()}"
-
-        # Validate state vector if provided
-        if len(self.state) > 0 and self.state.ndim != 1:
-            raise ValueError(f"State must be 1D array, got shape {self.state.shape}")
-
-
-@dataclass
-class Pattern:
-    """Cluster of similar episodes with aggregate statistics"""
-
-    # Pattern identity
-    pattern_id: str
-    centroid: np.ndarray  # Average state vector
-
-    # Episodes in this pattern
-    episodes: List[Episode] = field(default_factory=list)
-
-    # Statistics
-    n_samples: int = 0
-    mean_reward: float = 0.0
-    std_reward: float = 0.0
-    win_rate: float = 0.0
-    sharpe_ratio: float = 0.0
-
-    # Action distribution
-    action_counts: Dict[str, int] = field(default_factory=lambda: {"BUY": 0, "SELL": 0, "HOLD": 0})
-
-    # Performance by action
-    reward_by_action: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
-
-    # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    last_updated: datetime = field(default_factory=datetime.now)
-
-    def update_statistics(self):
-        """Recalculate statistics from episodes"""
-        if not self.episodes:
-            return
-
-        self.n_samples = len(self.episodes)
-
-        # Reward statistics
-        rewards = [ep.reward for ep in self.episodes]
-        self.mean_reward = np.mean(rewards)
-        self.std_reward = np.std(rewards)
-
-        # Win rate
-        wins = sum(1 for r in rewards if r > 0)
-        self.win_rate = wins / len(rewards) if rewards else 0.0
-
-        # Sharpe ratio (annualized, assuming daily frequency)
-        self.sharpe_ratio = (self.mean_reward / self.std_reward * np.sqrt(365)) if self.std_reward > 0 else 0.0
-
-        # Action distribution
-        self.action_counts = {"BUY": 0, "SELL": 0, "HOLD": 0}
-        for ep in self.episodes:
-            self.action_counts[ep.action] += 1
-
-        # Performance by action
-        self.reward_by_action = defaultdict(list)
-        for ep in self.episodes:
-            self.reward_by_action[ep.action].append(ep.reward)
-
-        # Update centroid
-        states = np.array([ep.state for ep in self.episodes])
-        self.centroid = np.mean(states, axis=0)
+from coinswarm.memory.ann_index import VectorIndex
+from coinswarm.memory.blob_store import BlobStore
+from coinswarm.memory.episode import Episode, Pattern
+from coinswarm.memory.clustering import StreamingKMeans, minibatch_kmeans, nearest_centroid
+from coinswarm.memory.episode_store import EpisodeStore, EvictionPolicy
+from coinswarm.memory.quantization import StateQuantizer
 
-        self.last_updated = datetime.now()
-
-    def get_best_action(self) -> Tuple[str, float]:
-        """
-        Determine best action for this pattern based on historical performance.
-
-        Returns:
-            (action, expected_reward)
-        """
-        action_rewards = {}
-        for action in ["BUY", "SELL", "HOLD"]:
-            if self.reward_by_action[action]:
-                action_rewards[action] = np.mean(self.reward_by_action[action])
-            else:
-                action_rewards[action] = 0.0
-
-        best_action = max(action_rewards, key=action_rewards.get)
-        expected_reward = action_rewards[best_action]
+logger = logging.getLogger(__name__)
 
-        return best_action, expected_reward
+# Most states a pattern refit clusters on (assignment still covers all)
+PATTERN_FIT_SAMPLE = 100_000
 
 
 class SimpleMemory:
@@ -237,7 +69,7 @@ class SimpleMemory:
         )
 
         # Before making decision
-        similar = await memory.recall_similar(state_features, k=10)
+        similar = memory.recall(state_features, k=10)
         best_action, confidence = memory.suggest_action(state_features)
     """
 
@@ -245,29 +77,70 @@ class SimpleMemory:
         self,
         max_episodes: int = 1000,
         pattern_update_frequency: int = 100,  # Update patterns every N episodes
-        min_pattern_samples: int = 5  # Minimum episodes to form a pattern
+        min_pattern_samples: int = 5,  # Minimum episodes to form a pattern
+        index_factory: Optional[Callable[[int, int], Optional[VectorIndex]]] = None,
+        eviction: Optional[EvictionPolicy] = None,
+        blob_path: Optional[str] = None,
+        quantizer: Optional[StateQuantizer] = None,
+        state_path: Optional[str] = None,
+        ids_path: Optional[str] = None
     ):
         """
         Initialize simple memory system.
 
         Args:
-            max_episodes: Maximum episodes to keep (LRU eviction)
+            max_episodes: Maximum episodes to keep (slots)
             pattern_update_frequency: How often to recompute patterns
             min_pattern_samples: Minimum samples required to form pattern
+            index_factory: (capacity, state_dim) -> approximate index used by
+                recall (None or a factory returning None = exact scan)
+            eviction: Which episode to drop when full (default FIFO, see
+                memory/episode_store.py)
+            blob_path: File for the compressed cold episode context
+                (default in memory)
+            quantizer: Storage dtype of the state matrix (default float32,
+                see memory/quantization.py). Pass the same instance to the
+                index factory so the index stores the same codes.
+            state_path: .npy file to memory-map the state matrix from
+                (default in RAM); pages are read in as recall touches them
+            ids_path: .npy file to memory-map the episode id column from
+                (default in RAM)
         """
         self.max_episodes = max_episodes
         self.pattern_update_frequency = pattern_update_frequency
         self.min_pattern_samples = min_pattern_samples
 
-        # Storage
-        self.episodes: List[Episode] = []
+        self.quantizer = quantizer or StateQuantizer()
+        self.state_path = state_path
+
+        # Storage: episode_id -> Episode over fixed slots (hot columns + cold blobs)
+        self.episodes = EpisodeStore(
+            max_episodes, eviction, BlobStore(blob_path),
+            state_dtype=self.quantizer.state_dtype, ids_path=ids_path
+        )
         self.patterns: Dict[str, Pattern] = {}
 
+        # Normalized state matrix, row i = episode slot i, stored as the
+        # quantizer's codes. Allocated once the state dimension is known
+        # (first non-empty state).
+        self.state_dim: Optional[int] = None
+        self._states: Optional[np.ndarray] = None  # (max_episodes, state_dim) codes
+        self._scores: Optional[np.ndarray] = None  # Recall score buffer
+        self._has_state: Optional[np.ndarray] = None  # Rows holding a usable state
+        self._index_factory = index_factory
+        self.index: Optional[VectorIndex] = None  # Keyed by state-matrix row
+
         # Statistics
         self.total_episodes_stored = 0
         self.episodes_evicted = 0
         self.pattern_updates = 0
 
+        # Pattern clustering: centroids streamed between refits; refits run
+        # in the default executor
+        self.clusters: Optional[StreamingKMeans] = None
+        self._pattern_task: Optional[asyncio.Future] = None
+        self._rng = np.random.default_rng()
+
         logger.info(
             f"SimpleMemory initialized: max_episodes={max_episodes}, "
             f"pattern_freq={pattern_update_frequency}"
@@ -367,29 +240,66 @@ class SimpleMemory:
             trade_type=trade_type
         )
 
-        # Add to storage
-        self.episodes.append(episode)
+        # Make room: expired episodes first, then the policy's victim if full
+        store = self.episodes
+        for slot in store.eviction.expired(store, episode.timestamp.timestamp()):
+            self._evict(slot)
+        if store.full:
+            self._evict(store.eviction.victim(store))
+
+        # Add to storage (the state goes to the slot's matrix row)
+        slot = store.add(episode)
+        if self._write_state_row(slot, episode) and self.clusters is not None:
+            self.clusters.partial_fit(self.quantizer.decode(self._states[slot]))
         self.total_episodes_stored += 1
 
-        # LRU eviction if over capacity
-        if len(self.episodes) > self.max_episodes:
-            evicted = self.episodes.pop(0)
-            self.episodes_evicted += 1
-            logger.debug(f"Evicted episode from {evicted.timestamp}")
-
-        # Update patterns periodically
+        # Refit patterns periodically, off the trade path
         if self.total_episodes_stored % self.pattern_update_frequency == 0:
-            await self._update_patterns()
+            if self._pattern_task is None or self._pattern_task.done():
+                self._pattern_task = asyncio.ensure_future(self._update_patterns())
 
-        logger.info(
-            f"Stored episode {episode.episode_id}: {action} {symbol} @ {price}, "
-            f"reward={reward:.4f}, confidence={confidence:.2f}, "
-            f"reason='{reason[:50]}...', total={len(self.episodes)}"
+        logger.debug(
+            "Stored episode %s: %s %s @ %s, reward=%.4f, confidence=%.2f, total=%d",
+            episode.episode_id, action, symbol, price, reward, confidence, len(store)
         )
 
         return episode.episode_id
 
-    async def recall_similar(
+    def _evict(self, slot: int):
+        """Drop the episode in slot and make its state row unrecallable"""
+        evicted = self.episodes.remove(slot)
+        if self._states is not None:
+            self._states[slot] = 0.0
+            self._has_state[slot] = False
+        if self.index is not None:
+            self.index.remove(slot)
+        self.episodes_evicted += 1
+        logger.debug("Evicted episode %s", evicted)
+
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop the episodes the eviction policy considers expired at now.
+
+        store_episode already does this on every store; call it to expire
+        memories that aren't being written to.
+
+        Returns:
+            Number of episodes dropped
+        """
+        now = (now or datetime.now()).timestamp()
+        expired = self.episodes.eviction.expired(self.episodes, now)
+        for slot in expired:
+            self._evict(slot)
+        return len(expired)
+
+    def close(self):
+        """Release disk-backed storage (blob file, state and id memmaps)"""
+        self.episodes.blobs.close()
+        for mapped in (self._states, self.episodes.ids):
+            if isinstance(mapped, np.memmap):
+                mapped.flush()
+
+    def recall(
         self,
         state: np.ndarray,
         k: int = 10,
@@ -398,6 +308,9 @@ class SimpleMemory:
         """
         Find k most similar past episodes using cosine similarity.
 
+        Synchronous (recall does no I/O), so hot paths and suggest_action can
+        call it directly. Scores go into a preallocated buffer.
+
         Args:
             state: Current state vector
             k: Number of similar episodes to return
@@ -406,21 +319,113 @@ class SimpleMemory:
         Returns:
             List of (episode, similarity) tuples, sorted by similarity
         """
-        if not self.episodes:
+        if not self.episodes or k <= 0:
             return []
 
-        # Compute similarities
-        similarities = []
-        for episode in self.episodes:
-            sim = self._cosine_similarity(state, episode.state)
-            if sim >= min_similarity:
-                similarities.append((episode, sim))
+        episode = self.episodes.episode
+
+        if self.index is not None:
+            rows, scores = self.index.search(self._normalized(state), k, min_similarity)
+            return [
+                (episode(row), float(score))
+                for row, score in zip(rows.tolist(), scores.tolist())
+            ]
+
+        # One mat-vec over the rows that have ever held an episode
+        n = self.episodes.high_water
+        if self._states is None:
+            similarities = np.zeros(n, dtype=np.float32)
+        else:
+            similarities = self.quantizer.scores(self._states[:n], self._normalized(state), out=self._scores[:n])
+            if not self.quantizer.preserves_zero:
+                similarities[~self._has_state[:n]] = 0.0
+
+        # Threshold (on occupied slots) as a mask, then partial sort for the top k
+        rows = np.flatnonzero((similarities >= min_similarity) & self.episodes.occupied[:n])
+        if len(rows) > k:
+            rows = rows[np.argpartition(-similarities[rows], k - 1)[:k]]
+        rows = rows[np.argsort(-similarities[rows], kind="stable")]
+
+        return [(episode(row), float(similarities[row])) for row in rows.tolist()]
 
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+    async def recall_similar(
+        self,
+        state: np.ndarray,
+        k: int = 10,
+        min_similarity: float = 0.7
+    ) -> List[Tuple[Episode, float]]:
+        """Awaitable form of recall() for existing async callers"""
+        return self.recall(state, k=k, min_similarity=min_similarity)
+
+    def _normalized(self, state: np.ndarray) -> np.ndarray:
+        """state as a unit float32 vector (zeros stay zeros)"""
+        if len(state) != self.state_dim:
+            raise ValueError(f"State has {len(state)} dimensions, memory holds {self.state_dim}")
 
-        # Return top k
-        return similarities[:k]
+        vector = np.asarray(state, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _write_state_row(self, row: int, episode: Episode) -> bool:
+        """
+        Store the episode's normalized state (zeros if it has none) in row.
+
+        Returns:
+            Whether the row now holds a usable state
+        """
+        state = episode.state
+        if self._states is None and len(state) > 0:
+            self.state_dim = len(state)
+            shape = (self.max_episodes, self.state_dim)
+            if self.state_path is None:
+                self._states = np.zeros(shape, dtype=self.quantizer.dtype)
+            else:
+                # Sparse file: disk is only used as rows are written
+                self._states = np.lib.format.open_memmap(
+                    self.state_path, mode="w+", dtype=self.quantizer.dtype, shape=shape
+                )
+            self._scores = np.empty(self.max_episodes, dtype=np.float32)
+            self._has_state = np.zeros(self.max_episodes, dtype=bool)
+            if self._index_factory is not None:
+                self.index = self._index_factory(self.max_episodes, self.state_dim)
+
+        if self._states is None:
+            return False
+
+        if len(state) == self.state_dim:
+            vector = self._normalized(state)
+            self._states[row] = self.quantizer.encode(vector)
+            self._has_state[row] = True
+            if self.index is not None:
+                self.index.add(row, vector)
+            if not self.quantizer.fitted:
+                self._calibrate()
+            return True
+
+        if len(state) > 0:
+            logger.warning(
+                "Episode %s state has %d dimensions, memory holds %d; not recallable",
+                episode.episode_id, len(state), self.state_dim
+            )
+        self._states[row] = 0.0
+        self._has_state[row] = False
+        if self.index is not None:
+            self.index.remove(row)
+        return False
+
+    def _calibrate(self):
+        """Fit the quantizer once enough states are stored, then re-encode them"""
+        rows = np.flatnonzero(self._has_state[:self.episodes.high_water])
+        if len(rows) < self.quantizer.calibration_size:
+            return
+
+        vectors = self.quantizer.decode(self._states[rows])
+        self.quantizer.fit(vectors)
+        self._states[rows] = self.quantizer.encode(vectors)
+        if self.index is not None:
+            for row, vector in zip(rows.tolist(), vectors):
+                self.index.add(row, vector)
+        logger.info("Calibrated %s state quantizer on %d states", self.quantizer.name, len(rows))
 
     def suggest_action(
         self,
@@ -438,7 +443,7 @@ class SimpleMemory:
             (suggested_action, confidence)
             confidence = expected reward normalized to [0, 1]
         """
-        similar = self.recall_similar(state, k=k)
+        similar = self.recall(state, k=k)
 
         if not similar:
             return "HOLD", 0.0
@@ -470,61 +475,77 @@ class SimpleMemory:
 
     async def _update_patterns(self) -> None:
         """
-        Extract patterns from episodes using simple k-means clustering.
+        Refit the pattern library with mini-batch k-means.
 
-        This is called periodically to update pattern library.
+        The fit runs in the default executor on the live state matrix; only
+        the finished patterns are swapped in on the event loop. store_episode
+        schedules this every pattern_update_frequency episodes without
+        awaiting it.
         """
-        if len(self.episodes) < self.min_pattern_samples:
+        if self._has_state is None:
             return
 
-        # Simple k-means clustering
-        # For Phase 0, use fixed k=5 clusters
-        k = min(5, len(self.episodes) // self.min_pattern_samples)
+        rows = np.flatnonzero(self._has_state[:self.episodes.high_water])
+        if len(rows) < self.min_pattern_samples:
+            return
 
+        # For Phase 0, use fixed k=5 clusters
+        k = min(5, len(rows) // self.min_pattern_samples)
         if k < 1:
             return
 
-        # Extract state vectors
-        states = np.array([ep.state for ep in self.episodes])
-
-        # Initialize centroids randomly
-        indices = np.random.choice(len(states), k, replace=False)
-        centroids = states[indices]
-
-        # K-means iterations (simple implementation)
-        for _ in range(10):  # Fixed 10 iterations
-            # Assign episodes to nearest centroid
-            assignments = []
-            for state in states:
-                distances = [np.linalg.norm(state - c) for c in centroids]
-                assignments.append(np.argmin(distances))
-
-            # Update centroids
-            new_centroids = []
-            for i in range(k):
-                cluster_states = states[np.array(assignments) == i]
-                if len(cluster_states) > 0:
-                    new_centroids.append(np.mean(cluster_states, axis=0))
-                else:
-                    new_centroids.append(centroids[i])
-            centroids = np.array(new_centroids)
-
-        # Create patterns from clusters
-        self.patterns = {}
-        for i in range(k):
-            cluster_episodes = [ep for j, ep in enumerate(self.episodes) if assignments[j] == i]
+        # Sequence numbers identify which episode each row held when the fit
+        # started; rows reused meanwhile are left out of the patterns
+        sequence = self.episodes.sequence[rows].copy()
+
+        loop = asyncio.get_running_loop()
+        patterns, clusters = await loop.run_in_executor(None, self._fit_patterns, rows, sequence, k)
+
+        self.patterns = patterns
+        self.clusters = clusters
+        self.pattern_updates += 1
+        logger.info("Updated patterns: %d patterns from %d episodes", len(patterns), len(rows))
 
-            if len(cluster_episodes) >= self.min_pattern_samples:
+    def _fit_patterns(
+        self,
+        rows: np.ndarray,
+        sequence: np.ndarray,
+        k: int
+    ) -> Tuple[Dict[str, Pattern], StreamingKMeans]:
+        """Cluster the given state rows into patterns (worker thread)"""
+        sample = rows
+        if len(rows) > PATTERN_FIT_SAMPLE:
+            sample = self._rng.choice(rows, PATTERN_FIT_SAMPLE, replace=False)
+        decode = self.quantizer.decode
+        centroids = minibatch_kmeans(decode(self._states[sample]), k, self._rng)
+
+        chunk = 65536
+        assignments = np.concatenate([
+            nearest_centroid(decode(self._states[rows[start:start + chunk]]), centroids)
+            for start in range(0, len(rows), chunk)
+        ])
+        clusters = StreamingKMeans(centroids, counts=np.bincount(assignments, minlength=k).astype(np.float64))
+
+        current = self.episodes.sequence[rows] == sequence
+        now = datetime.now().timestamp()
+
+        patterns = {}
+        for i in range(k):
+            members = (assignments == i) & current
+            if np.count_nonzero(members) >= self.min_pattern_samples:
                 pattern = Pattern(
-                    pattern_id=f"pattern_{i}_{datetime.now().timestamp()}",
+                    pattern_id=f"pattern_{i}_{now}",
                     centroid=centroids[i],
-                    episodes=cluster_episodes
+                    store=self.episodes,
+                    rows=rows[members],
+                    sequences=sequence[members]
                 )
-                pattern.update_statistics()
-                self.patterns[pattern.pattern_id] = pattern
+                # Centroid is a view (follows streaming updates); passing it
+                # keeps the members' cold state unloaded
+                pattern.update_statistics(centroid=centroids[i])
+                patterns[pattern.pattern_id] = pattern
 
-        self.pattern_updates += 1
-        logger.info(f"Updated patterns: {len(self.patterns)} patterns from {len(self.episodes)} episodes")
+        return patterns, clusters
 
     def get_pattern_for_state(self, state: np.ndarray) -> Optional[Pattern]:
         """Find the pattern that best matches this state"""
@@ -551,6 +572,8 @@ class SimpleMemory:
             "patterns_count": len(self.patterns),
             "pattern_updates": self.pattern_updates,
             "cache_utilization": len(self.episodes) / self.max_episodes,
+            "quantization": self.quantizer.name,
+            "state_bytes": self._states.nbytes if self._states is not None else 0,
             "patterns": [
                 {
                     "pattern_id": p.pattern_id,
@@ -588,5 +611,5 @@ class SimpleMemory:
         """Calculate overall win rate from all episodes"""
         if not self.episodes:
             return 0.0
-        wins = sum(1 for ep in self.episodes if ep.reward > 0)
+        wins = sum(1 for ep in self.episodes.values() if ep.reward > 0)
         return wins / len(self.episodes)
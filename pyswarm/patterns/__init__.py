@@ -12,10 +12,12 @@ from .correlation_detector import CorrelationDetector
 from .cointegration_tester import CointegrationTester
 from .lead_lag_analyzer import LeadLagAnalyzer
 from .arbitrage_detector import ArbitrageDetector
+from .rolling_covariance import RollingCovariance
 
 __all__ = [
     "CorrelationDetector",
     "CointegrationTester",
     "LeadLagAnalyzer",
     "ArbitrageDetector",
+    "RollingCovariance",
 ]
@@ -5,13 +5,23 @@ Detects arbitrage opportunities across:
 1. Stablecoin pairs (BTC-USDT vs BTC-USDC)
 2. Triangular arbitrage (BTC→SOL→USD loop)
 3. Statistical arbitrage (mean reversion on spreads)
+
+Stablecoin and triangular scans work on an N×N rate matrix (RateMatrix), so
+all routes are scored at once with NumPy instead of one Python loop per path.
 """
 
+import itertools
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 
+# A pair's price: one mid price, or a (bid, ask) tuple
+Quote = Union[float, Tuple[float, float]]
+
+DEFAULT_STABLECOINS = ("USD", "USDT", "USDC", "BUSD", "DAI", "TUSD", "FDUSD")
+
+
 @dataclass
 class ArbitrageOpportunity:
     """Detected arbitrage opportunity"""
@@ -24,6 +34,96 @@ class ArbitrageOpportunity:
     risk_level: str  # "low", "medium", "high"
 
 
+class RateMatrix:
+    """
+    Conversion rates between assets as an N×N NumPy array.
+
+    rates[i, j] = units of asset j received for 1 unit of asset i
+    (0 where there is no pair). A pair BASE-QUOTE fills both directions:
+
+        rates[BASE, QUOTE] = bid        (sell base)
+        rates[QUOTE, BASE] = 1 / ask    (buy base)
+
+    Asset indices and pair → (base, quote) index lookups are cached, so
+    loading a new set of prices is a couple of array writes, not string work.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.assets: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._pairs: Dict[str, Tuple[int, int]] = {}
+        self._rates = np.zeros((capacity, capacity))
+
+        # Index arrays for the last set of pairs loaded (reused while it repeats)
+        self._loaded_pairs: Tuple[str, ...] = ()
+        self._base = np.zeros(0, dtype=np.intp)
+        self._quote = np.zeros(0, dtype=np.intp)
+
+    @property
+    def rates(self) -> np.ndarray:
+        n = len(self.assets)
+        return self._rates[:n, :n]
+
+    def asset_index(self, asset: str) -> int:
+        i = self.index.get(asset)
+        if i is None:
+            i = len(self.assets)
+            if i == len(self._rates):
+                grown = np.zeros((2 * i, 2 * i))
+                grown[:i, :i] = self._rates
+                self._rates = grown
+            self.index[asset] = i
+            self.assets.append(asset)
+        return i
+
+    def pair_indices(self, pair: str) -> Tuple[int, int]:
+        """(base index, quote index) for "BASE-QUOTE" """
+        indices = self._pairs.get(pair)
+        if indices is None:
+            base, quote = pair.split("-")
+            indices = (self.asset_index(base), self.asset_index(quote))
+            self._pairs[pair] = indices
+        return indices
+
+    def load(self, price_data: Dict[str, Quote]):
+        """Replace all rates with price_data (pair -> price or (bid, ask))"""
+        pairs = tuple(price_data)
+        if pairs != self._loaded_pairs:
+            indices = np.array([self.pair_indices(pair) for pair in pairs], dtype=np.intp)
+            self._base, self._quote = indices.reshape(-1, 2).T
+            self._loaded_pairs = pairs
+
+        rates = self.rates
+        rates[:] = 0.0
+        if not pairs:
+            return
+
+        try:
+            bid = ask = np.fromiter(price_data.values(), dtype=np.float64, count=len(pairs))
+        except (TypeError, ValueError):
+            # Some quotes are (bid, ask) tuples
+            quotes = np.array(
+                [q if isinstance(q, tuple) else (q, q) for q in price_data.values()],
+                dtype=np.float64
+            )
+            bid, ask = quotes[:, 0], quotes[:, 1]
+
+        base, quote = self._base, self._quote
+        valid = (bid > 0) & (ask > 0)
+        if not valid.all():
+            base, quote, bid, ask = base[valid], quote[valid], bid[valid], ask[valid]
+
+        rates[base, quote] = bid
+        rates[quote, base] = 1.0 / ask
+
+    def pair_for(self, i: int, j: int) -> Optional[str]:
+        """Name of the pair trading assets i and j (either orientation)"""
+        for name in (f"{self.assets[i]}-{self.assets[j]}", f"{self.assets[j]}-{self.assets[i]}"):
+            if name in self._pairs:
+                return name
+        return None
+
+
 class ArbitrageDetector:
     """
     Detect arbitrage opportunities across multiple pairs
@@ -32,12 +132,18 @@ class ArbitrageDetector:
     1. Stablecoin arbitrage: BTC-USDT at $50,000, BTC-USDC at $50,010 → $10 profit
     2. Triangular arbitrage: USD→BTC→SOL→USD loop
     3. Statistical arbitrage: Mean reversion on historical spreads
+
+    Prices are loaded into a RateMatrix; every triangle (and every
+    stablecoin pair of a base asset) is then scored in one vectorized
+    expression and only the top_k are turned into opportunities.
     """
 
     def __init__(
         self,
         min_profit_pct: float = 0.001,  # 0.1% minimum
-        transaction_cost: float = 0.001  # 0.1% per trade
+        transaction_cost: float = 0.001,  # 0.1% per trade
+        top_k: int = 10,
+        stablecoins: Iterable[str] = DEFAULT_STABLECOINS
     ):
         """
         Initialize arbitrage detector
@@ -45,13 +151,50 @@ class ArbitrageDetector:
         Args:
             min_profit_pct: Minimum profit percentage to report
             transaction_cost: Estimated transaction cost per trade
+            top_k: Maximum opportunities returned per arbitrage type
+            stablecoins: Quote assets treated as interchangeable dollars
         """
         self.min_profit_pct = min_profit_pct
         self.transaction_cost = transaction_cost
+        self.top_k = top_k
+        self.stablecoins = set(stablecoins)
+        self.rate_matrix = RateMatrix()
+        self._triangle_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _top_k(self, candidates: np.ndarray, net: np.ndarray) -> np.ndarray:
+        """Positions of the top_k candidates by net profit, best first"""
+        order = np.arange(len(candidates))
+        if len(candidates) > self.top_k:
+            order = np.argpartition(net, -self.top_k)[-self.top_k:]
+        return order[np.argsort(net[order])[::-1]]
+
+    def _stablecoin_indices(self) -> np.ndarray:
+        index = self.rate_matrix.index
+        return np.array(
+            sorted(index[a] for a in self.stablecoins if a in index), dtype=np.intp
+        )
+
+    def scan_stablecoin_spreads(self, price_data: Dict[str, Quote]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Net edge of every (base, buy stablecoin, sell stablecoin) route.
+
+        net[b, s1, s2] = rates[s1, b] × rates[b, s2] − 1 − 2 × transaction_cost
+        (buy base with stablecoin s1, sell it for s2). Routes with a missing
+        pair have net = -1 − costs.
+
+        Returns:
+            (net, stablecoin asset indices for axes 1 and 2)
+        """
+        self.rate_matrix.load(price_data)
+        rates = self.rate_matrix.rates
+        stable = self._stablecoin_indices()
+
+        gross = rates[stable].T[:, :, None] * rates[:, stable][:, None, :]
+        return gross - 1 - 2 * self.transaction_cost, stable
 
     def detect_stablecoin_arbitrage(
         self,
-        price_data: Dict[str, float]
+        price_data: Dict[str, Quote]
     ) -> List[ArbitrageOpportunity]:
         """
         Detect arbitrage across stablecoin pairs
@@ -62,61 +205,94 @@ class ArbitrageDetector:
         → Buy BTC with USDT, sell for USDC, profit $10/BTC (0.02%)
         """
 
-        opportunities = []
+        net, stable = self.scan_stablecoin_spreads(price_data)
+        assets = self.rate_matrix.assets
+        rates = self.rate_matrix.rates
 
-        # Group by base asset
-        asset_prices = {}
-        for pair, price in price_data.items():
-            base, quote = pair.split("-")
+        candidates = np.flatnonzero(net > self.min_profit_pct)
+        candidate_net = net.ravel()[candidates]
 
-            if base not in asset_prices:
-                asset_prices[base] = {}
-
-            asset_prices[base][quote] = price
-
-        # Check for price differences across stablecoins
-        for base_asset, stablecoin_prices in asset_prices.items():
-            stablecoins = list(stablecoin_prices.keys())
-
-            for i, stable1 in enumerate(stablecoins):
-                for stable2 in stablecoins[i+1:]:
-                    price1 = stablecoin_prices[stable1]
-                    price2 = stablecoin_prices[stable2]
-
-                    # Calculate spread
-                    spread_pct = abs(price2 - price1) / price1
-
-                    # Account for transaction costs (2 trades)
-                    net_profit = spread_pct - (2 * self.transaction_cost)
-
-                    if net_profit > self.min_profit_pct:
-                        # Determine direction
-                        if price1 < price2:
-                            buy_pair = f"{base_asset}-{stable1}"
-                            sell_pair = f"{base_asset}-{stable2}"
-                        else:
-                            buy_pair = f"{base_asset}-{stable2}"
-                            sell_pair = f"{base_asset}-{stable1}"
-
-                        opportunities.append(ArbitrageOpportunity(
-                            type="stablecoin",
-                            pairs_involved=[buy_pair, sell_pair],
-                            profit_potential=net_profit * 100,
-                            confidence=0.95,  # High confidence (same asset)
-                            description=f"Stablecoin arbitrage: {buy_pair} at ${min(price1, price2):.2f} vs {sell_pair} at ${max(price1, price2):.2f}",
-                            execution_steps=[
-                                f"1. Buy {base_asset} on {buy_pair}",
-                                f"2. Sell {base_asset} on {sell_pair}",
-                                f"3. Profit: {net_profit*100:.3f}% per trade"
-                            ],
-                            risk_level="low"
-                        ))
+        opportunities = []
+        for pos in self._top_k(candidates, candidate_net):
+            b, s1, s2 = np.unravel_index(candidates[pos], net.shape)
+            q1, q2 = stable[s1], stable[s2]
+            base_asset = assets[b]
+            buy_pair = f"{base_asset}-{assets[q1]}"
+            sell_pair = f"{base_asset}-{assets[q2]}"
+            buy_price = 1.0 / rates[q1, b]
+            sell_price = rates[b, q2]
+            net_profit = float(candidate_net[pos])
+
+            opportunities.append(ArbitrageOpportunity(
+                type="stablecoin",
+                pairs_involved=[buy_pair, sell_pair],
+                profit_potential=net_profit * 100,
+                confidence=0.95,  # High confidence (same asset)
+                description=f"Stablecoin arbitrage: {buy_pair} at ${buy_price:.2f} vs {sell_pair} at ${sell_price:.2f}",
+                execution_steps=[
+                    f"1. Buy {base_asset} on {buy_pair}",
+                    f"2. Sell {base_asset} on {sell_pair}",
+                    f"3. Profit: {net_profit*100:.3f}% per trade"
+                ],
+                risk_level="low"
+            ))
 
         return opportunities
 
+    def _triangles(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every directed triangle over n assets, cached per n.
+
+        Returns:
+            (nodes, legs): nodes is (T, 3) asset indices in travel order
+            (i < j < k, both directions), legs is (3, T) flat indices into
+            the n×n rate matrix for each leg
+        """
+        cached = self._triangle_cache.get(n)
+        if cached is None:
+            count = n * (n - 1) * (n - 2) // 6
+            triples = np.fromiter(
+                itertools.chain.from_iterable(itertools.combinations(range(n), 3)),
+                dtype=np.intp, count=3 * count
+            ).reshape(-1, 3)
+            nodes = np.concatenate([triples, triples[:, [0, 2, 1]]])
+            i, j, k = nodes.T
+            legs = np.stack([i * n + j, j * n + k, k * n + i])
+            cached = (nodes, legs)
+            self._triangle_cache[n] = cached
+        return cached
+
+    def _triangle_products(self, price_data: Dict[str, Quote]) -> Tuple[np.ndarray, np.ndarray]:
+        """(nodes, rates[i, j] × rates[j, k] × rates[k, i]) for every triangle"""
+        self.rate_matrix.load(price_data)
+        rates = self.rate_matrix.rates
+        nodes, legs = self._triangles(len(rates))
+
+        product = np.take(rates, legs)  # (3, T) rate of each leg
+        product[0] *= product[1]
+        product[0] *= product[2]
+        return nodes, product[0]
+
+    def scan_triangles(self, price_data: Dict[str, Quote]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gross and net edge of every triangle i → j → k → i.
+
+        gross = rates[i, j] × rates[j, k] × rates[k, i] − 1
+        net = gross − 3 × transaction_cost
+
+        Both directions of each loop are scored; triangles with a missing
+        pair have gross = -1.
+
+        Returns:
+            (nodes, gross, net) with nodes of shape (T, 3)
+        """
+        nodes, product = self._triangle_products(price_data)
+        gross = product - 1
+        return nodes, gross, gross - 3 * self.transaction_cost
+
     def detect_triangular_arbitrage(
         self,
-        price_data: Dict[str, float]
+        price_data: Dict[str, Quote]
     ) -> List[ArbitrageOpportunity]:
         """
         Detect triangular arbitrage opportunities
@@ -126,61 +302,48 @@ class ArbitrageDetector:
         SOL-USD: $100
         BTC-SOL: 490 (implied should be 500)
 
-        → USD→BTC→SOL→USD loop profits from discrepancy
+        → USD→SOL→BTC→USD loop profits from discrepancy
+
+        Every triangle in the price data is checked (both directions), not
+        just BTC/SOL; the top_k by net profit are returned.
         """
 
-        opportunities = []
+        nodes, product = self._triangle_products(price_data)
+        cost = 3 * self.transaction_cost
+
+        # Threshold the raw products; gross/net only for the candidates
+        candidates = np.flatnonzero(product > 1 + cost + self.min_profit_pct)
+        gross = product[candidates] - 1
+        net = gross - cost
 
-        # Find triangular paths
-        # For simplicity, focus on common patterns: BTC-USD, SOL-USD, BTC-SOL
-
-        # Check BTC-SOL-USD triangle
-        if "BTC-USDT" in price_data and "SOL-USDT" in price_data:
-            btc_usd = price_data["BTC-USDT"]
-            sol_usd = price_data["SOL-USDT"]
-
-            # Calculate implied BTC-SOL rate
-            implied_btc_sol = btc_usd / sol_usd
-
-            # Check if we have direct BTC-SOL pair
-            if "BTC-SOL" in price_data:
-                direct_btc_sol = price_data["BTC-SOL"]
-
-                # Calculate arbitrage opportunity
-                spread = abs(direct_btc_sol - implied_btc_sol) / implied_btc_sol
-
-                # Account for 3 trades
-                net_profit = spread - (3 * self.transaction_cost)
-
-                if net_profit > self.min_profit_pct:
-                    if direct_btc_sol < implied_btc_sol:
-                        # Direct pair is cheaper
-                        path = ["USD", "BTC", "SOL", "USD"]
-                        steps = [
-                            "1. Buy BTC with USD",
-                            "2. Trade BTC for SOL (direct pair)",
-                            "3. Sell SOL for USD",
-                            f"4. Profit: {net_profit*100:.3f}%"
-                        ]
-                    else:
-                        # Cross pair is cheaper
-                        path = ["USD", "SOL", "BTC", "USD"]
-                        steps = [
-                            "1. Buy SOL with USD",
-                            "2. Trade SOL for BTC (direct pair)",
-                            "3. Sell BTC for USD",
-                            f"4. Profit: {net_profit*100:.3f}%"
-                        ]
-
-                    opportunities.append(ArbitrageOpportunity(
-                        type="triangular",
-                        pairs_involved=["BTC-USDT", "SOL-USDT", "BTC-SOL"],
-                        profit_potential=net_profit * 100,
-                        confidence=0.8,
-                        description=f"Triangular arbitrage: Direct BTC-SOL ({direct_btc_sol:.2f}) vs implied ({implied_btc_sol:.2f})",
-                        execution_steps=steps,
-                        risk_level="medium"
-                    ))
+        matrix = self.rate_matrix
+        assets = matrix.assets
+
+        opportunities = []
+        for pos in self._top_k(candidates, net):
+            i, j, k = nodes[candidates[pos]]
+            path = [assets[i], assets[j], assets[k], assets[i]]
+            net_profit = float(net[pos])
+            pairs = [matrix.pair_for(a, b) for a, b in ((i, j), (j, k), (k, i))]
+
+            steps = [
+                f"{step}. Convert {a} to {b} ({pair})"
+                for step, (a, b, pair) in enumerate(zip(path, path[1:], pairs), 1)
+            ]
+            steps.append(f"4. Profit: {net_profit*100:.3f}%")
+
+            opportunities.append(ArbitrageOpportunity(
+                type="triangular",
+                pairs_involved=pairs,
+                profit_potential=net_profit * 100,
+                confidence=0.8,
+                description=(
+                    f"Triangular arbitrage: {' → '.join(path)} "
+                    f"returns {float(gross[pos])*100:.3f}% before costs"
+                ),
+                execution_steps=steps,
+                risk_level="medium"
+            ))
 
         return opportunities
 
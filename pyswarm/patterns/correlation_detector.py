@@ -6,12 +6,18 @@ Detects correlation patterns across multiple pairs:
 - Amplified correlation (BTC up 5% → SOL up 10%)
 - Dampened correlation (BTC down 5% → SOL down 2%)
 - Correlation breaks (BTC and SOL diverging)
+
+The full correlation matrix comes from a RollingCovariance: either fed bar
+by bar with update() (O(N²) per bar), or computed for all pairs at once
+from price arrays.
 """
 
 import numpy as np
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from coinswarm.patterns.rolling_covariance import RollingCovariance, pairwise_correlation
+
 
 @dataclass
 class CorrelationPattern:
@@ -45,56 +51,68 @@ class CorrelationDetector:
         self.window_size = window_size
         self.correlation_history: Dict[tuple, List[float]] = {}
 
+        # Streaming correlation matrix (fed by update())
+        self.rolling = RollingCovariance(window=window_size, min_periods=2)
+
+    def update(self, prices: Dict[str, float]):
+        """Add one bar of prices (pair -> close) to the streaming matrix"""
+        self.rolling.update_prices(prices)
+
     def calculate_correlation_matrix(
         self,
-        price_data: Dict[str, np.ndarray]
+        price_data: Optional[Dict[str, np.ndarray]] = None
     ) -> Dict[tuple, float]:
         """
         Calculate correlation matrix across all pairs
 
         Args:
-            price_data: Dict of pair -> price array
+            price_data: Dict of pair -> price array (returns over the last
+                window_size candles are used). None reads the streaming
+                matrix fed by update().
 
         Returns:
             Dict of (pair1, pair2) -> correlation
         """
 
-        correlations = {}
-        pairs = list(price_data.keys())
-
-        for i, pair1 in enumerate(pairs):
-            for pair2 in pairs[i+1:]:
-                # Calculate returns
-                returns1 = np.diff(price_data[pair1]) / price_data[pair1][:-1]
-                returns2 = np.diff(price_data[pair2]) / price_data[pair2][:-1]
-
-                # Calculate correlation
-                min_len = min(len(returns1), len(returns2))
-                if min_len < 2:
-                    continue
-
-                corr = np.corrcoef(
-                    returns1[-min_len:],
-                    returns2[-min_len:]
-                )[0, 1]
-
-                correlations[(pair1, pair2)] = corr
-
-                # Track history
-                pair_key = (pair1, pair2)
-                if pair_key not in self.correlation_history:
-                    self.correlation_history[pair_key] = []
-                self.correlation_history[pair_key].append(corr)
+        if price_data is None:
+            correlations = self.rolling.pairs()
+        else:
+            pairs = list(price_data.keys())
+            corr = pairwise_correlation(self._returns_matrix(price_data, pairs))
+            rows, cols = np.triu_indices(len(pairs), k=1)
+            correlations = {
+                (pairs[i], pairs[j]): float(corr[i, j])
+                for i, j in zip(rows, cols)
+                if not np.isnan(corr[i, j])
+            }
+
+        # Track history
+        for pair_key, corr_value in correlations.items():
+            self.correlation_history.setdefault(pair_key, []).append(corr_value)
 
         return correlations
 
+    def _returns_matrix(self, price_data: Dict[str, np.ndarray], pairs: List[str]) -> np.ndarray:
+        """(window_size, N) simple returns, aligned at the latest candle, NaN-padded"""
+        returns = np.full((self.window_size, len(pairs)), np.nan)
+        for col, pair in enumerate(pairs):
+            prices = np.asarray(price_data[pair], dtype=np.float64)[-(self.window_size + 1):]
+            if len(prices) < 2:
+                continue
+            series = np.diff(prices) / prices[:-1]
+            returns[-len(series):, col] = series
+        return returns
+
     def detect_correlation_patterns(
         self,
-        price_data: Dict[str, np.ndarray]
+        price_data: Optional[Dict[str, np.ndarray]] = None
     ) -> List[CorrelationPattern]:
         """
         Detect correlation-based trading patterns
 
+        Args:
+            price_data: Dict of pair -> price array (None = streaming matrix)
+
         Returns:
             List of detected patterns with trading signals
         """
@@ -172,14 +190,14 @@ class CorrelationDetector:
     def get_diversification_score(
         self,
         held_pairs: List[str],
-        price_data: Dict[str, np.ndarray]
+        price_data: Optional[Dict[str, np.ndarray]] = None
     ) -> float:
         """
         Calculate portfolio diversification score
 
         Args:
             held_pairs: List of pairs currently held
-            price_data: Price data for calculation
+            price_data: Price data for calculation (None = streaming matrix)
 
         Returns:
             Diversification score (0 = all correlated, 1 = all independent)
@@ -0,0 +1,272 @@
+"""
+Streaming Return Covariance / Correlation
+
+Keeps the full N×N covariance and correlation of per-bar returns up to date
+in O(N²) per bar, instead of re-running np.corrcoef over the whole window
+for every pair (O(N² × window)).
+
+Two modes:
+- Rolling window (default): running sums over the last `window` bars. Each
+  bar adds one outer product and subtracts the one leaving the window. Sums
+  are pairwise-complete (a pair only counts bars where both symbols have a
+  return), which matches np.corrcoef on the pair's aligned returns. Sums are
+  rebuilt from the window every `window` bars so float drift can't
+  accumulate (amortized O(N²)).
+- EWMA (halflife given): exponentially weighted mean and covariance.
+
+Example:
+    cov = RollingCovariance(window=100)
+    for bar in bars:                      # {"BTC-USD": 50010.0, ...}
+        cov.update_prices(bar)
+    cov.correlation_of("BTC-USD", "ETH-USD")
+"""
+
+import math
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+def _window_sums(returns: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Pairwise-complete sums over a (T, N) return matrix (NaN = missing).
+
+    Returns:
+        (n, sx, sxx, sxy): n[i, j] bars where both are present, sx[i, j] and
+        sxx[i, j] the sum of x_i and x_i² over those bars, sxy[i, j] Σ x_i x_j
+    """
+    present = ~np.isnan(returns)
+    mask = present.astype(np.float64)
+    x = np.where(present, returns, 0.0)
+    return mask.T @ mask, x.T @ mask, (x * x).T @ mask, x.T @ x
+
+
+def _correlation_from_sums(n, sx, sxx, sxy, min_periods: int) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        numerator = n * sxy - sx * sx.T
+        var = n * sxx - sx * sx
+        corr = numerator / np.sqrt(var * var.T)
+    corr[(n < min_periods) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0, out=corr)
+
+
+def pairwise_correlation(returns: np.ndarray, min_periods: int = 2) -> np.ndarray:
+    """
+    Correlation matrix of a (T, N) return matrix with NaN for missing values.
+
+    Each pair uses the bars where both columns are present, like np.corrcoef
+    on the pair's aligned returns, but for every pair in a few matrix products.
+    """
+    return _correlation_from_sums(*_window_sums(returns), min_periods)
+
+
+class RollingCovariance:
+    """
+    Incrementally maintained covariance / correlation of symbol returns.
+
+    Symbols map to rows/columns in order of first appearance; storage grows
+    by doubling as new symbols appear.
+    """
+
+    def __init__(
+        self,
+        window: int = 100,
+        halflife: Optional[float] = None,
+        min_periods: int = 10,
+        initial_symbols: int = 8
+    ):
+        """
+        Args:
+            window: Bars in the rolling window (ignored with halflife)
+            halflife: EWMA half-life in bars (switches to EWMA mode)
+            min_periods: Bars a pair needs before it gets a value (else NaN)
+            initial_symbols: Initial capacity
+        """
+        if window < 2:
+            raise ValueError("window must be >= 2")
+
+        self.window = window
+        self.halflife = halflife
+        self.alpha = 1 - math.exp(math.log(0.5) / halflife) if halflife else None
+        self.min_periods = min_periods
+
+        self.index: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self._last_price: Dict[str, float] = {}
+        self.bars = 0
+        self._pos = 0
+
+        self._allocate(max(1, initial_symbols))
+
+    def _allocate(self, capacity: int):
+        """(Re)size per-symbol state to capacity, keeping existing values"""
+
+        def grow(name: str, shape, fill=0.0, dtype=np.float64):
+            grown = np.full(shape, fill, dtype=dtype)
+            array = getattr(self, name, None)
+            if array is not None:
+                grown[tuple(slice(0, s) for s in array.shape)] = array
+            setattr(self, name, grown)
+
+        square = (capacity, capacity)
+        grow("_n", square)
+        if self.alpha is None:
+            grow("_sx", square)
+            grow("_sxx", square)
+            grow("_sxy", square)
+            grow("_buffer", (self.window, capacity), np.nan)
+        else:
+            grow("_mean", (capacity,))
+            grow("_cov", square)
+            grow("_seen", (capacity,), False, bool)
+
+    def symbol_id(self, symbol: str) -> int:
+        i = self.index.get(symbol)
+        if i is None:
+            i = len(self.symbols)
+            if i == len(self._n):
+                self._allocate(2 * i)
+            self.index[symbol] = i
+            self.symbols.append(symbol)
+        return i
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update_prices(self, prices: Mapping[str, float]):
+        """One bar of prices; simple returns vs each symbol's previous price"""
+        returns = {}
+        for symbol, price in prices.items():
+            previous = self._last_price.get(symbol)
+            if price and price > 0:
+                if previous:
+                    returns[symbol] = price / previous - 1
+                else:
+                    self.symbol_id(symbol)
+                self._last_price[symbol] = price
+        self.update(returns)
+
+    def update(self, returns: Mapping[str, float]):
+        """One bar of returns (symbols not in the mapping are missing this bar)"""
+        for symbol in returns:
+            self.symbol_id(symbol)
+
+        x = np.full(len(self._n), np.nan)
+        for symbol, value in returns.items():
+            x[self.index[symbol]] = value
+
+        if self.alpha is None:
+            self._update_window(x)
+        else:
+            self._update_ewma(x)
+        self.bars += 1
+
+    def _update_window(self, x: np.ndarray):
+        row = self._pos % self.window
+        leaving = self._buffer[row].copy()
+        self._buffer[row] = x
+        self._pos += 1
+
+        if self._pos % self.window == 0:
+            # Rebuild from the window (bounds float drift)
+            self._n, self._sx, self._sxx, self._sxy = _window_sums(self._buffer)
+            return
+
+        self._add(x, 1.0)
+        if not np.isnan(leaving).all():
+            self._add(leaving, -1.0)
+
+    def _add(self, x: np.ndarray, sign: float):
+        """Add (sign=1) or remove (sign=-1) one bar from the window sums"""
+        present = ~np.isnan(x)
+        mask = present.astype(np.float64)
+        xz = np.where(present, x, 0.0)
+        self._n += np.outer(sign * mask, mask)
+        self._sx += np.outer(sign * xz, mask)
+        self._sxx += np.outer(sign * xz * xz, mask)
+        self._sxy += np.outer(sign * xz, xz)
+
+    def _update_ewma(self, x: np.ndarray):
+        present = ~np.isnan(x)
+        first = present & ~self._seen
+        self._mean[first] = x[first]
+        self._seen |= present
+
+        idx = np.flatnonzero(present & ~first)
+        if len(idx) == 0:
+            return
+
+        block = np.ix_(idx, idx)
+        delta = x[idx] - self._mean[idx]
+        self._mean[idx] += self.alpha * delta
+        self._cov[block] = (1 - self.alpha) * (self._cov[block] + self.alpha * np.outer(delta, delta))
+        self._n[block] += 1
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def covariance(self) -> np.ndarray:
+        """N×N return covariance (NaN for pairs with < min_periods bars)"""
+        k = len(self.symbols)
+        n = self._n[:k, :k]
+        if self.alpha is None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                sx = self._sx[:k, :k]
+                cov = (self._sxy[:k, :k] - sx * sx.T / n) / (n - 1)
+        else:
+            cov = self._cov[:k, :k].copy()
+        cov[n < self.min_periods] = np.nan
+        return cov
+
+    def correlation(self) -> np.ndarray:
+        """N×N return correlation (NaN for pairs with < min_periods bars)"""
+        k = len(self.symbols)
+        if self.alpha is None:
+            return _correlation_from_sums(
+                self._n[:k, :k], self._sx[:k, :k], self._sxx[:k, :k], self._sxy[:k, :k],
+                self.min_periods
+            )
+
+        cov = self.covariance()
+        std = np.sqrt(np.diag(self._cov[:k, :k]))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.outer(std, std)
+        corr[~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1.0, 1.0, out=corr)
+
+    def correlation_of(self, a: str, b: str) -> float:
+        """Correlation of two symbols (NaN if unknown or too few bars)"""
+        i, j = self.index.get(a), self.index.get(b)
+        if i is None or j is None:
+            return float("nan")
+        return float(self.correlation()[i, j])
+
+    def correlated_with(self, symbol: str, threshold: float) -> List[Tuple[str, float]]:
+        """Other symbols with |correlation| >= threshold, strongest first"""
+        i = self.index.get(symbol)
+        if i is None:
+            return []
+
+        row = self.correlation()[i]
+        row[i] = np.nan
+        with np.errstate(invalid="ignore"):
+            hits = np.flatnonzero(np.abs(row) >= threshold)
+        hits = hits[np.argsort(-np.abs(row[hits]))]
+        return [(self.symbols[j], float(row[j])) for j in hits]
+
+    def pairs(self) -> Dict[Tuple[str, str], float]:
+        """{(symbol_i, symbol_j): correlation} for i < j with a value"""
+        corr = self.correlation()
+        rows, cols = np.triu_indices(len(self.symbols), k=1)
+        values = corr[rows, cols]
+        valid = ~np.isnan(values)
+        return {
+            (self.symbols[i], self.symbols[j]): float(v)
+            for i, j, v in zip(rows[valid], cols[valid], values[valid])
+        }
+
+    def __repr__(self):
+        mode = f"halflife={self.halflife}" if self.alpha else f"window={self.window}"
+        return f"RollingCovariance(symbols={len(self.symbols)}, {mode}, bars={self.bars})"
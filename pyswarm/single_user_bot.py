@@ -162,7 +162,9 @@ class SingleUserTradingBot:
         # Committee (aggregates votes from all agents)
         self.committee = AgentCommittee(
             agents=agents,
-            confidence_threshold=0.7  # Only execute if 70%+ confidence
+            confidence_threshold=0.7,  # Only execute if 70%+ confidence
+            vote_timeout=0.05,  # 50ms budget: a slow news crawl can't stall the tick
+            late_vote_policy="cached"  # Late agents reuse their last vote
         )
 
         # Cosmos DB for persistence (10-20ms writes, async)
@@ -254,18 +256,21 @@ class SingleUserTradingBot:
         # For now, simulate with REST polling (will be replaced)
         while True:
             try:
-                for symbol in self.symbols:
-                    # Get latest market data from MCP
-                    # In production, this would be WebSocket stream
-                    tick = await self._fetch_latest_tick(symbol)
+                # Get latest market data from MCP for every symbol
+                # In production, this would be WebSocket stream
+                fetched = await asyncio.gather(
+                    *(self._fetch_latest_tick(symbol) for symbol in self.symbols)
+                )
+                ticks = [tick for tick in fetched if tick]
 
-                    if tick:
-                        # Update cache (0ms)
-                        self.cache.update_tick(symbol, tick)
-                        self.last_tick_time = datetime.now()
+                for tick in ticks:
+                    # Update cache (0ms)
+                    self.cache.update_tick(tick.symbol, tick)
+                    self.last_tick_time = datetime.now()
 
-                        # Process tick
-                        await self.process_tick(symbol, tick)
+                # Process the whole cross-section with one committee vote
+                if ticks:
+                    await self.process_ticks(ticks)
 
                 # Small delay (WebSocket would be push-based, no delay)
                 await asyncio.sleep(0.1)
@@ -332,53 +337,87 @@ class SingleUserTradingBot:
             logger.error(f"Error processing tick for {symbol}: {e}")
             self.stats["errors"] += 1
 
-    async def _run_agents(
-        self,
-        symbol: str,
-        tick: DataPoint,
-        position: Optional[dict]
-    ) -> Optional[TradeSignal]:
+    async def process_ticks(self, ticks: List[DataPoint]):
         """
-        Run agent swarm and get committee vote.
-
-        Process:
-        1. All agents analyze in parallel
-        2. Committee aggregates votes
-        3. Returns decision if confidence > threshold
+        Process the latest tick of several symbols at once.
 
-        Latency: 5-10ms (all agents run in-process)
-        Note: ResearchAgent may take 2-3s first time (crawls news),
-              but results are cached for 5 minutes.
+        Same as process_tick() per symbol, but the committee votes on all
+        symbols in one vote_batch() call, so agents are dispatched once per
+        round instead of once per symbol.
         """
 
-        price = tick.data.get("price", 0)
+        try:
+            self.stats["ticks_processed"] += len(ticks)
+
+            positions = [self.cache.get_position(tick.symbol) for tick in ticks]
+            contexts = [self._market_context(tick.symbol) for tick in ticks]
 
-        # Market context for agents
-        market_context = {
+            decisions = await self.committee.vote_batch(ticks, positions, contexts)
+
+            for tick, decision in zip(ticks, decisions):
+                signal = self._to_signal(tick, decision)
+                if signal and signal.confidence > 0.8:
+                    await self._execute_trade(tick.symbol, signal)
+
+        except Exception as e:
+            logger.error(f"Error processing ticks for {[t.symbol for t in ticks]}: {e}")
+            self.stats["errors"] += 1
+
+    def _market_context(self, symbol: str) -> dict:
+        """Market context for agents"""
+        return {
             "orderbook": self.cache.orderbooks.get(symbol),
             "recent_candles": self.cache.candles.get(symbol, []),
             "account_value": 100000,  # TODO: Get from MCP
             "drawdown_pct": 0.0,  # TODO: Calculate from trades
         }
 
-        # Get committee vote (all agents run in parallel)
-        decision = await self.committee.vote(tick, position, market_context)
+    def _to_signal(self, tick: DataPoint, decision) -> Optional[TradeSignal]:
+        """TradeSignal for a committee decision, or None if it is below threshold"""
 
         # Check if confidence meets threshold
         if decision.confidence >= self.committee.confidence_threshold:
             # Strong signal - return as TradeSignal
             return TradeSignal(
                 action=decision.action,
-                symbol=symbol,
+                symbol=tick.symbol,
                 confidence=decision.confidence,
                 size=decision.size,
-                price=price,
+                price=tick.data.get("price", 0),
                 reason=decision.reason
             )
 
         # Weak signal - HOLD
         return None
 
+    async def _run_agents(
+        self,
+        symbol: str,
+        tick: DataPoint,
+        position: Optional[dict]
+    ) -> Optional[TradeSignal]:
+        """
+        Run agent swarm and get committee vote.
+
+        Process:
+        1. All agents analyze in parallel
+        2. Committee aggregates votes
+        3. Returns decision if confidence > threshold
+
+        Latency: 5-10ms (all agents run in-process), capped by the
+        committee's 50ms vote budget.
+        Note: ResearchAgent may take 2-3s first time (crawls news); until it
+              finishes, the committee uses its last vote (or it abstains).
+        """
+
+        # Market context for agents
+        market_context = self._market_context(symbol)
+
+        # Get committee vote (all agents run concurrently within the budget)
+        decision = await self.committee.vote(tick, position, market_context)
+
+        return self._to_signal(tick, decision)
+
     async def _execute_trade(self, symbol: str, signal: TradeSignal):
         """
         Execute trade via MCP.
@@ -0,0 +1,51 @@
+"""
+Benchmark for approximate episode recall
+
+Reports recall@k of IVFIndex against exact search, and per-query latency of
+both, across nprobe settings on clustered state vectors.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.ann_index import IVFIndex
+
+
+def clustered_states(n: int, dim: int, clusters: int, spread: float, rng) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim))
+    x = (centers[rng.integers(0, clusters, n)] + spread * rng.normal(size=(n, dim))).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+@pytest.mark.performance
+def test_ivf_recall_at_k_vs_exact():
+    rng = np.random.default_rng(0)
+    n, dim, k = 100_000, 64, 10
+    states = clustered_states(n + 200, dim, clusters=500, spread=1.0, rng=rng)
+    vectors, queries = states[:n], states[n:]
+
+    index = IVFIndex(capacity=n, dim=dim, seed=0)
+    start = time.perf_counter()
+    for key, vector in enumerate(vectors):
+        index.add(key, vector)
+    insert_us = (time.perf_counter() - start) / n * 1e6
+
+    start = time.perf_counter()
+    truth = [set(np.argpartition(-(vectors @ q), k - 1)[:k].tolist()) for q in queries]
+    exact_ms = (time.perf_counter() - start) / len(queries) * 1e3
+
+    print(f"\n{n} × {dim}: insert {insert_us:.1f}µs, exact {exact_ms:.2f}ms/query")
+    recalls = {}
+    for nprobe in (4, 8, 16, 32, index.nlist):
+        index.nprobe = nprobe
+        start = time.perf_counter()
+        found = [index.search(q, k, -1.0)[0] for q in queries]
+        ann_ms = (time.perf_counter() - start) / len(queries) * 1e3
+
+        recalls[nprobe] = np.mean([len(truth[i] & set(keys.tolist())) / k for i, keys in enumerate(found)])
+        print(f"nprobe={nprobe:4d}: recall@{k}={recalls[nprobe]:.3f}, {ann_ms:.2f}ms/query")
+
+    assert recalls[index.nlist] == 1.0
+    assert recalls[16] > 0.8
@@ -0,0 +1,53 @@
+"""
+Performance test for AgentCommittee per-tick overhead
+
+Committee bookkeeping (dispatch, aggregation, decision record) should cost
+microseconds, not milliseconds, with 10+ cheap agents.
+"""
+
+import time
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.base_agent import AgentCost, AgentVote, BaseAgent
+from coinswarm.agents.committee import AgentCommittee
+from coinswarm.data_ingest.base import DataPoint
+
+
+class ConstantAgent(BaseAgent):
+    """Cheap agent returning a fixed vote (isolates committee overhead)"""
+
+    cost_class = AgentCost.CHEAP
+
+    def __init__(self, name: str, action: str):
+        super().__init__(name)
+        self.action = action
+
+    async def analyze(self, tick, position, market_context):
+        return AgentVote(self.name, self.action, 0.8, 0.01, "constant {}", reason_args=(1,))
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_committee_overhead_per_tick():
+    agents = [ConstantAgent(f"A{i}", ("BUY", "SELL", "HOLD")[i % 3]) for i in range(12)]
+    committee = AgentCommittee(agents)
+    tick = DataPoint(
+        source="test",
+        symbol="BTC-USD",
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": 50000.0, "volume": 1.0}
+    )
+
+    for _ in range(100):
+        await committee.vote(tick)
+
+    n = 2000
+    start = time.perf_counter()
+    for _ in range(n):
+        await committee.vote(tick)
+    per_vote_us = (time.perf_counter() - start) / n * 1e6
+
+    print(f"Committee overhead: {per_vote_us:.1f}µs per vote with {len(agents)} agents")
+    assert per_vote_us < 500
@@ -0,0 +1,51 @@
+"""
+Benchmark for quantized state storage
+
+Reports bytes per stored state, recall@k against full-precision (float32)
+search and per-query scan latency for each quantization mode, at the state
+dimensions the long timescales use.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.quantization import make_quantizer
+
+
+def clustered_states(n: int, dim: int, clusters: int, spread: float, rng) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim))
+    x = (centers[rng.integers(0, clusters, n)] + spread * rng.normal(size=(n, dim))).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("dim", [64, 128])
+def test_quantized_recall_vs_full_precision(dim):
+    rng = np.random.default_rng(0)
+    n, k = 100_000, 10
+    states = clustered_states(n + 100, dim, clusters=500, spread=1.0, rng=rng)
+    vectors, queries = states[:n], states[n:]
+    truth = [set(np.argpartition(-(vectors @ q), k - 1)[:k].tolist()) for q in queries]
+
+    print(f"\n{n} × {dim}:")
+    recalls = {}
+    for kind in ("float32", "float16", "int8"):
+        quantizer = make_quantizer(kind)
+        quantizer.fit(vectors[:1024])
+        codes = quantizer.encode(vectors)
+
+        start = time.perf_counter()
+        found = [np.argpartition(-quantizer.scores(codes, q), k - 1)[:k] for q in queries]
+        ms = (time.perf_counter() - start) / len(queries) * 1e3
+
+        recalls[kind] = np.mean([len(truth[i] & set(keys.tolist())) / k for i, keys in enumerate(found)])
+        print(
+            f"{kind:8s}: {codes.nbytes / n:4.0f} B/state ({vectors.nbytes / codes.nbytes:.0f}× smaller), "
+            f"recall@{k}={recalls[kind]:.3f}, {ms:.2f}ms/query"
+        )
+
+    assert recalls["float32"] == 1.0
+    assert recalls["float16"] > 0.98
+    assert recalls["int8"] > 0.9
@@ -0,0 +1,174 @@
+"""
+Unit tests for agent / committee snapshots and warm-start checkpoints
+"""
+
+import pickle
+import pytest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from coinswarm.agents.committee import AgentCommittee
+from coinswarm.agents.hedge_agent import HedgeAgent
+from coinswarm.agents.risk_agent import RiskManagementAgent
+from coinswarm.agents.symbol_state import SymbolRingBuffers
+from coinswarm.agents.trend_agent import TrendFollowingAgent
+from coinswarm.backtesting.checkpoints import CommitteeCheckpoints
+from coinswarm.data_ingest.base import DataPoint
+
+
+START = datetime(2024, 1, 1)
+
+
+def make_ticks(count: int, symbols=("BTC-USD", "ETH-USD"), seed: int = 0):
+    rng = np.random.default_rng(seed)
+    ticks = {}
+    for k, symbol in enumerate(symbols):
+        prices = 100.0 * (k + 1) * np.cumprod(1 + rng.normal(0.002, 0.01, count))
+        ticks[symbol] = [
+            DataPoint(
+                source="test", symbol=symbol, timeframe="1h",
+                timestamp=START + timedelta(hours=i), data={"price": float(p), "volume": 1.0}
+            )
+            for i, p in enumerate(prices)
+        ]
+    return ticks
+
+
+def merged(ticks):
+    return sorted((t for series in ticks.values() for t in series), key=lambda t: t.timestamp)
+
+
+def build_committee() -> AgentCommittee:
+    return AgentCommittee([
+        TrendFollowingAgent(weight=1.5),
+        RiskManagementAgent(),
+        HedgeAgent(correlation_window=20),
+    ], confidence_threshold=0.5)
+
+
+class TestSymbolRingBufferSnapshot:
+    """Test suite for SymbolRingBuffers.snapshot/restore"""
+
+    def test_round_trip_after_wrap(self):
+        buffers = SymbolRingBuffers(capacity=5, fields=("price", "volume"))
+        for i in range(13):
+            buffers.append("A", i, -i)
+        buffers.append("B", 100.0, 1.0)
+
+        restored = SymbolRingBuffers(capacity=5, fields=("price", "volume"))
+        restored.restore(buffers.snapshot())
+
+        assert restored.view("A").tolist() == [8, 9, 10, 11, 12]
+        assert restored.view("A", "volume").tolist() == [-8, -9, -10, -11, -12]
+        assert restored.view("B").tolist() == [100.0]
+
+        restored.append("A", 99, 0)
+        assert restored.view("A").tolist() == [9, 10, 11, 12, 99]
+        assert buffers.view("A").tolist() == [8, 9, 10, 11, 12]
+
+    def test_shape_mismatch(self):
+        with pytest.raises(ValueError):
+            SymbolRingBuffers(capacity=5).restore(SymbolRingBuffers(capacity=6).snapshot())
+
+
+class TestAgentSnapshot:
+    """Test suite for BaseAgent.snapshot/restore"""
+
+    @pytest.mark.asyncio
+    async def test_restored_agent_votes_like_warm_agent(self):
+        ticks = merged(make_ticks(80))
+        warm = TrendFollowingAgent()
+        for tick in ticks[:-2]:
+            await warm.analyze(tick, None, {})
+
+        cold = TrendFollowingAgent()
+        cold.restore(pickle.loads(pickle.dumps(warm.snapshot())))
+
+        for tick in ticks[-2:]:
+            assert await cold.analyze(tick, None, {}) == await warm.analyze(tick, None, {})
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_independent(self):
+        agent = TrendFollowingAgent()
+        ticks = merged(make_ticks(30))
+        for tick in ticks[:20]:
+            await agent.analyze(tick, None, {})
+        snapshot = agent.snapshot()
+        agent.weight = 5.0
+
+        for tick in ticks[20:]:
+            await agent.analyze(tick, None, {})
+
+        fresh = TrendFollowingAgent()
+        fresh.restore(snapshot)
+        fresh.history.append("BTC-USD", 1.0)
+        again = TrendFollowingAgent()
+        again.restore(snapshot)
+
+        assert again.weight == 1.0
+        assert again.history.count("BTC-USD") == 10
+
+    @pytest.mark.asyncio
+    async def test_rolling_state_is_captured(self):
+        agent = HedgeAgent(correlation_window=20)
+        for tick in merged(make_ticks(30)):
+            await agent.analyze(tick, None, {})
+
+        restored = HedgeAgent(correlation_window=20)
+        restored.restore(agent.snapshot())
+
+        np.testing.assert_array_equal(restored.covariance.correlation(), agent.covariance.correlation())
+
+
+class TestCommitteeCheckpoints:
+    """Warm-starting committees from dataset checkpoints"""
+
+    @pytest.mark.asyncio
+    async def test_window_restored_from_checkpoint_matches_replay(self):
+        ticks = make_ticks(120)
+        checkpoints = CommitteeCheckpoints(every=timedelta(hours=24))
+        taken = await checkpoints.build("test", build_committee(), ticks)
+        assert taken == 4
+
+        # Continuous replay up to the window start at hour 48
+        window_start = START + timedelta(hours=48)
+        replayed = build_committee()
+        for tick in merged(ticks):
+            if tick.timestamp >= window_start:
+                break
+            await replayed.vote(tick, None, {})
+
+        restored = build_committee()
+        assert checkpoints.restore("test", restored, window_start + timedelta(minutes=30)) == window_start
+
+        for tick in [t for t in merged(ticks) if t.timestamp >= window_start][:10]:
+            expected = await replayed.vote(tick, None, {})
+            actual = await restored.vote(tick, None, {})
+            assert (actual.action, actual.confidence) == (expected.action, expected.confidence)
+
+        assert restored.agents[0].weight == 1.5
+
+    def test_nearest(self):
+        checkpoints = CommitteeCheckpoints()
+        checkpoints.put("d", START + timedelta(days=2), {"n": 2})
+        checkpoints.put("d", START, {"n": 0})
+
+        assert checkpoints.nearest("d", START - timedelta(days=1)) is None
+        assert checkpoints.nearest("d", START + timedelta(days=1))[1] == {"n": 0}
+        assert checkpoints.nearest("d", START + timedelta(days=5))[1] == {"n": 2}
+        assert checkpoints.nearest("other", START) is None
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, tmp_path):
+        checkpoints = CommitteeCheckpoints(every=timedelta(hours=12))
+        await checkpoints.build("test", build_committee(), make_ticks(40))
+
+        path = tmp_path / "checkpoints.pkl"
+        checkpoints.save(str(path))
+        loaded = CommitteeCheckpoints.load(str(path))
+
+        assert loaded.checkpoints("test") == checkpoints.checkpoints("test")
+        committee = build_committee()
+        loaded.restore("test", committee, START + timedelta(hours=30))
+        assert committee.feature_bus.buffers.count("BTC-USD") == 24
@@ -0,0 +1,153 @@
+"""
+Unit tests for AgentVote / CommitteeDecision records
+
+Tests slotted records, lazily rendered reasons, and single-pass aggregation.
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.base_agent import AgentVote, StrategyTag, strategy_tag_names, strategy_tags_from_names
+from coinswarm.agents.committee import AgentCommittee, CommitteeDecision
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(price: float = 50000.0) -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol="BTC-USD",
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": price}
+    )
+
+
+class TestAgentVote:
+    """Test suite for AgentVote"""
+
+    def test_records_are_slotted(self):
+        vote = AgentVote("A", "BUY", 0.8, 0.01, "reason")
+        decision = CommitteeDecision("HOLD", 0.0, 0.0)
+
+        assert not hasattr(vote, "__dict__")
+        assert not hasattr(decision, "__dict__")
+
+    def test_template_reason_is_rendered_lazily(self):
+        vote = AgentVote(
+            "A", "BUY", 0.8, 0.01,
+            reason="momentum={:.2%}", reason_args=(0.0312,)
+        )
+
+        assert vote._reason_args is not None
+        assert vote.reason == "momentum=3.12%"
+        assert vote._reason_args is None
+
+    def test_callable_reason_runs_once(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "rendered"
+
+        vote = AgentVote("A", "HOLD", 0.5, 0.0, reason=render)
+        assert vote.reason == "rendered"
+        assert vote.reason == "rendered"
+        assert len(calls) == 1
+
+    def test_keyword_construction_and_equality(self):
+        a = AgentVote(agent_name="A", action="SELL", confidence=0.7, size=0.1, reason="x", veto=True)
+        b = AgentVote("A", "SELL", 0.7, 0.1, "x", True)
+
+        assert a == b
+        assert "SELL" in repr(a)
+
+    def test_repr_shows_tags(self):
+        vote = AgentVote("Trend", "BUY", 0.8, 0.01, "up", tags=StrategyTag.TREND_UPTREND)
+
+        assert "TREND_UPTREND" in repr(vote)
+
+
+class TestAggregation:
+    """Single-pass aggregation matches the weighted-confidence rules"""
+
+    def test_weighted_confidence_and_size(self):
+        committee = AgentCommittee([])
+        votes = [
+            AgentVote("A", "BUY", 0.9, 0.02, "a"),
+            AgentVote("B", "BUY", 0.6, 0.04, "b"),
+            AgentVote("C", "SELL", 0.7, 0.01, "c"),
+        ]
+
+        decision = committee._aggregate_votes(votes, make_tick())
+
+        assert decision.action == "BUY"
+        assert decision.confidence == pytest.approx(0.75)
+        assert decision.size == pytest.approx(0.03)
+        assert decision.price == 50000.0
+
+    def test_weights_come_from_agent_index(self):
+        from coinswarm.agents.trend_agent import TrendFollowingAgent
+
+        heavy = TrendFollowingAgent(name="Heavy", weight=3.0)
+        light = TrendFollowingAgent(name="Light", weight=1.0)
+        committee = AgentCommittee([heavy, light])
+        votes = [
+            AgentVote("Heavy", "SELL", 0.6, 0.01, "h"),
+            AgentVote("Light", "SELL", 1.0, 0.01, "l"),
+        ]
+
+        decision = committee._aggregate_votes(votes, make_tick())
+        assert decision.confidence == pytest.approx((3.0 * 0.6 + 1.0) / 4.0)
+
+        # Weight changes are picked up without rebuilding the index
+        heavy.weight = 1.0
+        decision = committee._aggregate_votes(votes, make_tick())
+        assert decision.confidence == pytest.approx(0.8)
+
+    def test_summary_reason_uses_top_three_votes_for_action(self):
+        committee = AgentCommittee([])
+        votes = [AgentVote(f"A{i}", "BUY", 0.8, 0.01, f"r{i}") for i in range(5)]
+        votes.append(AgentVote("S", "SELL", 0.1, 0.01, "ignored"))
+
+        decision = committee._aggregate_votes(votes, make_tick())
+
+        assert decision.reason == "A0(80%): r0 | A1(80%): r1 | A2(80%): r2"
+
+    def test_no_votes_holds(self):
+        committee = AgentCommittee([])
+        decision = committee._aggregate_votes([], make_tick())
+
+        assert decision.action == "HOLD"
+        assert decision.reason == "No votes received"
+
+
+class TestStrategyTags:
+    """Structured strategy tags on votes"""
+
+    def test_votes_default_to_no_tags(self):
+        assert AgentVote("A", "HOLD", 0.5, 0.0).tags == StrategyTag.NONE
+
+    def test_tags_take_part_in_equality(self):
+        a = AgentVote("A", "BUY", 0.8, 0.01, "r", tags=StrategyTag.BREAKOUT)
+        b = AgentVote("A", "BUY", 0.8, 0.01, "r")
+
+        assert a != b
+
+    def test_tag_names_round_trip(self):
+        tags = StrategyTag.TREND_DOWNTREND | StrategyTag.ARBITRAGE
+
+        assert strategy_tag_names(tags) == ("trend_downtrend", "arbitrage")
+        assert strategy_tags_from_names(["arbitrage", "trend_downtrend", "unknown"]) == tags
+
+    @pytest.mark.asyncio
+    async def test_trend_agent_tags_direction(self):
+        from coinswarm.agents.trend_agent import TrendFollowingAgent
+
+        agent = TrendFollowingAgent()
+        price, vote = 50000.0, None
+        for i in range(60):
+            price *= 1.03 if i % 2 else 0.985  # Choppy uptrend (RSI below 70)
+            vote = await agent.analyze(make_tick(price), None, {})
+
+        assert vote.action == "BUY"
+        assert vote.tags == StrategyTag.TREND_UPTREND
@@ -0,0 +1,182 @@
+"""
+Unit tests for the approximate nearest-neighbour episode indexes
+"""
+
+from functools import partial
+
+import numpy as np
+import pytest
+
+from coinswarm.memory import ann_index
+from coinswarm.memory.ann_index import IVFIndex, VectorIndex, make_index
+from coinswarm.memory.simple_memory import SimpleMemory
+
+
+def unit_vectors(n: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def exact(vectors: np.ndarray, keys, query: np.ndarray, k: int):
+    keys = np.asarray(keys)
+    scores = vectors[keys] @ query
+    return keys[np.argsort(-scores, kind="stable")[:k]]
+
+
+class TestIVFIndex:
+    """Test suite for IVFIndex"""
+
+    def test_untrained_search_is_exact(self):
+        vectors = unit_vectors(100)
+        index = IVFIndex(capacity=100, dim=16, nlist=16)
+        for key, vector in enumerate(vectors):
+            index.add(key, vector)
+
+        assert not index.trained
+        keys, similarities = index.search(vectors[7], k=5, min_similarity=-1.0)
+        assert keys.tolist() == exact(vectors, range(100), vectors[7], 5).tolist()
+        assert similarities[0] == pytest.approx(1.0, abs=1e-6)
+
+    def test_trains_and_full_probe_is_exact(self):
+        vectors = unit_vectors(2000)
+        index = IVFIndex(capacity=2000, dim=16, nlist=16, train_size=500, seed=0)
+        for key, vector in enumerate(vectors):
+            index.add(key, vector)
+
+        assert index.trained
+        assert len(index) == 2000
+
+        index.nprobe = index.nlist
+        for query in unit_vectors(20, seed=1):
+            keys, _ = index.search(query, k=10, min_similarity=-1.0)
+            assert keys.tolist() == exact(vectors, range(2000), query, 10).tolist()
+
+    def test_remove_and_replace(self):
+        vectors = unit_vectors(600)
+        index = IVFIndex(capacity=300, dim=16, nlist=16, train_size=200, seed=0)
+        for key in range(300):
+            index.add(key, vectors[key])
+
+        # Overwrite every even key, drop every key divisible by 3
+        for key in range(0, 300, 2):
+            index.add(key, vectors[300 + key])
+        for key in range(0, 300, 3):
+            index.remove(key)
+        index.remove(0)  # Already gone: no-op
+
+        current = {key: vectors[300 + key] if key % 2 == 0 else vectors[key]
+                   for key in range(300) if key % 3}
+        assert len(index) == len(current)
+
+        index.nprobe = index.nlist
+        keys, similarities = index.search(vectors[302], k=len(current) + 10, min_similarity=-1.0)
+        assert sorted(keys.tolist()) == sorted(current)
+        assert keys[0] == 2
+        assert similarities[0] == pytest.approx(1.0, abs=1e-6)
+
+    def test_memmap_segments_match_ram(self, tmp_path):
+        vectors = unit_vectors(1000)
+        in_ram = IVFIndex(capacity=1000, dim=16, nlist=16, train_size=300, seed=0)
+        on_disk = IVFIndex(capacity=1000, dim=16, nlist=16, train_size=300, seed=0,
+                           directory=str(tmp_path / "ivf"))
+        for key, vector in enumerate(vectors):
+            in_ram.add(key, vector)
+            on_disk.add(key, vector)
+
+        assert on_disk.trained
+        assert all(isinstance(block, np.memmap) for block in on_disk._vectors)
+        # One live segment file per list; replaced blocks are deleted
+        assert len(list((tmp_path / "ivf").iterdir())) == on_disk.nlist
+
+        for query in unit_vectors(10, seed=1):
+            assert on_disk.search(query, 10, -1.0)[0].tolist() == in_ram.search(query, 10, -1.0)[0].tolist()
+
+    @pytest.mark.asyncio
+    async def test_trains_in_background_inside_event_loop(self):
+        vectors = unit_vectors(800)
+        index = IVFIndex(capacity=800, dim=16, nlist=16, train_size=500, seed=0)
+        for key in range(500):
+            index.add(key, vectors[key])
+
+        # Fit scheduled, not run inline; search stays exact and adds keep going
+        assert index.training is not None
+        assert not index.trained
+        for key in range(500, 800):
+            index.add(key, vectors[key])
+        keys, _ = index.search(vectors[650], k=5, min_similarity=-1.0)
+        assert keys.tolist() == exact(vectors, range(800), vectors[650], 5).tolist()
+
+        await index.training
+
+        assert index.trained
+        assert index.training is None
+        assert len(index) == 800
+        index.nprobe = index.nlist
+        keys, _ = index.search(vectors[650], k=5, min_similarity=-1.0)
+        assert keys.tolist() == exact(vectors, range(800), vectors[650], 5).tolist()
+
+    def test_min_similarity(self):
+        index = IVFIndex(capacity=3, dim=2)
+        index.add(0, np.array([1.0, 0.0], dtype=np.float32))
+        index.add(1, np.array([0.0, 1.0], dtype=np.float32))
+        index.add(2, np.array([0.6, 0.8], dtype=np.float32))
+
+        keys, _ = index.search(np.array([1.0, 0.0], dtype=np.float32), k=10, min_similarity=0.5)
+
+        assert keys.tolist() == [0, 2]
+
+
+class TestMakeIndex:
+    """Index selection by name"""
+
+    def test_exact_means_no_index(self):
+        assert make_index("exact", 100, 8, nprobe=4) is None
+
+    def test_ivf_options(self):
+        index = make_index("ivf", 100, 8, nprobe=4)
+        assert isinstance(index, IVFIndex)
+        assert index.nprobe == 4
+
+    def test_hnsw_falls_back_to_ivf(self, monkeypatch):
+        monkeypatch.setattr(ann_index, "hnswlib", None)
+        assert isinstance(make_index("hnsw", 100, 8, nprobe=4), IVFIndex)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            make_index("lsh", 100, 8)
+
+    def test_vector_index_is_abstract(self):
+        with pytest.raises(TypeError):
+            VectorIndex()
+
+
+class TestSimpleMemoryIndex:
+    """SimpleMemory keeps its index in step with eviction"""
+
+    @pytest.mark.asyncio
+    async def test_index_follows_eviction(self):
+        states = unit_vectors(400, dim=8)
+        memory = SimpleMemory(
+            max_episodes=150,
+            pattern_update_frequency=10**6,
+            index_factory=partial(make_index, "ivf", nlist=16, train_size=100, seed=0)
+        )
+        for i, state in enumerate(states):
+            await memory.store_episode(
+                action="BUY", symbol="BTC-USD", price=1.0, size=1.0, state=state, reward=float(i)
+            )
+            if memory.index is not None and memory.index.training is not None:
+                await memory.index.training
+
+        assert memory.index.trained
+        assert len(memory.index) == 150
+
+        memory.index.nprobe = memory.index.nlist
+        for i in (250, 330, 399):
+            (episode, similarity), = await memory.recall_similar(states[i], k=1, min_similarity=0.0)
+            assert episode.reward == i
+            assert similarity == pytest.approx(1.0, abs=1e-6)
+
+        recalled = await memory.recall_similar(states[0], k=150, min_similarity=-1.0)
+        assert {episode.reward for episode, _ in recalled} == set(map(float, range(250, 400)))
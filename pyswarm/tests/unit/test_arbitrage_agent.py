@@ -5,7 +5,8 @@ ArbitrageAgent detects triangular arbitrage opportunities like:
 - BTC → SOL → USDC → BTC
 - Need >0.4% spread to profit after 0.9% total fees (3 legs × 0.3%)
 
-CrossExchangeArbitrageAgent is currently a stub (not yet implemented).
+CrossExchangeArbitrageAgent only trades from order books on two exchanges
+(see test_order_book.py); price ticks alone never trade.
 """
 
 import pytest
@@ -299,149 +300,6 @@ async def test_arbitrage_size_is_small(arb_agent):
     assert vote.size == 0.01
 
 
-# ============================================================================
-# ArbitrageAgent - Triangular Arbitrage Calculation Tests
-# ============================================================================
-
-def test_triangular_arbitrage_calculation_profitable(arb_agent):
-    """Test triangular arbitrage calculation for profitable path"""
-    arb_agent.price_cache = {
-        "BTC-USDC": 50000.0,
-        "BTC-SOL": 500.0,
-        "SOL-USDC": 101.0
-    }
-
-    result = arb_agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",
-        leg2="SOL-USDC",
-        end="BTC-USDC"
-    )
-
-    assert result is not None
-    path, profit_pct, end_amount = result
-
-    # Path: $50k → 1 BTC → 500 SOL → $50,500
-    # Profit: $500 / $50k = 1%
-    assert profit_pct == pytest.approx(0.01, abs=0.001)
-    assert end_amount == pytest.approx(50500, abs=10)
-
-
-def test_triangular_arbitrage_calculation_unprofitable(arb_agent):
-    """Test triangular arbitrage calculation for unprofitable path"""
-    arb_agent.price_cache = {
-        "BTC-USDC": 50000.0,
-        "BTC-SOL": 500.0,
-        "SOL-USDC": 99.0  # Loss path
-    }
-
-    result = arb_agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",
-        leg2="SOL-USDC",
-        end="BTC-USDC"
-    )
-
-    assert result is not None
-    path, profit_pct, end_amount = result
-
-    # Path: $50k → 1 BTC → 500 SOL → $49,500
-    # Loss: -$500 / $50k = -1%
-    assert profit_pct == pytest.approx(-0.01, abs=0.001)
-    assert end_amount < 50000  # Lost money
-
-
-def test_triangular_arbitrage_missing_prices(arb_agent):
-    """Test triangular arbitrage returns None when prices missing"""
-    # Only 1 price in cache
-    arb_agent.price_cache = {
-        "BTC-USDC": 50000.0
-    }
-
-    result = arb_agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",  # Not in cache
-        leg2="SOL-USDC",  # Not in cache
-        end="BTC-USDC"
-    )
-
-    assert result is None
-
-
-def test_triangular_arbitrage_path_structure(arb_agent):
-    """Test triangular arbitrage returns correct path structure"""
-    arb_agent.price_cache = {
-        "BTC-USDC": 50000.0,
-        "BTC-SOL": 500.0,
-        "SOL-USDC": 100.0
-    }
-
-    result = arb_agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",
-        leg2="SOL-USDC",
-        end="BTC-USDC"
-    )
-
-    assert result is not None
-    path, profit_pct, end_amount = result
-
-    # Path should contain all 4 symbols
-    assert len(path) == 4
-    assert path[0] == "BTC-USDC"
-    assert path[1] == "BTC-SOL"
-    assert path[2] == "SOL-USDC"
-    assert path[3] == "BTC-USDC"
-
-
-# ============================================================================
-# ArbitrageAgent - Complex (4-leg) Arbitrage Tests
-# ============================================================================
-
-def test_complex_arbitrage_calculation(arb_agent):
-    """Test 4-leg arbitrage calculation"""
-    arb_agent.price_cache = {
-        "SOL-USDC": 100.0,
-        "BTC-SOL": 500.0,
-        "ETH-BTC": 0.06,
-        "ETH-SOL": 30.0
-    }
-
-    result = arb_agent._calculate_complex_arbitrage(
-        start="SOL-USDC",
-        leg1="BTC-SOL",
-        leg2="ETH-BTC",
-        leg3="ETH-SOL",
-        end="SOL-USDC"
-    )
-
-    # May or may not be profitable, but should return valid result
-    assert result is not None
-    path, profit_pct, end_amount = result
-    assert len(path) == 5  # 4 legs + end
-    assert isinstance(profit_pct, float)
-    assert isinstance(end_amount, float)
-
-
-def test_complex_arbitrage_missing_prices(arb_agent):
-    """Test 4-leg arbitrage returns None when prices missing"""
-    arb_agent.price_cache = {
-        "SOL-USDC": 100.0,
-        "BTC-SOL": 500.0
-        # Missing ETH-BTC and ETH-SOL
-    }
-
-    result = arb_agent._calculate_complex_arbitrage(
-        start="SOL-USDC",
-        leg1="BTC-SOL",
-        leg2="ETH-BTC",
-        leg3="ETH-SOL",
-        end="SOL-USDC"
-    )
-
-    assert result is None
-
-
 # ============================================================================
 # ArbitrageAgent - Best Opportunity Selection Tests
 # ============================================================================
@@ -560,18 +418,18 @@ async def test_fees_make_marginal_opportunity_unprofitable(arb_agent):
 @pytest.mark.asyncio
 async def test_threshold_accounts_for_fees(arb_agent):
     """Test min_profit_pct is net profit after fees"""
-    # Setup: 1.3% gross profit
-    # After 0.9% fees = 0.4% net (exactly at threshold)
+    # Setup: 1.32% gross profit
+    # After 0.3% on each of 3 legs = 0.41% net (just above threshold)
     arb_agent.price_cache = {
         "BTC-USDC": 50000.0,
         "BTC-SOL": 500.0,
-        "SOL-USDC": 101.3  # 1.3% markup
+        "SOL-USDC": 101.32  # 1.32% markup
     }
 
     tick = create_tick("BTC-USDC", 50000.0)
     vote = await arb_agent.analyze(tick, None, {})
 
-    # 1.3% - 0.9% = 0.4% net = exactly at threshold
+    # 1.0132 × 0.997³ − 1 = 0.41% net
     # Should trade (>= threshold)
     assert vote.action == "BUY"
 
@@ -592,17 +450,10 @@ def test_custom_fee_structure(arb_agent):
         "SOL-USDC": 100.7  # 0.7% profit
     }
 
-    # 0.7% - 0.3% fees = 0.4% net (meets threshold)
-    result = agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",
-        leg2="SOL-USDC",
-        end="BTC-USDC"
-    )
-
-    assert result is not None
-    _, profit_pct, _ = result
-    assert profit_pct == pytest.approx(0.007, abs=0.001)
+    # 0.7% less 0.1% on each of 3 legs ≈ 0.4% net (meets threshold)
+    cycle = agent.best_cycle()
+    assert cycle.gross_return == pytest.approx(0.007, abs=0.001)
+    assert cycle.net_return == pytest.approx(1.007 * 0.999 ** 3 - 1)
 
 
 # ============================================================================
@@ -644,27 +495,6 @@ async def test_handles_missing_price_data(arb_agent):
     assert vote.action == "HOLD"
 
 
-def test_calculation_exception_handling(arb_agent):
-    """Test arbitrage calculation handles exceptions gracefully"""
-    # Force an error with invalid data
-    arb_agent.price_cache = {
-        "BTC-USDC": 0,  # Division by zero potential
-        "BTC-SOL": 500.0,
-        "SOL-USDC": 100.0
-    }
-
-    # Should return None instead of crashing
-    result = arb_agent._calculate_triangular_arbitrage(
-        start="BTC-USDC",
-        leg1="BTC-SOL",
-        leg2="SOL-USDC",
-        end="BTC-USDC"
-    )
-
-    # Should handle gracefully (may return None or handle the zero)
-    # The implementation has try/except that returns None on error
-
-
 # ============================================================================
 # ArbitrageAgent - High Weight Tests
 # ============================================================================
@@ -677,7 +507,7 @@ def test_arbitrage_agent_has_high_weight(arb_agent):
 
 
 # ============================================================================
-# CrossExchangeArbitrageAgent Tests (Stub Implementation)
+# CrossExchangeArbitrageAgent Tests (price ticks only)
 # ============================================================================
 
 def test_cross_exchange_initialization(cross_exchange_agent):
@@ -689,8 +519,8 @@ def test_cross_exchange_initialization(cross_exchange_agent):
 
 
 @pytest.mark.asyncio
-async def test_cross_exchange_not_implemented(cross_exchange_agent):
-    """Test CrossExchangeArbitrageAgent returns 'not yet implemented'"""
+async def test_cross_exchange_holds_without_books(cross_exchange_agent):
+    """Test CrossExchangeArbitrageAgent holds without order books"""
     tick = create_tick("BTC-USDC", 50000.0)
     vote = await cross_exchange_agent.analyze(tick, None, {})
 
@@ -698,12 +528,12 @@ async def test_cross_exchange_not_implemented(cross_exchange_agent):
     assert vote.action == "HOLD"
     assert vote.confidence == 0.5
     assert vote.size == 0.0
-    assert "not yet implemented" in vote.reason.lower()
+    assert "no executable cross-exchange spread" in vote.reason.lower()
 
 
 @pytest.mark.asyncio
 async def test_cross_exchange_never_trades(cross_exchange_agent):
-    """Test CrossExchangeArbitrageAgent never initiates trades (stub)"""
+    """Test CrossExchangeArbitrageAgent never trades on price ticks alone"""
     # Even with various conditions, should always HOLD
     for price in [10000, 50000, 100000]:
         tick = create_tick("BTC-USDC", price)
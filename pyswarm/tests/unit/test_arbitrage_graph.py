@@ -0,0 +1,169 @@
+"""
+Unit tests for CurrencyGraph and graph-based ArbitrageAgent search
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.arbitrage_agent import ArbitrageAgent
+from coinswarm.agents.arbitrage_graph import CurrencyGraph, split_pair
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(symbol: str, price: float, **extra) -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": price, **extra}
+    )
+
+
+class TestCurrencyGraph:
+    """Test suite for CurrencyGraph"""
+
+    def test_split_pair(self):
+        assert split_pair("BTC-USDC") == ("BTC", "USDC")
+        assert split_pair("ETH/BTC") == ("ETH", "BTC")
+        with pytest.raises(ValueError):
+            split_pair("BTCUSDC")
+
+    def test_finds_profitable_triangle(self):
+        graph = CurrencyGraph()
+        graph.update("BTC-USDC", 50000.0)
+        graph.update("BTC-SOL", 500.0)
+        graph.update("SOL-USDC", 101.5)
+
+        best = graph.best_cycle()
+        assert best is not None
+        assert best.assets == ("BTC", "SOL", "USDC", "BTC")
+        assert best.legs == 3
+        assert best.gross_return == pytest.approx(0.015)
+        assert len(graph.cycles) == 1  # Reverse direction loses money
+
+    def test_fees_are_part_of_edge_weights(self):
+        graph = CurrencyGraph(fee_pct=0.003)
+        graph.update("BTC-USDC", 50000.0)
+        graph.update("BTC-SOL", 500.0)
+        graph.update("SOL-USDC", 100.8)  # 0.8% gross < 3 × 0.3% fees
+
+        assert graph.cycles == {}
+
+        graph.update("SOL-USDC", 101.5)
+        best = graph.best_cycle()
+        assert best.net_return == pytest.approx(1.015 * 0.997 ** 3 - 1)
+
+    def test_uses_bid_and_ask_for_each_direction(self):
+        graph = CurrencyGraph()
+        graph.update("BTC-USDC", 50000.0, 50100.0)
+
+        assert graph.rate("BTC", "USDC") == 50000.0
+        assert graph.rate("USDC", "BTC") == pytest.approx(1 / 50100.0)
+
+    def test_finds_four_leg_cycles_up_to_max_length(self):
+        prices = {
+            "BTC-USDC": 50000.0,
+            "ETH-BTC": 0.06,
+            "ETH-SOL": 30.0,
+            "SOL-USDC": 100.0 * 1.02,  # Only USDC → BTC → ETH → SOL → USDC profits
+        }
+
+        short = CurrencyGraph(max_length=3)
+        full = CurrencyGraph(max_length=4)
+        for symbol, price in prices.items():
+            short.update(symbol, price)
+            full.update(symbol, price)
+
+        assert short.cycles == {}
+        best = full.best_cycle()
+        assert best.legs == 4
+        assert set(best.pairs) == set(prices)
+
+    def test_only_cycles_through_updated_pair_are_reevaluated(self):
+        graph = CurrencyGraph(max_length=3)
+        assets = ["USD", "BTC", "ETH", "SOL", "ADA", "DOT"]
+        for i, base in enumerate(assets[1:], start=1):
+            graph.update(f"{base}-USD", 10.0 * i)
+            for quote in assets[1:i]:
+                graph.update(f"{base}-{quote}", 10.0 * i / (10.0 * assets.index(quote)))
+
+        before = graph.stats["paths_evaluated"]
+        graph.update("SOL-ETH", 1.6)  # Mispriced vs 30 / 20
+        evaluated = graph.stats["paths_evaluated"] - before
+
+        # Triangles through SOL-ETH (both directions): one per other asset
+        assert evaluated == 2 * (len(assets) - 1)
+        assert all("SOL-ETH" in c.pairs for c in graph.cycles.values())
+        assert len(graph.cycles) == len(assets) - 2
+
+        # Restoring the price removes every cycle it created
+        graph.update("SOL-ETH", 30.0 / 20.0)
+        assert graph.cycles == {}
+
+    def test_remove_pair_drops_its_cycles(self):
+        graph = CurrencyGraph()
+        graph.update("BTC-USDC", 50000.0)
+        graph.update("BTC-SOL", 500.0)
+        graph.update("SOL-USDC", 101.5)
+
+        graph.remove("BTC-SOL")
+
+        assert graph.cycles == {}
+        assert graph.rate("BTC", "SOL") is None
+
+    def test_non_positive_price_removes_pair(self):
+        graph = CurrencyGraph()
+        graph.update("BTC-USDC", 50000.0)
+        graph.update("BTC-USDC", 0.0)
+
+        assert graph.rate("BTC", "USDC") is None
+
+
+class TestArbitrageAgentGraph:
+    """ArbitrageAgent searches every cached pair, not a fixed path list"""
+
+    @pytest.mark.asyncio
+    async def test_finds_cycle_outside_hardcoded_paths(self):
+        agent = ArbitrageAgent(fee_pct=0.001)
+
+        await agent.analyze(make_tick("ADA-USDT", 0.5), None, {})
+        await agent.analyze(make_tick("DOT-USDT", 7.0), None, {})
+        vote = await agent.analyze(make_tick("DOT-ADA", 14.2), None, {})
+
+        assert vote.action == "BUY"
+        assert "ADA" in vote.reason and "DOT" in vote.reason
+
+    @pytest.mark.asyncio
+    async def test_bid_ask_spread_removes_opportunity(self):
+        agent = ArbitrageAgent(fee_pct=0.001)
+        await agent.analyze(make_tick("ADA-USDT", 0.5), None, {})
+        await agent.analyze(make_tick("DOT-USDT", 7.0), None, {})
+
+        vote = await agent.analyze(
+            make_tick("DOT-ADA", 14.2, bid=13.9, ask=14.5), None, {}
+        )
+
+        assert vote.action == "HOLD"
+
+    def test_assigning_price_cache_rebuilds_graph(self):
+        agent = ArbitrageAgent()
+        agent.price_cache = {"BTC-USDC": 50000.0, "BTC-SOL": 500.0, "SOL-USDC": 101.5}
+        assert len(agent.graph.cycles) == 1
+
+        agent.price_cache = {}
+        assert agent.graph.cycles == {}
+
+    def test_cycle_through_inverse_pairs(self):
+        agent = ArbitrageAgent(fee_pct=0.0)
+        agent.price_cache = {
+            "SOL-USDC": 100.0,
+            "BTC-SOL": 500.0,  # 1 BTC = 500 SOL
+            "ETH-BTC": 0.06,  # 1 ETH = 0.06 BTC
+            "ETH-SOL": 30.3,  # 1% above 0.06 × 500
+        }
+
+        # SOL → BTC → ETH → SOL, converting against two pairs' quote order
+        cycle = agent.best_cycle()
+        assert set(cycle.pairs) == {"BTC-SOL", "ETH-BTC", "ETH-SOL"}
+        assert cycle.gross_return == pytest.approx(0.01)
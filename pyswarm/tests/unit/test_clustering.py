@@ -0,0 +1,116 @@
+"""
+Unit tests for vectorized k-means and SimpleMemory pattern refits
+"""
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.clustering import (
+    StreamingKMeans, kmeans_plus_plus, minibatch_kmeans, nearest_centroid
+)
+from coinswarm.memory.simple_memory import SimpleMemory
+
+
+CENTERS = np.array([[10.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 10.0]])
+
+
+def blobs(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, len(CENTERS), n)
+    return CENTERS[labels] + rng.normal(size=(n, 3)), labels
+
+
+class TestKMeans:
+    """Test suite for the clustering functions"""
+
+    def test_nearest_centroid_matches_brute_force(self):
+        x, _ = blobs(500)
+        centroids = np.random.default_rng(1).normal(size=(4, 3)) * 5
+
+        expected = np.argmin(np.linalg.norm(x[:, None, :] - centroids[None], axis=2), axis=1)
+        assert (nearest_centroid(x, centroids, chunk=64) == expected).all()
+
+    def test_kmeans_plus_plus_spreads_seeds(self):
+        x, labels = blobs(300)
+
+        seeds = kmeans_plus_plus(x, 3, np.random.default_rng(0))
+
+        assert sorted(nearest_centroid(seeds, CENTERS).tolist()) == [0, 1, 2]
+
+    def test_minibatch_recovers_clusters(self):
+        x, _ = blobs(5000)
+
+        centroids = minibatch_kmeans(x, 3, np.random.default_rng(0), batch_size=256, steps=30)
+
+        order = nearest_centroid(CENTERS, centroids)
+        np.testing.assert_allclose(centroids[order], CENTERS, atol=0.3)
+
+    def test_streaming_update(self):
+        stream = StreamingKMeans(CENTERS.copy(), counts=np.array([1.0, 1.0, 1.0]), max_count=4)
+
+        assert stream.partial_fit(np.array([12.0, 0.0, 0.0])) == 0
+        np.testing.assert_allclose(stream.centroids[0], [11.0, 0.0, 0.0])
+
+        for _ in range(10):
+            stream.partial_fit(np.array([20.0, 0.0, 0.0]))
+        assert stream.counts[0] == 4  # Learning rate floored at 1/4
+        assert stream.centroids[0, 0] > 19.0
+
+
+class TestSimpleMemoryPatterns:
+    """Pattern refits run off the store path"""
+
+    async def store(self, memory: SimpleMemory, states):
+        for i, state in enumerate(states):
+            await memory.store_episode(
+                action=("BUY", "SELL")[i % 2], symbol="BTC-USD", price=1.0, size=1.0,
+                state=state, reward=0.01
+            )
+
+    @pytest.mark.asyncio
+    async def test_refit_is_scheduled_not_awaited(self):
+        x, _ = blobs(200)
+        memory = SimpleMemory(pattern_update_frequency=100, min_pattern_samples=10)
+
+        await self.store(memory, x)
+
+        assert memory._pattern_task is not None
+        await memory._pattern_task
+        assert memory.pattern_updates >= 1
+        assert len(memory.patterns) == 5
+        assert sum(p.n_samples for p in memory.patterns.values()) == 200
+
+    @pytest.mark.asyncio
+    async def test_centroids_stream_between_refits(self):
+        x, _ = blobs(100)
+        memory = SimpleMemory(pattern_update_frequency=10**6, min_pattern_samples=10)
+        await self.store(memory, x)
+        await memory._update_patterns()
+
+        before = {pid: p.centroid.copy() for pid, p in memory.patterns.items()}
+        await self.store(memory, [np.array([0.0, 0.0, 1.0])] * 20)
+
+        moved = [pid for pid, p in memory.patterns.items() if not np.allclose(p.centroid, before[pid])]
+        assert moved
+        assert memory.get_pattern_for_state(np.array([0.0, 0.0, 1.0])) is not None
+
+    @pytest.mark.asyncio
+    async def test_patterns_keep_member_slots_not_episodes(self):
+        x, _ = blobs(200)
+        memory = SimpleMemory(max_episodes=200, pattern_update_frequency=10**6, min_pattern_samples=10)
+        await self.store(memory, x)
+        await memory._update_patterns()
+
+        pattern = max(memory.patterns.values(), key=lambda p: p.n_samples)
+        assert "episodes" not in vars(pattern)
+        assert len(pattern.rows) == len(pattern.sequences) == pattern.n_samples
+        assert pattern.action_counts["BUY"] + pattern.action_counts["SELL"] == pattern.n_samples
+        assert pattern.win_rate == 1.0
+        assert pattern.get_best_action()[1] == pytest.approx(0.01)
+
+        # Views are built on demand, and only for members still stored
+        members = pattern.episodes
+        assert [memory.episodes.slot_of(ep.episode_id) for ep in members] == pattern.rows.tolist()
+
+        await self.store(memory, x[:50])
+        assert len(pattern.episodes) < len(members)
@@ -0,0 +1,332 @@
+"""
+Unit tests for AgentCommittee vote scheduling
+
+Tests concurrent agent evaluation, the per-vote deadline budget, and
+veto-first / capacity pruning of agent evaluations.
+"""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.arbitrage_agent import ArbitrageAgent
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote
+from coinswarm.agents.committee import AgentCommittee
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(price: float = 50000.0, symbol: str = "BTC-USD") -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": price, "volume": 1.0}
+    )
+
+
+class SleepyAgent(BaseAgent):
+    """Agent that takes `delay` seconds to vote"""
+
+    def __init__(self, name: str, action: str, confidence: float, delay: float = 0.0):
+        super().__init__(name, weight=1.0)
+        self.action = action
+        self.confidence = confidence
+        self.delay = delay
+        self.calls = 0
+
+    async def analyze(self, tick, position, market_context):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return AgentVote(self.name, self.action, self.confidence, 0.01, f"{self.name} vote")
+
+
+class VetoAgent(SleepyAgent):
+    """Cheap veto-capable agent"""
+
+    cost_class = AgentCost.CHEAP
+    can_veto = True
+
+    def __init__(self, name: str, veto: bool):
+        super().__init__(name, "HOLD", 1.0 if veto else 0.5)
+        self.veto = veto
+
+    async def analyze(self, tick, position, market_context):
+        self.calls += 1
+        return AgentVote(self.name, "HOLD", self.confidence, 0.0, "risk check", veto=self.veto)
+
+
+class TestConcurrentVoting:
+    """Agents run concurrently and slow ones are bounded by the budget"""
+
+    @pytest.mark.asyncio
+    async def test_agents_run_concurrently(self):
+        agents = [SleepyAgent(f"A{i}", "BUY", 0.8, delay=0.05) for i in range(4)]
+        committee = AgentCommittee(agents)
+
+        start = time.perf_counter()
+        decision = await committee.vote(make_tick())
+        elapsed = time.perf_counter() - start
+
+        assert len(decision.votes) == 4
+        assert elapsed < 0.15  # Sequential would be >= 0.2s
+
+    @pytest.mark.asyncio
+    async def test_votes_keep_agent_order(self):
+        agents = [
+            SleepyAgent("Slow", "BUY", 0.8, delay=0.02),
+            SleepyAgent("Fast", "BUY", 0.9),
+        ]
+        committee = AgentCommittee(agents)
+
+        decision = await committee.vote(make_tick())
+
+        assert [v.agent_name for v in decision.votes] == ["Slow", "Fast"]
+
+    @pytest.mark.asyncio
+    async def test_late_agent_abstains(self):
+        slow = SleepyAgent("Slow", "SELL", 0.9, delay=0.2)
+        fast = SleepyAgent("Fast", "BUY", 0.8)
+        committee = AgentCommittee([slow, fast], vote_timeout=0.02)
+
+        start = time.perf_counter()
+        decision = await committee.vote(make_tick())
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.15
+        assert [v.agent_name for v in decision.votes] == ["Fast"]
+        assert decision.action == "BUY"
+        assert committee.stats["agent_timeouts"] == 1
+        assert committee.stats["abstentions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_late_agent_uses_cached_vote(self):
+        slow = SleepyAgent("Slow", "SELL", 0.9)
+        committee = AgentCommittee([slow], vote_timeout=0.02, late_vote_policy="cached")
+
+        # First vote completes and is cached
+        await committee.vote(make_tick())
+
+        slow.delay = 0.2
+        decision = await committee.vote(make_tick())
+
+        assert [v.action for v in decision.votes] == ["SELL"]
+        assert committee.stats["cached_votes_used"] == 1
+
+    @pytest.mark.asyncio
+    async def test_late_agent_is_not_restarted_while_running(self):
+        slow = SleepyAgent("Slow", "HOLD", 0.5, delay=0.1)
+        committee = AgentCommittee([slow], vote_timeout=0.01)
+
+        await committee.vote(make_tick())
+        await committee.vote(make_tick())
+        assert slow.calls == 1
+
+        # Once the background analysis finishes, the agent runs again
+        await asyncio.sleep(0.15)
+        slow.delay = 0.0
+        decision = await committee.vote(make_tick())
+        assert slow.calls == 2
+        assert len(decision.votes) == 1
+
+    @pytest.mark.asyncio
+    async def test_late_result_becomes_cached_vote(self):
+        slow = SleepyAgent("Slow", "SELL", 0.9, delay=0.05)
+        committee = AgentCommittee([slow], vote_timeout=0.01, late_vote_policy="cached")
+
+        decision = await committee.vote(make_tick())
+        assert decision.votes == []
+
+        await asyncio.sleep(0.1)
+        slow.delay = 0.5
+        decision = await committee.vote(make_tick())
+        assert [v.action for v in decision.votes] == ["SELL"]
+
+    @pytest.mark.asyncio
+    async def test_late_agent_keeps_its_feature_window(self):
+        class WindowAgent(SleepyAgent):
+            async def analyze(self, tick, position, market_context):
+                await asyncio.sleep(self.delay)
+                self.seen = list(market_context["features"].prices)
+                return await super().analyze(tick, position, market_context)
+
+        slow = WindowAgent("Slow", "HOLD", 0.5, delay=0.05)
+        committee = AgentCommittee([slow], vote_timeout=0.01, feature_history=3)
+
+        for price in (1.0, 2.0, 3.0):
+            await committee.vote(make_tick(price))
+        await asyncio.sleep(0.1)
+
+        # Ticks arriving while the agent sleeps overwrite the ring buffer
+        slow.delay = 0.05
+        await committee.vote(make_tick(4.0))
+        for price in (5.0, 6.0, 7.0):
+            committee.feature_bus.update(make_tick(price))
+        await asyncio.sleep(0.1)
+
+        assert slow.seen == [2.0, 3.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_stats_report_latency_and_timeouts(self):
+        committee = AgentCommittee([SleepyAgent("A", "HOLD", 0.5)])
+        await committee.vote(make_tick())
+
+        stats = committee.get_stats()
+        assert stats["agent_timeouts"] == 0
+        assert stats["abstentions"] == 0
+        assert stats["last_vote_latency_ms"] >= 0.0
+
+    def test_invalid_late_vote_policy(self):
+        with pytest.raises(ValueError):
+            AgentCommittee([], late_vote_policy="wait")
+
+
+class TestVetoFirstPruning:
+    """Veto agents run first; vetoes and missing capacity skip signal agents"""
+
+    @pytest.mark.asyncio
+    async def test_veto_skips_signal_agents(self):
+        signal = SleepyAgent("Signal", "BUY", 0.9)
+        risk = VetoAgent("Risk", veto=True)
+        committee = AgentCommittee([signal, risk])
+
+        decision = await committee.vote(make_tick())
+
+        assert decision.vetoed
+        assert signal.calls == 0
+        assert committee.stats["veto_short_circuits"] == 1
+        assert committee.stats["evaluations_pruned"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cheap_veto_tier_runs_before_expensive(self):
+        class ExpensiveVeto(VetoAgent):
+            cost_class = AgentCost.EXPENSIVE
+
+        cheap = VetoAgent("Cheap", veto=True)
+        expensive = ExpensiveVeto("Expensive", veto=False)
+        committee = AgentCommittee([expensive, cheap])
+
+        await committee.vote(make_tick())
+
+        assert cheap.calls == 1
+        assert expensive.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_no_veto_runs_everyone(self):
+        signal = SleepyAgent("Signal", "BUY", 0.9)
+        risk = VetoAgent("Risk", veto=False)
+        committee = AgentCommittee([signal, risk])
+
+        decision = await committee.vote(make_tick())
+
+        assert decision.action == "BUY"
+        assert signal.calls == 1
+        assert committee.stats["evaluations_pruned"] == 0
+
+    @pytest.mark.asyncio
+    async def test_veto_first_disabled(self):
+        signal = SleepyAgent("Signal", "BUY", 0.9)
+        risk = VetoAgent("Risk", veto=True)
+        committee = AgentCommittee([signal, risk], veto_first=False)
+
+        decision = await committee.vote(make_tick())
+
+        assert decision.vetoed
+        assert signal.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_skip_signal_agents_without_capacity(self):
+        signal = SleepyAgent("Signal", "BUY", 0.9)
+        risk = VetoAgent("Risk", veto=False)
+        committee = AgentCommittee([signal, risk])
+        context = {"open_positions": 5, "max_positions": 5}
+
+        decision = await committee.vote(make_tick(), None, context)
+
+        assert decision.action == "HOLD"
+        assert signal.calls == 0
+        assert risk.calls == 1
+        assert committee.stats["capacity_skips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_position_is_still_evaluated_at_capacity(self):
+        signal = SleepyAgent("Signal", "SELL", 0.9)
+        committee = AgentCommittee([signal])
+        context = {"open_positions": 5, "max_positions": 5}
+
+        decision = await committee.vote(make_tick(), {"size": 1.0}, context)
+
+        assert decision.action == "SELL"
+        assert signal.calls == 1
+
+
+def book_tick(symbol: str, update: str, first: int, last: int, bids=(), asks=()) -> DataPoint:
+    return DataPoint(
+        source="binance",
+        symbol=symbol,
+        timeframe="snapshot",
+        timestamp=datetime(2024, 1, 1),
+        data={
+            "update": update, "first_update_id": first, "last_update_id": last,
+            "bids": [list(level) for level in bids], "asks": [list(level) for level in asks],
+        }
+    )
+
+
+class TestPrunedTicksAreObserved:
+    """Agents with per-tick state keep it current on ticks whose vote is pruned"""
+
+    @pytest.mark.asyncio
+    async def test_vetoed_tick_reaches_arbitrage_prices(self):
+        arbitrage = ArbitrageAgent()
+        risk = VetoAgent("Risk", veto=False)
+        committee = AgentCommittee([arbitrage, risk])
+
+        await committee.vote(make_tick(50000.0, "BTC-USDC"))
+        risk.veto = True
+        decision = await committee.vote(make_tick(40000.0, "BTC-USDC"))
+
+        assert decision.vetoed
+        assert committee.stats["evaluations_pruned"] == 1
+        assert arbitrage.price_cache["BTC-USDC"] == 40000.0
+        assert arbitrage.graph.rate("BTC", "USDC") == 40000.0
+
+    @pytest.mark.asyncio
+    async def test_book_stays_in_sequence_at_capacity(self):
+        arbitrage = ArbitrageAgent()
+        committee = AgentCommittee([arbitrage])
+        full = {"open_positions": 5, "max_positions": 5}
+
+        await committee.vote(book_tick("ETH-USDC", "snapshot", 0, 10, [(3000, 1)], [(3001, 1)]))
+        await committee.vote(book_tick(
+            "ETH-USDC", "diff", 11, 12, [(3000, 0), (3002, 1)], [(3001, 0), (3003, 1)]
+        ), None, full)
+        await committee.vote(book_tick("ETH-USDC", "diff", 13, 13))
+
+        book = arbitrage.books.get("ETH-USDC")
+        assert committee.stats["capacity_skips"] == 1
+        assert not book.needs_snapshot
+        assert book.best_bid == 3002
+        assert arbitrage.price_cache["ETH-USDC"] == pytest.approx(3002.5)
+
+    @pytest.mark.asyncio
+    async def test_batch_prunes_feed_observe(self):
+        arbitrage = ArbitrageAgent()
+        risk = VetoAgent("Risk", veto=True)
+        committee = AgentCommittee([arbitrage, risk])
+
+        await committee.vote_batch([make_tick(40000.0, "BTC-USDC"), make_tick(3000.0, "ETH-USDC")])
+
+        assert arbitrage.price_cache == {"BTC-USDC": 40000.0, "ETH-USDC": 3000.0}
+
+    @pytest.mark.asyncio
+    async def test_pure_agents_are_not_observed(self):
+        signal = SleepyAgent("Signal", "BUY", 0.9)
+        committee = AgentCommittee([signal, VetoAgent("Risk", veto=True)])
+
+        await committee.vote(make_tick())
+
+        assert signal not in committee._observers
+        assert signal.calls == 0
@@ -0,0 +1,129 @@
+"""
+Unit tests for snapshot resync of depth-diff streams
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.arbitrage_agent import ArbitrageAgent
+from coinswarm.data_ingest.base import DataPoint
+from coinswarm.data_ingest.depth_sync import DepthSync
+
+
+def diff_tick(symbol: str, first: int, last: int, bids=(), asks=()) -> DataPoint:
+    return DataPoint(
+        source="binance",
+        symbol=symbol,
+        timeframe="snapshot",
+        timestamp=datetime(2024, 1, 1),
+        data={
+            "update": "diff", "first_update_id": first, "last_update_id": last,
+            "bids": [list(level) for level in bids], "asks": [list(level) for level in asks],
+        }
+    )
+
+
+class StubExchange:
+    """REST snapshots of fixed books at a given update id"""
+
+    def __init__(self, books, update_id: int = 10):
+        self.books = books  # symbol -> (bids, asks)
+        self.update_id = update_id
+        self.fail = False
+        self.fetches = []
+
+    async def get_orderbook(self, symbol: str):
+        self.fetches.append(symbol)
+        if self.fail:
+            raise ConnectionError("REST unavailable")
+        bids, asks = self.books[symbol]
+        return {
+            "symbol": symbol, "timestamp": datetime(2024, 1, 1), "update": "snapshot",
+            "last_update_id": self.update_id, "bids": bids, "asks": asks,
+        }
+
+
+async def collect(sync: DepthSync, ticks):
+    async def source():
+        for tick in ticks:
+            yield tick
+    return [tick async for tick in sync.stream(source())]
+
+
+class TestDepthSync:
+    """Snapshots are inserted exactly where a book would wait for one"""
+
+    @pytest.mark.asyncio
+    async def test_first_diff_is_preceded_by_a_snapshot(self):
+        exchange = StubExchange({"BTC-USDT": ([[100, 1]], [[101, 1]])})
+        sync = DepthSync(exchange.get_orderbook, "binance")
+
+        ticks = await collect(sync, [
+            diff_tick("BTC-USDT", 9, 10),  # Stale: the snapshot is at 10
+            diff_tick("BTC-USDT", 11, 12),
+            diff_tick("BTC-USDT", 13, 15),
+        ])
+
+        assert [t.data["update"] for t in ticks] == ["snapshot", "diff", "diff", "diff"]
+        assert ticks[0].data["last_update_id"] == 10
+        assert exchange.fetches == ["BTC-USDT"]
+
+    @pytest.mark.asyncio
+    async def test_gap_fetches_a_new_snapshot(self):
+        exchange = StubExchange({"BTC-USDT": ([[100, 1]], [[101, 1]])})
+        sync = DepthSync(exchange.get_orderbook, "binance", retry_interval=0.0)
+
+        await collect(sync, [diff_tick("BTC-USDT", 11, 12)])
+        exchange.update_id = 20
+        ticks = await collect(sync, [diff_tick("BTC-USDT", 14, 21)])  # 13 was missed
+
+        assert [t.data["update"] for t in ticks] == ["snapshot", "diff"]
+        assert len(exchange.fetches) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_retried_after_the_interval(self):
+        exchange = StubExchange({"BTC-USDT": ([[100, 1]], [[101, 1]])})
+        exchange.fail = True
+        sync = DepthSync(exchange.get_orderbook, "binance", retry_interval=60.0)
+
+        ticks = await collect(sync, [diff_tick("BTC-USDT", 11, 12), diff_tick("BTC-USDT", 13, 14)])
+
+        assert [t.data["update"] for t in ticks] == ["diff", "diff"]
+        assert len(exchange.fetches) == 1
+        assert sync.stats["errors"] == 1
+
+
+class TestDepthStreamIntoArbitrage:
+    """A live diff stream resyncs the agent's books instead of holding forever"""
+
+    @pytest.mark.asyncio
+    async def test_agent_trades_from_a_diff_only_stream(self):
+        # USDC → BTC → SOL → USDC returns ~1.5% at the top of each book
+        exchange = StubExchange({
+            "BTC-USDC": ([[49900, 5]], [[50000, 5]]),
+            "BTC-SOL": ([[500, 5]], [[505, 5]]),
+            "SOL-USDC": ([[100, 100]], [[100.4, 100]]),
+        })
+        sync = DepthSync(exchange.get_orderbook, "binance", retry_interval=0.0)
+        agent = ArbitrageAgent(min_profit_pct=0.004, fee_pct=0.001)
+
+        votes = []
+        for tick in await collect(sync, [
+            diff_tick("BTC-USDC", 11, 11),
+            diff_tick("BTC-SOL", 11, 11),
+            diff_tick("SOL-USDC", 11, 11),
+        ]):
+            votes.append(await agent.analyze(tick, None, {}))
+
+        assert not any("waiting for a snapshot" in vote.reason for vote in votes)
+        assert votes[-1].action == "HOLD"
+
+        # SOL-USDC update 12 is lost; the next snapshot already has the move
+        exchange.update_id = 20
+        exchange.books["SOL-USDC"] = ([[101.5, 100]], [[102, 100]])
+        for tick in await collect(sync, [diff_tick("SOL-USDC", 13, 14)]):
+            votes.append(await agent.analyze(tick, None, {}))
+
+        assert exchange.fetches == ["BTC-USDC", "BTC-SOL", "SOL-USDC", "SOL-USDC"]
+        assert agent.books.resync_keys() == []
+        assert votes[-1].action == "BUY"
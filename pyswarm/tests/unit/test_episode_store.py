@@ -0,0 +1,288 @@
+"""
+Unit tests for slot-based episode storage and eviction policies
+"""
+
+import asyncio
+from dataclasses import fields
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.blob_store import BlobStore
+from coinswarm.memory.episode_store import (
+    EpisodeStore, EvictionPolicy, FIFOEviction, RetentionEviction, RewardWeightedEviction
+)
+from coinswarm.memory.simple_memory import Episode, SimpleMemory
+
+
+START = datetime(2024, 1, 1)
+
+
+def episode(i: int, reward: float = 0.0, timestamp: datetime = None) -> Episode:
+    return Episode(
+        action="BUY", symbol="BTC-USD", price=100.0, size=1.0,
+        timestamp=timestamp or START + timedelta(minutes=i),
+        reward=reward, episode_id=f"ep{i}"
+    )
+
+
+def store_all(store: EpisodeStore, episodes):
+    for ep in episodes:
+        for slot in store.eviction.expired(store, ep.timestamp.timestamp()):
+            store.remove(slot)
+        if store.full:
+            store.remove(store.eviction.victim(store))
+        store.add(ep)
+
+
+class TestEpisodeStore:
+    """Test suite for EpisodeStore"""
+
+    def test_mapping_interface(self):
+        store = EpisodeStore(capacity=4)
+        store_all(store, [episode(i) for i in range(3)])
+
+        assert len(store) == 3
+        assert "ep1" in store
+        assert store["ep2"].episode_id == "ep2"
+        assert list(store) == ["ep0", "ep1", "ep2"]
+        assert dict(store.items())["ep0"].episode_id == "ep0"
+
+    def test_fifo_reuses_slots(self):
+        store = EpisodeStore(capacity=3, eviction=FIFOEviction())
+        store_all(store, [episode(i) for i in range(10)])
+
+        assert sorted(store) == ["ep7", "ep8", "ep9"]
+        assert store.high_water == 3
+        assert store.slot_of("ep9") == 0  # 9 % 3
+
+    def test_duplicate_ids_get_suffix(self):
+        store = EpisodeStore(capacity=3)
+        store.add(episode(1))
+        store.add(episode(1))
+
+        assert len(store) == 2
+        assert sorted(store) == ["ep1", "ep1_1"]
+
+    def test_retention_expires_old_episodes(self):
+        store = EpisodeStore(capacity=100, eviction=RetentionEviction(timedelta(minutes=5)))
+        store_all(store, [episode(i) for i in range(20)])
+
+        assert sorted(store, key=lambda e: int(e[2:])) == [f"ep{i}" for i in range(14, 20)]
+
+    def test_reward_weighted_keeps_informative_episodes(self):
+        store = EpisodeStore(capacity=10, eviction=RewardWeightedEviction(samples=64, seed=0))
+        rewards = [0.05, -0.04, 0.001, 0.03, -0.06, 0.0005, 0.02, -0.01, 0.07, 0.002]
+        store_all(store, [episode(i, r) for i, r in enumerate(rewards)])
+        store_all(store, [episode(10, 0.01), episode(11, -0.02)])
+
+        assert "ep5" not in store  # |0.0005|
+        assert "ep2" not in store  # |0.001|
+        assert len(store) == 10
+
+
+    def test_eviction_policy_needs_victim(self):
+        class NoVictim(EvictionPolicy):
+            pass
+
+        with pytest.raises(TypeError):
+            NoVictim()
+
+    def test_id_lookup_survives_churn(self):
+        # Small table: long probe runs, removals from their middle
+        store = EpisodeStore(capacity=8, eviction=RewardWeightedEviction(samples=4, seed=0))
+        rng = np.random.default_rng(0)
+        store_all(store, [episode(i, float(rng.normal())) for i in range(500)])
+
+        assert len(store) == 8
+        for slot in range(8):
+            assert store.slot_of(store.id_of(slot)) == slot
+        assert all(store[episode_id].episode_id == episode_id for episode_id in store)
+        assert "ep0" not in store
+
+    def test_fifo_ring_is_bounded(self):
+        store = EpisodeStore(capacity=4, eviction=FIFOEviction())
+        store_all(store, [episode(i) for i in range(4)])
+        # Removed outside the policy: its ring entry goes stale
+        store.remove(store.slot_of("ep1"))
+        store_all(store, [episode(i) for i in range(4, 50)])
+
+        assert sorted(store, key=lambda e: int(e[2:])) == ["ep46", "ep47", "ep48", "ep49"]
+        assert len(store.eviction._slots) == 4
+
+    def test_ids_memmap(self, tmp_path):
+        store = EpisodeStore(capacity=3, ids_path=str(tmp_path / "ids.npy"))
+        store_all(store, [episode(i) for i in range(5)])
+
+        assert isinstance(store.ids, np.memmap)
+        assert sorted(store) == ["ep2", "ep3", "ep4"]
+
+    def test_id_too_long(self):
+        store = EpisodeStore(capacity=2, id_width=8)
+        with pytest.raises(ValueError):
+            store.add(Episode(
+                action="BUY", symbol="BTC-USD", price=1.0, size=1.0, timestamp=START, episode_id="x" * 9
+            ))
+        assert len(store) == 0
+
+
+class TestHotColdSplit:
+    """Hot columns in NumPy, cold context compressed in the blob store"""
+
+    def test_round_trip(self):
+        store = EpisodeStore(capacity=4)
+        original = Episode(
+            action="SELL", symbol="ETH-USD", price=2500.5, size=0.25,
+            timestamp=datetime(2024, 3, 1, 12, 30, 15, 250000),
+            state=np.arange(6, dtype=np.float64),
+            market_context={"recent_volatility": 0.3},
+            sentiment_data={"news_sentiment": 0.1},
+            agent_votes={"TrendFollower": {"action": "SELL", "confidence": 0.8}},
+            reason="breakdown", confidence=0.75, reward=-0.02,
+            exit_reason="stop_loss", episode_id="e1"
+        )
+        store.add(original)
+
+        restored = store["e1"]
+        for f in fields(Episode):
+            if f.name == "state":
+                assert np.array_equal(restored.state, original.state)
+            else:
+                assert getattr(restored, f.name) == getattr(original, f.name), f.name
+        assert store.action[0] == store.actions.index("SELL")
+        assert store.symbols == ["ETH-USD"]
+
+    def test_cold_context_loads_lazily(self):
+        store = EpisodeStore(capacity=4)
+        store.add(Episode(
+            action="BUY", symbol="BTC-USD", price=1.0, size=1.0,
+            timestamp=START, state=np.ones(3), reason="lazy", episode_id="e1"
+        ))
+
+        ep = store["e1"]
+        assert ep.reward == 0.0
+        assert ep._cold is None  # Hot fields don't touch the blob store
+        assert ep.reason == "lazy"
+        assert store.context("e1")["reason"] == "lazy"
+
+    def test_evicted_cold_context_raises(self):
+        store = EpisodeStore(capacity=1)
+        store_all(store, [episode(0)])
+        stale = store["ep0"]
+        store_all(store, [episode(1)])
+
+        assert stale.reward == 0.0  # Hot fields were copied
+        with pytest.raises(KeyError):
+            stale.state
+
+    def test_compaction_keeps_live_records(self):
+        store = EpisodeStore(capacity=50)
+        big = np.random.default_rng(0).normal(size=(1000, 64))  # Incompressible
+        for i in range(400):
+            ep = episode(i)
+            ep.state = big[i % len(big)]
+            store_all(store, [ep])
+
+        assert store.blobs.dead < store.blobs.size  # Compacted at least once
+        for ep in store.values():
+            assert np.array_equal(ep.state, big[int(ep.episode_id[2:]) % len(big)])
+
+    @pytest.mark.asyncio
+    async def test_compaction_runs_in_background_inside_a_loop(self):
+        store = EpisodeStore(capacity=50)
+        big = np.random.default_rng(0).normal(size=(100, 2048))  # 16 KB records
+        scheduled = False
+        for i in range(400):
+            ep = episode(i)
+            ep.state = big[i % len(big)]
+            store_all(store, [ep])
+            scheduled = scheduled or store.compaction is not None
+            if i % 50 == 0:
+                await asyncio.sleep(0)  # Let a running compaction finish
+
+        assert scheduled
+        if store.compaction is not None:
+            await store.compaction
+        assert store.blobs.dead < store.blobs.size
+        for ep in store.values():
+            assert np.array_equal(ep.state, big[int(ep.episode_id[2:]) % len(big)])
+
+    @pytest.mark.parametrize("on_disk", [False, True])
+    def test_records_appended_during_compaction_survive(self, tmp_path, on_disk):
+        blobs = BlobStore(str(tmp_path / "cold.bin") if on_disk else None)
+        live = {}
+        for i in range(10):
+            live[i] = blobs.append({"i": i})
+            blobs.discard(blobs.append({"dead": i})[1])
+        offsets, lengths = (np.array(column, dtype=np.int64) for column in zip(*live.values()))
+
+        compaction = blobs.begin_compaction(offsets, lengths)
+        # Meanwhile one record arrives and one is dropped
+        live[10] = blobs.append({"i": 10})
+        blobs.discard(live.pop(0)[1])
+        compaction.run()
+        assert blobs.finish_compaction(compaction)
+
+        new_offsets = compaction.remap(np.array([offset for offset, _ in live.values()]))
+        for (i, (_, length)), offset in zip(live.items(), new_offsets):
+            assert blobs.read(int(offset), length) == {"i": i}
+        assert blobs.dead == lengths[0]
+        assert blobs.size == lengths.sum() + live[10][1]
+        blobs.close()
+
+    def test_file_backed_blobs(self, tmp_path):
+        store = EpisodeStore(capacity=5, blobs=BlobStore(str(tmp_path / "cold.bin")))
+        store_all(store, [episode(i) for i in range(20)])
+
+        assert (tmp_path / "cold.bin").exists()
+        assert [ep.episode_id for ep in store.values()] == [f"ep{i}" for i in (15, 16, 17, 18, 19)]
+        assert all(ep.market_context == {} for ep in store.values())
+        store.blobs.close()
+
+
+class TestSimpleMemoryEviction:
+    """SimpleMemory keeps the state matrix in step with its slots"""
+
+    @pytest.mark.asyncio
+    async def test_evicted_states_are_not_recalled(self):
+        rng = np.random.default_rng(0)
+        memory = SimpleMemory(
+            max_episodes=20,
+            pattern_update_frequency=10**6,
+            eviction=RewardWeightedEviction(samples=64, seed=1)
+        )
+        states = rng.normal(size=(60, 8))
+        for i, state in enumerate(states):
+            await memory.store_episode(
+                action="BUY", symbol="BTC-USD", price=1.0, size=1.0,
+                state=state, reward=float(i % 7) - 3.0
+            )
+
+        assert len(memory.episodes) == 20
+        assert memory.episodes_evicted == 40
+
+        recalled = memory.recall(states[0], k=60, min_similarity=-1.0)
+        assert len(recalled) == 20
+        for ep, similarity in recalled:
+            assert memory.episodes[ep.episode_id] == ep
+            assert similarity == pytest.approx(
+                SimpleMemory._cosine_similarity(states[0], ep.state), abs=1e-5
+            )
+
+        # Small |reward| episodes go first
+        kept = [abs(ep.reward) for ep in memory.episodes.values()]
+        assert np.mean(kept) > np.mean([abs(float(i % 7) - 3.0) for i in range(60)])
+
+    @pytest.mark.asyncio
+    async def test_retention_through_store_episode(self):
+        memory = SimpleMemory(
+            pattern_update_frequency=10**6, eviction=RetentionEviction(timedelta(0))
+        )
+        for _ in range(3):
+            await memory.store_episode(
+                action="BUY", symbol="BTC-USD", price=1.0, size=1.0, state=np.ones(2)
+            )
+
+        assert len(memory.episodes) == 1
+        assert memory.episodes_evicted == 2
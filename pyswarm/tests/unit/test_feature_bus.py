@@ -0,0 +1,127 @@
+"""
+Unit tests for the shared FeatureBus
+
+Tests per-symbol history, lazy memoized features, and committee integration.
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.base_agent import BaseAgent, AgentVote
+from coinswarm.agents.committee import AgentCommittee
+from coinswarm.agents.feature_bus import FEATURES, FeatureBus, FeatureSnapshot, register_feature
+from coinswarm.agents.risk_agent import RiskManagementAgent
+from coinswarm.agents.trend_agent import TrendFollowingAgent
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(price: float, symbol: str = "BTC-USD", volume: float = 100.0) -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": price, "volume": volume}
+    )
+
+
+class FeatureReadingAgent(BaseAgent):
+    """Agent that records the features it was given"""
+
+    def __init__(self, name: str, feature: str):
+        super().__init__(name)
+        self.feature = feature
+        self.seen = []
+
+    async def analyze(self, tick, position, market_context):
+        features = market_context["features"]
+        self.seen.append((features, features.get(self.feature)))
+        return AgentVote(self.name, "HOLD", 0.5, 0.0, "reading features")
+
+
+class TestFeatureBus:
+    """Test suite for FeatureBus and FeatureSnapshot"""
+
+    def test_history_is_per_symbol(self):
+        bus = FeatureBus()
+        bus.update(make_tick(100.0, "BTC-USD"))
+        bus.update(make_tick(10.0, "ETH-USD"))
+        bus.update(make_tick(101.0, "BTC-USD"))
+
+        assert bus.history("BTC-USD") == [100.0, 101.0]
+        assert bus.history("ETH-USD") == [10.0]
+
+    def test_history_is_trimmed(self):
+        bus = FeatureBus(max_history=5)
+        for i in range(8):
+            snapshot = bus.update(make_tick(100.0 + i))
+
+        assert len(snapshot) == 5
+        assert snapshot.prices[0] == 103.0
+
+    def test_features_are_memoized(self):
+        calls = []
+
+        @register_feature("test_counted")
+        def _counted(s):
+            calls.append(1)
+            return s.price * 2
+
+        try:
+            snapshot = FeatureBus().update(make_tick(50.0))
+            assert snapshot.get("test_counted") == 100.0
+            assert snapshot["test_counted"] == 100.0
+            assert len(calls) == 1
+        finally:
+            del FEATURES["test_counted"]
+
+    def test_unknown_feature_raises(self):
+        snapshot = FeatureSnapshot("BTC-USD", [1.0])
+        with pytest.raises(KeyError):
+            snapshot.get("no_such_feature")
+
+    def test_features_match_agent_indicators(self):
+        prices = [100.0 + (i % 7) * 1.5 + i * 0.3 for i in range(60)]
+        snapshot = FeatureSnapshot("BTC-USD", prices)
+
+        trend = TrendFollowingAgent()
+        trend.price_history = list(prices)
+        risk = RiskManagementAgent()
+        risk.price_history = list(prices)
+
+        assert snapshot.get("momentum_10") == trend._calculate_momentum()
+        assert snapshot.get("ma_crossover") == trend._calculate_ma_crossover()
+        assert snapshot.get("rsi_14") == trend._calculate_rsi()
+        assert snapshot.get("return_volatility") == risk._calculate_volatility()
+
+    def test_insufficient_history_returns_none(self):
+        snapshot = FeatureSnapshot("BTC-USD", [100.0] * 5)
+        assert snapshot.get("sma_10") is None
+        assert snapshot.get("volatility_10") is None
+        assert snapshot.get("ma_crossover") == "HOLD"
+
+    @pytest.mark.asyncio
+    async def test_committee_shares_one_snapshot_per_tick(self):
+        agents = [
+            FeatureReadingAgent("A", "sma_10"),
+            FeatureReadingAgent("B", "sma_10"),
+        ]
+        committee = AgentCommittee(agents)
+
+        for i in range(12):
+            await committee.vote(make_tick(100.0 + i))
+
+        snapshot_a, sma_a = agents[0].seen[-1]
+        snapshot_b, sma_b = agents[1].seen[-1]
+        assert snapshot_a is snapshot_b
+        assert sma_a == sma_b == pytest.approx(sum(range(102, 112)) / 10)
+        assert snapshot_a.computed == ["sma_10"]
+
+    @pytest.mark.asyncio
+    async def test_committee_does_not_mutate_caller_context(self):
+        committee = AgentCommittee([FeatureReadingAgent("A", "momentum_10")])
+        context = {"account_value": 1000}
+
+        await committee.vote(make_tick(100.0), market_context=context)
+
+        assert "features" not in context
@@ -28,6 +28,7 @@ Design Philosophy:
 - Check memory tier configurations
 """
 
+import asyncio
 import pytest
 import numpy as np
 from datetime import datetime, timedelta
@@ -373,6 +374,54 @@ def test_compress_state_different_configs_different_results(hierarchical_memory)
     assert len(year_compressed) == 64
 
 
+def test_compress_state_uses_precomputed_indices(hierarchical_memory, full_state_vector):
+    """Test that selection indices are computed once per timescale"""
+    config = TIMESCALE_CONFIGS[Timescale.WEEK]
+    compressor = hierarchical_memory.compressors[Timescale.WEEK]
+
+    assert hierarchical_memory.compressors[Timescale.MICROSECOND] is None  # Full dimension
+    assert len(compressor.indices) == 128
+    assert np.all(np.diff(compressor.indices) > 0)
+    np.testing.assert_array_equal(
+        hierarchical_memory._compress_state(full_state_vector, config),
+        full_state_vector[compressor.indices]
+    )
+
+
+def test_compress_state_batch_matches_single(hierarchical_memory):
+    """Test that a batch of states compresses like each state on its own"""
+    states = np.random.randn(50, 384)
+    config = TIMESCALE_CONFIGS[Timescale.MONTH]
+
+    batch = hierarchical_memory._compress_state(states, config)
+
+    assert batch.shape == (50, 64)
+    for state, compressed in zip(states, batch):
+        np.testing.assert_array_equal(compressed, hierarchical_memory._compress_state(state, config))
+
+
+@pytest.mark.asyncio
+async def test_fit_projection_replaces_feature_selection(hierarchical_memory):
+    """Test that a fitted PCA projection compresses stores and recalls"""
+    rng = np.random.default_rng(0)
+    basis = rng.normal(size=(8, 384))
+    states = rng.normal(size=(500, 8)) @ basis  # Rank-8 states
+
+    projection = hierarchical_memory.fit_projection(Timescale.YEAR, states)
+    assert projection.explained_variance_ratio.sum() == pytest.approx(1.0)
+
+    await hierarchical_memory.store_episode(
+        timescale=Timescale.YEAR, action="BUY", symbol="BTC-USD",
+        price=50000.0, size=1.0, state=states[0], reward=1.0
+    )
+    recalled = hierarchical_memory.recall(states[0], Timescale.YEAR, k=1, min_similarity=0.99)
+    assert len(recalled) == 1
+    assert len(recalled[0][0].state) == 64
+
+    with pytest.raises(ValueError):
+        hierarchical_memory.fit_projection(Timescale.YEAR, states)  # Already holds episodes
+
+
 # ============================================================================
 # Test 5: Episode Storage
 # ============================================================================
@@ -769,6 +818,78 @@ async def test_recall_cross_timescale_limits_adjacent_results(hierarchical_memor
     assert len(results) <= 10
 
 
+async def _store_random_states(memory, timescales, n, rng):
+    states = rng.normal(size=(n, 384))
+    for timescale in timescales:
+        for i, state in enumerate(states):
+            await memory.store_episode(
+                timescale=timescale, action="BUY", symbol="BTC-USD",
+                price=50000.0, size=0.1, state=state, reward=float(i)
+            )
+    return states
+
+
+@pytest.mark.asyncio
+async def test_recall_cross_timescale_parallel_matches_sequential(hierarchical_memory):
+    """Test that the parallel fan-out merges like a sequential sort"""
+    rng = np.random.default_rng(0)
+    timescales = [Timescale.MINUTE, Timescale.HOUR, Timescale.SECOND]
+    states = await _store_random_states(hierarchical_memory, timescales, 40, rng)
+    query = states[3] + 0.5 * rng.normal(size=384)
+
+    results = hierarchical_memory.recall(query, Timescale.MINUTE, k=10, min_similarity=-1.0, cross_timescale=True)
+
+    expected = []
+    for timescale, k, discount in [(Timescale.MINUTE, 10, 1.0), (Timescale.SECOND, 5, 0.8), (Timescale.HOUR, 5, 0.8)]:
+        compressed = hierarchical_memory._compress_state(query, TIMESCALE_CONFIGS[timescale])
+        expected.extend(
+            (ep.episode_id, sim * discount, timescale)
+            for ep, sim in hierarchical_memory.memories[timescale].recall(compressed, k=k, min_similarity=-1.0)
+        )
+    expected.sort(key=lambda r: r[1], reverse=True)
+
+    assert [(ep.episode_id, sim, ts) for ep, sim, ts in results] == expected[:10]
+
+
+@pytest.mark.asyncio
+async def test_recall_across_all_timescales(hierarchical_memory):
+    """Test top-k over every enabled timescale at once"""
+    rng = np.random.default_rng(1)
+    states = await _store_random_states(hierarchical_memory, [Timescale.MINUTE, Timescale.YEAR], 20, rng)
+
+    results = hierarchical_memory.recall_across(states[5], k=4, min_similarity=-1.0)
+
+    assert len(results) == 4
+    assert {ts for _, _, ts in results[:2]} == {Timescale.MINUTE, Timescale.YEAR}
+    assert all(ep.reward == 5.0 for ep, _, _ in results[:2])
+    assert [sim for _, sim, _ in results] == sorted((sim for _, sim, _ in results), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_recall_records_latency_against_slo(hierarchical_memory, full_state_vector, monkeypatch):
+    """Test that each searched timescale records its latency and SLO misses"""
+    monkeypatch.setattr(TIMESCALE_CONFIGS[Timescale.MICROSECOND], "retrieval_latency_ms", 0.0)
+    monkeypatch.setattr(TIMESCALE_CONFIGS[Timescale.MILLISECOND], "retrieval_latency_ms", 1e6)
+    for timescale in (Timescale.MICROSECOND, Timescale.MILLISECOND, Timescale.SECOND):
+        await hierarchical_memory.store_episode(
+            timescale=timescale, action="BUY", symbol="BTC-USD",
+            price=50000.0, size=0.1, state=full_state_vector
+        )
+
+    for _ in range(3):
+        hierarchical_memory.recall(full_state_vector, Timescale.MILLISECOND, cross_timescale=True)
+
+    stats = hierarchical_memory.get_statistics()["by_timescale"]
+    for timescale in (Timescale.MICROSECOND, Timescale.MILLISECOND, Timescale.SECOND):
+        latency = stats[timescale.value]["recall_latency"]
+        assert latency["count"] == 3
+        assert 0 < latency["last_ms"] <= latency["max_ms"]
+        assert latency["slo_ms"] == TIMESCALE_CONFIGS[timescale].retrieval_latency_ms
+    assert stats[Timescale.MICROSECOND.value]["recall_latency"]["slo_misses"] == 3
+    assert stats[Timescale.MILLISECOND.value]["recall_latency"]["slo_misses"] == 0
+    assert stats[Timescale.YEAR.value]["recall_latency"]["count"] == 0
+
+
 # ============================================================================
 # Test 8: Adjacent Timescale Detection
 # ============================================================================
@@ -981,6 +1102,60 @@ async def test_repr_after_storing_episodes(hierarchical_memory):
     assert "episodes=1" in repr_str
 
 
+# ============================================================================
+# Test 10b: Storage Tiers and Expiry
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_storage_tiers_place_data(tmp_path, full_state_vector):
+    """Test that hot stays in RAM, warm puts context on disk, cold also vectors"""
+    memory = HierarchicalMemory(
+        enabled_timescales=[Timescale.SECOND, Timescale.DAY, Timescale.YEAR],
+        storage_dir=str(tmp_path)
+    )
+    for timescale in memory.memories:
+        await memory.store_episode(
+            timescale=timescale, action="BUY", symbol="BTC-USD",
+            price=50000.0, size=0.1, state=full_state_vector, reason="tiered"
+        )
+
+    hot, warm, cold = (memory.memories[ts] for ts in (Timescale.SECOND, Timescale.DAY, Timescale.YEAR))
+    assert hot.episodes.blobs.path is None
+    assert not isinstance(hot._states, np.memmap)
+    assert warm.episodes.blobs.path == str(tmp_path / "day.blobs")
+    assert not isinstance(warm._states, np.memmap)
+    assert cold.episodes.blobs.path == str(tmp_path / "year.blobs")
+    assert isinstance(cold._states, np.memmap)
+    assert isinstance(cold.episodes.ids, np.memmap)
+    assert not isinstance(warm.episodes.ids, np.memmap)
+    assert cold.index.directory == str(tmp_path / "year.ivf")
+
+    recalled = memory.recall(full_state_vector, Timescale.YEAR, k=1)
+    assert recalled[0][0].reason == "tiered"
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_expire_drops_episodes_past_retention(tmp_path, full_state_vector):
+    """Test that expiry runs without new stores, in the background"""
+    memory = HierarchicalMemory(enabled_timescales=[Timescale.MINUTE], storage_dir=str(tmp_path))
+    retention = TIMESCALE_CONFIGS[Timescale.MINUTE].retention_period_days
+    await memory.store_episode(
+        timescale=Timescale.MINUTE, action="BUY", symbol="BTC-USD",
+        price=50000.0, size=0.1, state=full_state_vector
+    )
+
+    assert memory.expire() == {Timescale.MINUTE: 0}
+
+    later = datetime.now() + timedelta(days=retention + 1)
+    memory.start_expiry(interval_seconds=0.01, clock=lambda: later)
+    await asyncio.sleep(0.05)
+    await memory.stop_expiry()
+
+    assert len(memory.memories[Timescale.MINUTE].episodes) == 0
+    memory.close()
+
+
 # ============================================================================
 # Test 11: Integration Scenarios
 # ============================================================================
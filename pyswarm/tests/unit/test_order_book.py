@@ -0,0 +1,292 @@
+"""
+Unit tests for incremental L2 order books and depth-aware arbitrage sizing
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.arbitrage_agent import ArbitrageAgent, CrossExchangeArbitrageAgent
+from coinswarm.agents.order_book import (
+    ASK,
+    BID,
+    OrderBook,
+    OrderBooks,
+    best_fill,
+    fill_path,
+)
+from coinswarm.data_ingest.base import DataPoint
+
+
+def book_tick(symbol: str, bids, asks, source: str = "binance", **extra) -> DataPoint:
+    return DataPoint(
+        source=source,
+        symbol=symbol,
+        timeframe="snapshot",
+        timestamp=datetime(2024, 1, 1),
+        data={"update": "snapshot", "bids": bids, "asks": asks, **extra}
+    )
+
+
+def price_tick(symbol: str, price: float) -> DataPoint:
+    return DataPoint(
+        source="binance", symbol=symbol, timeframe="1m",
+        timestamp=datetime(2024, 1, 1), data={"price": price}
+    )
+
+
+class TestOrderBook:
+    """Test suite for OrderBook"""
+
+    def test_snapshot_sorts_sides(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[99, 2], [100, 1]], asks=[[102, 3], [101, 1]])
+
+        assert book.levels(BID)[0].tolist() == [100, 99]
+        assert book.levels(ASK)[0].tolist() == [101, 102]
+        assert book.best_bid == 100
+        assert book.best_ask == 101
+        assert book.mid == 100.5
+
+    def test_diff_updates_inserts_and_removes(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1], [99, 2]], asks=[[101, 1], [102, 3]])
+
+        book.apply_diff(bids=[[100, 0], [99.5, 1], [99, 5]], asks=[[102, 0], [101.5, 2]])
+
+        prices, sizes = book.levels(BID)
+        assert prices.tolist() == [99.5, 99]
+        assert sizes.tolist() == [1, 5]
+        assert book.levels(ASK)[0].tolist() == [101, 101.5]
+
+    def test_removing_unknown_level_is_noop(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1]], asks=[[101, 1]])
+
+        book.apply_diff(bids=[[98, 0]], asks=[])
+
+        assert book.levels(BID)[0].tolist() == [100]
+
+    def test_stale_diff_is_ignored(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1]], asks=[[101, 1]], last_update_id=10)
+
+        assert not book.apply_diff(bids=[[100, 0]], asks=[], first_update_id=5, last_update_id=9)
+        assert book.best_bid == 100
+
+        assert book.apply_diff(bids=[[100, 2]], asks=[], first_update_id=11, last_update_id=12)
+        assert not book.needs_snapshot
+
+    def test_gap_flags_snapshot(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1]], asks=[[101, 1]], last_update_id=10)
+
+        assert not book.apply_diff(bids=[[100, 2]], asks=[], first_update_id=20, last_update_id=21)
+
+        assert book.needs_snapshot
+        assert book.best_bid == 100
+
+    def test_diffs_dropped_until_snapshot(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1]], asks=[[101, 1]], last_update_id=10)
+        book.apply_diff(bids=[[100, 2]], asks=[], first_update_id=20, last_update_id=21)
+
+        assert not book.apply_diff(bids=[[99, 1]], asks=[], first_update_id=22, last_update_id=22)
+        assert book.levels(BID)[0].tolist() == [100]
+
+        book.apply_snapshot(bids=[[98, 1]], asks=[[101, 1]], last_update_id=30)
+        assert not book.needs_snapshot
+        assert book.apply_diff(bids=[[97, 1]], asks=[], first_update_id=31, last_update_id=31)
+        assert book.levels(BID)[0].tolist() == [98, 97]
+
+    def test_walking_depth(self):
+        book = OrderBook("BTC-USDT")
+        book.apply_snapshot(bids=[[100, 1], [98, 2]], asks=[[101, 1], [103, 1]])
+
+        assert book.sell_proceeds(2.0) == pytest.approx(100 + 98)
+        assert book.buy_cost(1.5) == pytest.approx(101 + 0.5 * 103)
+
+    def test_order_books_from_ticks(self):
+        books = OrderBooks()
+        books.update(book_tick("BTC-USDT", [[100, 1]], [[101, 1]]))
+        books.update(book_tick("BTC-USDT", [[100, 0], [99, 1]], [], update="diff"))
+
+        assert books.get("BTC-USDT").best_bid == 99
+        assert books.update(DataPoint(
+            source="test", symbol="BTC-USDT", timeframe="1m",
+            timestamp=datetime(2024, 1, 1), data={"price": 100.0}
+        )) is None
+
+
+    def test_gapped_book_is_not_used(self):
+        books = OrderBooks()
+        books.update(book_tick("BTC-USDT", [[100, 1]], [[101, 1]], last_update_id=10))
+        books.update(book_tick(
+            "BTC-USDT", [[99, 1]], [], update="diff", first_update_id=15, last_update_id=16
+        ))
+
+        assert books.get("BTC-USDT") is None
+        assert "BTC-USDT" not in books
+        assert books.resync_keys() == ["BTC-USDT"]
+
+        books.update(book_tick("BTC-USDT", [[99, 1]], [[101, 1]], last_update_id=20))
+        assert books.get("BTC-USDT").best_bid == 99
+        assert books.resync_keys() == []
+
+    def test_first_diff_waits_for_snapshot(self):
+        books = OrderBooks()
+        book = books.update(book_tick(
+            "ETH-USDT", [[3000, 1]], [[3001, 1]], update="diff", first_update_id=5, last_update_id=6
+        ))
+
+        assert book.needs_snapshot
+        assert not book
+        assert books.get("ETH-USDT") is None
+        assert books.resync_keys() == ["ETH-USDT"]
+
+
+class TestFillPath:
+    """Composing leg fill curves and sizing the path"""
+
+    def test_cross_book_optimal_size(self):
+        buy = OrderBook("BTC-USDT")
+        buy.apply_snapshot(bids=[[99, 5]], asks=[[100, 1], [101, 1], [103, 5]])
+        sell = OrderBook("BTC-USDT")
+        sell.apply_snapshot(bids=[[104, 0.5], [102, 1], [100, 5]], asks=[[105, 1]])
+
+        curve = fill_path([buy.fill_curve(sell=False), sell.fill_curve(sell=True)])
+        fill = best_fill(curve)
+
+        # 1.5 BTC bought for 150.5, sold for 52 + 102; the next unit loses
+        assert fill.amount_in == pytest.approx(150.5)
+        assert fill.amount_out == pytest.approx(154.0)
+
+    def test_fees_shrink_size(self):
+        buy = OrderBook("X")
+        buy.apply_snapshot(bids=[[99, 5]], asks=[[100, 1], [101, 1]])
+        sell = OrderBook("X")
+        sell.apply_snapshot(bids=[[102, 1], [101.5, 1]], asks=[[105, 1]])
+        curves = [buy.fill_curve(sell=False), sell.fill_curve(sell=True)]
+
+        assert best_fill(fill_path(curves)).amount_in == pytest.approx(201)
+
+        # After fees the second book's first level takes 1 / 0.996 BTC bought
+        with_fees = best_fill(fill_path(curves, fee_pct=0.004))
+        assert with_fees.amount_in == pytest.approx(100 + (1 / 0.996 - 1) * 101)
+
+    def test_stops_at_shallowest_leg(self):
+        buy = OrderBook("X")
+        buy.apply_snapshot(bids=[[90, 1]], asks=[[100, 10]])
+        sell = OrderBook("X")
+        sell.apply_snapshot(bids=[[110, 0.5]], asks=[[120, 1]])
+
+        amount_in, amount_out = fill_path([buy.fill_curve(sell=False), sell.fill_curve(sell=True)])
+
+        assert amount_in[-1] == pytest.approx(50)
+        assert amount_out[-1] == pytest.approx(55)
+
+    def test_unprofitable_path(self):
+        buy = OrderBook("X")
+        buy.apply_snapshot(bids=[[99, 1]], asks=[[100, 1]])
+
+        curve = fill_path([buy.fill_curve(sell=False), buy.fill_curve(sell=True)])
+
+        assert best_fill(curve) is None
+
+
+class TestDepthAwareArbitrage:
+    """Arbitrage agents size trades from order book depth"""
+
+    @pytest.mark.asyncio
+    async def test_triangle_sized_to_depth(self):
+        agent = ArbitrageAgent(min_profit_pct=0.004, fee_pct=0.001, capital=200000.0)
+
+        # USDC → BTC → SOL → USDC returns ~1.5% at the top of each book
+        await agent.analyze(book_tick("BTC-USDC", [[49900, 5]], [[50000, 0.02], [50500, 5]]), None, {})
+        await agent.analyze(book_tick("BTC-SOL", [[500, 5]], [[505, 5]]), None, {})
+        vote = await agent.analyze(book_tick("SOL-USDC", [[101.5, 100]], [[102, 100]]), None, {})
+
+        assert vote.action == "BUY"
+        assert agent.last_fill.amount_in == pytest.approx(0.02 * 50000)
+        assert vote.size == pytest.approx(1000 / 200000)
+
+    @pytest.mark.asyncio
+    async def test_phantom_top_of_book_edge_is_rejected(self):
+        agent = ArbitrageAgent(min_profit_pct=0.004, fee_pct=0.001)
+
+        # The books have no edge once the spread is crossed
+        await agent.analyze(book_tick("BTC-USDC", [[49900, 5]], [[50100, 5]]), None, {})
+        await agent.analyze(book_tick("BTC-SOL", [[500, 5]], [[501, 5]]), None, {})
+        await agent.analyze(book_tick("SOL-USDC", [[100, 100]], [[100.4, 100]]), None, {})
+
+        # A last-trade print suggests one
+        vote = await agent.analyze(DataPoint(
+            source="binance", symbol="SOL-USDC", timeframe="1m",
+            timestamp=datetime(2024, 1, 1), data={"price": 102.0}
+        ), None, {})
+
+        assert vote.action == "HOLD"
+        assert "not executable" in vote.reason
+        assert agent.depth_rejections == 1
+
+    @pytest.mark.asyncio
+    async def test_rejection_reports_the_cycle_it_sized(self):
+        agent = ArbitrageAgent(min_profit_pct=0.004, fee_pct=0.001)
+
+        # Phantom edge on the booked SOL triangle, as above
+        await agent.analyze(book_tick("BTC-USDC", [[49900, 5]], [[50100, 5]]), None, {})
+        await agent.analyze(book_tick("BTC-SOL", [[500, 5]], [[501, 5]]), None, {})
+        await agent.analyze(book_tick("SOL-USDC", [[100, 100]], [[100.4, 100]]), None, {})
+        await agent.analyze(price_tick("SOL-USDC", 102.0), None, {})
+
+        # A bigger top-of-book edge through ETH, which has no books
+        await agent.analyze(price_tick("ETH-BTC", 0.065), None, {})
+        vote = await agent.analyze(price_tick("ETH-USDC", 3000.0), None, {})
+
+        assert agent.best_cycle().net_return > 0.05
+        assert vote.action == "HOLD"
+        assert "not executable" in vote.reason
+        assert "SOL" in vote.reason and "ETH" not in vote.reason
+
+    @pytest.mark.asyncio
+    async def test_gapped_leg_is_not_traded(self):
+        agent = ArbitrageAgent(min_profit_pct=0.004, fee_pct=0.001)
+
+        await agent.analyze(book_tick("BTC-USDC", [[49900, 5]], [[50000, 5]]), None, {})
+        await agent.analyze(book_tick("BTC-SOL", [[500, 5]], [[505, 5]]), None, {})
+        await agent.analyze(book_tick("SOL-USDC", [[100, 100]], [[100.4, 100]], last_update_id=5), None, {})
+
+        # Diff 6 was missed; diff 7-8 would open the triangle's edge
+        vote = await agent.analyze(book_tick(
+            "SOL-USDC", [[101.5, 100]], [[102, 100]], update="diff", first_update_id=7, last_update_id=8
+        ), None, {})
+
+        assert vote.action == "HOLD"
+        assert "snapshot" in vote.reason
+        assert agent.price_cache["SOL-USDC"] == pytest.approx(100.2)
+        assert agent.books.get("SOL-USDC") is None
+
+    @pytest.mark.asyncio
+    async def test_cross_exchange_sized_to_depth(self):
+        agent = CrossExchangeArbitrageAgent(min_profit_pct=0.005, fee_pct=0.001, capital=1000.0)
+
+        await agent.analyze(
+            book_tick("BTC-USDT", [[99, 5]], [[100, 1], [101, 1], [103, 5]], source="binance"), None, {}
+        )
+        vote = await agent.analyze(
+            book_tick("BTC-USDT", [[104, 0.5], [102, 1], [100, 5]], [[105, 1]], source="coinbase"), None, {}
+        )
+
+        assert vote.action == "BUY"
+        assert "binance" in vote.reason and "coinbase" in vote.reason
+        # Through the 101 ask level (sold at 102); not into the 103 asks
+        assert 150 < agent.last_fill.amount_in < 151
+        assert vote.size == pytest.approx(0.01)
+
+    @pytest.mark.asyncio
+    async def test_cross_exchange_needs_two_books(self):
+        agent = CrossExchangeArbitrageAgent()
+
+        vote = await agent.analyze(book_tick("BTC-USDT", [[99, 5]], [[100, 1]]), None, {})
+
+        assert vote.action == "HOLD"
+        assert vote.size == 0.0
@@ -0,0 +1,131 @@
+"""
+Unit tests for quantized state storage
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.ann_index import IVFIndex
+from coinswarm.memory.episode_store import EpisodeStore
+from coinswarm.memory.quantization import (
+    Float16Quantizer, Float32Quantizer, Int8Quantizer, make_quantizer
+)
+from coinswarm.memory.simple_memory import Episode, SimpleMemory
+
+
+def unit_rows(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    x = np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+class TestQuantizers:
+    """Test suite for the state quantizers"""
+
+    @pytest.mark.parametrize("quantizer, tolerance", [
+        (Float32Quantizer(), 1e-6),
+        (Float16Quantizer(chunk=100), 2e-3),
+        (Int8Quantizer(chunk=100), 2e-2),
+    ])
+    def test_scores_match_full_precision(self, quantizer, tolerance):
+        x = unit_rows(1000, 32)
+        quantizer.fit(x)
+        codes = quantizer.encode(x)
+        query = x[7]
+
+        assert codes.dtype == quantizer.dtype
+        assert quantizer.scores(codes, query) == pytest.approx(x @ query, abs=tolerance)
+        assert quantizer.decode(codes) == pytest.approx(x, abs=tolerance)
+
+    def test_int8_scores_without_dequantizing(self):
+        quantizer = Int8Quantizer()
+        x = unit_rows(500, 16)
+        quantizer.fit(x)
+        codes = quantizer.encode(x)
+
+        out = np.empty(len(codes), dtype=np.float32)
+        scores = quantizer.scores(codes, x[0], out=out)
+        assert scores is out
+        assert scores == pytest.approx(quantizer.decode(codes) @ x[0], abs=1e-5)
+
+    def test_int8_fit_narrows_range(self):
+        quantizer = Int8Quantizer()
+        assert not quantizer.fitted
+        x = unit_rows(2000, 64)  # Coordinates well inside [-1, 1]
+        unfitted_error = np.abs(quantizer.decode(quantizer.encode(x)) - x).max()
+
+        quantizer.fit(x)
+        assert quantizer.fitted
+        assert quantizer.offset.shape == (64,)
+        assert np.abs(quantizer.decode(quantizer.encode(x)) - x).max() < unfitted_error
+
+    def test_make_quantizer(self):
+        assert isinstance(make_quantizer("int8", calibration_size=10), Int8Quantizer)
+        assert make_quantizer("float16").dtype == np.float16
+        with pytest.raises(ValueError):
+            make_quantizer("int4")
+
+
+class TestQuantizedMemory:
+    """SimpleMemory and IVFIndex storing quantized codes"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kind", ["float16", "int8"])
+    async def test_recall_matches_full_precision(self, kind):
+        states = unit_rows(300, 16, seed=1)
+        full = SimpleMemory(max_episodes=300, pattern_update_frequency=10**6)
+        quantized = SimpleMemory(
+            max_episodes=300, pattern_update_frequency=10**6,
+            quantizer=make_quantizer(kind, **({"calibration_size": 100} if kind == "int8" else {}))
+        )
+        for i, state in enumerate(states):
+            for memory in (full, quantized):
+                await memory.store_episode(
+                    action="BUY", symbol="BTC-USD", price=1.0, size=1.0, state=state, reward=float(i)
+                )
+
+        assert quantized.quantizer.fitted
+        assert quantized._states.dtype == np.dtype(kind)
+        for query in states[:20]:
+            expected = [ep.reward for ep, _ in full.recall(query, k=5, min_similarity=-1.0)]
+            recalled = quantized.recall(query, k=5, min_similarity=-1.0)
+            assert recalled[0][0].reward == expected[0]  # Exact match stays on top
+            assert len({ep.reward for ep, _ in recalled} & set(expected)) >= 4
+
+    @pytest.mark.asyncio
+    async def test_int8_stateless_episodes_score_zero(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6, quantizer=Int8Quantizer(calibration_size=10))
+        for state in unit_rows(20, 4):
+            await memory.store_episode(action="BUY", symbol="BTC-USD", price=1.0, size=1.0, state=state)
+        await memory.store_episode(action="SELL", symbol="BTC-USD", price=1.0, size=1.0)
+
+        recalled = memory.recall(np.ones(4), k=100, min_similarity=-1.0)
+        stateless = [s for ep, s in recalled if ep.action == "SELL"]
+        assert stateless == [0.0]
+
+    def test_ivf_index_stores_codes(self):
+        quantizer = Int8Quantizer()
+        x = unit_rows(2000, 16)
+        quantizer.fit(x)
+        index = IVFIndex(capacity=2000, dim=16, nlist=16, nprobe=16, seed=0, quantizer=quantizer)
+        for key, vector in enumerate(x):
+            index.add(key, vector)
+
+        assert index.trained
+        assert index._vectors[0].dtype == np.int8
+        keys, scores = index.search(x[3], k=1, min_similarity=0.0)
+        assert keys[0] == 3
+        assert scores[0] == pytest.approx(1.0, abs=2e-2)
+
+    def test_episode_store_state_dtype(self):
+        store = EpisodeStore(capacity=2, state_dtype=np.float16)
+        state = np.linspace(-3, 3, 8)
+        store.add(Episode(
+            action="BUY", symbol="BTC-USD", price=1.0, size=1.0,
+            timestamp=datetime(2024, 1, 1), state=state, episode_id="e1"
+        ))
+
+        restored = store["e1"].state
+        assert restored.dtype == np.float64
+        assert restored == pytest.approx(state, abs=1e-2)
@@ -0,0 +1,305 @@
+"""
+Unit tests for ResearchAgent background refresh and NewsCrawler
+
+Runs against a local aiohttp stub server (no external network).
+"""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from aiohttp import web
+
+from coinswarm.agents.news_crawler import NewsCrawler
+from coinswarm.agents.research_agent import NewsSource, ResearchAgent
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(symbol: str = "BTC-USD") -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": 50000.0}
+    )
+
+
+class StubNewsServer:
+    """Local news API: JSON articles with an ETag, optional delay"""
+
+    def __init__(self):
+        self.articles = [{"title": "BTC rally continues", "description": "Bullish breakout"}]
+        self.etag = '"v1"'
+        self.delay = 0.0
+        self.status = 200  # Anything else: error response
+        self.requests = []  # (path, If-None-Match, client port)
+
+        app = web.Application()
+        app.router.add_get("/news", self.news)
+        app.router.add_get("/text", self.text)
+        self.runner = web.AppRunner(app)
+        self.url = None
+
+    async def start(self):
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def news(self, request):
+        self.requests.append((
+            request.path,
+            request.headers.get("If-None-Match"),
+            request.transport.get_extra_info("peername")[1]
+        ))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        return web.json_response({"articles": self.articles}, headers={"ETag": self.etag})
+
+    async def text(self, request):
+        self.requests.append((request.path, None, None))
+        return web.Response(text="Analysts see a crash and heavy losses")
+
+
+@pytest.fixture
+async def server():
+    stub = StubNewsServer()
+    await stub.start()
+    yield stub
+    await stub.stop()
+
+
+def stub_source(server, name: str = "Stub", path: str = "/news", **kwargs) -> NewsSource:
+    return NewsSource(name, server.url + path + "?q={symbol}", 0.9, min_interval=0.0, **kwargs)
+
+
+class TestNewsCrawler:
+    """Shared session, conditional requests, rate limits, timeouts"""
+
+    @pytest.mark.asyncio
+    async def test_conditional_request_reuses_body(self, server):
+        async with NewsCrawler() as crawler:
+            url = server.url + "/news"
+            first = await crawler.fetch("Stub", url)
+            second = await crawler.fetch("Stub", url)
+
+        assert first == second
+        assert server.requests[1][1] == '"v1"'
+        assert crawler.stats["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_etag_returns_new_body(self, server):
+        async with NewsCrawler() as crawler:
+            url = server.url + "/news"
+            await crawler.fetch("Stub", url)
+            server.etag = '"v2"'
+            server.articles = [{"title": "Updated"}]
+            body = await crawler.fetch("Stub", url)
+
+        assert body["articles"][0]["title"] == "Updated"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_skips_network(self, server):
+        async with NewsCrawler() as crawler:
+            url = server.url + "/news"
+            first = await crawler.fetch("Stub", url, min_interval=60.0)
+            second = await crawler.fetch("Stub", url, min_interval=60.0)
+
+        assert second == first
+        assert len(server.requests) == 1
+        assert crawler.stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_per_url(self, server):
+        async with NewsCrawler() as crawler:
+            btc = await crawler.fetch("Stub", server.url + "/news?q=BTC", min_interval=60.0)
+            eth = await crawler.fetch("Stub", server.url + "/news?q=ETH", min_interval=60.0)
+
+        assert btc is not None and eth is not None
+        assert len(server.requests) == 2
+        assert crawler.stats["rate_limited"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self, server):
+        server.delay = 0.5
+        async with NewsCrawler() as crawler:
+            body = await crawler.fetch("Stub", server.url + "/news", timeout=0.05)
+
+        assert body is None
+        assert crawler.stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_url_backs_off(self, server):
+        server.status = 503
+        async with NewsCrawler(retry_backoff=60.0) as crawler:
+            url = server.url + "/news"
+            first = await crawler.fetch("Stub", url)
+            second = await crawler.fetch("Stub", url)
+
+        assert first is None and second is None
+        assert len(server.requests) == 1
+        assert crawler.stats["backed_off"] == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_and_resets_on_success(self, server):
+        server.status = 503
+        async with NewsCrawler(retry_backoff=0.05, max_backoff=0.15) as crawler:
+            url = server.url + "/news"
+            await crawler.fetch("Stub", url)
+            assert crawler._interval(crawler._failures[url], 0.0) == 0.05
+
+            await asyncio.sleep(0.06)
+            await crawler.fetch("Stub", url)
+            assert crawler._interval(crawler._failures[url], 0.0) == 0.1
+            assert crawler._interval(5, 0.0) == 0.15
+
+            server.status = 200
+            await asyncio.sleep(0.11)
+            body = await crawler.fetch("Stub", url)
+
+        assert body is not None
+        assert url not in crawler._failures
+        assert len(server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_connection_is_kept_alive(self, server):
+        async with NewsCrawler() as crawler:
+            for _ in range(3):
+                await crawler.fetch("Stub", server.url + "/news")
+
+        ports = {port for _, _, port in server.requests}
+        assert len(ports) == 1
+
+
+class TestResearchAgentRefresh:
+    """analyze() never waits for crawling"""
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_returns_immediately_and_refreshes(self, server):
+        server.delay = 0.3
+        agent = ResearchAgent(sources=[stub_source(server)])
+
+        start = time.perf_counter()
+        vote = await agent.analyze(make_tick(), None, {})
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        assert vote.action == "HOLD"
+
+        await agent.wait_for_refresh()
+        vote = await agent.analyze(make_tick(), None, {})
+        await agent.close()
+
+        assert vote.action == "BUY"
+        assert agent.sentiment_cache["BTC-USD"][0].headline == "BTC rally continues"
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_is_served_while_revalidating(self, server):
+        agent = ResearchAgent(sources=[stub_source(server)])
+        await agent.refresh("BTC-USD")
+        agent.cache_ttl = timedelta(0)
+
+        server.delay = 0.3
+        server.etag = '"v2"'
+        server.articles = [{"title": "Market crash", "description": "Bearish losses"}]
+
+        vote = await agent.analyze(make_tick(), None, {})
+        assert vote.action == "BUY"  # Stale, but immediate
+
+        await agent.analyze(make_tick(), None, {})
+        assert len(agent._refreshing) == 1  # One refresh in flight per symbol
+
+        await agent.wait_for_refresh()
+        vote = await agent.analyze(make_tick(), None, {})
+        await agent.close()
+
+        assert vote.action == "SELL"
+
+    @pytest.mark.asyncio
+    async def test_second_symbol_inside_rate_limit_gets_news(self, server):
+        agent = ResearchAgent(sources=[stub_source(server)])
+        agent.sources[0].min_interval = 60.0
+
+        await agent.refresh("BTC-USD")
+        eth = await agent.refresh("ETH-USD")
+        await agent.close()
+
+        assert len(eth) == 1
+        assert agent.sentiment_cache["ETH-USD"][0].headline == "BTC rally continues"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_sentiment(self, server):
+        agent = ResearchAgent(sources=[stub_source(server)])
+        await agent.refresh("BTC-USD")
+        refreshed_at = agent._refreshed_at["BTC-USD"]
+
+        server.status = 503
+        sentiments = await agent.refresh("BTC-USD")
+
+        assert [s.headline for s in sentiments] == ["BTC rally continues"]
+        assert agent.sentiment_cache["BTC-USD"][0].headline == "BTC rally continues"
+        assert agent._refreshed_at["BTC-USD"] == refreshed_at  # Still stale: next access retries
+
+        # Nothing cached yet and every source fails: stays missing
+        await agent.refresh("ETH-USD")
+        await agent.close()
+        assert "ETH-USD" not in agent.sentiment_cache
+        assert "ETH-USD" not in agent._refreshed_at
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_not_retried_every_tick(self, server):
+        server.status = 503
+        agent = ResearchAgent(sources=[stub_source(server)])
+
+        await agent.analyze(make_tick(), None, {})
+        await agent.wait_for_refresh()
+        for _ in range(5):
+            await agent.analyze(make_tick(), None, {})
+
+        assert not agent._refreshing
+        assert len(server.requests) == 1
+
+        # After the backoff, the next tick retries
+        agent._retry_at["BTC-USD"] = datetime.now() - timedelta(seconds=1)
+        agent.crawler.retry_backoff = 0.0
+        server.status = 200
+        await agent.analyze(make_tick(), None, {})
+        await agent.wait_for_refresh()
+        await agent.close()
+
+        assert len(server.requests) == 2
+        assert "BTC-USD" not in agent._retry_at
+        assert agent._get_cached_sentiment("BTC-USD")
+
+    @pytest.mark.asyncio
+    async def test_plain_text_source(self, server):
+        agent = ResearchAgent(sources=[stub_source(server, path="/text")])
+
+        sentiments = await agent.refresh("BTC-USD")
+        await agent.close()
+
+        assert sentiments[0].sentiment < 0
+
+    @pytest.mark.asyncio
+    async def test_failing_source_is_skipped(self, server):
+        sources = [
+            stub_source(server),
+            NewsSource("Down", server.url + "/missing?q={symbol}", 0.9, min_interval=0.0),
+        ]
+        agent = ResearchAgent(sources=sources)
+
+        sentiments = await agent.refresh("BTC-USD")
+        await agent.close()
+
+        assert [s.source for s in sentiments] == ["Stub"]
+        assert agent.crawler.stats["errors"] == 1
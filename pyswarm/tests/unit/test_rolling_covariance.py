@@ -0,0 +1,175 @@
+"""
+Unit tests for the streaming covariance / correlation engine and its readers
+(CorrelationDetector, HedgeAgent)
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from coinswarm.agents.hedge_agent import HedgeAgent
+from coinswarm.data_ingest.base import DataPoint
+from coinswarm.patterns.correlation_detector import CorrelationDetector
+from coinswarm.patterns.rolling_covariance import RollingCovariance, pairwise_correlation
+
+
+def correlated_returns(bars: int = 300, symbols: int = 5, missing: float = 0.0, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(size=bars)
+    returns = 0.01 * (market[:, None] + 0.7 * rng.normal(size=(bars, symbols)))
+    returns[rng.random((bars, symbols)) < missing] = np.nan
+    return returns
+
+
+def feed(engine: RollingCovariance, returns: np.ndarray):
+    names = [f"S{i}" for i in range(returns.shape[1])]
+    for row in returns:
+        engine.update({n: v for n, v in zip(names, row) if not np.isnan(v)})
+
+
+class TestRollingCovariance:
+    """Test suite for RollingCovariance"""
+
+    def test_window_matches_corrcoef(self):
+        returns = correlated_returns()
+        engine = RollingCovariance(window=50, min_periods=2)
+        feed(engine, returns)
+
+        np.testing.assert_allclose(engine.correlation(), np.corrcoef(returns[-50:].T), atol=1e-12)
+        np.testing.assert_allclose(engine.covariance(), np.cov(returns[-50:].T), atol=1e-15)
+
+    def test_window_matches_between_rebuilds(self):
+        returns = correlated_returns(bars=137)
+        engine = RollingCovariance(window=50, min_periods=2)
+        feed(engine, returns)
+
+        np.testing.assert_allclose(engine.correlation(), np.corrcoef(returns[-50:].T), atol=1e-12)
+
+    def test_missing_values_are_pairwise(self):
+        returns = correlated_returns(missing=0.2)
+        engine = RollingCovariance(window=60, min_periods=2)
+        feed(engine, returns)
+
+        window = returns[-60:]
+        both = ~np.isnan(window[:, 0]) & ~np.isnan(window[:, 1])
+        expected = np.corrcoef(window[both, 0], window[both, 1])[0, 1]
+        assert engine.correlation_of("S0", "S1") == pytest.approx(expected)
+
+        # Symbol ids follow first appearance, not column order
+        order = [engine.index[f"S{i}"] for i in range(returns.shape[1])]
+        np.testing.assert_allclose(
+            engine.correlation()[np.ix_(order, order)], pairwise_correlation(window), atol=1e-12
+        )
+
+    def test_min_periods(self):
+        engine = RollingCovariance(window=20, min_periods=10)
+        feed(engine, correlated_returns(bars=5))
+
+        assert np.isnan(engine.correlation()).all()
+
+    def test_grows_with_new_symbols(self):
+        engine = RollingCovariance(window=30, min_periods=2, initial_symbols=1)
+        returns = correlated_returns(bars=40, symbols=12)
+        feed(engine, returns)
+
+        assert engine.correlation().shape == (12, 12)
+        np.testing.assert_allclose(engine.correlation(), np.corrcoef(returns[-30:].T), atol=1e-12)
+
+    def test_update_prices(self):
+        engine = RollingCovariance(window=10, min_periods=2)
+        prices = 100 * np.cumprod(1 + correlated_returns(bars=21, symbols=2), axis=0)
+        for a, b in prices:
+            engine.update_prices({"A": a, "B": b})
+
+        returns = np.diff(prices, axis=0) / prices[:-1]
+        assert engine.correlation_of("A", "B") == pytest.approx(
+            np.corrcoef(returns[-10:].T)[0, 1]
+        )
+
+    def test_ewma_tracks_regime_change(self):
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=400)
+        y = np.concatenate([x[:300], -x[300:]]) + 0.1 * rng.normal(size=400)
+
+        ewma = RollingCovariance(halflife=10)
+        for a, b in zip(x, y):
+            ewma.update({"X": a, "Y": b})
+
+        assert ewma.correlation_of("X", "Y") < -0.9
+
+    def test_correlated_with(self):
+        engine = RollingCovariance(window=100, min_periods=2)
+        rng = np.random.default_rng(2)
+        for _ in range(100):
+            x = rng.normal()
+            engine.update({"A": x, "B": x + 0.1 * rng.normal(), "C": -x, "D": rng.normal()})
+
+        hits = engine.correlated_with("A", 0.8)
+        assert {name for name, _ in hits} == {"B", "C"}
+        assert dict(hits)["C"] < 0
+
+
+class TestCorrelationDetector:
+    """Batch and streaming paths read the same matrix"""
+
+    def test_batch_uses_window(self):
+        prices = 100 * np.cumprod(1 + correlated_returns(bars=201, symbols=3), axis=0)
+        price_data = {f"P{i}": prices[:, i] for i in range(3)}
+        detector = CorrelationDetector(window_size=100)
+
+        correlations = detector.calculate_correlation_matrix(price_data)
+
+        returns = np.diff(prices, axis=0) / prices[:-1]
+        expected = np.corrcoef(returns[-100:].T)
+        assert list(correlations) == [("P0", "P1"), ("P0", "P2"), ("P1", "P2")]
+        assert correlations[("P0", "P2")] == pytest.approx(expected[0, 2])
+
+    def test_streaming_matches_batch(self):
+        prices = 100 * np.cumprod(1 + correlated_returns(bars=151, symbols=3), axis=0)
+        price_data = {f"P{i}": prices[:, i] for i in range(3)}
+        detector = CorrelationDetector(window_size=100)
+
+        for row in prices:
+            detector.update({f"P{i}": p for i, p in enumerate(row)})
+
+        streaming = detector.calculate_correlation_matrix()
+        batch = detector.calculate_correlation_matrix(price_data)
+        for key, value in batch.items():
+            assert streaming[key] == pytest.approx(value)
+
+
+class TestHedgeAgentCorrelations:
+    """HedgeAgent hedges with the live correlation matrix"""
+
+    @pytest.mark.asyncio
+    async def test_hedge_from_rolling_correlation(self):
+        agent = HedgeAgent(correlation_window=50)
+        rng = np.random.default_rng(3)
+        start = datetime(2024, 1, 1)
+        btc, doge = 50000.0, 0.1
+
+        for i in range(60):
+            move = rng.normal(0, 0.01)
+            btc *= 1 + move
+            doge *= 1 - move + rng.normal(0, 0.001)
+            for symbol, price in (("BTC-USD", btc), ("DOGE-USD", doge)):
+                tick = DataPoint(
+                    source="test", symbol=symbol, timeframe="1m",
+                    timestamp=start + timedelta(minutes=i), data={"price": price}
+                )
+                await agent.analyze(tick, None, {})
+
+        hedge = agent._recommend_hedge("BTC-USD", {"size": 1.0}, {})
+
+        assert hedge.hedge_symbol == "DOGE-USD"
+        assert hedge.hedge_type == "long"
+        assert hedge.correlation < -0.9
+
+    def test_prior_correlations_until_enough_bars(self):
+        agent = HedgeAgent()
+
+        hedge = agent._recommend_hedge("BTC-USD", {"size": 1.0}, {})
+
+        assert hedge.hedge_symbol == "ETH-USD"
+        assert hedge.hedge_type == "short"
+        assert hedge.hedge_size == pytest.approx(0.85)
@@ -0,0 +1,124 @@
+"""
+Unit tests for SimpleMemory vectorized recall
+"""
+
+import numpy as np
+import pytest
+
+from coinswarm.memory.simple_memory import SimpleMemory
+
+
+async def fill(memory: SimpleMemory, states, **kwargs):
+    ids = []
+    for i, state in enumerate(states):
+        ids.append(await memory.store_episode(
+            action="BUY", symbol="BTC-USD", price=100.0 + i, size=1.0,
+            state=state, reward=float(i), **kwargs
+        ))
+    return ids
+
+
+def brute_force(memory: SimpleMemory, query, k, min_similarity):
+    scored = [
+        (episode, memory._cosine_similarity(query, episode.state))
+        for episode in memory.episodes.values()
+    ]
+    scored = [(e, s) for e, s in scored if s >= min_similarity]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:k]
+
+
+class TestSimpleMemoryRecall:
+    """recall_similar on the normalized state matrix"""
+
+    @pytest.mark.asyncio
+    async def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        memory = SimpleMemory(max_episodes=500, pattern_update_frequency=10**6)
+        await fill(memory, rng.normal(size=(300, 16)))
+        query = rng.normal(size=16)
+
+        recalled = await memory.recall_similar(query, k=10, min_similarity=0.2)
+        expected = brute_force(memory, query, 10, 0.2)
+
+        assert [e.reward for e, _ in recalled] == [e.reward for e, _ in expected]
+        assert [s for _, s in recalled] == pytest.approx([s for _, s in expected], abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_rows_follow_eviction(self):
+        rng = np.random.default_rng(1)
+        memory = SimpleMemory(max_episodes=50, pattern_update_frequency=10**6)
+        states = rng.normal(size=(137, 8))
+        await fill(memory, states)
+
+        assert len(memory.episodes) == 50
+        for i in (87, 100, 136):
+            (episode, similarity), = await memory.recall_similar(states[i], k=1, min_similarity=0.0)
+            assert episode.reward == i
+            assert similarity == pytest.approx(1.0, abs=1e-6)
+
+        # Evicted states are no longer recalled
+        (episode, _), = await memory.recall_similar(states[10], k=1, min_similarity=0.0)
+        assert episode.reward != 10
+
+    @pytest.mark.asyncio
+    async def test_threshold_mask(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        await fill(memory, [np.array([1.0, 0.0]), np.array([1.0, 1.0]), np.array([0.0, 1.0])])
+
+        recalled = await memory.recall_similar(np.array([1.0, 0.0]), k=10, min_similarity=0.7)
+
+        assert [e.reward for e, _ in recalled] == [0.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_zero_and_missing_states_score_zero(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        await fill(memory, [np.zeros(3), np.array([]), np.ones(3)])
+
+        recalled = await memory.recall_similar(np.ones(3), k=10, min_similarity=0.5)
+
+        assert [e.reward for e, _ in recalled] == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_query_dimension_mismatch(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        await fill(memory, [np.ones(3)])
+
+        with pytest.raises(ValueError):
+            await memory.recall_similar(np.ones(4))
+
+
+class TestSimpleMemorySuggestAction:
+    """suggest_action on the synchronous recall path"""
+
+    @pytest.mark.asyncio
+    async def test_recall_matches_recall_similar(self):
+        rng = np.random.default_rng(2)
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        await fill(memory, rng.normal(size=(50, 4)))
+        query = rng.normal(size=4)
+
+        assert memory.recall(query, k=5, min_similarity=0.0) == \
+            await memory.recall_similar(query, k=5, min_similarity=0.0)
+
+    @pytest.mark.asyncio
+    async def test_suggests_best_rewarded_action(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        for action, reward in (("BUY", 0.05), ("BUY", 0.03), ("SELL", -0.04)):
+            await memory.store_episode(
+                action=action, symbol="BTC-USD", price=100.0, size=1.0,
+                state=np.array([1.0, 0.1]), reward=reward
+            )
+
+        action, confidence = memory.suggest_action(np.array([1.0, 0.0]))
+
+        assert action == "BUY"
+        assert confidence == pytest.approx((0.04 + 0.1) / 0.2, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_hold_without_similar_episodes(self):
+        memory = SimpleMemory(pattern_update_frequency=10**6)
+        await fill(memory, [np.array([1.0, 0.0])])
+
+        assert memory.suggest_action(np.array([0.0, 1.0])) == ("HOLD", 0.0)
+        assert SimpleMemory().suggest_action(np.array([1.0, 0.0])) == ("HOLD", 0.0)
@@ -0,0 +1,155 @@
+"""
+Unit tests for StrategyLearningAgent and its array-backed population
+"""
+
+import numpy as np
+import pytest
+
+from coinswarm.agents.strategy_learning_agent import StrategyLearningAgent
+from coinswarm.agents.strategy_population import GENES, StrategyPopulation
+
+
+def make_population(weights, seed: int = 0) -> StrategyPopulation:
+    population = StrategyPopulation(capacity=2, seed=seed)
+    for i, weight in enumerate(weights):
+        population.add(
+            f"s{i}", f"S{i}", {"type": "trend", "momentum_threshold": 0.01 * (i + 1)},
+            weight=weight, sandbox_tested=True, production_ready=True
+        )
+    return population
+
+
+class TestStrategyPopulation:
+    """Test suite for StrategyPopulation"""
+
+    def test_pattern_round_trip(self):
+        population = StrategyPopulation()
+        pattern = {"type": "mean_reversion", "condition": "oversold", "rsi_min": 30.0, "deviation_threshold": -2.0}
+
+        row = population.add("mr", "Mean Reversion", pattern)
+
+        assert population.pattern(row) == pattern
+
+    def test_selection_is_weight_proportional(self):
+        population = make_population([1.0, 3.0, -1.0, 0.0])
+
+        pairs = population.select_parents(20000, population.production_mask())
+
+        counts = np.bincount(pairs.ravel(), minlength=4)
+        assert counts[2] == counts[3] == 0
+        assert counts[1] / counts[0] == pytest.approx(3.0, rel=0.05)
+
+    def test_selection_needs_two_candidates(self):
+        population = make_population([1.0, -1.0])
+
+        assert len(population.select_parents(10, population.production_mask())) == 0
+
+    def test_crossover_averages_shared_genes_and_inherits_the_rest(self):
+        population = StrategyPopulation(seed=1)
+        population.add("a", "A", {"type": "trend", "momentum_threshold": 0.02, "rsi_max": 70})
+        population.add("b", "B", {"type": "news", "momentum_threshold": 0.04, "confidence_threshold": 0.7})
+
+        rows = population.breed(np.array([[0, 1]]), mutation_rate=0.0)
+
+        child = population.pattern(rows[0])
+        assert child["momentum_threshold"] == pytest.approx(0.03)
+        assert child["rsi_max"] == 70
+        assert child["confidence_threshold"] == 0.7
+        assert population.parents[rows[0]] == ("a", "b")
+        assert not population.sandbox_tested[rows[0]]
+
+    def test_mutation_stays_within_ten_percent(self):
+        population = make_population([1.0, 1.0])
+
+        rows = population.breed(np.zeros((500, 2), dtype=int), mutation_rate=1.0)
+
+        genes = population.params[rows, GENES.index("momentum_threshold")]
+        assert np.all((genes >= 0.009) & (genes <= 0.011))
+        assert genes.std() > 0
+
+    def test_cull_compacts_rows(self):
+        population = make_population([1.0, -2.0, 0.5, -3.0])
+
+        removed = population.cull(-0.5)
+
+        assert removed == ["s1", "s3"]
+        assert population.ids == ["s0", "s2"]
+        assert population.index == {"s0": 0, "s2": 1}
+        assert population.weight[:2].tolist() == [1.0, 0.5]
+
+    def test_killed_rows_leave_at_once_and_compact_on_cull(self):
+        population = make_population([1.0, 2.0, 3.0, 4.0])
+
+        population.kill(1)
+        population.kill(3)
+
+        assert "s1" not in population and "s3" not in population
+        assert population.production_mask()[:4].tolist() == [True, False, True, False]
+        assert len(population) == 4
+
+        removed = population.cull(-0.5)
+
+        assert removed == ["s1", "s3"]
+        assert population.ids == ["s0", "s2"]
+        assert population.index == {"s0": 0, "s2": 1}
+        assert population.dead_count == 0
+
+
+class TestStrategyLearningAgent:
+    """Test suite for StrategyLearningAgent"""
+
+    def test_base_strategies(self):
+        agent = StrategyLearningAgent()
+
+        assert set(agent.strategies) == {"trend_uptrend", "mean_reversion_oversold", "news_positive"}
+        assert agent.strategies["trend_uptrend"].pattern["momentum_threshold"] == 0.02
+
+    def test_weight_updates_reward_and_penalize(self):
+        agent = StrategyLearningAgent(breeding_probability=0.0)
+
+        agent.update_strategy_weights({"trend_uptrend": 0.2, "news_positive": -0.5, "unknown": 1.0})
+
+        assert agent.strategies["trend_uptrend"].weight == pytest.approx(1.3)
+        assert agent.strategies["news_positive"].weight == pytest.approx(0.0)
+
+    def test_losers_are_culled(self):
+        agent = StrategyLearningAgent(breeding_probability=0.0)
+
+        agent.update_strategy_weights({"news_positive": -1.0})
+
+        assert "news_positive" not in agent.strategies
+
+    def test_full_generation(self):
+        agent = StrategyLearningAgent(seed=3)
+
+        children = agent.evolve_generation(5000)
+
+        assert len(children) == 5000
+        assert len(agent.get_sandbox_strategies()) == 5000
+        assert agent.get_strategy_summary()["total_strategies"] == 5003
+
+    def test_sandbox_lifecycle(self):
+        agent = StrategyLearningAgent(seed=4)
+        passed, failed = agent.evolve_generation(2)
+
+        agent.mark_sandbox_tested(passed, success=True)
+        agent.mark_sandbox_tested(failed, success=False)
+
+        assert agent.strategies[passed].production_ready
+        assert failed not in agent.strategies
+
+    def test_sandbox_failures_are_compacted_on_next_cull(self):
+        agent = StrategyLearningAgent(seed=5, breeding_probability=0.0)
+        children = agent.evolve_generation(200)
+
+        for child in children:
+            agent.mark_sandbox_tested(child, success=False)
+
+        assert agent.get_strategy_summary()["total_strategies"] == 3
+        assert agent.get_sandbox_strategies() == []
+        assert len(agent.population) == 203
+
+        agent.update_strategy_weights({})
+
+        assert len(agent.population) == 3
+        assert set(agent.strategies) == {"trend_uptrend", "mean_reversion_oversold", "news_positive"}
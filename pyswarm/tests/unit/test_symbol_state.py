@@ -0,0 +1,133 @@
+"""
+Unit tests for SymbolRingBuffers and per-symbol agent state
+"""
+
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.chaos_buy_agent import ChaosBuyAgent
+from coinswarm.agents.opportunistic_sell_agent import OpportunisticSellAgent
+from coinswarm.agents.symbol_state import SymbolRingBuffers
+from coinswarm.agents.trend_agent import TrendFollowingAgent
+from coinswarm.agents.risk_agent import RiskManagementAgent
+from coinswarm.data_ingest.base import DataPoint
+
+
+def make_tick(price: float, symbol: str) -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1),
+        data={"price": price, "volume": 1.0}
+    )
+
+
+class TestSymbolRingBuffers:
+    """Test suite for SymbolRingBuffers"""
+
+    def test_append_and_view_in_order(self):
+        buffers = SymbolRingBuffers(capacity=4)
+        for price in [1.0, 2.0, 3.0]:
+            buffers.append("BTC-USD", price)
+
+        assert buffers.view("BTC-USD").tolist() == [1.0, 2.0, 3.0]
+        assert buffers.count("BTC-USD") == 3
+
+    def test_wraparound_keeps_latest_window(self):
+        buffers = SymbolRingBuffers(capacity=4)
+        for price in range(10):
+            buffers.append("BTC-USD", float(price))
+
+        assert buffers.view("BTC-USD").tolist() == [6.0, 7.0, 8.0, 9.0]
+
+    def test_view_is_zero_copy(self):
+        buffers = SymbolRingBuffers(capacity=4)
+        for price in range(6):
+            buffers.append("BTC-USD", float(price))
+
+        view = buffers.view("BTC-USD")
+        assert view.base is not None
+
+    def test_symbols_are_isolated(self):
+        buffers = SymbolRingBuffers(capacity=3, fields=("price", "volume"))
+        buffers.append("BTC-USD", 100.0, 1.0)
+        buffers.append("ETH-USD", 10.0, 5.0)
+        buffers.append("BTC-USD", 101.0, 2.0)
+
+        assert buffers.view("BTC-USD").tolist() == [100.0, 101.0]
+        assert buffers.view("ETH-USD", "volume").tolist() == [5.0]
+
+    def test_symbol_id_index(self):
+        buffers = SymbolRingBuffers(capacity=3)
+        sid = buffers.append("SOL-USD", 20.0)
+        buffers.append(sid, 21.0)
+
+        assert buffers.symbol_id("SOL-USD") == sid
+        assert buffers.view(sid).tolist() == [20.0, 21.0]
+
+        with pytest.raises(KeyError):
+            buffers.view(99)
+
+    def test_grows_beyond_initial_symbols(self):
+        buffers = SymbolRingBuffers(capacity=2, initial_symbols=2)
+        for i in range(40):
+            buffers.append(f"SYM{i}", float(i))
+
+        assert len(buffers.symbols) == 40
+        assert buffers.view("SYM0").tolist() == [0.0]
+        assert buffers.view("SYM39").tolist() == [39.0]
+
+    def test_unknown_symbol_is_empty(self):
+        buffers = SymbolRingBuffers()
+        assert len(buffers.view("DOGE-USD")) == 0
+        assert buffers.count("DOGE-USD") == 0
+
+    def test_load_replaces_window(self):
+        buffers = SymbolRingBuffers(capacity=3)
+        buffers.load("BTC-USD", [1.0, 2.0, 3.0, 4.0])
+
+        assert buffers.view("BTC-USD").tolist() == [2.0, 3.0, 4.0]
+
+
+class TestPerSymbolAgentState:
+    """Agents keep separate history per symbol on an interleaved stream"""
+
+    @pytest.mark.asyncio
+    async def test_trend_agent_separates_symbols(self):
+        agent = TrendFollowingAgent()
+
+        for i in range(30):
+            await agent.analyze(make_tick(50000.0 + i, "BTC-USD"), None, {})
+            await agent.analyze(make_tick(3000.0 - i, "ETH-USD"), None, {})
+
+        btc = agent.history.view("BTC-USD")
+        eth = agent.history.view("ETH-USD")
+        assert len(btc) == len(eth) == 30
+        assert btc[-1] == 50029.0
+        assert eth[-1] == 2971.0
+
+        # price_history reflects the most recently analyzed symbol
+        assert agent.price_history[-1] == 2971.0
+
+    @pytest.mark.asyncio
+    async def test_risk_agent_does_not_see_cross_symbol_flash_crash(self):
+        agent = RiskManagementAgent()
+
+        vote = None
+        for _ in range(15):
+            await agent.analyze(make_tick(50000.0, "BTC-USD"), None, {})
+            vote = await agent.analyze(make_tick(3000.0, "ETH-USD"), None, {})
+
+        # A single interleaved buffer would see a 94% "crash" every tick
+        assert not vote.veto
+
+    @pytest.mark.parametrize(
+        "agent_class",
+        [TrendFollowingAgent, RiskManagementAgent, ChaosBuyAgent, OpportunisticSellAgent]
+    )
+    def test_price_history_is_assignable(self, agent_class):
+        agent = agent_class()
+        agent.price_history = [1.0, 2.0, 3.0]
+
+        assert agent.price_history == [1.0, 2.0, 3.0]
@@ -0,0 +1,179 @@
+"""
+Unit tests for TradeAnalysisAgent running statistics
+"""
+
+import random
+import pytest
+from datetime import datetime
+
+from coinswarm.agents.base_agent import StrategyTag
+from coinswarm.agents.chaos_buy_agent import ChaosBuyAgent
+from coinswarm.agents.trade_analysis_agent import TradeAnalysisAgent
+from coinswarm.data_ingest.base import DataPoint
+
+
+AGENTS = ["Trend", "Risk", "Research", "MeanReversion"]
+REASONS = ["Uptrend: momentum=2.5%", "Positive news sentiment", "RSI oversold", "Breakout above range"]
+
+
+def run_trades(agent: TradeAnalysisAgent, count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(count):
+        entry = 100.0
+        exit_price = entry * (1 + rng.gauss(0, 0.02))
+        votes = [
+            {"agent_name": name, "action": rng.choice(["BUY", "SELL"]), "reason": rng.choice(REASONS)}
+            for name in AGENTS
+        ]
+        agent.analyze_completed_trade(
+            {
+                "id": f"t{i}",
+                "symbol": "BTC-USD",
+                "size": rng.uniform(0.1, 2.0),
+                "action": rng.choice(["BUY", "SELL"]),
+                "timestamp": datetime(2024, 1, 1).isoformat(),
+            },
+            entry,
+            exit_price,
+            votes
+        )
+
+
+def expected_metrics(outcomes):
+    wins = [t for t in outcomes if t.winning]
+    losses = [t for t in outcomes if not t.winning]
+    returns = [t.pnl_pct for t in outcomes]
+    mean = sum(returns) / len(returns)
+    std = (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+    return {
+        "total_trades": len(outcomes),
+        "winning_trades": len(wins),
+        "losing_trades": len(losses),
+        "total_pnl": sum(t.pnl for t in outcomes),
+        "total_pnl_pct": sum(returns),
+        "best_trade_pnl": max(t.pnl for t in outcomes),
+        "worst_trade_pnl": min(t.pnl for t in outcomes),
+        "avg_win": sum(t.pnl for t in wins) / len(wins),
+        "avg_loss": sum(t.pnl for t in losses) / len(losses),
+        "win_rate": len(wins) / len(outcomes),
+        "profit_factor": sum(t.pnl for t in wins) / abs(sum(t.pnl for t in losses)),
+        "sharpe_ratio": mean / std,
+    }
+
+
+class TestTradeAnalysisAgent:
+    """Running aggregates match a full recomputation over the window"""
+
+    def test_metrics_before_window_fills(self):
+        agent = TradeAnalysisAgent(lookback_period=100)
+        run_trades(agent, 40)
+
+        assert agent.get_metrics() == pytest.approx(expected_metrics(list(agent.trade_outcomes)))
+
+    def test_metrics_after_eviction(self):
+        agent = TradeAnalysisAgent(lookback_period=25)
+        run_trades(agent, 500)
+
+        assert len(agent.trade_outcomes) == 25
+        assert agent.trade_outcomes[0].trade_id == "t475"
+        assert agent.get_metrics() == pytest.approx(expected_metrics(list(agent.trade_outcomes)))
+
+    def test_agent_and_strategy_performance(self):
+        agent = TradeAnalysisAgent(lookback_period=30)
+        run_trades(agent, 200, seed=1)
+
+        for name in AGENTS:
+            trades = [t for t in agent.trade_outcomes if name in t.contributing_agents]
+            perf = agent.get_agent_performance(name)
+            assert perf["trade_count"] == len(trades)
+            assert perf["total_pnl"] == pytest.approx(sum(t.pnl for t in trades))
+            assert perf["win_rate"] == pytest.approx(sum(t.winning for t in trades) / len(trades))
+
+        tags = {tag for t in agent.trade_outcomes for tag in t.strategy_tags}
+        assert set(agent.get_all_strategy_weights()) == tags
+        for tag in tags:
+            trades = [t for t in agent.trade_outcomes if tag in t.strategy_tags]
+            perf = agent.get_strategy_performance(tag)
+            assert perf["trade_count"] == len(trades)
+            assert perf["avg_pnl"] == pytest.approx(sum(t.pnl for t in trades) / len(trades))
+
+    def test_unknown_agent_and_strategy(self):
+        agent = TradeAnalysisAgent()
+
+        assert agent.get_agent_performance("Nobody")["win_rate"] == 0.5
+        assert agent.get_strategy_performance("nothing")["trade_count"] == 0
+        assert agent.get_all_strategy_weights() == {}
+
+
+class TestStrategyTags:
+    """Strategy attribution from vote tags"""
+
+    def close_trade(self, agent: TradeAnalysisAgent, votes, exit_price: float = 110.0):
+        return agent.analyze_completed_trade(
+            {"id": "t", "symbol": "BTC-USD", "size": 1.0, "action": "BUY",
+             "timestamp": datetime(2024, 1, 1).isoformat()},
+            100.0,
+            exit_price,
+            votes
+        )
+
+    def test_tags_from_votes(self):
+        agent = TradeAnalysisAgent()
+
+        outcome = self.close_trade(agent, [
+            {"agent_name": "Trend", "action": "BUY", "tags": StrategyTag.TREND_UPTREND},
+            {"agent_name": "Arb", "action": "BUY", "tags": StrategyTag.ARBITRAGE},
+            {"agent_name": "Research", "action": "HOLD", "tags": StrategyTag.NONE},
+        ])
+
+        assert outcome.tags == StrategyTag.TREND_UPTREND | StrategyTag.ARBITRAGE
+        assert outcome.strategy_tags == ["trend_uptrend", "arbitrage"]
+        assert agent.get_strategy_performance("arbitrage")["trade_count"] == 1
+
+    def test_tags_win_over_reason_text(self):
+        agent = TradeAnalysisAgent()
+
+        outcome = self.close_trade(agent, [
+            {"agent_name": "Trend", "action": "SELL", "reason": "Downtrend: momentum=-3%",
+             "tags": StrategyTag.TREND_DOWNTREND},
+        ])
+
+        assert outcome.strategy_tags == ["trend_downtrend"]
+
+    def test_untagged_votes_fall_back_to_reason(self):
+        agent = TradeAnalysisAgent()
+
+        outcome = self.close_trade(agent, [
+            {"agent_name": "Legacy", "action": "BUY", "reason": "Breakout with positive news"},
+        ])
+
+        assert outcome.tags == StrategyTag.BREAKOUT | StrategyTag.NEWS_POSITIVE
+
+    def test_zero_tags_are_not_parsed_from_reason(self):
+        agent = TradeAnalysisAgent()
+
+        outcome = self.close_trade(agent, [
+            {"agent_name": "Trend", "action": "HOLD", "reason": "Weak momentum", "tags": 0},
+        ])
+
+        assert outcome.tags == StrategyTag.NONE
+
+    @pytest.mark.asyncio
+    async def test_chaos_vote_tagged_from_its_justification(self):
+        chaos = ChaosBuyAgent(buy_probability=1.0)
+        for price in (100.0, 101.0):
+            vote = await chaos.analyze(DataPoint(
+                source="test", symbol="BTC-USD", timeframe="1m",
+                timestamp=datetime(2024, 1, 1), data={"price": price, "volume": 1.0}
+            ), None, {})
+        assert vote.tags & StrategyTag.TREND_UPTREND
+
+        # As LearningLoop passes committee votes
+        agent = TradeAnalysisAgent()
+        outcome = self.close_trade(agent, [
+            {"agent_name": vote.agent_name, "action": vote.action,
+             "reason": vote.reason, "tags": int(vote.tags)},
+        ])
+
+        assert outcome.tags & StrategyTag.TREND_UPTREND
+        assert agent.get_strategy_performance("trend_uptrend")["trade_count"] == 1
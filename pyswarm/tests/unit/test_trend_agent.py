@@ -363,18 +363,16 @@ class TestTrendFollowingAgent:
     # Edge Cases
     # ========================================================================
 
-    def test_price_history_max_length(self, agent):
+    @pytest.mark.asyncio
+    async def test_price_history_max_length(self, agent):
         """Test price history doesn't exceed max length"""
-        # Add more than max_history prices
+        # Analyze more than max_history ticks
         for i in range(150):
-            agent.price_history.append(50000 + i)
-
-        # Simulate normal analysis flow
-        agent.price_history.append(50000)
-        if len(agent.price_history) > agent.max_history:
-            agent.price_history.pop(0)
+            await agent.analyze(self.create_tick(50000.0 + i), position=None, market_context={})
 
-        assert len(agent.price_history) <= agent.max_history
+        assert agent.history.count("BTC-USD") == agent.max_history
+        assert agent.price_history[0] == 50050.0
+        assert agent.price_history[-1] == 50149.0
 
     @pytest.mark.asyncio
     async def test_handles_zero_price(self, agent):
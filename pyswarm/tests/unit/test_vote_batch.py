@@ -0,0 +1,224 @@
+"""
+Unit tests for batched multi-symbol committee voting
+
+Tests AgentCommittee.vote_batch against per-symbol vote(), the vectorized
+TrendFollowingAgent path, and per-symbol pruning inside a batch.
+"""
+
+import math
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+from coinswarm.agents.base_agent import AgentCost, BaseAgent, AgentVote
+from coinswarm.agents.committee import AgentCommittee
+from coinswarm.agents.feature_bus import FeatureBus
+from coinswarm.agents.risk_agent import RiskManagementAgent
+from coinswarm.agents.symbol_state import SymbolRingBuffers
+from coinswarm.agents.trend_agent import TrendFollowingAgent
+from coinswarm.data_ingest.base import DataPoint
+
+
+SYMBOLS = ["BTC-USD", "ETH-USD", "SOL-USD", "AVAX-USD"]
+
+
+def make_tick(price: float, symbol: str, step: int = 0) -> DataPoint:
+    return DataPoint(
+        source="test",
+        symbol=symbol,
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1) + timedelta(minutes=step),
+        data={"price": price, "volume": 100.0 + step % 7}
+    )
+
+
+def price_paths(steps: int, seed: int = 7):
+    """Trending random walks (one per symbol) so agents take all sides"""
+    rng = random.Random(seed)
+    prices = {symbol: 100.0 * (i + 1) for i, symbol in enumerate(SYMBOLS)}
+    drift = {symbol: (-1) ** i * 0.004 for i, symbol in enumerate(SYMBOLS)}
+    for step in range(steps):
+        if step % 50 == 0:
+            for symbol in SYMBOLS:
+                drift[symbol] = -drift[symbol]
+        row = []
+        for symbol in SYMBOLS:
+            prices[symbol] *= 1 + drift[symbol] + rng.gauss(0, 0.01)
+            row.append(make_tick(prices[symbol], symbol, step))
+        yield row
+
+
+def make_agents():
+    return [
+        TrendFollowingAgent(),
+        TrendFollowingAgent(name="HeavyTrend", weight=2.0),
+        RiskManagementAgent()
+    ]
+
+
+class VetoOn(BaseAgent):
+    """Cheap veto agent that vetoes the given symbols"""
+
+    cost_class = AgentCost.CHEAP
+    can_veto = True
+
+    def __init__(self, symbols):
+        super().__init__("Veto")
+        self.symbols = set(symbols)
+        self.seen = []
+
+    async def analyze(self, tick, position, market_context):
+        self.seen.append(tick.symbol)
+        veto = tick.symbol in self.symbols
+        return AgentVote(self.name, "HOLD", 1.0 if veto else 0.5, 0.0, "veto check", veto=veto)
+
+
+class CountingAgent(BaseAgent):
+    """Signal agent recording how often it is dispatched"""
+
+    def __init__(self, name: str = "Counter", action: str = "BUY"):
+        super().__init__(name)
+        self.action = action
+        self.batch_calls = []
+
+    async def analyze(self, tick, position, market_context):
+        return AgentVote(self.name, self.action, 0.9, 0.01, "count")
+
+    async def analyze_batch(self, ticks, positions, market_contexts):
+        self.batch_calls.append([t.symbol for t in ticks])
+        return await super().analyze_batch(ticks, positions, market_contexts)
+
+
+class TestSymbolWindow:
+    """SymbolRingBuffers.window / FeatureBatch matrices"""
+
+    def test_window_matches_views(self):
+        buffers = SymbolRingBuffers(capacity=5)
+        for i in range(8):
+            buffers.append("A", float(i))
+        buffers.append("B", 10.0)
+        buffers.append("B", 11.0)
+
+        values, counts = buffers.window(["A", "B"], 3)
+
+        assert values[0].tolist() == [5.0, 6.0, 7.0]
+        assert math.isnan(values[1, 0])
+        assert values[1, 1:].tolist() == [10.0, 11.0]
+        assert counts.tolist() == [5, 2]
+
+    def test_batch_features_match_snapshots(self):
+        bus = FeatureBus()
+        for row in price_paths(80):
+            batch = bus.update_batch(row)
+
+        for name in ["momentum_10", "rsi_14", "sma_10", "sma_50"]:
+            expected = [batch.snapshot(i).get(name) for i in range(len(batch))]
+            assert batch.get(name) == pytest.approx(expected)
+
+        codes = {"BUY": 1, "SELL": -1, "HOLD": 0}
+        expected = [codes[batch.snapshot(i).get("ma_crossover")] for i in range(len(batch))]
+        assert batch.get("ma_crossover").tolist() == expected
+
+
+class TestVoteBatch:
+    """vote_batch decides like vote() per symbol"""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_symbol_votes(self):
+        single = AgentCommittee(make_agents(), confidence_threshold=0.5)
+        batched = AgentCommittee(make_agents(), confidence_threshold=0.5)
+
+        seen = set()
+        for row in price_paths(120):
+            expected = [await single.vote(tick) for tick in row]
+            decisions = await batched.vote_batch(row)
+
+            for e, d in zip(expected, decisions):
+                assert d.action == e.action
+                assert d.confidence == pytest.approx(e.confidence)
+                assert d.size == pytest.approx(e.size)
+                assert d.vetoed == e.vetoed
+                assert [v.agent_name for v in d.votes] == [v.agent_name for v in e.votes]
+                seen.update(v.action for v in d.votes)
+                seen.add("VETO" if d.vetoed else d.action)
+
+        # The paths exercise every branch: both trend signals, trades and vetoes
+        assert {"BUY", "SELL", "VETO"} <= seen
+        assert batched.stats["decisions_made"] == single.stats["decisions_made"]
+        assert batched.stats["trades_executed"] == single.stats["trades_executed"]
+
+    @pytest.mark.asyncio
+    async def test_trend_agent_vectorized_matches_analyze(self):
+        committee = AgentCommittee([TrendFollowingAgent()])
+        agent = TrendFollowingAgent()
+
+        for row in price_paths(90):
+            batch = committee.feature_bus.update_batch(row)
+            contexts = [{"features": batch.snapshot(i), "feature_batch": batch} for i in range(len(row))]
+
+            batch_votes = await agent.analyze_batch(row, [None] * len(row), contexts)
+            for tick, context, vote in zip(row, contexts, batch_votes):
+                expected = await agent.analyze(tick, None, {"features": context["features"]})
+                assert vote.action == expected.action
+                assert vote.confidence == pytest.approx(expected.confidence)
+                assert vote.reason == expected.reason
+
+    @pytest.mark.asyncio
+    async def test_agents_dispatched_once_per_batch(self):
+        agent = CountingAgent()
+        committee = AgentCommittee([agent])
+
+        decisions = await committee.vote_batch([make_tick(100.0, s) for s in SYMBOLS])
+
+        assert agent.batch_calls == [SYMBOLS]
+        assert [d.action for d in decisions] == ["BUY"] * len(SYMBOLS)
+        assert agent.stats["votes_cast"] == len(SYMBOLS)
+
+    @pytest.mark.asyncio
+    async def test_veto_prunes_only_vetoed_symbols(self):
+        veto = VetoOn({"ETH-USD"})
+        signal = CountingAgent()
+        committee = AgentCommittee([signal, veto])
+
+        decisions = await committee.vote_batch([make_tick(100.0, s) for s in SYMBOLS])
+
+        assert [d.vetoed for d in decisions] == [s == "ETH-USD" for s in SYMBOLS]
+        assert signal.batch_calls == [[s for s in SYMBOLS if s != "ETH-USD"]]
+        assert committee.stats["veto_short_circuits"] == 1
+        assert committee.stats["trades_vetoed"] == 1
+        assert veto.stats["vetoes_issued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_capacity_skip_is_per_symbol(self):
+        signal = CountingAgent(action="SELL")
+        committee = AgentCommittee([signal])
+        ticks = [make_tick(100.0, "BTC-USD"), make_tick(10.0, "ETH-USD")]
+        context = {"open_positions": 5, "max_positions": 5}
+
+        decisions = await committee.vote_batch(ticks, [{"size": 1.0}, None], context)
+
+        assert signal.batch_calls == [["BTC-USD"]]
+        assert [d.action for d in decisions] == ["SELL", "HOLD"]
+        assert committee.stats["capacity_skips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_symbols_rejected(self):
+        committee = AgentCommittee([])
+        ticks = [make_tick(1.0, "BTC-USD"), make_tick(2.0, "BTC-USD")]
+
+        with pytest.raises(ValueError):
+            await committee.vote_batch(ticks)
+
+    def test_aggregate_matrix_tie_break(self):
+        actions = np.array([[0, 1], [1, 2], [-1, -1]], dtype=np.int8)
+        confidences = np.array([[0.8, 0.8], [0.7, 0.9], [0.0, 0.0]])
+        sizes = np.array([[0.02, 0.01], [0.01, 0.0], [0.0, 0.0]])
+
+        choice, confidence, size = AgentCommittee._aggregate_matrix(
+            actions, confidences, sizes, np.ones(2)
+        )
+
+        assert choice.tolist() == [0, 2, 2]  # BUY wins ties, then HOLD
+        assert confidence.tolist() == pytest.approx([0.8, 0.9, 0.0])
+        assert size.tolist() == pytest.approx([0.02, 0.0, 0.0])